@@ -19,6 +19,7 @@ from src.core.report import ProjectReport, UserReport
 from src.core.statistic import Statistic, StatisticIndex
 from src.database.api.models import UserConfigModel
 from src.database.api import models
+from src.services.project.insights_service import schedule_project_insights
 
 
 @pytest.fixture
@@ -98,6 +99,18 @@ def blank_db():
     yield engine
 
 
+@pytest.fixture
+def insights_in_foreground(monkeypatch):
+    """
+    Makes the miner wait for each background insights job it schedules.
+    The in-memory `blank_db` has a single connection, which a job must not
+    share with the test while it runs.
+    """
+    monkeypatch.setattr(
+        "src.services.mining_service.schedule_project_insights",
+        lambda *args: schedule_project_insights(*args).result())
+
+
 @pytest.fixture
 def mock_readme_analysis(monkeypatch):
     """
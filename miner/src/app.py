@@ -6,6 +6,7 @@ from src.core.ML.models.azure_openai_runtime import azure_openai_enabled
 from src.infrastructure.log.logging import get_logger
 import os
 import sys
+import threading
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -24,31 +25,11 @@ load_dotenv()
 
 
 def _init_db() -> None:
+    """Create or upgrade the database schema through the Alembic migrations."""
 
-    from sqlmodel import SQLModel, text
+    from src.database.core.migrations import upgrade_database
 
-    from src.database.core.base import get_engine
-    from sqlalchemy import inspect as sa_inspect
-    import src.database.api.models
-
-    engine = get_engine()
-    SQLModel.metadata.create_all(engine)
-
-    # Add new nullable columns to existing tables when they are missing.
-    inspector = sa_inspect(engine)
-    if inspector.has_table("resumemodel"):
-        existing_cols = {col["name"] for col in inspector.get_columns("resumemodel")}
-        with engine.connect() as conn:
-            if "title" not in existing_cols:
-                conn.execute(text("ALTER TABLE resumemodel ADD COLUMN title TEXT"))
-                conn.commit()
-
-    if inspector.has_table("projectreportmodel"):
-        existing_cols = {col["name"] for col in inspector.get_columns("projectreportmodel")}
-        with engine.connect() as conn:
-            if "is_deleted" not in existing_cols:
-                conn.execute(text("ALTER TABLE projectreportmodel ADD COLUMN is_deleted INTEGER NOT NULL DEFAULT 0"))
-                conn.commit()
+    upgrade_database()
 
 
 def init_system() -> tuple[bool, str]:
@@ -96,10 +77,72 @@ def init_system() -> tuple[bool, str]:
         return False, "ML warmup failed."
 
 
+_WARMUP_LOCK = threading.Lock()
+_WARMUP_THREAD: threading.Thread | None = None
+_WARMUP_STATUS: dict = {
+    "state": "not_started",
+    "ml_ready": False,
+    "message": "ML warmup has not started.",
+}
+
+
+def _run_warmup() -> None:
+    """Thread target that runs `init_system` and records the outcome."""
+    try:
+        ml_ready, message = init_system()
+    except Exception:
+        logger.exception("Background ML warmup crashed")
+        ml_ready, message = False, "ML warmup failed."
+
+    with _WARMUP_LOCK:
+        _WARMUP_STATUS.update(
+            state="complete", ml_ready=ml_ready, message=message)
+
+
+def start_background_warmup() -> threading.Thread:
+    """
+    Run `init_system` on a daemon thread so the caller (API lifespan or the
+    CLI) can start serving right away. Calling this again while a warmup is
+    running, or after it finished, returns the existing thread.
+    """
+    global _WARMUP_THREAD
+
+    with _WARMUP_LOCK:
+        if _WARMUP_THREAD is not None:
+            return _WARMUP_THREAD
+
+        _WARMUP_STATUS.update(
+            state="running", ml_ready=False, message="ML warmup in progress.")
+        _WARMUP_THREAD = threading.Thread(
+            target=_run_warmup, name="ml-warmup", daemon=True)
+        _WARMUP_THREAD.start()
+        return _WARMUP_THREAD
+
+
+def wait_for_warmup(timeout: float | None = None) -> dict:
+    """
+    Block until the background warmup finishes (or `timeout` seconds pass)
+    and return the current warmup status.
+    """
+    thread = _WARMUP_THREAD
+    if thread is not None:
+        thread.join(timeout)
+    return get_warmup_status()
+
+
+def get_warmup_status() -> dict:
+    """
+    Return a copy of the warmup status. `state` is one of `not_started`,
+    `running` or `complete`; `ml_ready` tells whether any model loaded.
+    """
+    with _WARMUP_LOCK:
+        return dict(_WARMUP_STATUS)
+
+
 def main():
     _init_db()
-    _, startup_message = init_system()
-    print(startup_message)
+    start_background_warmup()
+    print("ML warmup started in the background. Use option (11) to wait for it.")
 
     from src.interface.cli.cli import ArtifactMiner
     try:
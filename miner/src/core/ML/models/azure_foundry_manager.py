@@ -2,13 +2,12 @@ from __future__ import annotations
 
 import json
 import os
-import urllib.error
-import urllib.request
 from typing import Any
 
 from pydantic import BaseModel
 
-from src.core.ML.models.azure_openai_runtime import azure_openai_enabled
+from src.core.ML.models.azure_openai_runtime import azure_openai_enabled, post_chat_completion
+from src.core.ML.models.llm_cache import llm_cache_key
 from src.infrastructure.log.logging import get_logger
 
 logger = get_logger(__name__)
@@ -85,43 +84,24 @@ class AzureFoundryManager:
             },
         }
 
-        request = urllib.request.Request(
-            url=self._url(),
-            data=json.dumps(payload).encode("utf-8"),
-            headers={
-                "Content-Type": "application/json",
-                "api-key": self.api_key,
-            },
-            method="POST",
-        )
-
-        try:
-            with urllib.request.urlopen(request, timeout=45.0) as response:
-                raw = response.read().decode("utf-8", errors="replace")
-            parsed = json.loads(raw)
-            choices = parsed.get("choices", [])
-            if not choices:
-                return None
-            message = choices[0].get("message", {}) if isinstance(choices[0], dict) else {}
-            content = message.get("content")
-            if isinstance(content, list):
-                content = "".join(str(part.get("text", "")) for part in content if isinstance(part, dict))
-            if not isinstance(content, str) or not content.strip():
-                return None
-            if hasattr(response_model, "model_validate_json"):
-                return response_model.model_validate_json(content.strip())
-            return response_model.parse_raw(content.strip())  # pragma: no cover
-        except urllib.error.HTTPError as exc:
-            body = ""
+        def _parse(content: str) -> BaseModel | None:
             try:
-                body = exc.read().decode("utf-8", errors="replace")
+                if hasattr(response_model, "model_validate_json"):
+                    return response_model.model_validate_json(content)
+                return response_model.parse_raw(content)  # pragma: no cover
             except Exception:
-                body = ""
-            logger.error(
-                "AzureFoundryManager HTTP error (schema=%s, status=%s, body=%s)",
-                schema_id,
-                getattr(exc, "code", "unknown"),
-                body[:300],
+                logger.warning("AzureFoundryManager returned invalid output (schema=%s)", schema_id)
+                return None
+
+        try:
+            return post_chat_completion(
+                json.dumps(payload).encode("utf-8"),
+                url=self._url(),
+                api_key=self.api_key,
+                schema_name=schema_id,
+                parse_content=_parse,
+                cache_key=llm_cache_key(
+                    self.deployment, system_prompt, user_input, schema_id, temperature),
             )
         except Exception:
             logger.exception("AzureFoundryManager request failed (schema=%s)", schema_id)
@@ -1,18 +1,37 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
+import threading
 import time
-import urllib.error
-import urllib.request
-from typing import Any
-
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Any, Callable, Sequence, TypeVar
+
+import httpx
 from pydantic import BaseModel
 
+from src.core.ML.models.llm_cache import SingleFlight, get_llm_cache, llm_cache_enabled, llm_cache_key
 from src.infrastructure.log.logging import get_logger
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+I = TypeVar("I")
+
+_DEFAULT_TIMEOUT_SECONDS = 45.0
+_DEFAULT_MAX_CONCURRENCY = 4
+_DEFAULT_REQUESTS_PER_SECOND = 4.0
+_MAX_ATTEMPTS = 3
+# Never honour a Retry-After longer than this, the caller is usually a request
+_MAX_RETRY_AFTER_SECONDS = 30.0
+_RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
 
 def _extract_message_content(parsed: dict[str, Any], schema_name: str) -> str | None:
     choices = parsed.get("choices", [])
@@ -133,25 +152,461 @@ def _request_payload(
     return json.dumps(payload).encode("utf-8")
 
 
-def _make_request(body: bytes, deployment: str | None) -> dict[str, Any] | None:
-    request = urllib.request.Request(
-        url=_request_url(deployment),
-        data=body,
-        headers={
-            "Content-Type": "application/json",
-            "api-key": os.environ["AZURE_OPENAI_API_KEY"].strip(),
-        },
-        method="POST",
-    )
-    with urllib.request.urlopen(request, timeout=45.0) as response:
-        raw = response.read().decode("utf-8", errors="replace")
-    return json.loads(raw)
-
-
 def _retry_delay_seconds(attempt: int, *, rate_limited: bool = False) -> float:
     return (1.5 if rate_limited else 0.4) * (attempt + 1)
 
 
+def _env_float(name: str, default: float) -> float:
+    try:
+        value = float(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+    return value if value > 0 else default
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket shared by every Azure OpenAI call. After the
+    service throttles us the whole bucket is paused, so other callers back
+    off too instead of piling more requests onto a 429.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """
+        Take a token if one is available. Returns 0.0 on success, otherwise
+        the number of seconds to wait before trying again.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+
+            elapsed = now - self._updated
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+            return (1.0 - self._tokens) / self.rate
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._paused_until = max(
+                self._paused_until, time.monotonic() + seconds)
+
+
+class _RuntimeMetrics:
+    """Counters and a rolling latency window for Azure OpenAI calls."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters = {
+                "requests": 0,
+                "successes": 0,
+                "failures": 0,
+                "retries": 0,
+                "throttled": 0,
+                "cache_hits": 0,
+                "cache_misses": 0,
+                "coalesced": 0,
+            }
+            self._throttle_wait_seconds = 0.0
+            self._limiter_wait_seconds = 0.0
+            self._latencies: deque[float] = deque(maxlen=512)
+
+    def incr(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def record_request(self, latency: float) -> None:
+        with self._lock:
+            self._counters["requests"] += 1
+            self._latencies.append(latency)
+
+    def record_throttle(self, wait_seconds: float) -> None:
+        with self._lock:
+            self._counters["throttled"] += 1
+            self._throttle_wait_seconds += wait_seconds
+
+    def record_limiter_wait(self, wait_seconds: float) -> None:
+        with self._lock:
+            self._limiter_wait_seconds += wait_seconds
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            snapshot: dict[str, Any] = dict(self._counters)
+            snapshot["throttle_wait_seconds"] = round(self._throttle_wait_seconds, 4)
+            snapshot["limiter_wait_seconds"] = round(self._limiter_wait_seconds, 4)
+
+        def _percentile(pct: float) -> float:
+            if not latencies:
+                return 0.0
+            index = min(len(latencies) - 1, int(round(pct * (len(latencies) - 1))))
+            return round(latencies[index], 4)
+
+        snapshot["latency_seconds"] = {
+            "count": len(latencies),
+            "avg": round(sum(latencies) / len(latencies), 4) if latencies else 0.0,
+            "p50": _percentile(0.50),
+            "p95": _percentile(0.95),
+            "max": round(latencies[-1], 4) if latencies else 0.0,
+        }
+        return snapshot
+
+
+_STATE_LOCK = threading.Lock()
+_CLIENT: httpx.Client | None = None
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+_CONCURRENCY: threading.BoundedSemaphore | None = None
+_RATE_LIMITER: _TokenBucket | None = None
+_METRICS = _RuntimeMetrics()
+_FLIGHTS = SingleFlight()
+
+
+def _max_concurrency() -> int:
+    return int(_env_float("ARTIFACT_MINER_AZURE_MAX_CONCURRENCY", _DEFAULT_MAX_CONCURRENCY))
+
+
+def _client_options() -> dict[str, Any]:
+    concurrency = _max_concurrency()
+    timeout = _env_float("ARTIFACT_MINER_AZURE_TIMEOUT_SECONDS", _DEFAULT_TIMEOUT_SECONDS)
+    return {
+        "timeout": httpx.Timeout(timeout, connect=min(10.0, timeout)),
+        "limits": httpx.Limits(
+            max_connections=concurrency,
+            max_keepalive_connections=concurrency,
+            keepalive_expiry=60.0,
+        ),
+    }
+
+
+def _get_client() -> httpx.Client:
+    """Return the shared keep-alive client, creating it on first use."""
+    global _CLIENT
+    with _STATE_LOCK:
+        if _CLIENT is None:
+            _CLIENT = httpx.Client(**_client_options())
+        return _CLIENT
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """Return the keep-alive async client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _STATE_LOCK:
+        client = _ASYNC_CLIENTS.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(**_client_options())
+            _ASYNC_CLIENTS[loop] = client
+        return client
+
+
+def _get_limiters() -> tuple[threading.BoundedSemaphore, _TokenBucket]:
+    global _CONCURRENCY, _RATE_LIMITER
+    with _STATE_LOCK:
+        if _CONCURRENCY is None:
+            _CONCURRENCY = threading.BoundedSemaphore(_max_concurrency())
+        if _RATE_LIMITER is None:
+            rate = _env_float(
+                "ARTIFACT_MINER_AZURE_REQUESTS_PER_SECOND", _DEFAULT_REQUESTS_PER_SECOND)
+            _RATE_LIMITER = _TokenBucket(rate=rate, capacity=max(1.0, rate))
+        return _CONCURRENCY, _RATE_LIMITER
+
+
+def get_azure_runtime_metrics() -> dict[str, Any]:
+    """Return request, retry, throttle and latency metrics for Azure OpenAI calls."""
+    return _METRICS.snapshot()
+
+
+def reset_azure_runtime() -> None:
+    """
+    Close the shared clients and drop the limiters and metrics, so the next
+    call picks up fresh `ARTIFACT_MINER_AZURE_*` settings.
+    """
+    global _CLIENT, _CONCURRENCY, _RATE_LIMITER
+    with _STATE_LOCK:
+        if _CLIENT is not None:
+            _CLIENT.close()
+        _CLIENT = None
+        async_clients = list(_ASYNC_CLIENTS.items())
+        _ASYNC_CLIENTS.clear()
+        _CONCURRENCY = None
+        _RATE_LIMITER = None
+    for loop, client in async_clients:
+        _close_async_client(loop, client)
+    _METRICS.reset()
+
+
+def _close_async_client(loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient) -> None:
+    """
+    Close `client` on the loop that owns it. A closed loop has already torn
+    down the client's connections, so there is nothing left to release.
+    """
+    if loop.is_closed():
+        return
+    if loop.is_running():
+        # Possibly the calling thread's own loop, so schedule rather than wait
+        loop.call_soon_threadsafe(lambda: loop.create_task(client.aclose()))
+        return
+    try:
+        loop.run_until_complete(client.aclose())
+    except RuntimeError:
+        logger.warning("Could not close an idle Azure OpenAI async client", exc_info=True)
+
+
+def run_llm_batch(
+    fn: Callable[[I], T],
+    items: Sequence[I],
+    *,
+    task_name: str,
+) -> list[T | None]:
+    """
+    Run `fn` over `items` on a thread pool no larger than the Azure
+    concurrency budget, so LLM-backed work for many projects overlaps its
+    network wait. Results keep the order of `items`. A failing item is
+    logged and yields None without affecting the others.
+    """
+    if not items:
+        return []
+
+    def _safe(item: I) -> T | None:
+        try:
+            return fn(item)
+        except Exception:
+            logger.exception("[TASK=%s] LLM batch item failed", task_name)
+            return None
+
+    workers = max(1, min(len(items), _max_concurrency()))
+    if workers == 1:
+        return [_safe(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"llm-{task_name}") as pool:
+        return list(pool.map(_safe, items))
+
+
+@contextmanager
+def _request_slot():
+    """Hold one of the global concurrency slots and a rate limit token."""
+    semaphore, limiter = _get_limiters()
+    started = time.monotonic()
+    semaphore.acquire()
+    try:
+        while (wait := limiter.try_acquire()) > 0:
+            time.sleep(wait)
+        _METRICS.record_limiter_wait(time.monotonic() - started)
+        yield
+    finally:
+        semaphore.release()
+
+
+@asynccontextmanager
+async def _arequest_slot():
+    """Async version of `_request_slot` that never blocks the event loop."""
+    semaphore, limiter = _get_limiters()
+    started = time.monotonic()
+    if not semaphore.acquire(blocking=False):
+        # The slots are shared with threaded callers, so wait for one on an
+        # executor thread. If this task is cancelled meanwhile, hand the
+        # slot back as soon as the executor gets it.
+        acquired = asyncio.get_running_loop().run_in_executor(None, semaphore.acquire)
+        try:
+            await asyncio.shield(acquired)
+        except asyncio.CancelledError:
+            acquired.add_done_callback(lambda _: semaphore.release())
+            raise
+    try:
+        while (wait := limiter.try_acquire()) > 0:
+            await asyncio.sleep(wait)
+        _METRICS.record_limiter_wait(time.monotonic() - started)
+        yield
+    finally:
+        semaphore.release()
+
+
+def _retry_after_seconds(response: httpx.Response) -> float | None:
+    """
+    Read how long the service asked us to wait. Azure sends `retry-after-ms`
+    alongside the standard `Retry-After` (seconds or an HTTP date).
+    """
+    seconds: float | None = None
+
+    raw_ms = response.headers.get("retry-after-ms")
+    if raw_ms:
+        try:
+            seconds = float(raw_ms) / 1000.0
+        except ValueError:
+            seconds = None
+
+    raw = response.headers.get("retry-after")
+    if seconds is None and raw:
+        try:
+            seconds = float(raw)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(raw)
+                seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                seconds = None
+
+    if seconds is None:
+        return None
+    return min(max(0.0, seconds), _MAX_RETRY_AFTER_SECONDS)
+
+
+def _evaluate_response(
+    response: httpx.Response,
+    schema_name: str,
+    parse_content: Callable[[str], T | None],
+    attempt: int,
+) -> tuple[T | None, float | None]:
+    """
+    Turn one HTTP response into `(result, retry_delay)`. A `retry_delay` of
+    None means the caller should stop retrying.
+    """
+    can_retry = attempt + 1 < _MAX_ATTEMPTS
+
+    if response.status_code >= 400:
+        logger.error(
+            "Azure OpenAI HTTP error for schema=%s (status=%s, body=%s)",
+            schema_name,
+            response.status_code,
+            response.text[:300],
+        )
+        if response.status_code not in _RETRYABLE_STATUS_CODES:
+            return None, None
+
+        throttled = response.status_code == 429
+        retry_after = _retry_after_seconds(response)
+        delay = retry_after if retry_after is not None else _retry_delay_seconds(
+            attempt, rate_limited=throttled)
+        if throttled:
+            _METRICS.record_throttle(delay)
+            _get_limiters()[1].pause(delay)
+        if not can_retry:
+            return None, None
+        logger.warning(
+            "Retrying Azure OpenAI request for schema=%s after status=%s in %.2fs",
+            schema_name,
+            response.status_code,
+            delay,
+        )
+        return None, delay
+
+    content = _extract_message_content(response.json(), schema_name)
+    if content is None:
+        return None, None
+
+    result = parse_content(content)
+    if result is not None:
+        return result, None
+    if can_retry:
+        logger.warning(
+            "Retrying Azure OpenAI parse for schema=%s after malformed structured output", schema_name)
+        return None, _retry_delay_seconds(attempt)
+    return None, None
+
+
+def _request_headers(api_key: str) -> dict[str, str]:
+    return {"Content-Type": "application/json", "api-key": api_key}
+
+
+def _post_chat_uncached(
+    body: bytes,
+    *,
+    url: str,
+    api_key: str,
+    schema_name: str,
+    parse_content: Callable[[str], T | None],
+) -> T | None:
+    for attempt in range(_MAX_ATTEMPTS):
+        delay: float | None = None
+        try:
+            with _request_slot():
+                started = time.perf_counter()
+                try:
+                    response = _get_client().post(
+                        url, content=body, headers=_request_headers(api_key))
+                finally:
+                    _METRICS.record_request(time.perf_counter() - started)
+            result, delay = _evaluate_response(
+                response, schema_name, parse_content, attempt)
+            if result is not None:
+                _METRICS.incr("successes")
+                return result
+        except httpx.HTTPError:
+            logger.exception("Azure OpenAI request failed for schema=%s", schema_name)
+            if attempt + 1 < _MAX_ATTEMPTS:
+                delay = _retry_delay_seconds(attempt)
+        except Exception:
+            logger.exception("Azure OpenAI response parsing failed for schema=%s", schema_name)
+            if attempt + 1 < _MAX_ATTEMPTS:
+                delay = _retry_delay_seconds(attempt)
+
+        if delay is None:
+            break
+        _METRICS.incr("retries")
+        time.sleep(delay)
+
+    _METRICS.incr("failures")
+    return None
+
+
+async def _post_chat_uncached_async(
+    body: bytes,
+    *,
+    url: str,
+    api_key: str,
+    schema_name: str,
+    parse_content: Callable[[str], T | None],
+) -> T | None:
+    for attempt in range(_MAX_ATTEMPTS):
+        delay: float | None = None
+        try:
+            async with _arequest_slot():
+                started = time.perf_counter()
+                try:
+                    response = await _get_async_client().post(
+                        url, content=body, headers=_request_headers(api_key))
+                finally:
+                    _METRICS.record_request(time.perf_counter() - started)
+            result, delay = _evaluate_response(
+                response, schema_name, parse_content, attempt)
+            if result is not None:
+                _METRICS.incr("successes")
+                return result
+        except httpx.HTTPError:
+            logger.exception("Azure OpenAI request failed for schema=%s", schema_name)
+            if attempt + 1 < _MAX_ATTEMPTS:
+                delay = _retry_delay_seconds(attempt)
+        except Exception:
+            logger.exception("Azure OpenAI response parsing failed for schema=%s", schema_name)
+            if attempt + 1 < _MAX_ATTEMPTS:
+                delay = _retry_delay_seconds(attempt)
+
+        if delay is None:
+            break
+        _METRICS.incr("retries")
+        await asyncio.sleep(delay)
+
+    _METRICS.incr("failures")
+    return None
+
+
 def azure_openai_enabled() -> bool:
     """Return whether Azure OpenAI is the active ML provider."""
     return os.environ.get("ARTIFACT_MINER_ML_PROVIDER", "").strip().lower() == "azure_openai"
@@ -206,26 +661,134 @@ def _model_validate_json(model: type[BaseModel], text: str) -> BaseModel:
     return model.parse_raw(text)  # pragma: no cover - pydantic v1 fallback
 
 
-def azure_chat_parse(
+def _cached_result(cache_key: str, parse_content: Callable[[str], T | None]) -> T | None:
+    content = get_llm_cache().get(cache_key)
+    if content is None:
+        return None
+    return parse_content(content)
+
+
+def _capturing(parse_content: Callable[[str], T | None], captured: list[str]) -> Callable[[str], T | None]:
+    """Wrap `parse_content` so the raw content of a successful parse is kept."""
+    def _parse(content: str) -> T | None:
+        result = parse_content(content)
+        if result is not None:
+            captured.append(content)
+        return result
+    return _parse
+
+
+def post_chat_completion(
+    body: bytes,
     *,
-    system_prompt: str,
-    user_prompt: str,
-    response_model: type[BaseModel],
+    url: str,
+    api_key: str,
     schema_name: str,
-    max_tokens: int = 280,
-    temperature: float = 0.0,
-    deployment: str | None = None,
-) -> BaseModel | None:
+    parse_content: Callable[[str], T | None],
+    cache_key: str | None = None,
+) -> T | None:
     """
-    Request a structured JSON response from Azure OpenAI and parse to Pydantic.
+    POST a chat completion over the shared keep-alive client and parse the
+    message content with `parse_content`. Calls are capped by the global
+    concurrency limit and token bucket, and retried on throttling, server
+    errors and malformed output (honouring `Retry-After`).
+
+    When a `cache_key` is given, a cached response is returned without a
+    network call, and concurrent calls for the same key share one request.
     """
+    request = dict(url=url, api_key=api_key, schema_name=schema_name)
+    if cache_key is None or not llm_cache_enabled():
+        return _post_chat_uncached(body, parse_content=parse_content, **request)
+
+    cached = _cached_result(cache_key, parse_content)
+    if cached is not None:
+        _METRICS.incr("cache_hits")
+        return cached
+
+    flight, is_leader = _FLIGHTS.join(cache_key)
+    if not is_leader:
+        _METRICS.incr("coalesced")
+        content = flight.wait()
+        return parse_content(content) if content is not None else None
+
+    captured: list[str] = []
+    try:
+        # Another leader may have filled the cache between our read and join
+        result = _cached_result(cache_key, _capturing(parse_content, captured))
+        if result is not None:
+            _METRICS.incr("cache_hits")
+            return result
+
+        _METRICS.incr("cache_misses")
+        result = _post_chat_uncached(
+            body, parse_content=_capturing(parse_content, captured), **request)
+        if captured:
+            get_llm_cache().put(cache_key, captured[-1])
+        return result
+    finally:
+        _FLIGHTS.finish(cache_key, captured[-1] if captured else None)
+
+
+async def post_chat_completion_async(
+    body: bytes,
+    *,
+    url: str,
+    api_key: str,
+    schema_name: str,
+    parse_content: Callable[[str], T | None],
+    cache_key: str | None = None,
+) -> T | None:
+    """Async version of `post_chat_completion`, sharing its limits, cache and metrics."""
+    request = dict(url=url, api_key=api_key, schema_name=schema_name)
+    if cache_key is None or not llm_cache_enabled():
+        return await _post_chat_uncached_async(body, parse_content=parse_content, **request)
+
+    cached = _cached_result(cache_key, parse_content)
+    if cached is not None:
+        _METRICS.incr("cache_hits")
+        return cached
+
+    flight, is_leader = _FLIGHTS.join(cache_key)
+    if not is_leader:
+        _METRICS.incr("coalesced")
+        content = await flight.wait_async()
+        return parse_content(content) if content is not None else None
+
+    captured: list[str] = []
+    try:
+        result = _cached_result(cache_key, _capturing(parse_content, captured))
+        if result is not None:
+            _METRICS.incr("cache_hits")
+            return result
+
+        _METRICS.incr("cache_misses")
+        result = await _post_chat_uncached_async(
+            body, parse_content=_capturing(parse_content, captured), **request)
+        if captured:
+            get_llm_cache().put(cache_key, captured[-1])
+        return result
+    finally:
+        _FLIGHTS.finish(cache_key, captured[-1] if captured else None)
+
+
+def _structured_request_body(
+    *,
+    system_prompt: str,
+    user_prompt: str,
+    schema_name: str,
+    schema: dict[str, Any],
+    max_tokens: int,
+    temperature: float,
+    deployment: str | None,
+) -> bytes | None:
+    """Build the request body, or return None when Azure OpenAI is unavailable."""
     if not azure_openai_enabled():
         return None
     if not _config_valid(deployment):
         logger.warning("Azure OpenAI provider selected but required env vars are missing")
         return None
 
-    body = _request_payload(
+    return _request_payload(
         system_prompt=system_prompt,
         user_prompt=user_prompt,
         max_tokens=max_tokens,
@@ -235,50 +798,63 @@ def azure_chat_parse(
             "json_schema": {
                 "name": schema_name,
                 "strict": True,
-                "schema": _model_schema(response_model),
+                "schema": schema,
             },
         },
     )
 
-    max_attempts = 3
-    for attempt in range(max_attempts):
-        try:
-            parsed = _make_request(body, deployment)
-            if parsed is None:
-                return None
-            content = _extract_message_content(parsed, schema_name)
-            if content is None:
-                return None
-            model = _parse_model_content(content, schema_name, response_model)
-            if model is not None:
-                return model
-            if attempt + 1 < max_attempts:
-                logger.warning("Retrying Azure OpenAI parse for schema=%s after malformed structured output", schema_name)
-                time.sleep(_retry_delay_seconds(attempt))
-        except urllib.error.HTTPError as exc:
-            logger.error(
-                "Azure OpenAI HTTP error for schema=%s (status=%s)",
-                schema_name,
-                getattr(exc, "code", "unknown"),
-            )
-            if getattr(exc, "code", None) == 429 and attempt + 1 < max_attempts:
-                logger.warning("Retrying Azure OpenAI request for schema=%s after rate limiting", schema_name)
-                time.sleep(_retry_delay_seconds(attempt, rate_limited=True))
-                continue
-            return None
-        except (urllib.error.URLError, OSError, TimeoutError):
-            logger.exception("Azure OpenAI request failed for schema=%s", schema_name)
-            if attempt + 1 < max_attempts:
-                time.sleep(_retry_delay_seconds(attempt))
-                continue
-            return None
-        except Exception:
-            logger.exception("Azure OpenAI response parsing failed for schema=%s", schema_name)
-            if attempt + 1 < max_attempts:
-                time.sleep(_retry_delay_seconds(attempt))
-                continue
-            return None
-    return None
+
+def _api_key() -> str:
+    return os.environ["AZURE_OPENAI_API_KEY"].strip()
+
+
+def _request_cache_key(
+    system_prompt: str,
+    user_prompt: str,
+    schema_name: str,
+    temperature: float,
+    deployment: str | None,
+) -> str:
+    active_deployment = deployment or os.environ["AZURE_OPENAI_DEPLOYMENT"]
+    return llm_cache_key(active_deployment, system_prompt, user_prompt, schema_name, temperature)
+
+
+def azure_chat_parse(
+    *,
+    system_prompt: str,
+    user_prompt: str,
+    response_model: type[BaseModel],
+    schema_name: str,
+    max_tokens: int = 280,
+    temperature: float = 0.0,
+    deployment: str | None = None,
+) -> BaseModel | None:
+    """
+    Request a structured JSON response from Azure OpenAI and parse to Pydantic.
+    """
+    body = _structured_request_body(
+        system_prompt=system_prompt,
+        user_prompt=user_prompt,
+        schema_name=schema_name,
+        schema=_model_schema(response_model),
+        max_tokens=max_tokens,
+        temperature=temperature,
+        deployment=deployment,
+    )
+    if body is None:
+        return None
+
+    return post_chat_completion(
+        body,
+        url=_request_url(deployment),
+        api_key=_api_key(),
+        schema_name=schema_name,
+        parse_content=lambda content: _parse_model_content(
+            content, schema_name, response_model),
+        cache_key=_request_cache_key(
+            system_prompt, user_prompt, schema_name, temperature, deployment),
+    )
+
 
 def azure_chat_json(
     *,
@@ -293,63 +869,94 @@ def azure_chat_json(
     """
     Request a structured JSON response from Azure OpenAI and parse to a dict.
     """
-    if not azure_openai_enabled():
+    body = _structured_request_body(
+        system_prompt=system_prompt,
+        user_prompt=user_prompt,
+        schema_name=schema_name,
+        schema=_normalize_schema_for_azure(response_schema),
+        max_tokens=max_tokens,
+        temperature=temperature,
+        deployment=deployment,
+    )
+    if body is None:
         return None
-    if not _config_valid(deployment):
-        logger.warning("Azure OpenAI provider selected but required env vars are missing")
+
+    return post_chat_completion(
+        body,
+        url=_request_url(deployment),
+        api_key=_api_key(),
+        schema_name=schema_name,
+        parse_content=lambda content: _parse_json_object_content(content, schema_name),
+        cache_key=_request_cache_key(
+            system_prompt, user_prompt, schema_name, temperature, deployment),
+    )
+
+
+async def azure_chat_parse_async(
+    *,
+    system_prompt: str,
+    user_prompt: str,
+    response_model: type[BaseModel],
+    schema_name: str,
+    max_tokens: int = 280,
+    temperature: float = 0.0,
+    deployment: str | None = None,
+) -> BaseModel | None:
+    """Async version of `azure_chat_parse`."""
+    body = _structured_request_body(
+        system_prompt=system_prompt,
+        user_prompt=user_prompt,
+        schema_name=schema_name,
+        schema=_model_schema(response_model),
+        max_tokens=max_tokens,
+        temperature=temperature,
+        deployment=deployment,
+    )
+    if body is None:
         return None
 
-    body = _request_payload(
+    return await post_chat_completion_async(
+        body,
+        url=_request_url(deployment),
+        api_key=_api_key(),
+        schema_name=schema_name,
+        parse_content=lambda content: _parse_model_content(
+            content, schema_name, response_model),
+        cache_key=_request_cache_key(
+            system_prompt, user_prompt, schema_name, temperature, deployment),
+    )
+
+
+async def azure_chat_json_async(
+    *,
+    system_prompt: str,
+    user_prompt: str,
+    response_schema: dict[str, Any],
+    schema_name: str,
+    max_tokens: int = 280,
+    temperature: float = 0.0,
+    deployment: str | None = None,
+) -> dict[str, Any] | None:
+    """Async version of `azure_chat_json`."""
+    body = _structured_request_body(
         system_prompt=system_prompt,
         user_prompt=user_prompt,
+        schema_name=schema_name,
+        schema=_normalize_schema_for_azure(response_schema),
         max_tokens=max_tokens,
         temperature=temperature,
-        response_format={
-            "type": "json_schema",
-            "json_schema": {
-                "name": schema_name,
-                "strict": True,
-                "schema": _normalize_schema_for_azure(response_schema),
-            },
-        },
+        deployment=deployment,
+    )
+    if body is None:
+        return None
+
+    return await post_chat_completion_async(
+        body,
+        url=_request_url(deployment),
+        api_key=_api_key(),
+        schema_name=schema_name,
+        parse_content=lambda content: _parse_json_object_content(content, schema_name),
+        cache_key=_request_cache_key(
+            system_prompt, user_prompt, schema_name, temperature, deployment),
     )
 
-    max_attempts = 3
-    for attempt in range(max_attempts):
-        try:
-            parsed = _make_request(body, deployment)
-            if parsed is None:
-                return None
-            content = _extract_message_content(parsed, schema_name)
-            if content is None:
-                return None
-            parsed_content = _parse_json_object_content(content, schema_name)
-            if parsed_content is not None:
-                return parsed_content
-            if attempt + 1 < max_attempts:
-                logger.warning("Retrying Azure OpenAI JSON parse for schema=%s after malformed structured output", schema_name)
-                time.sleep(_retry_delay_seconds(attempt))
-        except urllib.error.HTTPError as exc:
-            logger.error(
-                "Azure OpenAI HTTP error for schema=%s (status=%s)",
-                schema_name,
-                getattr(exc, "code", "unknown"),
-            )
-            if getattr(exc, "code", None) == 429 and attempt + 1 < max_attempts:
-                logger.warning("Retrying Azure OpenAI request for schema=%s after rate limiting", schema_name)
-                time.sleep(_retry_delay_seconds(attempt, rate_limited=True))
-                continue
-            return None
-        except (urllib.error.URLError, OSError, TimeoutError):
-            logger.exception("Azure OpenAI request failed for schema=%s", schema_name)
-            if attempt + 1 < max_attempts:
-                time.sleep(_retry_delay_seconds(attempt))
-                continue
-            return None
-        except Exception:
-            logger.exception("Azure OpenAI response parsing failed for schema=%s", schema_name)
-            if attempt + 1 < max_attempts:
-                time.sleep(_retry_delay_seconds(attempt))
-                continue
-            return None
-    return None
@@ -1,6 +1,5 @@
 from pydantic import BaseModel, Field
 import os
-from transformers import pipeline
 from src.infrastructure.log.logging import get_logger
 
 logger = get_logger(__name__)
@@ -53,6 +52,9 @@ def _get_commit_classifier():
 
     if _CLASSIFIER_PIPELINE is None:
         try:
+            # transformers pulls in torch, so only import it when a model is needed
+            from transformers import pipeline
+
             model_name = os.environ.get(
                 "ARTIFACT_MINER_COMMIT_CLASSIFIER_MODEL",
                 "facebook/bart-large-mnli"
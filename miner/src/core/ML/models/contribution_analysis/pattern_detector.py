@@ -2,7 +2,6 @@ import os
 from datetime import datetime
 from enum import Enum
 import numpy as np
-from sklearn.cluster import DBSCAN
 from src.infrastructure.log.logging import get_logger
 
 logger = get_logger(__name__)
@@ -32,6 +31,8 @@ class PatternDetector:
             return WorkPattern.SPORADIC
 
         try:
+            from sklearn.cluster import DBSCAN
+
             # Convert to timestamps (seconds since epoch)
             timestamps = np.array([dt.timestamp() for dt in commit_dates]).reshape(-1, 1)
 
@@ -1,6 +1,5 @@
 import os
 from enum import Enum
-from transformers import pipeline
 from src.infrastructure.log.logging import get_logger
 
 logger = get_logger(__name__)
@@ -47,6 +46,9 @@ def _get_role_classifier():
 
     if _ROLE_CLASSIFIER is None:
         try:
+            # transformers pulls in torch, so only import it when a model is needed
+            from transformers import pipeline
+
             model_name = os.environ.get(
                 "ARTIFACT_MINER_ROLE_CLASSIFIER_MODEL",
                 "facebook/bart-large-mnli"
@@ -0,0 +1,257 @@
+"""
+Disk-backed cache for Azure OpenAI responses, plus single-flight
+coalescing so identical prompts that are in flight at the same time only
+hit the network once.
+
+Entries are the raw message content returned by the model, keyed by
+(deployment, system prompt, user prompt, schema name, temperature). The
+store is a small SQLite file; entries expire after a TTL and the least
+recently used entries are evicted once the store grows past a size cap.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+
+from src.infrastructure.log.logging import get_logger
+
+logger = get_logger(__name__)
+
+_DEFAULT_CACHE_PATH = Path(__file__).resolve().parents[3] / "database" / "llm_cache.db"
+_DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+_DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+def llm_cache_enabled() -> bool:
+    """Allow disabling the response cache, e.g. for strict per-run ML checks."""
+    return os.environ.get("ARTIFACT_MINER_LLM_CACHE_DISABLE", "0") != "1"
+
+
+def llm_cache_key(
+    deployment: str,
+    system_prompt: str,
+    user_prompt: str,
+    schema_name: str,
+    temperature: float,
+) -> str:
+    """Create a stable cache key for one chat completion request."""
+    serialized = json.dumps(
+        [deployment.strip(), system_prompt, user_prompt,
+         schema_name, round(float(temperature), 4)],
+        ensure_ascii=True,
+    )
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    SQLite backed key/value store for model output. Every operation opens
+    its own connection, so the cache can be shared across threads.
+    """
+
+    def __init__(self, path: Path, ttl_seconds: float, max_bytes: int):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_response_cache ("
+                " key TEXT PRIMARY KEY,"
+                " content TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_llm_response_cache_last_access"
+                " ON llm_response_cache (last_access)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5.0)
+
+    def get(self, key: str) -> str | None:
+        """Return the cached content for `key`, or None if missing or expired."""
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn, conn:
+                row = conn.execute(
+                    "SELECT content, created_at FROM llm_response_cache WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+
+                content, created_at = row
+                if now - created_at > self.ttl_seconds:
+                    conn.execute(
+                        "DELETE FROM llm_response_cache WHERE key = ?", (key,))
+                    return None
+
+                conn.execute(
+                    "UPDATE llm_response_cache SET last_access = ? WHERE key = ?",
+                    (now, key),
+                )
+                return content
+        except sqlite3.Error:
+            logger.exception("LLM response cache read failed")
+            return None
+
+    def put(self, key: str, content: str) -> None:
+        """Store `content` under `key`, then evict expired and LRU entries."""
+        now = time.time()
+        size = len(content.encode("utf-8"))
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_response_cache"
+                    " (key, content, size, created_at, last_access)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (key, content, size, now, now),
+                )
+                self._evict(conn, now)
+        except sqlite3.Error:
+            logger.exception("LLM response cache write failed")
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        conn.execute(
+            "DELETE FROM llm_response_cache WHERE created_at < ?",
+            (now - self.ttl_seconds,),
+        )
+
+        total = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM llm_response_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        to_delete: list[str] = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM llm_response_cache ORDER BY last_access ASC"
+        ):
+            if total <= self.max_bytes:
+                break
+            to_delete.append(key)
+            total -= size
+
+        conn.executemany(
+            "DELETE FROM llm_response_cache WHERE key = ?",
+            [(key,) for key in to_delete],
+        )
+
+    def clear(self) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM llm_response_cache")
+
+    def stats(self) -> dict[str, int]:
+        with closing(self._connect()) as conn:
+            entries, total = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_response_cache"
+            ).fetchone()
+        return {"entries": entries, "bytes": total}
+
+
+_CACHE_LOCK = threading.Lock()
+_CACHE: LLMResponseCache | None = None
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Return the shared response cache, configured from `ARTIFACT_MINER_LLM_CACHE_*`."""
+    global _CACHE
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            path = os.environ.get("ARTIFACT_MINER_LLM_CACHE_PATH") or _DEFAULT_CACHE_PATH
+            try:
+                ttl = float(os.environ.get(
+                    "ARTIFACT_MINER_LLM_CACHE_TTL_SECONDS", _DEFAULT_TTL_SECONDS))
+                max_bytes = int(os.environ.get(
+                    "ARTIFACT_MINER_LLM_CACHE_MAX_BYTES", _DEFAULT_MAX_BYTES))
+            except ValueError:
+                ttl, max_bytes = _DEFAULT_TTL_SECONDS, _DEFAULT_MAX_BYTES
+            _CACHE = LLMResponseCache(Path(path), ttl, max_bytes)
+        return _CACHE
+
+
+def reset_llm_cache() -> None:
+    """Forget the shared cache so the next call re-reads its settings."""
+    global _CACHE
+    with _CACHE_LOCK:
+        _CACHE = None
+
+
+class _Flight:
+    """One in-flight request that followers can wait on."""
+
+    def __init__(self):
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+        self._waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self.content: str | None = None
+
+    def wait(self, timeout: float | None = None) -> str | None:
+        self._done.wait(timeout)
+        return self.content
+
+    async def wait_async(self) -> str | None:
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        with self._lock:
+            if self._done.is_set():
+                return self.content
+            self._waiters.append((loop, waiter))
+        await waiter
+        return self.content
+
+    def finish(self, content: str | None) -> None:
+        with self._lock:
+            self.content = content
+            self._done.set()
+            waiters, self._waiters = self._waiters, []
+        # Followers may be on other threads' loops
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:
+                pass  # Its loop has closed, nobody is waiting any more
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent work for the same key. The first caller becomes
+    the leader and does the work; later callers wait for the leader's
+    result instead of repeating it. Works across threads and event loops.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: dict[str, _Flight] = {}
+
+    def join(self, key: str) -> tuple[_Flight, bool]:
+        """Return the flight for `key` and whether the caller is its leader."""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                return flight, False
+            flight = _Flight()
+            self._flights[key] = flight
+            return flight, True
+
+    def finish(self, key: str, content: str | None) -> None:
+        with self._lock:
+            flight = self._flights.pop(key, None)
+        if flight is not None:
+            flight.finish(content)
@@ -214,9 +214,11 @@ class BaseFileAnalyzer:
         metadata = None
         metadata = Path(self.filepath).stat()
 
+        # These values come straight from os.stat/datetime, so their types
+        # are known and the Statistic type check can be skipped.
         stats = [
-            Statistic(FileStatCollection.FILE_SIZE_BYTES.value,
-                      metadata.st_size)
+            Statistic.trusted(FileStatCollection.FILE_SIZE_BYTES.value,
+                              metadata.st_size)
         ]
 
         if self.is_git_tracked:
@@ -234,9 +236,9 @@ class BaseFileAnalyzer:
                 first_commit = commits[-1]
                 latest_commit = commits[0]
 
-                stats.append(Statistic(FileStatCollection.DATE_CREATED.value, datetime.datetime.fromtimestamp(
+                stats.append(Statistic.trusted(FileStatCollection.DATE_CREATED.value, datetime.datetime.fromtimestamp(
                     first_commit.authored_date)))
-                stats.append(Statistic(FileStatCollection.DATE_MODIFIED.value, datetime.datetime.fromtimestamp(
+                stats.append(Statistic.trusted(FileStatCollection.DATE_MODIFIED.value, datetime.datetime.fromtimestamp(
                     latest_commit.authored_date)))
         else:
             # Fallback to filesystem metadata
@@ -251,8 +253,8 @@ class BaseFileAnalyzer:
             """
 
             stats.append(
-                Statistic(FileStatCollection.DATE_CREATED.value, self.created_at))
-            stats.append(Statistic(FileStatCollection.DATE_MODIFIED.value, datetime.datetime.fromtimestamp(
+                Statistic.trusted(FileStatCollection.DATE_CREATED.value, self.created_at))
+            stats.append(Statistic.trusted(FileStatCollection.DATE_MODIFIED.value, datetime.datetime.fromtimestamp(
                 metadata.st_mtime)))
 
         self.stats.extend(stats)
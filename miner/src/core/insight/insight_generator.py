@@ -2,8 +2,9 @@
 Generates human-readable project insights from an existing ProjectReport.
 
 Insights are prompts designed to help a user reflect on their contributions
-when editing their resume. They are derived at request time from already-mined
-statistics — no new mining or database writes are needed.
+when editing their resume. They are derived from already-mined statistics —
+no new mining is needed — and each one records the calculator that produced
+it and whether that calculator reads ML-inferred statistics.
 """
 
 from dataclasses import dataclass
@@ -23,9 +24,16 @@ if TYPE_CHECKING:
 @dataclass
 class ProjectInsight:
     message: str
+    # Name of the InsightCalculator that produced the message
+    source: str = ""
+    uses_ml: bool = False
 
 
 class InsightCalculator(ABC):
+    # Whether the calculator reads statistics inferred by ML models, so its
+    # insights must be hidden from users who have not consented to ML
+    uses_ml: bool = False
+
     @abstractmethod
     def calculate(self, report: "ProjectReport") -> list[ProjectInsight]:
         """
@@ -160,6 +168,8 @@ class OwnershipInsightCalculator(InsightCalculator):
 class CollaborationInsightCalculator(InsightCalculator):
     """Prompts about team dynamics and the user's role."""
 
+    uses_ml = True
+
     def calculate(self, report: "ProjectReport") -> list[ProjectInsight]:
         is_group = report.get_value(
             ProjectStatCollection.IS_GROUP_PROJECT.value)
@@ -256,6 +266,8 @@ class SkillsInsightCalculator(InsightCalculator):
 class ReadmeNarrativeInsightCalculator(InsightCalculator):
     """Prompts the user to translate README-level ML signals into resume language."""
 
+    uses_ml = True
+
     def calculate(self, report: "ProjectReport") -> list[ProjectInsight]:
         themes = report.get_value(ProjectStatCollection.PROJECT_THEMES.value) or []
         tags = report.get_value(ProjectStatCollection.PROJECT_TAGS.value) or []
@@ -300,6 +312,8 @@ class ReadmeNarrativeInsightCalculator(InsightCalculator):
 class CommitFocusInsightCalculator(InsightCalculator):
     """Prompts based on the dominant ML-inferred commit focus for the project."""
 
+    uses_ml = True
+
     def calculate(self, report: "ProjectReport") -> list[ProjectInsight]:
         distribution = report.get_value(
             ProjectStatCollection.COMMIT_TYPE_DISTRIBUTION.value
@@ -356,6 +370,8 @@ class CommitFocusInsightCalculator(InsightCalculator):
 class WorkPatternInsightCalculator(InsightCalculator):
     """Prompts based on detected work cadence."""
 
+    uses_ml = True
+
     def calculate(self, report: "ProjectReport") -> list[ProjectInsight]:
         pattern = report.get_value(ProjectStatCollection.WORK_PATTERN.value)
         if not pattern:
@@ -428,7 +444,9 @@ class InsightGenerator:
         for calc in calculators:
             # Calculate returns a list of insights
             generated_insights = calc.calculate(report)
-            if generated_insights:
-                all_insights.extend(generated_insights)
+            for insight in generated_insights or []:
+                insight.source = type(calc).__name__
+                insight.uses_ml = calc.uses_ml
+                all_insights.append(insight)
 
         return all_insights
@@ -2,6 +2,7 @@
 Standalone project summary builder used by the project card service.
 
 This module provides build_project_summary(project_report) -> str | None,
+and build_project_summaries(project_reports) for many projects at once,
 extracted from the former ProjectSummariesSectionBuilder so the summary
 logic is available outside of the portfolio section system.
 """
@@ -71,6 +72,23 @@ def build_project_summary(project_report) -> str | None:
     return None
 
 
+def build_project_summaries(project_reports) -> list[str | None]:
+    """
+    Build summaries for several projects, running the per-project LLM calls
+    concurrently within the Azure runtime's concurrency budget.
+
+    The result lines up with `project_reports`; a None report, or a project
+    whose summary fails, gets None.
+    """
+    from src.core.ML.models.azure_openai_runtime import run_llm_batch
+
+    return run_llm_batch(
+        lambda report: build_project_summary(report) if report is not None else None,
+        list(project_reports),
+        task_name="project_summary",
+    )
+
+
 def configure_summary_run(project_count: int) -> None:
     """Forward project count to the ML layer for batch configuration."""
     configure_project_summary_run(project_count)
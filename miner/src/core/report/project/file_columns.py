@@ -0,0 +1,139 @@
+"""
+This file defines `FileColumns`, a column-oriented view of a project's
+file reports.
+
+The project calculators used to each walk `report.file_reports` and call
+`get_value` once per file and statistic. `FileColumns` reads every
+file-level statistic they need in one pass and keeps each as a NumPy
+array, so the calculators can reduce over whole columns instead.
+"""
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.core.statistic import FileStatCollection
+
+# Looked up once, since reading an Enum member's `.value` is not free
+_TEMPLATES = (
+    FileStatCollection.FILE_SIZE_BYTES.value,
+    FileStatCollection.LINES_IN_FILE.value,
+    FileStatCollection.CODING_LANGUAGE.value,
+    FileStatCollection.TYPE_OF_FILE.value,
+    FileStatCollection.DATE_CREATED.value,
+    FileStatCollection.DATE_MODIFIED.value,
+    FileStatCollection.PERCENTAGE_LINES_COMMITTED.value,
+    FileStatCollection.IMPORTED_PACKAGES.value,
+)
+
+
+class FileColumns:
+    """
+    One array per file-level statistic, all aligned by file index.
+
+    Missing numbers are `NaN`, missing dates are `NaT` and missing lists
+    are `None`. Enum columns (`language`, `domain`) hold integer codes into
+    `languages`/`domains`, with -1 for a missing value, so grouping by them
+    never has to hash the enum members again.
+    """
+
+    def __init__(self, file_reports: list):
+        self.file_reports = file_reports
+
+        filepaths: list[str] = []
+        is_info: list[bool] = []
+        sizes: list[Any] = []
+        lines: list[Any] = []
+        languages: list[Any] = []
+        domains: list[Any] = []
+        created: list[Any] = []
+        modified: list[Any] = []
+        commit_pcts: list[Any] = []
+        packages: list[Any] = []
+
+        size_t, lines_t, language_t, domain_t, created_t, modified_t, commit_t, packages_t = \
+            _TEMPLATES
+        for fr in file_reports:
+            get = fr.statistics.get_value
+            filepaths.append(fr.filepath)
+            is_info.append(fr.is_info_file is True)
+            sizes.append(get(size_t))
+            lines.append(get(lines_t))
+            languages.append(get(language_t))
+            domains.append(get(domain_t))
+            created.append(get(created_t))
+            modified.append(get(modified_t))
+            commit_pcts.append(get(commit_t))
+            packages.append(get(packages_t))
+
+        self.filepath = _object_column(filepaths)
+        self.is_info = np.array(is_info, dtype=bool)
+        self.size = _float_column(sizes)
+        self.lines = _float_column(lines)
+        self.language, self.languages = _code_column(languages)
+        self.domain, self.domains = _code_column(domains)
+        self.created = _date_column(created)
+        self.modified = _date_column(modified)
+        self.commit_pct = _float_column(commit_pcts)
+        self.packages = _object_column(packages)
+
+    def __len__(self) -> int:
+        return len(self.filepath)
+
+    def is_stale(self, file_reports: list) -> bool:
+        """Whether this view no longer matches `file_reports`."""
+        return file_reports is not self.file_reports or len(file_reports) != len(self)
+
+
+def _float_column(values: list) -> np.ndarray:
+    # NumPy stores None as NaN in a float array
+    return np.array(values, dtype=np.float64)
+
+
+def _object_column(values: list) -> np.ndarray:
+    # Filled element by element so lists stay single cells instead of
+    # becoming a second array dimension
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def _date_column(values: list) -> np.ndarray:
+    try:
+        # pandas parses datetime objects far faster than np.array does
+        return pd.DatetimeIndex(values).to_numpy(dtype="datetime64[us]")
+    except (ValueError, TypeError):
+        # Mixed timezone awareness or out of pandas' range
+        return np.array(values, dtype="datetime64[us]")
+
+
+def _code_column(values: list) -> tuple[np.ndarray, np.ndarray]:
+    codes, uniques = pd.factorize(_object_column(values))
+    return codes, np.asarray(uniques, dtype=object)
+
+
+def group_sum(codes: np.ndarray, labels: np.ndarray, values) -> dict[Any, float]:
+    """
+    Sum `values` per code of an enum column (rows with code -1 are left
+    out). Labels come back in the order their codes first appear in
+    `codes`, so callers that need a particular key order pass the rows in
+    that order.
+    """
+    values = np.broadcast_to(np.asarray(values, dtype=np.float64), codes.shape)
+    present = codes >= 0
+    codes, values = codes[present], values[present]
+    if codes.size == 0:
+        return {}
+
+    sums = np.bincount(codes, weights=values, minlength=len(labels))
+    seen, first_row = np.unique(codes, return_index=True)
+    return {labels[code]: sums[code].item() for code in seen[np.argsort(first_row)]}
+
+
+def count_per_key(keys: np.ndarray) -> dict[Any, int]:
+    """Count occurrences of each key, in first-appearance order."""
+    if len(keys) == 0:
+        return {}
+    counts = pd.Series(keys).value_counts(sort=False)
+    return dict(zip(counts.index, counts.to_numpy().tolist()))
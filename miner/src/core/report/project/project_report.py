@@ -4,17 +4,22 @@ This file defines the ProjectReport class
 
 from typing import Optional
 from pathlib import Path
+import copy
 import re
+import numpy as np
 from git import Repo
 from datetime import datetime, date
 from typing import Type
 
 from src.core.report.base_report import BaseReport
 from src.core.report.file_report import FileReport
-from src.core.statistic import StatisticIndex, ProjectStatCollection, FileStatCollection
+from src.core.report.project.file_columns import FileColumns
+from src.core.statistic import StatisticIndex, ProjectStatCollection
 from src.core.resume.bullet_point_builder import BulletPointBuilder
 from src.core.resume.resume import ResumeItem
 
+_MAX_CACHED_RESUME_ITEMS = 1024
+
 
 class ProjectReport(BaseReport):
     """
@@ -27,6 +32,8 @@ class ProjectReport(BaseReport):
     """
 
     bullet_builder = BulletPointBuilder()
+    # (project name, statistics fingerprint, bullet builder context) -> item
+    _RESUME_ITEM_CACHE: dict[tuple, ResumeItem] = {}
 
     @staticmethod
     def _get_base_project_name(project_name: str) -> str:
@@ -61,6 +68,7 @@ class ProjectReport(BaseReport):
         the `project_report` table!
         """
         self.file_reports = file_reports or []
+        self._file_columns: Optional[FileColumns] = None
         self.project_name = project_name or "Unknown Project"
         self.project_path = project_path or "Unknown Path"
         self.project_repo = project_repo
@@ -91,6 +99,17 @@ class ProjectReport(BaseReport):
             calculator_classes=calculator_classes)
         builder.build(self)
 
+    @property
+    def file_columns(self) -> FileColumns:
+        """
+        Column view of `self.file_reports`, built on first use and rebuilt
+        if the file report list is replaced or changes length.
+        """
+        columns = getattr(self, "_file_columns", None)
+        if columns is None or columns.is_stale(self.file_reports):
+            columns = self._file_columns = FileColumns(self.file_reports)
+        return columns
+
     def get_project_weight(self) -> float:
         """
         Ranks the project using a linear combination of lines of code, date range, and individual contribution.
@@ -100,10 +119,7 @@ class ProjectReport(BaseReport):
         # Lines normalization
         total_lines = 0.0
         if self.file_reports:
-            total_lines = sum(
-                report.get_value(FileStatCollection.LINES_IN_FILE.value) or 0.0
-                for report in self.file_reports
-            )
+            total_lines = float(np.nansum(self.file_columns.lines))
         norm_lines = min(total_lines / 500.0, 1.0) if total_lines > 0 else 0.0
 
         # Date range normalization (assume 1 year = 1.0 weight)
@@ -140,13 +156,36 @@ class ProjectReport(BaseReport):
         """
         Generates a `ResumeItem` from the project report statistics.
 
+        Items are cached by project name and statistics fingerprint, so a
+        project whose statistics have not changed skips the bullet point
+        rules. Each call returns its own copy.
+
         Args:
             title: Title of the resume item
             bullet_points: List of bullet points describing the project
             start_date: Start date of the project
             end_date: End date of the project
         """
-
+        cache = ProjectReport._RESUME_ITEM_CACHE
+        key = (self.project_name, self.project_statistics.fingerprint(),
+               self.bullet_builder.context())
+
+        item = cache.get(key)
+        if item is None:
+            item = self._build_resume_item()
+            # Start over rather than grow without bound
+            if len(cache) >= _MAX_CACHED_RESUME_ITEMS:
+                cache.clear()
+            cache[key] = item
+
+        return copy.deepcopy(item)
+
+    @classmethod
+    def clear_resume_item_cache(cls) -> None:
+        """Forget the cached resume items, e.g. after changing the bullet rules."""
+        cls._RESUME_ITEM_CACHE.clear()
+
+    def _build_resume_item(self) -> ResumeItem:
         start_date = self.get_value(
             ProjectStatCollection.PROJECT_START_DATE.value)
         end_date = self.get_value(
@@ -12,10 +12,13 @@ from typing import List, Type
 import os
 import json
 import re
+import numpy as np
+import pandas as pd
 from pathlib import Path
 from src.core.statistic import Statistic, FileStatCollection, ProjectStatCollection, WeightedSkills
 from src.core.report import ProjectReport
 from src.core.report.statistic_builder import StatisticCalculation, StatisticReportBuilder
+from src.core.report.project.file_columns import count_per_key, group_sum
 from src.core.ML.models.azure_foundry_manager import AzureFoundryManager, azure_openai_enabled
 from src.core.statistic.skills import SkillMapper
 from datetime import datetime, timedelta, MINYEAR
@@ -41,38 +44,28 @@ class ProjectDates(ProjectStatisticCalculation):
     """
 
     def calculate(self, report: ProjectReport) -> list[Statistic]:
+        columns = report.file_columns
+
         # Set the value to 1 day in the future
         latest_date = datetime.now() + timedelta(days=1)
         earliest_date = datetime(MINYEAR, 1, 1, 0, 0, 0, 0)
 
-        start_date = latest_date
-        end_date = earliest_date
-
-        for file_report in report.file_reports:
-            curr_start_date = file_report.get_value(
-                FileStatCollection.DATE_CREATED.value)
-            curr_end_date = file_report.get_value(
-                FileStatCollection.DATE_MODIFIED.value)
-
-            # curr_start_date and curr_end_date are always datetime; if not, let comparison throw an error
-
-            if curr_start_date and curr_start_date < start_date:
-                start_date = curr_start_date
-
-            if curr_end_date and curr_end_date > end_date:
-                end_date = curr_end_date
+        created = columns.created[~np.isnat(columns.created)]
+        modified = columns.modified[~np.isnat(columns.modified)]
 
         to_return = []
 
-        if end_date != earliest_date:
-            project_end_stat = Statistic(
-                ProjectStatCollection.PROJECT_END_DATE.value, end_date)
-            to_return.append(project_end_stat)
+        if modified.size:
+            end_date = modified.max().item()
+            if end_date > earliest_date:
+                to_return.append(Statistic(
+                    ProjectStatCollection.PROJECT_END_DATE.value, end_date))
 
-        if start_date != latest_date:
-            project_start_stat = Statistic(
-                ProjectStatCollection.PROJECT_START_DATE.value, start_date)
-            to_return.append(project_start_stat)
+        if created.size:
+            start_date = created.min().item()
+            if start_date < latest_date:
+                to_return.append(Statistic(
+                    ProjectStatCollection.PROJECT_START_DATE.value, start_date))
 
         return to_return
 
@@ -87,60 +80,45 @@ class CodingLanguageRatio(ProjectStatisticCalculation):
     """
 
     def calculate(self, report: ProjectReport) -> list[Statistic]:
-        langauges_to_bytes = {}
-
-        # Track files by (filename, file_size) to detect true duplicates
-        seen_file_signatures = {}
-
-        # Sort file_reports to prioritize non-database paths
-        sorted_reports = sorted(
-            report.file_reports,
-            key=lambda r: (
-                'database' in str(r.filepath).lower(),
-                str(r.filepath)
-            )
-        )
-
-        # Map coding language to file sizes in bytes
-        for file_report in sorted_reports:
-            coding_language = file_report.get_value(
-                FileStatCollection.CODING_LANGUAGE.value)
-
-            if coding_language is None:
-                continue
+        columns = report.file_columns
 
-            # Use file-level statistics instead of os.path.getsize
-            file_size = file_report.get_value(
-                FileStatCollection.FILE_SIZE_BYTES.value)
-            if file_size is None:
-                # Fallback to line count if bytes not available
-                file_size = file_report.get_value(
-                    FileStatCollection.LINES_IN_FILE.value)
-            if file_size is None:
-                # Last resort: count as 1 byte
-                file_size = 1
-
-            # Create a signature to detect true duplicates
-            # Only skip if BOTH filename AND size match (likely a database export duplicate)
-            filepath_lower = str(file_report.filepath).lower()
-            path_parts = filepath_lower.replace('\\', '/').split('/')
-            filename = path_parts[-1] if path_parts else ''
-            file_signature = (filename, file_size)
-
-            if file_signature in seen_file_signatures:
-                # This is likely a duplicate database export - skip it
-                continue
+        has_language = columns.language >= 0
+        if not has_language.any():
+            return []
 
-            # Mark this file signature as seen
-            seen_file_signatures[file_signature] = file_report.filepath
-
-            if file_size > 0:
-                langauges_to_bytes[coding_language] = langauges_to_bytes.get(
-                    coding_language, 0) + file_size
-            else:
-                # Count empty files as 1 byte (test files are often empty)
-                langauges_to_bytes[coding_language] = langauges_to_bytes.get(
-                    coding_language, 0) + 1
+        # Use file-level statistics instead of os.path.getsize, falling back
+        # to the line count and, as a last resort, to 1 byte
+        file_size = columns.size[has_language]
+        file_size = np.where(np.isnan(file_size),
+                             columns.lines[has_language], file_size)
+        file_size = np.where(np.isnan(file_size), 1, file_size)
+
+        paths = [str(path) for path in columns.filepath[has_language]]
+        files = pd.DataFrame({
+            "filename": [path.lower().replace('\\', '/').rsplit('/', 1)[-1] for path in paths],
+            "size": file_size,
+        })
+
+        # Only skip a file if BOTH filename AND size match another one (likely
+        # a database export duplicate). Of each duplicate group, keep the copy
+        # outside of a database path, then the first by path.
+        keep = ~files.duplicated(["filename", "size"], keep=False).to_numpy()
+        if not keep.all():
+            duplicates = files[~keep].assign(path=[paths[i] for i in np.flatnonzero(~keep)])
+            duplicates["in_database"] = duplicates["path"].str.lower().str.contains(
+                "database", regex=False)
+            duplicates = duplicates.sort_values(["in_database", "path"], kind="stable")
+            keep[duplicates.drop_duplicates(["filename", "size"]).index] = True
+
+        # Count empty files as 1 byte (test files are often empty)
+        byte_counts = np.where(file_size > 0, file_size, 1)
+        # Sum in (outside a database path first, then by path) order, so the
+        # languages come out in the order of their first such file
+        in_database = np.array(["database" in path.lower() for path in paths])
+        order = np.lexsort((np.array(paths, dtype=object), in_database))
+        order = order[keep[order]]
+        langauges_to_bytes = group_sum(
+            columns.language[has_language][order], columns.languages, byte_counts[order])
 
         if len(langauges_to_bytes) == 0:
             return []
@@ -227,19 +205,7 @@ class ProjectWeightedSkills(ProjectStatisticCalculation):
         return skill_activity
 
     def calculate(self, report: ProjectReport) -> list[Statistic]:
-
-        def count_one_per_file(counter: dict, fileset: dict, key: str, filepath: str):
-            """
-            Increments `counter[key]` only once per filepath.
-            Ensures high-level skills are deduped per file.
-            """
-            if key not in fileset:
-                fileset[key] = set()
-
-            if filepath not in fileset[key]:
-                fileset[key].add(filepath)
-                counter[key] = counter.get(key, 0) + 1
-
+        columns = report.file_columns
         dirnames = report._get_sub_dirs()
 
         non_user_authors_by_file: dict[str, int] = {}
@@ -253,85 +219,52 @@ class ProjectWeightedSkills(ProjectStatisticCalculation):
             except Exception:
                 non_user_authors_by_file = {}
 
-        # High-level skill tracking (deduped per file)
-        high_level_skill_counter: dict[str, int] = {}
-        high_level_skill_files: dict[str, set] = {}
-
-        group_high_level_skill_counter: dict[str, int] = {}
-        group_high_level_skill_files: dict[str, set] = {}
-
-        project_framework_counter: dict[str, int] = {}
-        project_framework_files: dict[str, set] = {}
-
-        group_project_framework_counter: dict[str, int] = {}
-        group_project_framework_files: dict[str, set] = {}
-
-        for file_report in report.file_reports:
-            imported_packages: Optional[list[str]] = file_report.get_value(
-                FileStatCollection.IMPORTED_PACKAGES.value
-            )
-
-            # 1. Skill from filename (e.g., Dockerfile → DevOps)
-            file_skill = SkillMapper.map_filepath_to_skill(
-                file_report.filepath)
-            is_group_file = True if non_user_authors_by_file.get(
-                file_report.filepath, 0) >= 1 else False
-            if file_skill:
-                count_one_per_file(
-                    high_level_skill_counter,
-                    high_level_skill_files,
-                    file_skill.value,
-                    file_report.filepath
-                )
-                if is_group_file:
-                    count_one_per_file(
-                        group_high_level_skill_counter,
-                        group_high_level_skill_files,
-                        file_skill.value,
-                        file_report.filepath
-                    )
-
-            if imported_packages is None or imported_packages == []:
-                continue
-
-            for package in imported_packages:
-
-                if package == "app" or package in dirnames:
-                    continue
-
-                count_one_per_file(
-                    project_framework_counter,
-                    project_framework_files,
-                    package,
-                    file_report.filepath
-                )
-                if is_group_file:
-                    count_one_per_file(
-                        group_project_framework_counter,
-                        group_project_framework_files,
-                        package,
-                        file_report.filepath
-                    )
+        is_group_file = np.fromiter(
+            (non_user_authors_by_file.get(path, 0) >= 1 for path in columns.filepath),
+            dtype=bool, count=len(columns))
+
+        # Frameworks: one row per (file, imported package), deduped per file
+        imports = pd.Series(columns.packages, dtype=object).explode().dropna()
+        imports = imports[(imports != "app") & ~imports.isin(list(dirnames))]
+        frameworks = pd.DataFrame({
+            "file": imports.index.to_numpy(dtype=np.int64),
+            "name": imports.to_numpy(),
+        }).drop_duplicates()
+
+        # High-level skills: one row per (file, skill), deduped per file. A
+        # file's own skill (e.g., Dockerfile → DevOps) comes before the skills
+        # of its imports, so skills are counted in the order files show them.
+        package_skills = {}
+        for package in frameworks["name"].unique():
+            package_skill = SkillMapper.map_package_to_skill(package)
+            if package_skill:
+                package_skills[package] = package_skill.value
+
+        file_skills = [SkillMapper.map_filepath_to_skill(path)
+                       for path in columns.filepath]
+        skills = pd.concat([
+            pd.DataFrame({
+                "file": np.arange(len(columns), dtype=np.int64),
+                "order": -1,
+                "name": [skill.value if skill else None for skill in file_skills],
+            }),
+            pd.DataFrame({
+                "file": frameworks["file"].to_numpy(),
+                "order": np.arange(len(frameworks)),
+                "name": frameworks["name"].map(package_skills).to_numpy(),
+            }),
+        ]).dropna(subset=["name"])
+        skills = skills.sort_values(["file", "order"], kind="stable")
+        skills = skills.drop_duplicates(["file", "name"])
 
-                package_skill = SkillMapper.map_package_to_skill(package)
-                if package_skill:
-                    count_one_per_file(
-                        high_level_skill_counter,
-                        high_level_skill_files,
-                        package_skill.value,
-                        file_report.filepath
-                    )
-                    if is_group_file:
-                        count_one_per_file(
-                            group_high_level_skill_counter,
-                            group_high_level_skill_files,
-                            package_skill.value,
-                            file_report.filepath
-                        )
         to_return = []
 
-        def _add_weighted_stat(stat_key, counter: dict) -> None:
-            """Adds a weighted `Statistic` entry if the counter has values."""
+        def _add_weighted_stat(stat_key, rows: pd.DataFrame, group_only: bool = False) -> None:
+            """Adds a weighted `Statistic` entry if any file demonstrates a name."""
+            if group_only:
+                rows = rows[is_group_file[rows["file"].to_numpy()]]
+
+            counter = count_per_key(rows["name"].to_numpy())
             if not counter:
                 return
 
@@ -345,22 +278,24 @@ class ProjectWeightedSkills(ProjectStatisticCalculation):
 
         _add_weighted_stat(
             ProjectStatCollection.PROJECT_SKILLS_DEMONSTRATED.value,
-            high_level_skill_counter
+            skills
         )
 
         _add_weighted_stat(
             ProjectStatCollection.PROJECT_FRAMEWORKS.value,
-            project_framework_counter
+            frameworks
         )
 
         _add_weighted_stat(
             ProjectStatCollection.GROUP_PROJECT_SKILLS_DEMONSTRATED.value,
-            group_high_level_skill_counter
+            skills,
+            group_only=True
         )
 
         _add_weighted_stat(
             ProjectStatCollection.GROUP_PROJECT_FRAMEWORKS.value,
-            group_project_framework_counter
+            frameworks,
+            group_only=True
         )
 
         to_return.append(Statistic(ProjectStatCollection.PROJECT_SKILL_ACTIVITY.value,
@@ -671,44 +606,28 @@ class ProjectActivityTypeContributions(ProjectStatisticCalculation):
     """
 
     def calculate(self, report: ProjectReport) -> list[Statistic]:
-        activity_type_to_lines = {}
-        average_activity_type_to_lines = {}
+        columns = report.file_columns
 
         git_analysis = True if report.email and report.project_repo else False
 
-        for fr in report.file_reports:
-            file_domain = fr.get_value(FileStatCollection.TYPE_OF_FILE.value)
-
-            lines_in_file = fr.get_value(
-                FileStatCollection.LINES_IN_FILE.value)
-
-            if not file_domain or not lines_in_file:
-                continue
-
-            if fr.is_info_file:
-                continue
-
-            percent = 1
-
-            # If git analysis, check to see if the user has contributed
-            # if so, take that percent. Else, that file is local and assume
-            # they contributed to it themeseleves
-            if git_analysis:
-                percent_lines_commited = fr.get_value(
-                    FileStatCollection.PERCENTAGE_LINES_COMMITTED.value)
-
-                if percent_lines_commited is not None:
-                    percent = percent_lines_commited / 100
-
-            prev_lines = activity_type_to_lines.get(file_domain, 0)
-
-            activity_type_to_lines[file_domain] = prev_lines + \
-                lines_in_file * percent
-
-            prev_count = average_activity_type_to_lines.get(file_domain, 0)
-
-            average_activity_type_to_lines[file_domain] = prev_count + \
-                lines_in_file
+        # Skip info files and files without a domain or without lines
+        counted = (columns.domain >= 0) & (np.nan_to_num(columns.lines) != 0) \
+            & ~columns.is_info
+        domains = columns.domain[counted]
+        lines_in_file = columns.lines[counted]
+
+        # If git analysis, take the user's share of each file they committed
+        # to. Else, that file is local and assume they wrote all of it
+        percent = 1.0
+        if git_analysis:
+            percent_lines_commited = columns.commit_pct[counted]
+            percent = np.where(np.isnan(percent_lines_commited),
+                               1.0, percent_lines_commited / 100)
+
+        activity_type_to_lines = group_sum(
+            domains, columns.domains, lines_in_file * percent)
+        average_activity_type_to_lines = group_sum(
+            domains, columns.domains, lines_in_file)
 
         normalize(activity_type_to_lines)
         normalize(average_activity_type_to_lines)
@@ -878,20 +797,65 @@ class ProjectContributionPatterns(ProjectStatisticCalculation):
         logger.info(
             f"ProjectContributionPatterns.calculate called for {report.project_name}")
 
+        facts = self._build_facts(report)
+        if facts is None:
+            return []
+
+        try:
+            return self._to_statistics(report, self._request(facts))
+        except Exception as e:
+            logger.error(
+                f"Azure contribution pattern analysis failed for {report.project_name}: {e}",
+                exc_info=True
+            )
+            return []
+
+    @classmethod
+    def calculate_many(cls, reports: list[ProjectReport]) -> list[list[Statistic]]:
+        """
+        Run the analysis for several projects at once. Facts are collected
+        serially (GitPython repos are not thread safe), then the Azure calls
+        run concurrently within the runtime's shared concurrency budget.
+        The returned lists line up with `reports`, and every report has its
+        statistics added to `project_statistics`. A project whose call fails
+        simply gets no statistics.
+        """
+        from src.core.ML.models.azure_openai_runtime import run_llm_batch
+
+        calculator = cls()
+        facts_by_report = [calculator._build_facts(report) for report in reports]
+        pending = [i for i, facts in enumerate(facts_by_report) if facts is not None]
+
+        responses = run_llm_batch(
+            lambda i: calculator._request(facts_by_report[i]),
+            pending,
+            task_name="contribution_patterns",
+        )
+
+        results: list[list[Statistic]] = [[] for _ in reports]
+        for i, response in zip(pending, responses):
+            stats = calculator._to_statistics(reports[i], response)
+            if stats:
+                reports[i].project_statistics.extend(stats)
+            results[i] = stats
+        return results
+
+    def _build_facts(self, report: ProjectReport) -> Optional[dict]:
+        """Collect the facts payload for the LLM, or None if the analysis should be skipped."""
         if not report.project_repo or not report.email:
             logger.info(
                 "Skipping contribution pattern analysis: no repo or email")
-            return []
+            return None
 
         if not ml_extraction_allowed():
             logger.info(
                 "Skipping contribution pattern analysis: ML consent not granted")
-            return []
+            return None
 
         if not azure_openai_enabled():
             logger.info(
                 "Skipping contribution pattern analysis: Azure OpenAI disabled")
-            return []
+            return None
 
         try:
             user_commits = [
@@ -901,93 +865,97 @@ class ProjectContributionPatterns(ProjectStatisticCalculation):
                     or (report.github and is_github_noreply(getattr(c.author, "email", "") or "", report.github))
                 )
             ]
+        except Exception as e:
+            logger.error(
+                f"Could not read commits for {report.project_name}: {e}",
+                exc_info=True
+            )
+            return None
 
-            if not user_commits:
-                logger.info(
-                    f"No commits found for {report.email} in {report.project_name}")
-                return []
-
-            # Extract context for the LLM
-            user_commit_pct = report.get_value(
-                ProjectStatCollection.USER_COMMIT_PERCENTAGE.value)
-            total_authors = report.get_value(
-                ProjectStatCollection.TOTAL_AUTHORS.value) or 1
-            is_group = report.get_value(
-                ProjectStatCollection.IS_GROUP_PROJECT.value) or False
-
-            # Cap commits to avoid token limit bloat (e.g., take the most recent 100)
-            # You can adjust this limit based on your Azure deployment's context window.
-            commit_data = [
-                {
-                    "message": c.message.strip(),
-                    "date": str(datetime.fromtimestamp(c.authored_date))
-                }
-                for c in user_commits[:100]
-            ]
+        if not user_commits:
+            logger.info(
+                f"No commits found for {report.email} in {report.project_name}")
+            return None
 
-            # Assemble the facts payload
-            facts = {
-                "project_name": report.project_name,
-                "user_email": report.email,
-                "user_commit_percentage": user_commit_pct,
-                "total_authors": total_authors,
-                "is_group_project": is_group,
-                "total_user_commits_analyzed": len(commit_data),
-                "commits_sample": commit_data
+        # Extract context for the LLM
+        user_commit_pct = report.get_value(
+            ProjectStatCollection.USER_COMMIT_PERCENTAGE.value)
+        total_authors = report.get_value(
+            ProjectStatCollection.TOTAL_AUTHORS.value) or 1
+        is_group = report.get_value(
+            ProjectStatCollection.IS_GROUP_PROJECT.value) or False
+
+        # Cap commits to avoid token limit bloat (e.g., take the most recent 100)
+        # You can adjust this limit based on your Azure deployment's context window.
+        commit_data = [
+            {
+                "message": c.message.strip(),
+                "date": str(datetime.fromtimestamp(c.authored_date))
             }
+            for c in user_commits[:100]
+        ]
 
-            # Call the Foundry Manager
-            foundry = AzureFoundryManager()
-            response = foundry.process_request(
-                user_input=f"FACTS_JSON: {json.dumps(facts, ensure_ascii=True)}",
-                system_prompt=CONTRIBUTION_PATTERN_PROMPT,
-                response_model=ContributionPatternOutput,
-                schema_name="contribution_patterns",
-                max_tokens=400,  # Increased slightly to accommodate dicts and descriptions
-                temperature=0.1  # Keep low for analytical consistency
-            )
+        # Assemble the facts payload
+        return {
+            "project_name": report.project_name,
+            "user_email": report.email,
+            "user_commit_percentage": user_commit_pct,
+            "total_authors": total_authors,
+            "is_group_project": is_group,
+            "total_user_commits_analyzed": len(commit_data),
+            "commits_sample": commit_data
+        }
 
-            if response is None:
-                logger.warning(
-                    f"Azure generation returned no structured response for {report.project_name}"
-                )
-                return []
+    def _request(self, facts: dict) -> Optional[ContributionPatternOutput]:
+        """Call the Foundry Manager with a facts payload."""
+        foundry = AzureFoundryManager()
+        return foundry.process_request(
+            user_input=f"FACTS_JSON: {json.dumps(facts, ensure_ascii=True)}",
+            system_prompt=CONTRIBUTION_PATTERN_PROMPT,
+            response_model=ContributionPatternOutput,
+            schema_name="contribution_patterns",
+            max_tokens=400,  # Increased slightly to accommodate dicts and descriptions
+            temperature=0.1  # Keep low for analytical consistency
+        )
 
-            logger.info(
-                f"Azure contribution pattern analysis completed for {report.project_name}: "
-                f"role={response.collaboration_role}, pattern={response.work_pattern}"
+    def _to_statistics(
+        self,
+        report: ProjectReport,
+        response: Optional[ContributionPatternOutput],
+    ) -> list[Statistic]:
+        if response is None:
+            logger.warning(
+                f"Azure generation returned no structured response for {report.project_name}"
             )
+            return []
 
-            stats = [
-                Statistic(
-                    ProjectStatCollection.COMMIT_TYPE_DISTRIBUTION.value,
-                    response.commit_type_distribution.model_dump()
-                ),
-                Statistic(
-                    ProjectStatCollection.WORK_PATTERN.value,
-                    response.work_pattern
-                ),
-                Statistic(
-                    ProjectStatCollection.COLLABORATION_ROLE.value,
-                    response.collaboration_role
-                ),
-                Statistic(
-                    ProjectStatCollection.ACTIVITY_METRICS.value,
-                    response.activity_metrics.model_dump()
-                ),
-                Statistic(
-                    ProjectStatCollection.ROLE_DESCRIPTION.value,
-                    response.role_description
-                ),
-            ]
-            return stats
+        logger.info(
+            f"Azure contribution pattern analysis completed for {report.project_name}: "
+            f"role={response.collaboration_role}, pattern={response.work_pattern}"
+        )
 
-        except Exception as e:
-            logger.error(
-                f"Azure contribution pattern analysis failed for {report.project_name}: {e}",
-                exc_info=True
-            )
-            return []
+        return [
+            Statistic(
+                ProjectStatCollection.COMMIT_TYPE_DISTRIBUTION.value,
+                response.commit_type_distribution.model_dump()
+            ),
+            Statistic(
+                ProjectStatCollection.WORK_PATTERN.value,
+                response.work_pattern
+            ),
+            Statistic(
+                ProjectStatCollection.COLLABORATION_ROLE.value,
+                response.collaboration_role
+            ),
+            Statistic(
+                ProjectStatCollection.ACTIVITY_METRICS.value,
+                response.activity_metrics.model_dump()
+            ),
+            Statistic(
+                ProjectStatCollection.ROLE_DESCRIPTION.value,
+                response.role_description
+            ),
+        ]
 
 
 class ProjectTotalContributionPercentage(ProjectStatisticCalculation):
@@ -1024,26 +992,20 @@ class ProjectTotalContributionPercentage(ProjectStatisticCalculation):
                     except (FileNotFoundError, IsADirectoryError):
                         pass  # skip directories or removed files
         else:
-            for fr in report.file_reports:
-                val = fr.get_value(FileStatCollection.LINES_IN_FILE.value)
-                if val is not None:
-                    total += val
+            total = int(np.nansum(report.file_columns.lines))
 
         return total
 
     def _total_contribution_percentage(self, report: ProjectReport, project_lines: float) -> float:
         """
-        Iterate over fileReports to get total lines responsible over whole project
+        Sum the user's committed share of every file's lines to get total
+        lines responsible over whole project
         """
 
-        total_contribution_lines = 0.0
-
-        for file in report.file_reports:
-            file_commit_pct = file.get_value(
-                FileStatCollection.PERCENTAGE_LINES_COMMITTED.value)
-            if file_commit_pct is not None:
-                total_contribution_lines += file_commit_pct / 100 * \
-                    file.get_value(FileStatCollection.LINES_IN_FILE.value)
+        columns = report.file_columns
+        committed = ~np.isnan(columns.commit_pct)
+        total_contribution_lines = float(np.nansum(
+            columns.commit_pct[committed] / 100 * columns.lines[committed]))
 
         if project_lines > 0:
             return round((total_contribution_lines / project_lines) * 100, 2)
@@ -1089,21 +1051,25 @@ class ProjectCommitActivityTimeline(ProjectStatisticCalculation):
         return [Statistic(ProjectStatCollection.COMMIT_ACTIVITY_TIMELINE.value, dict(sorted(user_commits_dict.items()))), Statistic(ProjectStatCollection.TOTAL_COMMIT_ACTIVITY_TIMELINE.value, dict(sorted(commits_dict.items())))]
 
 
+# Every project calculator, in the order the builder runs them.
+PROJECT_CALCULATOR_CLASSES: list[Type[ProjectStatisticCalculation]] = [
+    ProjectDates,
+    CodingLanguageRatio,
+    ProjectWeightedSkills,
+    ProjectReadmeInsights,
+    ProjectActivityTypeContributions,
+    ProjectAnalyzeGitAuthorship,
+    ProjectTotalContributionPercentage,
+    ProjectContributionPatterns,
+    ProjectCommitActivityTimeline,
+]
+
+
 class ProjectStatisticReportBuilder(StatisticReportBuilder[ProjectReport]):
     """Base builder for project reports."""
 
     def __init__(self, calculator_classes: Optional[list[Type]] = None) -> None:
-        all_calculator_classes = [
-            ProjectDates,
-            CodingLanguageRatio,
-            ProjectWeightedSkills,
-            ProjectReadmeInsights,
-            ProjectActivityTypeContributions,
-            ProjectAnalyzeGitAuthorship,
-            ProjectTotalContributionPercentage,
-            ProjectContributionPatterns,
-            ProjectCommitActivityTimeline,
-        ]
+        all_calculator_classes = PROJECT_CALCULATOR_CLASSES
 
         # If specific calculator classes are requested, filter to only those
         if calculator_classes is not None:
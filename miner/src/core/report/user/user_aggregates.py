@@ -0,0 +1,150 @@
+"""
+This file defines `ProjectContribution`, what a single project adds to the
+user-level statistics, and `UserAggregates`, their running totals.
+
+Every user statistic is either a sum over projects (skill weights,
+language bytes, commit timelines) or a min/max (dates). Keeping each
+project's contribution around lets the user statistics be rebuilt, or
+kept up to date as projects are saved and deleted, without loading any
+project's file reports again.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Optional, TYPE_CHECKING
+
+import numpy as np
+
+from src.core.statistic import CodingLanguage, ProjectStatCollection
+
+if TYPE_CHECKING:
+    from src.core.report import ProjectReport
+
+# Sums that fall below this after a project is taken out are dropped, so
+# float error does not leave skills behind with a weight of ~1e-17
+_EPSILON = 1e-9
+
+
+@dataclass
+class ProjectContribution:
+    """
+    The values one project adds to the user-level statistics.
+
+    `skill_weights` are already multiplied by the project `weight`, and
+    `language_bytes` are the project's language ratio scaled back up by its
+    total bytes.
+    """
+    weight: float = 0.0
+    skill_weights: dict[str, float] = field(default_factory=dict)
+    language_bytes: dict[CodingLanguage, float] = field(default_factory=dict)
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    commit_timeline: dict[str, int] = field(default_factory=dict)
+    total_commit_timeline: dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_project_report(cls, report: "ProjectReport") -> "ProjectContribution":
+        """
+        Compute the contribution from a project report. The language bytes
+        and the weight need the report's file reports.
+        """
+        weight = report.get_project_weight()
+
+        skill_weights: dict[str, float] = {}
+        for weighted_skill in report.get_value(
+                ProjectStatCollection.PROJECT_SKILLS_DEMONSTRATED.value) or []:
+            skill_weights[weighted_skill.skill_name] = skill_weights.get(
+                weighted_skill.skill_name, 0) + weighted_skill.weight * weight
+
+        language_bytes: dict[CodingLanguage, float] = {}
+        language_ratio = report.get_value(
+            ProjectStatCollection.CODING_LANGUAGE_RATIO.value)
+        if language_ratio:
+            # Convert ratios back to byte counts so projects of different
+            # sizes aggregate properly
+            total_bytes = _total_bytes(report)
+            for language, ratio in language_ratio.items():
+                if language is not None:
+                    language_bytes[language] = ratio * total_bytes
+
+        # Commit timelines only count for projects with a git history
+        total_commit_timeline = report.get_value(
+            ProjectStatCollection.TOTAL_COMMIT_ACTIVITY_TIMELINE.value) or {}
+        commit_timeline = {}
+        if total_commit_timeline:
+            commit_timeline = report.get_value(
+                ProjectStatCollection.COMMIT_ACTIVITY_TIMELINE.value) or {}
+
+        return cls(
+            weight=weight,
+            skill_weights=skill_weights,
+            language_bytes=language_bytes,
+            start_date=report.get_value(
+                ProjectStatCollection.PROJECT_START_DATE.value),
+            end_date=report.get_value(
+                ProjectStatCollection.PROJECT_END_DATE.value),
+            commit_timeline=dict(commit_timeline),
+            total_commit_timeline=dict(total_commit_timeline),
+        )
+
+
+@dataclass
+class UserAggregates:
+    """Running totals of `ProjectContribution`s across projects."""
+    skill_weights: dict[str, float] = field(default_factory=dict)
+    language_bytes: dict[CodingLanguage, float] = field(default_factory=dict)
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    commit_timeline: dict[str, int] = field(default_factory=dict)
+    total_commit_timeline: dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_contributions(cls, contributions: list[ProjectContribution]) -> "UserAggregates":
+        aggregates = cls()
+        for contribution in contributions:
+            aggregates.add(contribution)
+        return aggregates
+
+    def add(self, contribution: ProjectContribution) -> None:
+        _add_into(self.skill_weights, contribution.skill_weights, 1)
+        _add_into(self.language_bytes, contribution.language_bytes, 1)
+        _add_into(self.commit_timeline, contribution.commit_timeline, 1)
+        _add_into(self.total_commit_timeline,
+                  contribution.total_commit_timeline, 1)
+
+        if contribution.start_date is not None and (
+                self.start_date is None or contribution.start_date < self.start_date):
+            self.start_date = contribution.start_date
+        if contribution.end_date is not None and (
+                self.end_date is None or contribution.end_date > self.end_date):
+            self.end_date = contribution.end_date
+
+    def subtract(self, contribution: ProjectContribution) -> None:
+        """
+        Take a project's contribution back out of the sums. A min/max cannot
+        be undone, so the dates are left alone and must be recomputed by
+        the caller.
+        """
+        _add_into(self.skill_weights, contribution.skill_weights, -1)
+        _add_into(self.language_bytes, contribution.language_bytes, -1)
+        _add_into(self.commit_timeline, contribution.commit_timeline, -1)
+        _add_into(self.total_commit_timeline,
+                  contribution.total_commit_timeline, -1)
+
+
+def _add_into(totals: dict[Any, Any], values: dict[Any, Any], sign: int) -> None:
+    for key, value in values.items():
+        total = totals.get(key, 0) + sign * value
+        if sign < 0 and abs(total) < _EPSILON:
+            totals.pop(key, None)
+        else:
+            totals[key] = total
+
+
+def _total_bytes(report: "ProjectReport") -> float:
+    """Sum of file sizes in bytes, falling back to lines and then to 1 per file."""
+    if not report.file_reports:
+        return 0
+    columns = report.file_columns
+    sizes = np.where(np.isnan(columns.size), columns.lines, columns.size)
+    return float(np.where(np.isnan(sizes), 1, sizes).sum())
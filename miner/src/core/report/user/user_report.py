@@ -6,11 +6,12 @@ from typing import Optional, Type
 
 from src.core.report.base_report import BaseReport
 from src.core.report import ProjectReport
+from src.core.report.user.user_aggregates import ProjectContribution, UserAggregates
 from src.core.statistic import (
     StatisticIndex,
     UserStatCollection,
 )
-from src.core.resume.resume import Resume
+from src.core.resume.resume import Resume, ResumeItem
 from src.core.portfolio.builder.build_system import PortfolioBuilder
 
 
@@ -24,7 +25,8 @@ class UserReport(BaseReport):
                  project_reports: list[ProjectReport],
                  report_name: str = "",  # deperacted
                  statistics: Optional[StatisticIndex] = None,
-                 calculator_classes: Optional[list[Type]] = None
+                 calculator_classes: Optional[list[Type]] = None,
+                 contributions: Optional[list[ProjectContribution]] = None
                  ):
         """
         Initialize UserReport with project reports to calculate user-level statistics.
@@ -37,10 +39,18 @@ class UserReport(BaseReport):
             project_reports (list[ProjectReport]): List of ProjectReport objects containing project-level statistics
             report_name (str): By default, the name of the zipped directory. Can be overwritten by user input
             statistics: Optional `StatisticIndex` when rebuilding `UserReport` from DB row
+            contributions: Optional stored `ProjectContribution` for each project report,
+                in the same order. Lets the project reports be loaded without
+                their file reports. Computed from the reports if None.
         """
 
         self.report_name = report_name
         self.project_reports = project_reports or []
+        # Ranking and resume items are only built when first read, since
+        # most callers just want the statistics
+        self._contributions = contributions
+        self._ranked_project_reports: Optional[list[ProjectReport]] = None
+        self._resume_items: Optional[list[ResumeItem]] = None
 
         # In this case, we are loading from the database and we are explicitly
         # given statistics. We load those stats in, and move on
@@ -48,13 +58,10 @@ class UserReport(BaseReport):
             super().__init__(statistics)
             return
 
-        # rank the project reports according to their weights
-        ranked_project_reports = sorted(
-            project_reports, key=lambda p: p.get_project_weight(), reverse=True)
-
-        self.resume_items = []
-        for report in ranked_project_reports:
-            self.resume_items.append(report.generate_resume_item())
+        if self._contributions is None:
+            self._contributions = [ProjectContribution.from_project_report(p)
+                                   for p in self.project_reports]
+        self.aggregates = UserAggregates.from_contributions(self._contributions)
 
         super().__init__(StatisticIndex())  # list of user-level statistics
 
@@ -64,6 +71,29 @@ class UserReport(BaseReport):
             calculator_classes=calculator_classes)
         builder.build(self)
 
+    @property
+    def ranked_project_reports(self) -> list[ProjectReport]:
+        """The project reports, heaviest project weight first."""
+        if self._ranked_project_reports is None:
+            if self._contributions is not None:
+                weights = [c.weight for c in self._contributions]
+            else:
+                weights = [p.get_project_weight() for p in self.project_reports]
+            self._ranked_project_reports = [
+                report for report, _ in sorted(
+                    zip(self.project_reports, weights),
+                    key=lambda pair: pair[1], reverse=True)
+            ]
+        return self._ranked_project_reports
+
+    @property
+    def resume_items(self) -> list[ResumeItem]:
+        """One `ResumeItem` per project, in ranked order."""
+        if self._resume_items is None:
+            self._resume_items = [report.generate_resume_item()
+                                  for report in self.ranked_project_reports]
+        return self._resume_items
+
     def generate_resume(
         self,
         email: Optional[str],
@@ -328,6 +328,13 @@ class BulletPointBuilder:
 
         self.fallback: BulletPoint = FallBackRule()
 
+    def context(self) -> tuple:
+        """
+        Inputs other than the report's statistics that change the bullets,
+        so anything caching `build` results can key on them too.
+        """
+        return (ml_extraction_allowed(),)
+
     def build(self, report: ProjectReport) -> List[str]:
         bullet_points: List[str] = []
 
@@ -4,7 +4,6 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 import tempfile
 from typing import TYPE_CHECKING, Union
-from pdflatex import PDFLaTeX
 from src.infrastructure.log.logging import get_logger
 
 logger = get_logger(__name__)
@@ -114,14 +113,21 @@ class PDFRenderer(ResumeRender):
     """
 
     def render(self, resume) -> bytes:
+        return self.compile(resume.export(ResumeLatexRenderer()))
+
+    def compile(self, tex: str) -> bytes:
+        """
+        Compile LaTeX source to PDF with pdflatex. Returns empty bytes if
+        TeX Live is not installed.
+        """
+        # pdflatex is only needed for PDF exports, keep it off the import path
+        from pdflatex import PDFLaTeX
+
         pdf = b""
 
         with tempfile.TemporaryDirectory() as tmpdir:
             tex_path = Path(tmpdir) / "helper.tex"
-            tex_path.write_text(
-                resume.export(ResumeLatexRenderer()),
-                encoding="utf-8"
-            )
+            tex_path.write_text(tex, encoding="utf-8")
 
             pdfLaTeX = PDFLaTeX.from_texfile(str(tex_path))
             pdfLaTeX.set_interaction_mode()
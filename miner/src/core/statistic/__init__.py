@@ -1,4 +1,4 @@
-from .base_classes import StatisticIndex, Statistic, StatisticTemplate
+from .base_classes import StatisticIndex, LazyStatisticIndex, Statistic, StatisticTemplate
 from .file_stat_collection import FileStatCollection
 from .project_stat_collection import ProjectStatCollection
 from .user_stat_collection import UserStatCollection
@@ -15,6 +15,7 @@ __all__ = [
     "ProjectStatCollection",
     "UserStatCollection",
     "StatisticIndex",
+    "LazyStatisticIndex",
     "Statistic",
     "StatisticTemplate",
     "FileDomain",
@@ -1,8 +1,10 @@
+import hashlib
+import json
 from dataclasses import dataclass
 from typing import Any, List, Dict, Optional, get_origin
 from abc import ABC
 
-from src.core.statistic.statistic_serializer import serialize
+from src.core.statistic.statistic_codecs import get_codec
 
 
 @dataclass(frozen=True)
@@ -15,6 +17,12 @@ class StatisticTemplate(ABC):
     description: str
     expected_type: Any
 
+    def __hash__(self):
+        # Templates are dict keys for every statistic lookup. Hashing just
+        # the name (whose hash Python caches) is much cheaper than hashing
+        # all three fields, and equal templates still share a hash.
+        return hash(self.name)
+
 
 class Statistic():
     """
@@ -27,6 +35,8 @@ class Statistic():
 
     """
 
+    __slots__ = ("statistic_template", "value")
+
     def __init__(self, stat_template: StatisticTemplate, value: Any):
         self.statistic_template = stat_template
         expected_type = stat_template.expected_type
@@ -47,6 +57,18 @@ class Statistic():
 
         self.value = value
 
+    @classmethod
+    def trusted(cls, stat_template: StatisticTemplate, value: Any) -> "Statistic":
+        """
+        Create a Statistic without the type validation. Only use this for
+        values that are known to match the template already, like ones
+        loaded back from the database or an analyzer's own typed output.
+        """
+        stat = cls.__new__(cls)
+        stat.statistic_template = stat_template
+        stat.value = value
+        return stat
+
     def get_template(self) -> StatisticTemplate:
         return self.statistic_template
 
@@ -67,6 +89,8 @@ class StatisticIndex():
     layer of abstraction.
     """
 
+    __slots__ = ("_stats",)
+
     _stats: Dict[StatisticTemplate, Statistic]
 
     def __init__(self, list_of_statistics: Optional[List[Statistic]] = None):
@@ -139,10 +163,19 @@ class StatisticIndex():
         """
 
         return {
-            stat.get_template().name: serialize(stat.value)
-            for stat in self._stats.values()
+            template.name: get_codec(template).encode(stat.value)
+            for template, stat in self._stats.items()
         }
 
+    def fingerprint(self) -> str:
+        """
+        A hash of the serialized statistics. Indexes holding the same values
+        have the same fingerprint, so it can key caches of anything derived
+        from them.
+        """
+        serialized = json.dumps(self.to_json(), sort_keys=True, default=str)
+        return hashlib.sha1(serialized.encode()).hexdigest()
+
     def __len__(self):
         return len(self._stats)
 
@@ -157,3 +190,72 @@ class StatisticIndex():
 
     def __contains__(self, template: StatisticTemplate) -> bool:
         return template in self._stats
+
+
+class LazyStatisticIndex(StatisticIndex):
+    """
+    A StatisticIndex built from serialized statistics (e.g. a database
+    row) that keeps each value as raw JSON and only deserializes it the
+    first time it is read. Loading a project with thousands of file
+    reports then costs little more than the JSON parse, and only the
+    statistics an endpoint actually touches are decoded.
+
+    It behaves exactly like a StatisticIndex; iterating or converting the
+    whole index decodes everything that is still pending.
+    """
+
+    __slots__ = ("_raw",)
+
+    _raw: Dict[StatisticTemplate, Any]
+
+    def __init__(self, raw_statistics: Dict[StatisticTemplate, Any]):
+        super().__init__()
+        self._raw = dict(raw_statistics)
+
+    def _decode(self, template: StatisticTemplate) -> None:
+        raw_value = self._raw.pop(template)
+        # Stored values were validated when they were first computed
+        self._stats[template] = Statistic.trusted(
+            template, get_codec(template).decode(raw_value))
+
+    def _decode_all(self) -> None:
+        for template in list(self._raw):
+            self._decode(template)
+
+    def add(self, stat: Statistic):
+        self._raw.pop(stat.get_template(), None)
+        super().add(stat)
+
+    def remove(self, stat: Statistic):
+        self._raw.pop(stat.get_template(), None)
+        super().remove(stat)
+
+    def get(self, template: StatisticTemplate) -> Optional[Statistic]:
+        if template in self._raw:
+            self._decode(template)
+        return super().get(template)
+
+    def to_dict(self) -> Dict[str, Any]:
+        self._decode_all()
+        return super().to_dict()
+
+    def to_json(self) -> dict[str, Any]:
+        # Pending values are already in their serialized form
+        serialized = super().to_json()
+        serialized.update(
+            {template.name: raw_value for template, raw_value in self._raw.items()})
+        return serialized
+
+    def __len__(self):
+        return len(self._stats) + len(self._raw)
+
+    def __repr__(self):
+        self._decode_all()
+        return super().__repr__()
+
+    def __iter__(self):
+        self._decode_all()
+        return super().__iter__()
+
+    def __contains__(self, template: StatisticTemplate) -> bool:
+        return template in self._raw or super().__contains__(template)
@@ -3,11 +3,13 @@ This file provides functionality to map imports, filenames and keywords to skill
 such as DevOps or Machine Learning
 """
 
-from typing import Dict, Set, Optional
+from typing import Dict, List, Set, Optional
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 
+_MAX_MEMOIZED_LOOKUPS = 100_000
+
 
 class Skill(Enum):
     MACHINE_LEARNING = "ML"
@@ -542,6 +544,14 @@ class SkillMapper:
     }
     _SUMMARY_EMERGING_KEYWORDS_CACHE: Optional[Dict[str, Set[str]]] = None
 
+    # Built from `SKILL_INDICATORS` on first use
+    _PACKAGE_INDEX: Optional[Dict[str, Skill]] = None
+    _FILEPATH_MATCHERS: Optional[List["_FilepathMatcher"]] = None
+
+    # Memoized `map_package_to_skill`/`map_filepath_to_skill` results
+    _PACKAGE_SKILL_CACHE: Dict[str, Optional[Skill]] = {}
+    _FILEPATH_SKILL_CACHE: Dict[str, Optional[Skill]] = {}
+
     @classmethod
     def summary_focus_keywords(cls) -> Dict[str, Set[str]]:
         """
@@ -623,6 +633,39 @@ class SkillMapper:
             for label, keywords in cls._SUMMARY_EMERGING_KEYWORDS_CACHE.items()
         }
 
+    @classmethod
+    def _package_index(cls) -> Dict[str, Skill]:
+        """
+        Inverted `SKILL_INDICATORS` packages: package name -> skill. When a
+        package is listed under several skills, the first skill wins, as it
+        did when the indicators were scanned in order.
+        """
+        if cls._PACKAGE_INDEX is None:
+            index: Dict[str, Skill] = {}
+            for skill, indicators in cls.SKILL_INDICATORS.items():
+                for package in indicators.packages:
+                    index.setdefault(package, skill)
+            cls._PACKAGE_INDEX = index
+        return cls._PACKAGE_INDEX
+
+    @classmethod
+    def _filepath_matchers(cls) -> List["_FilepathMatcher"]:
+        """One compiled matcher per skill, in `SKILL_INDICATORS` order."""
+        if cls._FILEPATH_MATCHERS is None:
+            cls._FILEPATH_MATCHERS = [
+                _FilepathMatcher.compile(skill, indicators)
+                for skill, indicators in cls.SKILL_INDICATORS.items()
+            ]
+        return cls._FILEPATH_MATCHERS
+
+    @classmethod
+    def clear_caches(cls) -> None:
+        """Forget the compiled indicators and memoized lookups, e.g. after editing `SKILL_INDICATORS`."""
+        cls._PACKAGE_INDEX = None
+        cls._FILEPATH_MATCHERS = None
+        cls._PACKAGE_SKILL_CACHE.clear()
+        cls._FILEPATH_SKILL_CACHE.clear()
+
     @classmethod
     def map_package_to_skill(cls, package: str) -> Optional[Skill]:
         """
@@ -634,13 +677,16 @@ class SkillMapper:
         Returns:
             Skill enum if matched, None otherwise
         """
-        normalized_package = package.split('.')[0].lower()
+        try:
+            return cls._PACKAGE_SKILL_CACHE[package]
+        except KeyError:
+            pass
 
-        for skill, indicators in cls.SKILL_INDICATORS.items():
-            if normalized_package in indicators.packages:
-                return skill
+        normalized_package = package.split('.')[0].lower()
+        skill = cls._package_index().get(normalized_package)
 
-        return None
+        _remember(cls._PACKAGE_SKILL_CACHE, package, skill)
+        return skill
 
     @classmethod
     def map_filepath_to_skill(cls, filepath: str) -> Optional[Skill]:
@@ -652,44 +698,86 @@ class SkillMapper:
         Returns:
             Skill enum if matched, None otherwise
         """
+        try:
+            return cls._FILEPATH_SKILL_CACHE[filepath]
+        except KeyError:
+            pass
+
         path = Path(filepath)
         extension = path.suffix.lower()
+        filename = path.name.lower()
+        filepath_lower = str(path).lower()
 
-        for skill, indicators in cls.SKILL_INDICATORS.items():
-            # Check file extensions
-            if extension and extension in indicators.file_extensions:
-                return skill
+        skill = None
+        for matcher in cls._filepath_matchers():
+            if matcher.matches(extension, filename, filepath_lower):
+                skill = matcher.skill
+                break
 
-            # Check file patterns
-            if cls._matches_any_pattern(filepath, indicators.file_patterns):
-                return skill
+        _remember(cls._FILEPATH_SKILL_CACHE, filepath, skill)
+        return skill
 
-        return None
 
-    @staticmethod
-    def _matches_any_pattern(filepath: str, patterns: Set[str]) -> bool:
-        """Check if filepath matches any pattern in the set"""
-        path = Path(filepath)
-        filename = path.name.lower()
-        filepath_lower = str(path).lower()
+@dataclass(frozen=True)
+class _FilepathMatcher:
+    """
+    A skill's file extensions and patterns, pre-split by kind of pattern so
+    matching a path is a few set lookups and `str.startswith`/`endswith`
+    calls on tuples.
+    """
+    skill: Skill
+    extensions: frozenset
+    filenames: frozenset     # exact match, e.g. 'Dockerfile'
+    prefixes: tuple          # 'deploy*'
+    suffixes: tuple          # '*.tf'
+    path_fragments: tuple    # '.github/workflows/*'
 
-        for pattern in patterns:
+    @classmethod
+    def compile(cls, skill: Skill, indicators: SkillIndicator) -> "_FilepathMatcher":
+        filenames, prefixes, suffixes, path_fragments = set(), [], [], []
+
+        for pattern in indicators.file_patterns:
             # Handle directory patterns (e.g., '.github/workflows/*')
             if '/' in pattern:
-                if pattern.lower().replace('*', '').strip('/') in filepath_lower:
-                    return True
+                path_fragments.append(
+                    pattern.lower().replace('*', '').strip('/'))
 
             # Handle wildcard patterns (e.g., '*.tf')
             elif pattern.startswith('*'):
-                if filename.endswith(pattern[1:].lower()):
-                    return True
+                suffixes.append(pattern[1:].lower())
 
             elif pattern.endswith('*'):
-                if filename.startswith(pattern[:-1].lower()):
-                    return True
+                prefixes.append(pattern[:-1].lower())
 
             # Exact match
-            elif filename == pattern.lower():
-                return True
+            else:
+                filenames.add(pattern.lower())
+
+        return cls(
+            skill=skill,
+            extensions=frozenset(indicators.file_extensions),
+            filenames=frozenset(filenames),
+            prefixes=tuple(prefixes),
+            suffixes=tuple(suffixes),
+            path_fragments=tuple(path_fragments),
+        )
+
+    def matches(self, extension: str, filename: str, filepath_lower: str) -> bool:
+        # Check file extensions, then file patterns
+        if extension and extension in self.extensions:
+            return True
+
+        return (
+            filename in self.filenames
+            or filename.startswith(self.prefixes)
+            or filename.endswith(self.suffixes)
+            or any(fragment in filepath_lower for fragment in self.path_fragments)
+        )
+
 
-        return False
+def _remember(cache: Dict[str, Optional[Skill]], key: str, skill: Optional[Skill]) -> None:
+    # Paths keep coming as new projects are mined, so start over instead of
+    # growing without bound
+    if len(cache) >= _MAX_MEMOIZED_LOOKUPS:
+        cache.clear()
+    cache[key] = skill
@@ -0,0 +1,221 @@
+"""
+Per-template codecs for statistic values.
+
+`serialize`/`deserialize` in statistic_serializer inspect every value
+recursively to work out what it is. A `StatisticTemplate` already declares
+its `expected_type`, so here we build an encoder/decoder pair once per
+template that converts values of that shape directly.
+
+The wire format is exactly the one statistic_serializer produces and
+reads. Whenever a value does not have the declared shape (old rows,
+loosely typed statistics such as plain `dict`), the codec hands it to the
+generic functions, so anything they could read is still read the same way.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, get_args, get_origin
+
+from src.core.statistic.statistic_models import WeightedSkills
+from src.core.statistic.statistic_serializer import (
+    ENUM_REGISTRY,
+    _deserialize_dict_key,
+    _serialize_dict_key,
+    deserialize,
+    serialize,
+)
+
+_SCALARS = (str, int, float, bool)
+
+
+@dataclass(frozen=True)
+class StatisticCodec:
+    """The encode/decode pair for one statistic type."""
+    encode: Callable[[Any], Any]
+    decode: Callable[[Any], Any]
+
+
+GENERIC_CODEC = StatisticCodec(serialize, deserialize)
+
+
+def _is_scalar(value: Any) -> bool:
+    return value is None or isinstance(value, _SCALARS)
+
+
+# ---------------------------------------------------------------------------
+# Leaf types
+# ---------------------------------------------------------------------------
+
+def _scalar_codec() -> StatisticCodec:
+    def encode(value):
+        return value if _is_scalar(value) else serialize(value)
+
+    def decode(value):
+        return value if _is_scalar(value) else deserialize(value)
+
+    return StatisticCodec(encode, decode)
+
+
+def _enum_codec(cls: type[Enum]) -> StatisticCodec:
+    class_name = cls.__name__
+    registered = ENUM_REGISTRY.get(class_name) is cls
+
+    def encode(value):
+        if value.__class__ is cls:
+            return {"__type__": "enum", "class": class_name, "value": value.value}
+        return serialize(value)
+
+    def decode(value):
+        if registered and isinstance(value, dict) and value.get("class") == class_name:
+            return cls(value["value"])
+        return deserialize(value)
+
+    return StatisticCodec(encode, decode)
+
+
+def _date_codec() -> StatisticCodec:
+    def encode(value):
+        if isinstance(value, datetime):
+            return {"__type__": "datetime", "value": value.isoformat()}
+        return serialize(value)
+
+    def decode(value):
+        if isinstance(value, dict) and value.get("__type__") == "datetime":
+            return datetime.fromisoformat(value["value"])
+        return deserialize(value)
+
+    return StatisticCodec(encode, decode)
+
+
+def _weighted_skills_codec() -> StatisticCodec:
+    def encode(value):
+        if value.__class__ is WeightedSkills:
+            return {
+                "__type__": "dataclass",
+                "class": "WeightedSkills",
+                "value": {"skill_name": value.skill_name, "weight": value.weight},
+            }
+        return serialize(value)
+
+    def decode(value):
+        if isinstance(value, dict) and value.get("class") == "WeightedSkills":
+            return WeightedSkills(**value["value"])
+        return deserialize(value)
+
+    return StatisticCodec(encode, decode)
+
+
+# ---------------------------------------------------------------------------
+# Containers
+# ---------------------------------------------------------------------------
+
+def _list_codec(item: StatisticCodec) -> StatisticCodec:
+    encode_item, decode_item = item.encode, item.decode
+
+    def encode(value):
+        if isinstance(value, list):
+            return [encode_item(v) for v in value]
+        return serialize(value)
+
+    def decode(value):
+        if isinstance(value, list):
+            return [decode_item(v) for v in value]
+        return deserialize(value)
+
+    return StatisticCodec(encode, decode)
+
+
+def _str_key_dict_codec(item: StatisticCodec) -> StatisticCodec:
+    encode_item, decode_item = item.encode, item.decode
+
+    def encode(value):
+        if not isinstance(value, dict):
+            return serialize(value)
+        return {
+            k if k.__class__ is str else _serialize_dict_key(k): encode_item(v)
+            for k, v in value.items()
+        }
+
+    def decode(value):
+        if not isinstance(value, dict) or "__type__" in value:
+            return deserialize(value)
+        return {
+            # A key the generic serializer encoded (e.g. an enum) decodes the same way
+            _deserialize_dict_key(k) if k.startswith("__") else k: decode_item(v)
+            for k, v in value.items()
+        }
+
+    return StatisticCodec(encode, decode)
+
+
+def _enum_key_dict_codec(cls: type[Enum], item: StatisticCodec) -> StatisticCodec:
+    encode_item, decode_item = item.encode, item.decode
+    key_for_member = {member: _serialize_dict_key(member) for member in cls}
+    member_for_key = {key: member for member, key in key_for_member.items()}
+
+    def encode(value):
+        if not isinstance(value, dict):
+            return serialize(value)
+        return {
+            key_for_member[k] if k.__class__ is cls else _serialize_dict_key(k): encode_item(v)
+            for k, v in value.items()
+        }
+
+    def decode(value):
+        if not isinstance(value, dict) or "__type__" in value:
+            return deserialize(value)
+        out = {}
+        for k, v in value.items():
+            member = member_for_key.get(k)
+            out[member if member is not None else _deserialize_dict_key(k)] = decode_item(v)
+        return out
+
+    return StatisticCodec(encode, decode)
+
+
+# ---------------------------------------------------------------------------
+# Compilation
+# ---------------------------------------------------------------------------
+
+def compile_codec(expected_type: Any) -> StatisticCodec:
+    """
+    Build the codec for a statistic's `expected_type`. Types we have no
+    specialised codec for (plain `dict`, `list`, `Any`, ...) get the
+    generic recursive serializer.
+    """
+    origin = get_origin(expected_type)
+    args = get_args(expected_type)
+
+    if origin is list and len(args) == 1:
+        return _list_codec(compile_codec(args[0]))
+
+    if origin is dict and len(args) == 2:
+        key_type, value_type = args
+        if key_type is str:
+            return _str_key_dict_codec(compile_codec(value_type))
+        if isinstance(key_type, type) and issubclass(key_type, Enum):
+            return _enum_key_dict_codec(key_type, compile_codec(value_type))
+        return GENERIC_CODEC
+
+    if expected_type in _SCALARS:
+        return _scalar_codec()
+    if expected_type is date or expected_type is datetime:
+        return _date_codec()
+    if expected_type is WeightedSkills:
+        return _weighted_skills_codec()
+    if isinstance(expected_type, type) and issubclass(expected_type, Enum):
+        return _enum_codec(expected_type)
+
+    return GENERIC_CODEC
+
+
+_CODECS: dict[Any, StatisticCodec] = {}
+
+
+def get_codec(template) -> StatisticCodec:
+    """Return the (cached) codec for a `StatisticTemplate`."""
+    codec = _CODECS.get(template)
+    if codec is None:
+        codec = _CODECS[template] = compile_codec(template.expected_type)
+    return codec
@@ -2,8 +2,9 @@
 The db package has everything that is needed for the database.
 """
 
-from .api.CRUD.projects import save_project_report, get_project_report_by_name, delete_project_report_by_name, get_project_report_model_by_name, get_project_report_models_by_names
+from .api.CRUD.projects import save_project_report, get_project_report_by_name, delete_project_report_by_name, get_project_report_model_by_name, get_project_report_models_by_names, get_project_reports_by_names
 from .api.CRUD.resume import save_resume, load_resume, get_resume_model_by_id
+from .api.CRUD.user_aggregates import get_project_contributions, get_user_aggregates
 
 from .api.CRUD.user_config import get_most_recent_user_config, save_user_config
 from .api.CRUD.portfolio import (
@@ -36,7 +37,10 @@ __all__ = [
     "get_project_report_by_name",
     "get_project_report_model_by_name",
     "get_project_report_models_by_names",
+    "get_project_reports_by_names",
     "delete_project_report_by_name",
+    "get_project_contributions",
+    "get_user_aggregates",
     "get_most_recent_user_config",
     "save_user_config",
     "get_portfolio_block",
@@ -1,3 +1,4 @@
+from sqlalchemy.orm import defer
 from sqlmodel import Session, select
 from typing import Optional
 from sqlmodel import Session
@@ -5,6 +6,20 @@ from src.core.report.file_report import FileReport
 from src.database.api.models import FileReportModel
 from src.database.core.base import table_exists
 from src.database.core.model_deserializer import deserialize_file_report
+from src.database.core.pagination import SortKey, fetch_page
+
+# Each sort is backed by a (project_name, column) index; the id breaks ties
+FILE_SORTS: dict[str, list[SortKey]] = {
+    "file_path": [SortKey(FileReportModel.file_path), SortKey(FileReportModel.id)],
+    "size": [SortKey(FileReportModel.size_bytes), SortKey(FileReportModel.id)],
+    "-size": [SortKey(FileReportModel.size_bytes, True), SortKey(FileReportModel.id, True)],
+    "lines": [SortKey(FileReportModel.line_count), SortKey(FileReportModel.id)],
+    "-lines": [SortKey(FileReportModel.line_count, True), SortKey(FileReportModel.id, True)],
+    "contribution": [SortKey(FileReportModel.percentage_lines_committed),
+                     SortKey(FileReportModel.id)],
+    "-contribution": [SortKey(FileReportModel.percentage_lines_committed, True),
+                      SortKey(FileReportModel.id, True)],
+}
 
 
 def get_file_report_model_by_hash(
@@ -85,3 +100,57 @@ def filepath_exists_in_db(
         FileReportModel.file_path == filepath)
 
     return session.exec(statement).first() is not None
+
+
+def get_file_report_models_page(
+        session: Session,
+        project_name: str,
+        sort: str = "file_path",
+        limit: Optional[int] = None,
+        after: Optional[list] = None,
+        coding_language: Optional[str] = None,
+        file_type: Optional[str] = None,
+        is_info_file: Optional[bool] = None,
+        min_percentage_lines_committed: Optional[float] = None,
+        path_prefix: Optional[str] = None,
+        include_statistics: bool = True,
+) -> tuple[list[FileReportModel], Optional[list]]:
+    """
+    Returns one page of a project's file reports ordered by one of
+    `FILE_SORTS`, keeping only the files that match every filter given.
+    `after` is the value returned for the previous page; the returned one
+    is None on the last page. Without `include_statistics` the statistic
+    JSON is not read.
+
+    Args:
+        session: SQLModel Session
+        project_name: The project the files belong to
+        coding_language: A `CodingLanguage` value, e.g. "Python"
+        file_type: A `FileDomain` value, e.g. "code"
+        is_info_file: Only info files (True) or only other files (False)
+        min_percentage_lines_committed: Lowest PERCENTAGE_LINES_COMMITTED to keep
+        path_prefix: Only files whose path starts with this
+    """
+    statement = select(FileReportModel).where(
+        FileReportModel.project_name == project_name)
+
+    if coding_language is not None:
+        statement = statement.where(FileReportModel.coding_language == coding_language)
+    if file_type is not None:
+        statement = statement.where(FileReportModel.file_type == file_type)
+    if is_info_file is not None:
+        statement = statement.where(FileReportModel.is_info_file == is_info_file)
+    if min_percentage_lines_committed is not None:
+        statement = statement.where(
+            FileReportModel.percentage_lines_committed >= min_percentage_lines_committed)
+    if path_prefix:
+        # A range rather than LIKE, which is case-insensitive in SQLite and
+        # so cannot use the file_path index
+        statement = statement.where(
+            FileReportModel.file_path >= path_prefix,
+            FileReportModel.file_path < path_prefix[:-1] + chr(ord(path_prefix[-1]) + 1),
+        )
+    if not include_statistics:
+        statement = statement.options(defer(FileReportModel.statistic))  # pyright: ignore
+
+    return fetch_page(session, statement, FILE_SORTS[sort], limit, after)
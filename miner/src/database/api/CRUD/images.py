@@ -0,0 +1,88 @@
+"""
+CRUD for project images.
+
+Images live in `ProjectImageModel`, keyed by the SHA-256 hash of their
+bytes, so projects sharing an image store it once and the hash doubles as
+the image's ETag. A project only holds the hash in `image_hash`.
+"""
+
+import hashlib
+from typing import Optional
+
+from sqlmodel import Session, select
+
+from src.database.api.models import ProjectImageModel, ProjectReportModel
+from src.utils.images import make_thumbnail
+
+
+def hash_image(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def get_project_image(session: Session, image_hash: str) -> Optional[ProjectImageModel]:
+    return session.get(ProjectImageModel, image_hash)
+
+
+def save_project_image(
+    session: Session,
+    project_model: ProjectReportModel,
+    data: bytes,
+    content_type: str,
+) -> ProjectImageModel:
+    """
+    Store `data` as the image of `project_model`, reusing the stored blob
+    if the same image was uploaded before and generating its thumbnail
+    otherwise. The project's previous image is removed if nothing else
+    uses it. DOES NOT COMMIT THE SESSION! YOU MUST COMMIT.
+    """
+    image_hash = hash_image(data)
+    image = session.get(ProjectImageModel, image_hash)
+    if image is None:
+        thumbnail = make_thumbnail(data)
+        image = ProjectImageModel(
+            hash=image_hash,
+            content_type=content_type,
+            data=data,
+            thumbnail=thumbnail[0] if thumbnail else None,
+            thumbnail_content_type=thumbnail[1] if thumbnail else None,
+        )
+        session.add(image)
+
+    previous_hash = project_model.image_hash
+    project_model.image_hash = image_hash
+    session.add(project_model)
+    if previous_hash is not None and previous_hash != image_hash:
+        release_project_image(session, previous_hash, project_model.project_name)
+    return image
+
+
+def remove_project_image(session: Session, project_model: ProjectReportModel) -> None:
+    """
+    Detach the image from `project_model`, removing it if nothing else
+    uses it. DOES NOT COMMIT THE SESSION! YOU MUST COMMIT.
+    """
+    previous_hash = project_model.image_hash
+    project_model.image_hash = None
+    session.add(project_model)
+    if previous_hash is not None:
+        release_project_image(session, previous_hash, project_model.project_name)
+
+
+def release_project_image(session: Session, image_hash: str, project_name: str) -> None:
+    """
+    Delete the stored image `image_hash` unless a project other than
+    `project_name` still uses it. DOES NOT COMMIT THE SESSION! YOU MUST
+    COMMIT.
+    """
+    still_used = session.exec(
+        select(ProjectReportModel.project_name).where(
+            ProjectReportModel.image_hash == image_hash,
+            ProjectReportModel.project_name != project_name,
+        )
+    ).first()
+    if still_used is not None:
+        return
+
+    image = session.get(ProjectImageModel, image_hash)
+    if image is not None:
+        session.delete(image)
@@ -1,46 +1,85 @@
 from typing import Optional
-from sqlmodel import Session, select
-from datetime import datetime
+from sqlmodel import Session, delete, select
 
-from src.database.api.models import DismissedInsightModel, ProjectInsightsModel
+from src.core.insight import ProjectInsight
+from src.database.api.models import (
+    DismissedInsightModel,
+    InsightMessageModel,
+    ProjectInsightsModel,
+)
 
 
 def get_project_insights(
     session: Session,
     project_name: str,
 ) -> Optional[ProjectInsightsModel]:
-    """Return the cached ProjectInsightsModel for a project, or None."""
-    return session.exec(
-        select(ProjectInsightsModel).where(
-            ProjectInsightsModel.project_name == project_name
-        )
-    ).first()
+    """Return the ProjectInsightsModel for a project, or None if its insights
+    have not been generated."""
+    return session.get(ProjectInsightsModel, project_name)
 
 
-def save_project_insights(
+def get_project_insight_messages(
     session: Session,
     project_name: str,
-    insight_messages: list[str],
-) -> ProjectInsightsModel:
+    include_ml: bool,
+) -> Optional[list[str]]:
     """
-    Persist insight messages for a project.
+    Return a project's insight messages in the order they were generated,
+    leaving out dismissed ones and, unless `include_ml`, ML-derived ones.
 
-    If a row already exists it is replaced; otherwise a new row is inserted.
+    Returns None if the project's insights have not been generated.
     """
+    if get_project_insights(session, project_name) is None:
+        return None
 
-    pi = get_project_insights(session, project_name)
+    dismissed = select(DismissedInsightModel.message).where(
+        DismissedInsightModel.project_name == project_name)
+    statement = select(InsightMessageModel.message).where(
+        InsightMessageModel.project_name == project_name,
+        InsightMessageModel.message.not_in(dismissed),
+    )
+    if not include_ml:
+        statement = statement.where(InsightMessageModel.uses_ml == False)  # noqa: E712
 
-    if pi is not None:
-        pi.insights = insight_messages
-        pi.generated_at = datetime.now()
-        session.add(pi)
-    else:
-        pi = ProjectInsightsModel(
-            project_name=project_name,
-            insights=insight_messages,
-        )
+    return list(session.exec(statement.order_by(InsightMessageModel.position)).all())
+
+
+def delete_project_insights(session: Session, project_name: str) -> None:
+    """Remove a project's generated insights. DOES NOT COMMIT THE SESSION!"""
+    session.exec(
+        delete(InsightMessageModel).where(
+            InsightMessageModel.project_name == project_name)
+    )
+    session.exec(
+        delete(ProjectInsightsModel).where(
+            ProjectInsightsModel.project_name == project_name)
+    )
+
+
+def save_project_insights(
+    session: Session,
+    project_name: str,
+    insights: list[ProjectInsight],
+) -> ProjectInsightsModel:
+    """
+    Persist generated insights for a project, replacing any saved before.
+    """
 
-        session.add(pi)
+    delete_project_insights(session, project_name)
+
+    pi = ProjectInsightsModel(
+        project_name=project_name,
+        messages=[
+            InsightMessageModel(
+                position=position,
+                message=insight.message,
+                source=insight.source,
+                uses_ml=insight.uses_ml,
+            )
+            for position, insight in enumerate(insights)
+        ],
+    )
+    session.add(pi)
 
     return pi
 
@@ -1,6 +1,8 @@
 import base64
+import hashlib
+import json
 from sqlmodel import Session, select
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import defer, joinedload
 from typing import Optional
 
 from src.core.portfolio.sections.block.block import Block
@@ -10,8 +12,16 @@ from src.database.api.models import PortfolioModel, PortfolioSectionModel, Block
 from src.core.portfolio.portfolio import Portfolio, PortfolioSection
 from src.database.core.model_serializer import serialize_portfolio, serialize_portfolio_section
 from src.database.core.model_deserializer import deserialize_portfolio
+from src.database.core.pagination import SortKey, fetch_page
 from src.utils.errors import KeyNotFoundError
 
+PORTFOLIO_SORTS: dict[str, list[SortKey]] = {
+    "id": [SortKey(PortfolioModel.id)],
+    "-id": [SortKey(PortfolioModel.id, True)],
+    "-last_updated_at": [SortKey(PortfolioModel.last_updated_at, True), SortKey(PortfolioModel.id, True)],
+    "last_updated_at": [SortKey(PortfolioModel.last_updated_at), SortKey(PortfolioModel.id)],
+}
+
 
 def save_portfolio(session: Session, portfolio: Portfolio) -> PortfolioModel:
     """
@@ -61,6 +71,45 @@ def load_portfolio(session: Session, portfolio_id: int) -> Portfolio | None:
     return deserialize_portfolio(portfolio_model)
 
 
+def get_portfolio_fingerprint(session: Session, portfolio_id: int) -> Optional[str]:
+    """
+    A hash of everything stored for a portfolio: its metadata, sections,
+    blocks and project cards. It changes whenever any of them does, so it
+    can key caches of anything built from the portfolio. Returns None if
+    the portfolio does not exist.
+    """
+    portfolio_model = session.get(PortfolioModel, portfolio_id)
+    if portfolio_model is None:
+        return None
+
+    sections = session.exec(
+        select(PortfolioSectionModel)
+        .where(PortfolioSectionModel.portfolio_id == portfolio_id)
+        .order_by(PortfolioSectionModel.id)  # pyright: ignore
+    ).all()
+    blocks = session.exec(
+        select(BlockModel)
+        .join(PortfolioSectionModel)
+        .where(PortfolioSectionModel.portfolio_id == portfolio_id)
+        .order_by(BlockModel.id)  # pyright: ignore
+    ).all()
+    cards = session.exec(
+        select(PortfolioProjectCardModel)
+        .where(PortfolioProjectCardModel.portfolio_id == portfolio_id)
+        .order_by(PortfolioProjectCardModel.id)  # pyright: ignore
+    ).all()
+
+    digest = hashlib.sha256()
+    for model in (portfolio_model, *sections, *blocks, *cards):
+        row = model.model_dump(exclude={"image_data"})
+        if isinstance(model, PortfolioProjectCardModel) and model.image_data:
+            # Hashed separately; large images would dominate the JSON
+            row["image_data"] = hashlib.sha256(model.image_data).hexdigest()
+        digest.update(type(model).__name__.encode())
+        digest.update(json.dumps(row, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
 def get_portfolio_block_model(
     session: Session,
     portfolio_id: int,
@@ -199,16 +248,20 @@ def get_project_cards_for_portfolio(
     tones: Optional[list[str]] = None,
     tags: Optional[list[str]] = None,
     skills: Optional[list[str]] = None,
+    include_images: bool = True,
 ) -> list[PortfolioProjectCardModel]:
     """
     Retrieve all project cards for a portfolio, with optional filtering.
     Filtering is done in Python since SQLite JSON array querying is unreliable.
     Showcase cards are returned first, then alphabetically by project name.
+    Without `include_images` the image bytes are not read.
     """
     statement = (
         select(PortfolioProjectCardModel)
         .where(PortfolioProjectCardModel.portfolio_id == portfolio_id)
     )
+    if not include_images:
+        statement = statement.options(defer(PortfolioProjectCardModel.image_data))  # pyright: ignore
     cards = list(session.exec(statement).all())
 
     if themes:
@@ -336,8 +389,22 @@ def list_portfolios(session: Session) -> list[dict]:
     Returns a lightweight list of all portfolios.
     Does NOT load sections, blocks, or project cards.
     """
-    statement = select(PortfolioModel)
-    models = session.exec(statement).all()
+    return list_portfolios_page(session)[0]
+
+
+def list_portfolios_page(
+    session: Session,
+    sort: str = "id",
+    limit: Optional[int] = None,
+    after: Optional[list] = None,
+) -> tuple[list[dict], Optional[list]]:
+    """
+    Returns one page of the lightweight portfolio list, ordered by one of
+    `PORTFOLIO_SORTS`. `after` is the value returned for the previous page;
+    the returned one is None on the last page.
+    """
+    models, next_after = fetch_page(
+        session, select(PortfolioModel), PORTFOLIO_SORTS[sort], limit, after)
     return [
         {
             "id": m.id,
@@ -347,7 +414,7 @@ def list_portfolios(session: Session) -> list[dict]:
             "project_names": m.project_ids_include or [],
         }
         for m in models
-    ]
+    ], next_after
 
 
 def delete_portfolio(session: Session, portfolio_id: int) -> bool:
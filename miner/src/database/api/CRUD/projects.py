@@ -1,13 +1,43 @@
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Collection, Optional
 
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import defer, selectinload
 from sqlmodel import Session, delete, select
 
-from src.database.api.models import ProjectReportModel, FileReportModel, ProjectInsightsModel
+from src.database.api.models import (
+    PROJECT_UNRANKED,
+    ProjectReportModel,
+    FileReportModel,
+    ProjectLineageModel,
+)
 from src.core.report import ProjectReport
+from src.core.report.user.user_aggregates import ProjectContribution
+from src.database.api.CRUD.images import release_project_image
+from src.database.api.CRUD.insights import delete_project_insights
+from src.database.api.CRUD.user_aggregates import (
+    record_project_contribution,
+    withdraw_project_contribution,
+)
 from src.database.core.model_serializer import serialize_project_report, serialize_file_report
 from src.database.core.model_deserializer import deserialize_project_report
+from src.database.core.pagination import SortKey, fetch_page
+
+PROJECT_SORTS: dict[str, list[SortKey]] = {
+    "rank": [
+        SortKey(PROJECT_UNRANKED),
+        SortKey(ProjectReportModel.representation_rank),
+        SortKey(ProjectReportModel.created_at),
+        SortKey(ProjectReportModel.project_name),
+    ],
+    "created_at": [SortKey(ProjectReportModel.created_at), SortKey(ProjectReportModel.project_name)],
+    "-created_at": [SortKey(ProjectReportModel.created_at, True),
+                    SortKey(ProjectReportModel.project_name, True)],
+    "last_updated": [SortKey(ProjectReportModel.last_updated), SortKey(ProjectReportModel.project_name)],
+    "-last_updated": [SortKey(ProjectReportModel.last_updated, True),
+                      SortKey(ProjectReportModel.project_name, True)],
+    "project_name": [SortKey(ProjectReportModel.project_name)],
+    "-project_name": [SortKey(ProjectReportModel.project_name, True)],
+}
 
 
 def _get_latest_related_project_model(
@@ -20,28 +50,96 @@ def _get_latest_related_project_model(
     A related project is either:
     - Exact base name (e.g. "ProjectA")
     - Versioned name (e.g. "ProjectA_2", "ProjectA_3", ...)
+
+    The chain is read from `ProjectLineageModel`, so only the head row is
+    loaded and unrelated names that share a prefix ("ProjectA_api") are
+    never matched.
     """
-    statement = select(ProjectReportModel).where(
-        (ProjectReportModel.project_name == base_project_name) |
-        (ProjectReportModel.project_name.like(f"{base_project_name}_%"))
+    statement = (
+        select(ProjectReportModel)
+        .join(
+            ProjectLineageModel,
+            ProjectLineageModel.project_name == ProjectReportModel.project_name,
+        )
+        .where(
+            ProjectLineageModel.base_name == base_project_name,
+            ProjectLineageModel.is_head == True,  # noqa: E712
+        )
     )
-    related_projects = session.exec(statement).all()
+    return session.exec(statement).first()
 
-    if not related_projects:
-        return None
 
-    return max(
-        related_projects,
-        key=lambda project: (
-            project.analyzed_count if project.analyzed_count is not None else 1,
-            project.created_at
+def _add_to_lineage(
+    session: Session,
+    base_project_name: str,
+    project_model: ProjectReportModel,
+) -> ProjectLineageModel:
+    """
+    Record `project_model` as a version of `base_project_name`, moving the
+    head to it unless the chain already has a later version. DOES NOT
+    COMMIT THE SESSION! YOU MUST COMMIT.
+    """
+    version = project_model.analyzed_count or 1
+    head = session.exec(
+        select(ProjectLineageModel).where(
+            ProjectLineageModel.base_name == base_project_name,
+            ProjectLineageModel.is_head == True,  # noqa: E712
         )
+    ).first()
+
+    is_head = head is None or version >= head.version
+    if head is not None and is_head:
+        head.is_head = False
+        session.add(head)
+
+    lineage = ProjectLineageModel(
+        project_name=project_model.project_name,
+        base_name=base_project_name,
+        version=version,
+        is_head=is_head,
     )
+    session.add(lineage)
+    return lineage
+
+
+def _remove_from_lineage(session: Session, project_name: str) -> None:
+    """
+    Drop a project from its version chain, handing the head to the next
+    latest version if needed. DOES NOT COMMIT THE SESSION! YOU MUST COMMIT.
+    """
+    lineage = session.get(ProjectLineageModel, project_name)
+    if lineage is None:
+        return
+
+    session.delete(lineage)
+    if not lineage.is_head:
+        return
+
+    successor = session.exec(
+        select(ProjectLineageModel)
+        .join(
+            ProjectReportModel,
+            ProjectLineageModel.project_name == ProjectReportModel.project_name,
+        )
+        .where(
+            ProjectLineageModel.base_name == lineage.base_name,
+            ProjectLineageModel.project_name != project_name,
+        )
+        .order_by(
+            ProjectLineageModel.version.desc(),  # pyright: ignore
+            ProjectReportModel.created_at.desc(),  # pyright: ignore
+        )
+    ).first()
+
+    if successor is not None:
+        successor.is_head = True
+        session.add(successor)
 
 
 def get_latest_related_project_report(
     session: Session,
-    base_project_name: str
+    base_project_name: str,
+    include_file_reports: bool = True
 ) -> Optional[ProjectReport]:
     """
     Retrieve the latest saved ProjectReport in a version chain by base project name.
@@ -49,6 +147,7 @@ def get_latest_related_project_report(
     Args:
         session: SQLModel Session
         base_project_name: Unversioned project name (e.g. "ProjectA")
+        include_file_reports: Set to False to skip loading the file reports
 
     Returns:
         Latest related ProjectReport if found, else None
@@ -59,7 +158,7 @@ def get_latest_related_project_report(
     if latest_model is None:
         return None
 
-    return deserialize_project_report(latest_model)
+    return deserialize_project_report(latest_model, include_file_reports)
 
 
 def get_all_project_ids(
@@ -82,8 +181,9 @@ def save_project_report(
 ) -> ProjectReportModel:
     """
     Save a ProjectReport domain object along with all its FileReports
-    and generated ResumeItems into the database. DOES NOT COMMIT THE
-    SESSION! YOU MUST COMMIT.
+    and generated ResumeItems into the database, and update the stored
+    user-level aggregates with it. DOES NOT COMMIT THE SESSION! YOU MUST
+    COMMIT.
 
     Args:
         session: SQLModel Session
@@ -95,9 +195,13 @@ def save_project_report(
         The saved ProjectReportModel instance
     """
 
-    incoming_model = serialize_project_report(project_report, user_config_id)
+    # Files are serialized separately so the in-place update below does not
+    # pull the unsaved model into the session along with them
+    incoming_model = serialize_project_report(
+        project_report, user_config_id, include_file_reports=False)
     incoming_files = [serialize_file_report(
         fr) for fr in project_report.file_reports]
+    contribution = ProjectContribution.from_project_report(project_report)
 
     existing = get_project_report_model_by_name(
         session, incoming_model.project_name)
@@ -109,6 +213,9 @@ def save_project_report(
     if existing is None and latest_related_project is None:
         incoming_model.file_reports = incoming_files
         session.add(incoming_model)
+        _add_to_lineage(session, project_report.project_name, incoming_model)
+        record_project_contribution(
+            session, incoming_model.project_name, contribution, was_counted=False)
         return incoming_model
 
     existing = existing or latest_related_project
@@ -119,6 +226,7 @@ def save_project_report(
         existing.user_config_used = user_config_id
         existing.statistic = incoming_model.statistic
         existing.last_updated = datetime.now(timezone.utc)
+        was_counted = not existing.is_deleted
         # Resurrect if the project was previously soft-deleted
         if existing.is_deleted:
             existing.is_deleted = False
@@ -129,16 +237,17 @@ def save_project_report(
                 FileReportModel.project_name == previous_project_name)
         )
 
-        session.exec(
-            delete(ProjectInsightsModel).where(
-                ProjectInsightsModel.project_name == previous_project_name)
-        )
+        delete_project_insights(session, previous_project_name)
 
         for file_model in incoming_files:
             file_model.project_name = existing.project_name
             session.add(file_model)
 
         session.add(existing)
+        if session.get(ProjectLineageModel, existing.project_name) is None:
+            _add_to_lineage(session, project_report.project_name, existing)
+        record_project_contribution(
+            session, existing.project_name, contribution, was_counted)
         return existing
 
     # Files changed—create a NEW version row (do not mutate prior versions)
@@ -162,6 +271,9 @@ def save_project_report(
 
     incoming_model.file_reports = incoming_files
     session.add(incoming_model)
+    _add_to_lineage(session, project_report.project_name, incoming_model)
+    record_project_contribution(
+        session, versioned_name, contribution, was_counted=False)
     return incoming_model
 
 
@@ -177,16 +289,26 @@ def get_project_report_model_by_name(
 def get_project_report_models_by_names(
     session: Session,
     project_names: list[str],
+    include_file_reports: bool = True,
+    include_images: bool = False,
 ) -> list[ProjectReportModel]:
+    """
+    Fetch the named projects in one query, plus one for all their file
+    reports when `include_file_reports` is set and one for all their images
+    when `include_images` is set. Returned in the order of `project_names`.
+    Raises `KeyError` naming any project that does not exist.
+    """
     if not project_names:
         return []
 
-    statement = (
-        select(ProjectReportModel)
-        .where(ProjectReportModel.project_name.in_(project_names))
-        # pyright: ignore
-        .options(selectinload(ProjectReportModel.file_reports))
-    )
+    statement = select(ProjectReportModel).where(
+        ProjectReportModel.project_name.in_(project_names))  # pyright: ignore
+    if include_file_reports:
+        statement = statement.options(
+            selectinload(ProjectReportModel.file_reports))  # pyright: ignore
+    if include_images:
+        statement = statement.options(
+            selectinload(ProjectReportModel.image))  # pyright: ignore
     projects = list(session.exec(statement).all())
     projects_by_name = {project.project_name: project for project in projects}
     missing = [name for name in project_names if name not in projects_by_name]
@@ -195,9 +317,57 @@ def get_project_report_models_by_names(
     return [projects_by_name[name] for name in project_names]
 
 
+def get_project_last_updated(
+    session: Session,
+    project_names: Collection[str],
+) -> dict[str, datetime]:
+    """
+    The `last_updated` time of each named project that exists, without
+    loading the projects. Saving a project always moves it, so it stands in
+    for the project's statistics in cache keys.
+    """
+    if not project_names:
+        return {}
+    statement = select(ProjectReportModel.project_name, ProjectReportModel.last_updated).where(
+        ProjectReportModel.project_name.in_(project_names))  # pyright: ignore
+    return {name: last_updated for name, last_updated in session.exec(statement).all()}
+
+
+def get_project_reports_by_names(
+    session: Session,
+    project_names: list[str],
+    include_file_reports: bool = True,
+    statistic_keys: Optional[Collection[str]] = None,
+) -> list[ProjectReport]:
+    """
+    Bulk version of `get_project_report_by_name`. Loads every project in a
+    constant number of queries instead of one (or two) per project.
+
+    Args:
+        session: SQLModel Session
+        project_names: The project names to load
+        include_file_reports: Set to False to skip loading the file reports
+        statistic_keys: Only keep these project statistics (template
+            names), for callers that read a few values
+
+    Returns:
+        The ProjectReports, in the order of `project_names`
+
+    Raises:
+        KeyError: naming any project that does not exist
+    """
+    models = get_project_report_models_by_names(
+        session, project_names, include_file_reports)
+    return [
+        deserialize_project_report(model, include_file_reports, statistic_keys)
+        for model in models
+    ]
+
+
 def get_project_report_by_name(
     session: Session,
-    project_name: str
+    project_name: str,
+    include_file_reports: bool = True
 ) -> Optional[ProjectReport]:
     """
     Retrieve a ProjectReportModel by its project_name, including
@@ -206,6 +376,8 @@ def get_project_report_by_name(
     Args:
         session: SQLModel Session
         project_name: The project name to query
+        include_file_reports: Set to False to skip loading the file reports
+            when only project-level statistics are needed
 
     Returns:
         ProjectReportModel if found, else None
@@ -215,7 +387,7 @@ def get_project_report_by_name(
     if result is None:
         return None
 
-    return deserialize_project_report(result)
+    return deserialize_project_report(result, include_file_reports)
 
 
 def delete_project_report_by_name(
@@ -242,6 +414,16 @@ def delete_project_report_by_name(
     if project is None:
         return False
 
+    _remove_from_lineage(session, project_name)
+    withdraw_project_contribution(
+        session, project_name, was_counted=not project.is_deleted, keep_row=False)
+    # Removed first, otherwise deleting the project nulls their project_name
+    session.exec(
+        delete(FileReportModel).where(
+            FileReportModel.project_name == project_name)
+    )
+    if project.image_hash is not None:
+        release_project_image(session, project.image_hash, project_name)
     session.delete(project)
     return True
 
@@ -262,6 +444,31 @@ def get_all_project_report_models(session: Session) -> list[ProjectReportModel]:
     return list(session.exec(statement).all())
 
 
+def get_project_report_models_page(
+    session: Session,
+    sort: str = "rank",
+    limit: Optional[int] = None,
+    after: Optional[list] = None,
+    include_statistics: bool = True,
+) -> tuple[list[ProjectReportModel], Optional[list]]:
+    """
+    Get one page of the projects that are not soft-deleted, ordered by one
+    of `PROJECT_SORTS`. `after` is the value returned for the previous page.
+    Without `include_statistics` the statistics column is never read, and
+    touching `statistic` on the returned models loads it row by row.
+
+    Returns:
+        The projects, and the `after` value for the next page (None on the
+        last page).
+    """
+    statement = select(ProjectReportModel).where(
+        ProjectReportModel.is_deleted == False  # noqa: E712
+    )
+    if not include_statistics:
+        statement = statement.options(defer(ProjectReportModel.statistic))  # pyright: ignore
+    return fetch_page(session, statement, PROJECT_SORTS[sort], limit, after)
+
+
 def soft_delete_project_report_by_name(
     session: Session,
     project_name: str
@@ -284,6 +491,9 @@ def soft_delete_project_report_by_name(
     ).first()
     if project is None:
         return False
+    if not project.is_deleted:
+        withdraw_project_contribution(
+            session, project_name, was_counted=True, keep_row=True)
     project.is_deleted = True
     session.add(project)
     return True
@@ -12,6 +12,14 @@ from src.database.core.model_serializer import (
     serialize_resume,
     serialize_resume_item,
 )
+from src.database.core.pagination import SortKey, fetch_page
+
+RESUME_SORTS: dict[str, list[SortKey]] = {
+    "-last_updated": [SortKey(ResumeModel.last_updated, True), SortKey(ResumeModel.id, True)],
+    "last_updated": [SortKey(ResumeModel.last_updated), SortKey(ResumeModel.id)],
+    "-created_at": [SortKey(ResumeModel.created_at, True), SortKey(ResumeModel.id, True)],
+    "created_at": [SortKey(ResumeModel.created_at), SortKey(ResumeModel.id)],
+}
 
 
 def save_resume(
@@ -70,12 +78,25 @@ def list_resumes(session: Session) -> list[ResumeModel]:
     Loads resume items so item_count can be derived by the router.
     Most recently updated resumes are returned first.
     """
+    return list_resumes_page(session)[0]
+
+
+def list_resumes_page(
+    session: Session,
+    sort: str = "-last_updated",
+    limit: Optional[int] = None,
+    after: Optional[list] = None,
+) -> tuple[list[ResumeModel], Optional[list]]:
+    """
+    Returns one page of resumes ordered by one of `RESUME_SORTS`, with
+    their items loaded. `after` is the value returned for the previous
+    page; the returned one is None on the last page.
+    """
     statement = (
         select(ResumeModel)
         .options(selectinload(ResumeModel.items))  # pyright: ignore
-        .order_by(ResumeModel.last_updated.desc())
     )
-    return list(session.exec(statement).all())
+    return fetch_page(session, statement, RESUME_SORTS[sort], limit, after)
 
 
 def delete_resume(session: Session, resume_id: int) -> bool:
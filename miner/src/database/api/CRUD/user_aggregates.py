@@ -0,0 +1,256 @@
+"""
+CRUD for the stored user-level aggregates.
+
+`ProjectContributionModel` holds what each project adds to the user
+statistics and `UserAggregateModel` holds their totals over every project
+that is not soft-deleted. `projects.py` keeps both up to date as projects
+are saved and deleted, so reading the user statistics never loads a file
+report.
+"""
+
+from datetime import date, datetime, time, timezone
+from typing import Optional
+
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from src.core.report.user.user_aggregates import ProjectContribution, UserAggregates
+from src.core.statistic import CodingLanguage
+from src.database.api.models import (
+    ProjectContributionModel,
+    ProjectReportModel,
+    UserAggregateModel,
+)
+from src.database.core.model_deserializer import deserialize_project_report
+
+
+def record_project_contribution(
+    session: Session,
+    project_name: str,
+    contribution: ProjectContribution,
+    was_counted: bool,
+) -> None:
+    """
+    Store a project's contribution and move the user totals over to it.
+    `was_counted` says whether the project's previous contribution (if it
+    had one) is currently part of the totals. DOES NOT COMMIT THE SESSION!
+    YOU MUST COMMIT.
+    """
+    row = session.get(ProjectContributionModel, project_name)
+    totals = _get_totals_model(session)
+
+    if totals is not None:
+        aggregates = _to_aggregates(totals)
+        if row is not None and was_counted:
+            aggregates.subtract(_to_contribution(row))
+            totals.project_count -= 1
+            _recompute_dates(session, aggregates, exclude=project_name)
+        aggregates.add(contribution)
+        totals.project_count += 1
+        _write_aggregates(totals, aggregates)
+        session.add(totals)
+
+    if row is None:
+        row = ProjectContributionModel(project_name=project_name)
+    _write_contribution(row, contribution)
+    session.add(row)
+
+
+def withdraw_project_contribution(
+    session: Session,
+    project_name: str,
+    was_counted: bool,
+    keep_row: bool,
+) -> None:
+    """
+    Take a project out of the user totals, for deletes and soft-deletes.
+    With `keep_row` the stored contribution stays so the project can be
+    counted again later. DOES NOT COMMIT THE SESSION! YOU MUST COMMIT.
+    """
+    row = session.get(ProjectContributionModel, project_name)
+    totals = _get_totals_model(session)
+
+    if totals is not None and was_counted:
+        if row is None:
+            # The totals cannot be corrected without the contribution, so
+            # drop them and let the next read rebuild them
+            session.delete(totals)
+        else:
+            aggregates = _to_aggregates(totals)
+            aggregates.subtract(_to_contribution(row))
+            totals.project_count -= 1
+            _recompute_dates(session, aggregates, exclude=project_name)
+            _write_aggregates(totals, aggregates)
+            session.add(totals)
+
+    if row is not None and not keep_row:
+        session.delete(row)
+
+
+def get_user_aggregates(session: Session) -> UserAggregates:
+    """
+    Get the user totals over every project that is not soft-deleted. If
+    they were never stored they are built and committed in a session of
+    their own, so this only reads through `session` and leaves whatever it
+    holds uncommitted.
+    """
+    totals = _get_totals_model(session)
+    if totals is not None:
+        return _to_aggregates(totals)
+
+    with Session(session.get_bind()) as rebuild_session:
+        aggregates = rebuild_user_aggregates(rebuild_session)
+        rebuild_session.commit()
+    return aggregates
+
+
+def rebuild_user_aggregates(session: Session) -> UserAggregates:
+    """
+    Recompute the user totals from the stored contributions, computing
+    any missing ones from the full project reports. DOES NOT COMMIT THE
+    SESSION! YOU MUST COMMIT.
+    """
+    project_names = list(session.exec(
+        select(ProjectReportModel.project_name).where(
+            ProjectReportModel.is_deleted == False  # noqa: E712
+        )
+    ).all())
+    aggregates = UserAggregates.from_contributions(
+        get_project_contributions(session, project_names))
+
+    totals = _get_totals_model(session) or UserAggregateModel()
+    totals.project_count = len(project_names)
+    _write_aggregates(totals, aggregates)
+    session.add(totals)
+    return aggregates
+
+
+def get_project_contributions(
+    session: Session,
+    project_names: list[str],
+) -> list[ProjectContribution]:
+    """
+    Get the stored contributions of `project_names`, in the same order.
+    Projects saved before contributions were stored have theirs computed
+    and stored now. Raises `KeyError` naming any project that does not
+    exist. DOES NOT COMMIT THE SESSION! YOU MUST COMMIT to keep them.
+    """
+    if not project_names:
+        return []
+
+    rows = session.exec(
+        select(ProjectContributionModel).where(
+            ProjectContributionModel.project_name.in_(  # pyright: ignore
+                project_names)
+        )
+    ).all()
+    by_name = {row.project_name: _to_contribution(row) for row in rows}
+
+    missing = []
+    for name in project_names:
+        if name in by_name:
+            continue
+        project = session.get(ProjectReportModel, name)
+        if project is None:
+            missing.append(name)
+            continue
+        contribution = ProjectContribution.from_project_report(
+            deserialize_project_report(project))
+        row = ProjectContributionModel(project_name=name)
+        _write_contribution(row, contribution)
+        session.add(row)
+        by_name[name] = contribution
+
+    if missing:
+        raise KeyError(", ".join(missing))
+    return [by_name[name] for name in project_names]
+
+
+def _get_totals_model(session: Session) -> Optional[UserAggregateModel]:
+    return session.exec(select(UserAggregateModel)).first()
+
+
+def _recompute_dates(
+    session: Session,
+    aggregates: UserAggregates,
+    exclude: str,
+) -> None:
+    """
+    Recompute the date range over the counted projects other than
+    `exclude`, since a min/max cannot be subtracted.
+    """
+    start_date, end_date = session.exec(
+        select(
+            func.min(ProjectContributionModel.start_date),
+            func.max(ProjectContributionModel.end_date),
+        )
+        .join(
+            ProjectReportModel,
+            ProjectReportModel.project_name == ProjectContributionModel.project_name,
+        )
+        .where(
+            ProjectReportModel.is_deleted == False,  # noqa: E712
+            ProjectContributionModel.project_name != exclude,
+        )
+    ).one()
+    aggregates.start_date = start_date
+    aggregates.end_date = end_date
+
+
+def _to_contribution(row: ProjectContributionModel) -> ProjectContribution:
+    return ProjectContribution(
+        weight=row.weight,
+        skill_weights=dict(row.skill_weights),
+        language_bytes=_decode_languages(row.language_bytes),
+        start_date=row.start_date,
+        end_date=row.end_date,
+        commit_timeline=dict(row.commit_timeline),
+        total_commit_timeline=dict(row.total_commit_timeline),
+    )
+
+
+def _write_contribution(row: ProjectContributionModel, contribution: ProjectContribution) -> None:
+    row.weight = contribution.weight
+    row.skill_weights = dict(contribution.skill_weights)
+    row.language_bytes = _encode_languages(contribution.language_bytes)
+    row.start_date = _as_datetime(contribution.start_date)
+    row.end_date = _as_datetime(contribution.end_date)
+    row.commit_timeline = dict(contribution.commit_timeline)
+    row.total_commit_timeline = dict(contribution.total_commit_timeline)
+
+
+def _to_aggregates(totals: UserAggregateModel) -> UserAggregates:
+    return UserAggregates(
+        skill_weights=dict(totals.skill_weights),
+        language_bytes=_decode_languages(totals.language_bytes),
+        start_date=totals.start_date,
+        end_date=totals.end_date,
+        commit_timeline=dict(totals.commit_timeline),
+        total_commit_timeline=dict(totals.total_commit_timeline),
+    )
+
+
+def _write_aggregates(totals: UserAggregateModel, aggregates: UserAggregates) -> None:
+    # Reassigned rather than mutated so the JSON columns are marked dirty
+    totals.skill_weights = dict(aggregates.skill_weights)
+    totals.language_bytes = _encode_languages(aggregates.language_bytes)
+    totals.start_date = _as_datetime(aggregates.start_date)
+    totals.end_date = _as_datetime(aggregates.end_date)
+    totals.commit_timeline = dict(aggregates.commit_timeline)
+    totals.total_commit_timeline = dict(aggregates.total_commit_timeline)
+    totals.last_updated = datetime.now(timezone.utc)
+
+
+def _encode_languages(language_bytes: dict[CodingLanguage, float]) -> dict[str, float]:
+    return {language.value: value for language, value in language_bytes.items()}
+
+
+def _decode_languages(language_bytes: dict[str, float]) -> dict[CodingLanguage, float]:
+    return {CodingLanguage(language): value for language, value in language_bytes.items()}
+
+
+def _as_datetime(value: Optional[date]) -> Optional[datetime]:
+    # SQLite's DateTime column only takes datetimes
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.combine(value, time.min)
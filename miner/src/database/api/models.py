@@ -8,7 +8,7 @@ from datetime import datetime, date, timezone
 from typing import Optional, List, Any
 from pydantic import field_serializer
 from sqlmodel import Field, SQLModel, Relationship
-from sqlalchemy import Column, JSON, LargeBinary
+from sqlalchemy import Column, Index, Integer, JSON, LargeBinary, cast
 
 
 class UserConfigModel(SQLModel, table=True):
@@ -36,22 +36,39 @@ class UserConfigModel(SQLModel, table=True):
     )
 
 
+class ProjectImageModel(SQLModel, table=True):
+    """
+    An uploaded project image, stored once per distinct content and keyed
+    by its SHA-256 hash, along with a thumbnail made on upload. Kept out of
+    `ProjectReportModel` so loading projects never reads image bytes.
+    """
+    hash: str = Field(primary_key=True)
+    content_type: str
+    data: bytes = Field(sa_column=Column(LargeBinary, nullable=False))
+    thumbnail: Optional[bytes] = Field(
+        default=None, sa_column=Column(LargeBinary, nullable=True))
+    thumbnail_content_type: Optional[str] = None
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc))
+
+
 class ProjectReportModel(SQLModel, table=True):
     project_name: str = Field(primary_key=True)
     user_config_used: Optional[int] = Field(
         default=None, foreign_key="userconfigmodel.id")
-    image_data: Optional[bytes] = Field(
-        default=None, sa_column=Column(LargeBinary, nullable=True)
-    )  # This stores your image bytes
+    # Hash of the project's image in `ProjectImageModel`
+    image_hash: Optional[str] = Field(
+        default=None, foreign_key="projectimagemodel.hash", index=True)
     statistic: dict = Field(sa_column=Column(JSON, nullable=False))
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc))
-    last_updated: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+        default_factory=lambda: datetime.now(timezone.utc), index=True)
+    last_updated: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc), index=True)
     analyzed_count: int = Field(default=1, nullable=False)
     parent: Optional[str] = None
 
     # Representation (Milestone 2 human-in-the-loop)
-    representation_rank: int | None = None
+    representation_rank: int | None = Field(default=None, index=True)
     chrono_start_override: datetime | None = None
     chrono_end_override: datetime | None = None
     showcase_selected: bool = Field(default=False)
@@ -71,7 +88,7 @@ class ProjectReportModel(SQLModel, table=True):
         default_factory=list, sa_column=Column(JSON))
     showcase_last_user_edit_at: Optional[datetime] = None
 
-    is_deleted: bool = Field(default=False)
+    is_deleted: bool = Field(default=False, index=True)
 
     # Relationships
 
@@ -80,26 +97,141 @@ class ProjectReportModel(SQLModel, table=True):
         back_populates="project_reports")
     file_reports: List["FileReportModel"] = Relationship(
         back_populates="project")
+    image: Optional[ProjectImageModel] = Relationship()
     project_insights: Optional["ProjectInsightsModel"] = Relationship(
         back_populates="project",
         cascade_delete=True)
 
 
+# 1 for projects without a representation rank, which list after ranked
+# ones. `GET /projects/` sorts by this expression, so it is indexed as is.
+PROJECT_UNRANKED = cast(ProjectReportModel.representation_rank.is_(None), Integer)
+
+Index(
+    "ix_projectreportmodel_rank_order",
+    PROJECT_UNRANKED,
+    ProjectReportModel.representation_rank,
+    ProjectReportModel.created_at,
+    ProjectReportModel.project_name,
+)
+
+
+class ProjectLineageModel(SQLModel, table=True):
+    """
+    Places each project row in its version chain. All versions of a project
+    share a `base_name` (the unversioned name, e.g. "ProjectA" for
+    "ProjectA_2") and exactly one of them is flagged as the head, so the
+    latest version is a single indexed lookup.
+    """
+    __table_args__ = (
+        Index("ix_projectlineagemodel_base_name_is_head", "base_name", "is_head"),
+    )
+
+    project_name: str = Field(
+        primary_key=True,
+        foreign_key="projectreportmodel.project_name",
+        ondelete="CASCADE"
+    )
+    base_name: str
+    version: int = Field(default=1)
+    is_head: bool = Field(default=True)
+
+
 class ProjectInsightsModel(SQLModel, table=True):
+    """
+    Marks that a project's insights have been generated; the messages
+    themselves are `InsightMessageModel` rows.
+    """
     project_name: str = Field(
         primary_key=True,
         foreign_key="projectreportmodel.project_name",
         ondelete="CASCADE"
     )
-    insights: List[str] = Field(sa_column=Column(JSON, nullable=False))
     generated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
     # Relationship
     project: Optional["ProjectReportModel"] = Relationship(
         back_populates="project_insights")
+    messages: List["InsightMessageModel"] = Relationship(
+        cascade_delete=True,
+        sa_relationship_kwargs={"order_by": "InsightMessageModel.position"})
+
+
+class InsightMessageModel(SQLModel, table=True):
+    """
+    One generated insight, with the calculator it came from and whether
+    that calculator reads ML-inferred statistics, so the ML-derived ones
+    can be left out for users without ML consent.
+    """
+    __table_args__ = (
+        Index("ix_insightmessagemodel_project_name_position",
+              "project_name", "position"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    project_name: str = Field(
+        foreign_key="projectinsightsmodel.project_name",
+        ondelete="CASCADE"
+    )
+    # Order the message was generated in
+    position: int
+    message: str
+    source: str
+    uses_ml: bool = Field(default=False)
+
+
+class ProjectContributionModel(SQLModel, table=True):
+    """
+    What a project adds to the user-level statistics (a stored
+    `ProjectContribution`), written whenever the project is saved so user
+    statistics never have to load its file reports.
+    """
+    project_name: str = Field(
+        primary_key=True,
+        foreign_key="projectreportmodel.project_name",
+        ondelete="CASCADE"
+    )
+    weight: float = Field(default=0.0)
+    skill_weights: dict = Field(
+        sa_column=Column(JSON, nullable=False), default_factory=dict)
+    language_bytes: dict = Field(
+        sa_column=Column(JSON, nullable=False), default_factory=dict)
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    commit_timeline: dict = Field(
+        sa_column=Column(JSON, nullable=False), default_factory=dict)
+    total_commit_timeline: dict = Field(
+        sa_column=Column(JSON, nullable=False), default_factory=dict)
+
+
+class UserAggregateModel(SQLModel, table=True):
+    """
+    Running totals of `ProjectContributionModel` over every project that is
+    not soft-deleted. A single row, kept up to date as projects are saved,
+    deleted and soft-deleted.
+    """
+    id: Optional[int] = Field(default=None, primary_key=True)
+    project_count: int = Field(default=0)
+    skill_weights: dict = Field(
+        sa_column=Column(JSON, nullable=False), default_factory=dict)
+    language_bytes: dict = Field(
+        sa_column=Column(JSON, nullable=False), default_factory=dict)
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    commit_timeline: dict = Field(
+        sa_column=Column(JSON, nullable=False), default_factory=dict)
+    total_commit_timeline: dict = Field(
+        sa_column=Column(JSON, nullable=False), default_factory=dict)
+    last_updated: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc))
 
 
 class DismissedInsightModel(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_dismissedinsightmodel_project_name_message",
+              "project_name", "message"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     project_name: str = Field(
         foreign_key="projectreportmodel.project_name",
@@ -110,12 +242,34 @@ class DismissedInsightModel(SQLModel, table=True):
 
 
 class FileReportModel(SQLModel, table=True):
+    """
+    A file's statistics. The ones `GET /projects/{name}/files` filters and
+    sorts by are also copied out of `statistic` into their own columns,
+    indexed together with `project_name` so one project's files can be
+    paged without reading the JSON of the others.
+    """
+    __table_args__ = (
+        Index("ix_filereportmodel_project_name_file_path", "project_name", "file_path"),
+        Index("ix_filereportmodel_project_name_size_bytes", "project_name", "size_bytes"),
+        Index("ix_filereportmodel_project_name_line_count", "project_name", "line_count"),
+        Index("ix_filereportmodel_project_name_percentage_lines_committed",
+              "project_name", "percentage_lines_committed"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
-    project_name: str = Field(foreign_key="projectreportmodel.project_name")
-    file_path: str
+    project_name: str = Field(
+        foreign_key="projectreportmodel.project_name", index=True)
+    file_path: str = Field(index=True)
     is_info_file: bool = False
-    file_hash: Optional[bytes] = None
+    file_hash: Optional[bytes] = Field(default=None, index=True)
     statistic: dict = Field(sa_column=Column(JSON, nullable=False))
+    # Copied from `statistic` (CODING_LANGUAGE, TYPE_OF_FILE, FILE_SIZE_BYTES,
+    # LINES_IN_FILE and PERCENTAGE_LINES_COMMITTED)
+    coding_language: Optional[str] = None
+    file_type: Optional[str] = None
+    size_bytes: Optional[int] = None
+    line_count: Optional[int] = None
+    percentage_lines_committed: Optional[float] = None
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc))
 
@@ -205,9 +359,9 @@ class ResumeModel(SQLModel, table=True):
     )
 
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc))
+        default_factory=lambda: datetime.now(timezone.utc), index=True)
     last_updated: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc))
+        default_factory=lambda: datetime.now(timezone.utc), index=True)
 
     # Relationship
     items: List["ResumeItemModel"] = Relationship(back_populates="resume")
@@ -280,7 +434,7 @@ class PortfolioModel(SQLModel, table=True):
 
     # Metadata fields
     creation_time: datetime = Field(default_factory=datetime.now)
-    last_updated_at: datetime = Field(default_factory=datetime.now)
+    last_updated_at: datetime = Field(default_factory=datetime.now, index=True)
     project_ids_include: List[str] = Field(
         sa_column=Column(JSON), default=list())
 
@@ -300,7 +454,7 @@ class PortfolioProjectCardModel(SQLModel, table=True):
     The is_showcase flag is user-controlled and never overwritten by the system.
     """
     id: Optional[int] = Field(default=None, primary_key=True)
-    portfolio_id: int = Field(foreign_key="portfoliomodel.id")
+    portfolio_id: int = Field(foreign_key="portfoliomodel.id", index=True)
 
     # project_name is NOT a FK — portfolio-scoped snapshot; avoids cascade issues
     project_name: str
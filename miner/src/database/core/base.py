@@ -3,12 +3,89 @@ This file initializes `Base`, a class that all of our models (tables)
 inherit and defines a function to use the database's `engine`.
 '''
 
+import os
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from sqlmodel import create_engine, inspect
 
 DB_PATH = "sqlite:///src/database/data.db"
 
 ENGINE_CACHE = None
 
+# Applied to every new SQLite connection. WAL lets API reads carry on while
+# a mining job writes, and with WAL `synchronous=NORMAL` only syncs at
+# checkpoints instead of on every commit. Each value can be overridden with
+# `ARTIFACT_MINER_SQLITE_<PRAGMA>` (e.g. `ARTIFACT_MINER_SQLITE_BUSY_TIMEOUT`),
+# and `ARTIFACT_MINER_SQLITE_PROFILE=0` turns the profile off.
+SQLITE_PRAGMAS: dict[str, str | int] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,             # ms to wait on a lock before failing
+    "mmap_size": 256 * 1024 * 1024,   # bytes of the file memory-mapped
+    "cache_size": -64 * 1024,         # negative means KiB, so 64 MiB
+    "temp_store": "MEMORY",
+}
+
+# FastAPI runs sync endpoints on a threadpool of 40 workers, so the default
+# pool of 5 (+10 overflow) connections makes requests queue for a connection.
+_DEFAULT_POOL_SIZE = 10
+_DEFAULT_MAX_OVERFLOW = 20
+_DEFAULT_POOL_TIMEOUT_SECONDS = 30
+
+
+def sqlite_pragmas() -> dict[str, str | int]:
+    '''Return the pragmas to apply, taking `ARTIFACT_MINER_SQLITE_*` overrides into account.'''
+
+    if os.environ.get("ARTIFACT_MINER_SQLITE_PROFILE", "1") == "0":
+        return {}
+
+    pragmas: dict[str, str | int] = {}
+    for name, default in SQLITE_PRAGMAS.items():
+        pragmas[name] = os.environ.get(
+            f"ARTIFACT_MINER_SQLITE_{name.upper()}", default)
+    return pragmas
+
+
+def apply_sqlite_pragmas(engine: Engine, pragmas: dict[str, str | int]) -> None:
+    '''Run `PRAGMA name=value` for each entry on every connection the engine opens.'''
+
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def create_sqlite_engine(url: str, pragmas: dict[str, str | int] | None = None) -> Engine:
+    '''
+    Create an engine for a file-backed SQLite database with a pool sized
+    for the API threadpool and `pragmas` (the configured profile by default)
+    applied to each connection.
+    '''
+
+    if pragmas is None:
+        pragmas = sqlite_pragmas()
+
+    engine = create_engine(
+        url,
+        future=True,
+        connect_args={"check_same_thread": False},
+        pool_size=int(os.environ.get(
+            "ARTIFACT_MINER_DB_POOL_SIZE", _DEFAULT_POOL_SIZE)),
+        max_overflow=int(os.environ.get(
+            "ARTIFACT_MINER_DB_MAX_OVERFLOW", _DEFAULT_MAX_OVERFLOW)),
+        pool_timeout=_DEFAULT_POOL_TIMEOUT_SECONDS,
+    )
+    apply_sqlite_pragmas(engine, pragmas)
+    return engine
+
 
 def get_engine():
     '''
@@ -19,7 +96,7 @@ def get_engine():
     global ENGINE_CACHE
 
     if not ENGINE_CACHE:
-        ENGINE_CACHE = create_engine(DB_PATH, future=True)
+        ENGINE_CACHE = create_sqlite_engine(DB_PATH)
 
     return ENGINE_CACHE
 
@@ -0,0 +1,143 @@
+'''
+In-process version counters for the rows API responses are built from.
+
+Every committed write bumps the version of the entity it touches (a
+project, a resume) and of that entity's kind as a whole, so a cached
+response can be checked against the versions it was built at instead of
+being reloaded. Versions are collected from the ORM session events below
+as rows are flushed and applied once the transaction commits, so readers
+never see a new version before the data behind it.
+
+Bulk `UPDATE`/`DELETE` statements do not say which rows they touched, so
+they bump every entity of their kind.
+'''
+
+import threading
+from typing import Hashable, Iterable, Optional, Union
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.database.api.models import (
+    FileReportModel,
+    ProjectContributionModel,
+    ProjectReportModel,
+    ResumeConfigModel,
+    ResumeItemModel,
+    ResumeModel,
+    UserAggregateModel,
+    UserConfigModel,
+)
+
+PROJECT = "project"
+RESUME = "resume"
+USER_CONFIG = "user_config"
+
+# A `(kind, key)` pair names one entity; a bare kind names all of them
+Dependency = Union[str, tuple[str, Hashable]]
+
+_PENDING_KEY = "entity_versions_pending"
+
+# model -> (kind, attribute holding the entity key, or None for kind-wide rows)
+_TRACKED_MODELS: dict[type, tuple[str, Optional[str]]] = {
+    ProjectReportModel: (PROJECT, "project_name"),
+    FileReportModel: (PROJECT, "project_name"),
+    ProjectContributionModel: (PROJECT, "project_name"),
+    UserAggregateModel: (PROJECT, None),
+    ResumeModel: (RESUME, "id"),
+    ResumeItemModel: (RESUME, "resume_id"),
+    UserConfigModel: (USER_CONFIG, None),
+    ResumeConfigModel: (USER_CONFIG, None),
+}
+
+_lock = threading.Lock()
+_entity_versions: dict[tuple[str, Hashable], int] = {}
+# Bumped by any change to a kind; what views over every entity depend on
+_kind_versions: dict[str, int] = {}
+# Bumped by bulk statements; every entity of the kind depends on it
+_bulk_versions: dict[str, int] = {}
+
+
+def versions_of(dependencies: Iterable[Dependency]) -> tuple[int, ...]:
+    '''Return the current version of each dependency, in order.'''
+    out: list[int] = []
+    with _lock:
+        for dependency in dependencies:
+            if isinstance(dependency, tuple):
+                kind = dependency[0]
+                out.append(_bulk_versions.get(kind, 0))
+                out.append(_entity_versions.get(dependency, 0))
+            else:
+                out.append(_kind_versions.get(dependency, 0))
+    return tuple(out)
+
+
+def bump(kind: str, key: Optional[Hashable] = None) -> None:
+    '''
+    Mark entity `key` of `kind` as changed, or every entity of `kind` when
+    `key` is None.
+    '''
+    with _lock:
+        _bump_kind(kind)
+        if key is None:
+            _bulk_versions[kind] = _bulk_versions.get(kind, 0) + 1
+        else:
+            _entity_versions[(kind, key)] = _entity_versions.get((kind, key), 0) + 1
+
+
+def bump_kind(kind: str) -> None:
+    '''
+    Mark `kind` as changed without touching its entities, for rows that
+    only feed views over every entity (like the user-level totals).
+    '''
+    with _lock:
+        _bump_kind(kind)
+
+
+def _bump_kind(kind: str) -> None:
+    _kind_versions[kind] = _kind_versions.get(kind, 0) + 1
+
+
+def _pending(session: Session) -> set[tuple[str, str, Optional[Hashable]]]:
+    return session.info.setdefault(_PENDING_KEY, set())
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_flushed_rows(session: Session, flush_context, instances) -> None:
+    pending = _pending(session)
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        tracked = _TRACKED_MODELS.get(type(instance))
+        if tracked is None:
+            continue
+        kind, attribute = tracked
+        key = getattr(instance, attribute) if attribute else None
+        if key is None:
+            # Kind-wide rows, and rows not given a key yet, which nothing
+            # can have been cached under
+            pending.add(("kind", kind, None))
+        else:
+            pending.add(("entity", kind, key))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_statements(orm_execute_state) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    tracked = _TRACKED_MODELS.get(mapper.class_) if mapper is not None else None
+    if tracked is not None:
+        _pending(orm_execute_state.session).add(("bulk", tracked[0], None))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending(session: Session) -> None:
+    for scope, kind, key in session.info.pop(_PENDING_KEY, set()):
+        if scope == "kind":
+            bump_kind(kind)
+        else:
+            bump(kind, key)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,58 @@
+'''
+Applies the Alembic migrations in `src/database/migrations` to a database.
+
+Databases created before the schema was managed by Alembic have every
+table but no `alembic_version` row; those are stamped at the baseline
+revision first so only the later revisions run against them.
+'''
+
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
+
+from src.database.core.base import get_engine
+from src.infrastructure.log.logging import get_logger
+
+logger = get_logger(__name__)
+
+MIGRATIONS_DIR = Path(__file__).resolve().parents[1] / "migrations"
+BASELINE_REVISION = "0001"
+
+
+def _alembic_config(connection) -> Config:
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    config.attributes["connection"] = connection
+    return config
+
+
+def current_revision(engine: Engine | None = None) -> str | None:
+    '''Return the revision the database is at, or None if it is unversioned.'''
+    if engine is None:
+        engine = get_engine()
+    with engine.connect() as connection:
+        return MigrationContext.configure(connection).get_current_revision()
+
+
+def upgrade_database(engine: Engine | None = None, revision: str = "head") -> None:
+    '''
+    Bring the database schema up to `revision` (the latest by default).
+    Safe to call on every startup; it is a no-op when already up to date.
+    '''
+    if engine is None:
+        engine = get_engine()
+
+    with engine.begin() as connection:
+        config = _alembic_config(connection)
+        version = MigrationContext.configure(connection).get_current_revision()
+
+        if version is None and inspect(connection).has_table("projectreportmodel"):
+            logger.info("Adopting unversioned database at revision %s",
+                        BASELINE_REVISION)
+            command.stamp(config, BASELINE_REVISION)
+
+        command.upgrade(config, revision)
@@ -4,10 +4,12 @@ them into domain classes
 """
 
 import base64
+from typing import Collection, Optional
+
 from src.core.report import FileReport, ProjectReport
 from src.core.resume.resume import Resume, ResumeItem, SkillsByExpertise
 from src.database.api.models import FileReportModel, ProjectReportModel, ResumeItemModel, ResumeModel
-from src.core.statistic import StatisticIndex, FileStatCollection, ProjectStatCollection, deserialize, Statistic, WeightedSkills
+from src.core.statistic import LazyStatisticIndex, FileStatCollection, ProjectStatCollection, WeightedSkills
 from src.infrastructure.log.logging import get_logger
 from src.database.api.models import BlockModel
 from src.core.portfolio.portfolio import Portfolio, PortfolioMetadata
@@ -31,11 +33,12 @@ TEMPLATE_LOOKUP = {
 }
 
 
-def deserialize_statistics(statistic: dict) -> StatisticIndex:
+def deserialize_statistics(statistic: dict) -> LazyStatisticIndex:
     """
     Convert a dict of serialized statistics back into a StatisticIndex.
+    Values are decoded lazily, the first time each statistic is read.
     """
-    stat_index = StatisticIndex()
+    raw_statistics = {}
 
     for key, value in statistic.items():
         template = TEMPLATE_LOOKUP.get(key)
@@ -45,10 +48,9 @@ def deserialize_statistics(statistic: dict) -> StatisticIndex:
                 f"Tried to desearlize statistics but couldn't find stat {key}")
             continue
 
-        stat_value = deserialize(value)
-        stat_index.add(Statistic(stat_template=template, value=stat_value))
+        raw_statistics[template] = value
 
-    return stat_index
+    return LazyStatisticIndex(raw_statistics)
 
 
 def deserialize_file_report(file_report_model: FileReportModel) -> FileReport:
@@ -67,17 +69,30 @@ def deserialize_file_report(file_report_model: FileReportModel) -> FileReport:
     )
 
 
-def deserialize_project_report(project_report_model: ProjectReportModel) -> ProjectReport:
+def deserialize_project_report(
+    project_report_model: ProjectReportModel,
+    include_file_reports: bool = True,
+    statistic_keys: Optional[Collection[str]] = None,
+) -> ProjectReport:
     """
     Turn a ProjectReportModel into a ProjectReport domain object.
+
+    With `include_file_reports=False` the file reports are neither loaded
+    nor deserialized, for callers that only read project-level statistics.
+    `statistic_keys` limits the project statistics to those template names.
     """
+    statistic = project_report_model.statistic
+    if statistic_keys is not None:
+        statistic = {key: statistic[key]
+                     for key in statistic_keys if key in statistic}
+
     # Convert the serialized statistics JSON into a StatisticIndex
-    stat_index = deserialize_statistics(project_report_model.statistic)
+    stat_index = deserialize_statistics(statistic)
 
     # Deserialize file reports if needed
     file_reports = [
         deserialize_file_report(f) for f in project_report_model.file_reports
-    ] if project_report_model.file_reports else []
+    ] if include_file_reports and project_report_model.file_reports else []
 
     return ProjectReport(
         project_name=project_report_model.project_name,
@@ -24,6 +24,22 @@ from src.utils.errors import DomainClassToModelConverisonError
 from src.core.portfolio.sections.block.block import Block, BlockContent
 
 
+def _enum_value(encoded) -> Optional[str]:
+    # Enum statistics are stored as {"__type__": "enum", ..., "value": ...}
+    return encoded.get("value") if isinstance(encoded, dict) else encoded
+
+
+def _file_columns(file_statistics: dict) -> dict:
+    """The `FileReportModel` columns copied out of the serialized statistics."""
+    return {
+        "coding_language": _enum_value(file_statistics.get("CODING_LANGUAGE")),
+        "file_type": _enum_value(file_statistics.get("TYPE_OF_FILE")),
+        "size_bytes": file_statistics.get("FILE_SIZE_BYTES"),
+        "line_count": file_statistics.get("LINES_IN_FILE"),
+        "percentage_lines_committed": file_statistics.get("PERCENTAGE_LINES_COMMITTED"),
+    }
+
+
 def serialize_file_report(file_report: FileReport) -> FileReportModel:
     """
     Serializes a FileReport domain object into a FileReportModel (SQLModel)
@@ -59,13 +75,15 @@ def serialize_file_report(file_report: FileReport) -> FileReportModel:
         file_path=file_path,
         is_info_file=is_info_file,
         file_hash=file_hash,
-        statistic=file_statistics
+        statistic=file_statistics,
+        **_file_columns(file_statistics),
     )
 
 
 def serialize_project_report(
     project_report: ProjectReport,
-    user_config_id: Optional[int]
+    user_config_id: Optional[int],
+    include_file_reports: bool = True
 ) -> ProjectReportModel:
     """
     Serializes a ProjectReport domain object into a ProjectReportModel (SQLModel)
@@ -73,6 +91,8 @@ def serialize_project_report(
     Args:
         project_report: Domain-level ProjectReport
         user_config_id: ID of the associated UserConfigModel
+        include_file_reports: Set to False to leave `file_reports` empty, for
+            callers that serialize the file reports themselves
 
     Returns:
         ProjectReportModel ready to be added to the DB
@@ -96,10 +116,9 @@ def serialize_project_report(
         parent=None
     )
 
-    file_models = [serialize_file_report(fr)
-                   for fr in project_report.file_reports]
-
-    project_model.file_reports = file_models
+    if include_file_reports:
+        project_model.file_reports = [serialize_file_report(fr)
+                                      for fr in project_report.file_reports]
 
     return project_model
 
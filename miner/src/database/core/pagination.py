@@ -0,0 +1,127 @@
+'''
+Keyset (cursor) pagination for list queries.
+
+A page is the rows strictly after the sort-key values of the previous
+page's last row, so pages stay stable while rows are added and each page
+is one indexed range scan rather than an `OFFSET` over everything before
+it. The last key in every sort must be unique (usually the primary key)
+so that rows with equal sort values are not skipped.
+
+Keys may be NULL; as in SQLite's ordering, NULLs sort before every value.
+'''
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import and_, false, or_
+from sqlalchemy.sql.elements import ColumnElement
+from sqlmodel import Session
+
+
+@dataclass(frozen=True)
+class SortKey:
+    expression: ColumnElement
+    descending: bool = False
+
+
+def key_types(keys: Sequence[SortKey]) -> list[tuple[type, ...]]:
+    '''
+    The Python types each key's cursor value may have, including NoneType
+    for nullable keys, so a cursor can be checked before it is queried.
+    '''
+    types = []
+    for key in keys:
+        python_type = _python_type(key)
+        nullable = getattr(key.expression, "nullable", True)
+        types.append((python_type, type(None)) if nullable else (python_type,))
+    return types
+
+
+def order_by(keys: Sequence[SortKey]) -> list[ColumnElement]:
+    return [key.expression.desc() if key.descending else key.expression.asc() for key in keys]
+
+
+def after(keys: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement:
+    '''
+    The condition for rows that sort after `values`:
+    `(k1 > v1) OR (k1 = v1 AND k2 > v2) OR ...`, flipped for descending keys.
+    '''
+    if len(values) != len(keys):
+        raise ValueError("A cursor must have one value per sort key")
+
+    clauses = []
+    for i, key in enumerate(keys):
+        equal_before = [_equal(keys[j], _coerce(keys[j], values[j])) for j in range(i)]
+        clauses.append(and_(*equal_before, _beyond(key, _coerce(key, values[i]))))
+    return or_(*clauses)
+
+
+def fetch_page(
+    session: Session,
+    statement,
+    keys: Sequence[SortKey],
+    limit: Optional[int] = None,
+    after_values: Optional[Sequence[Any]] = None,
+) -> tuple[list[Any], Optional[list[Any]]]:
+    '''
+    Run `statement` (a `select` of one entity) sorted by `keys`, starting
+    after `after_values` and returning at most `limit` rows (all of them
+    when `limit` is None).
+
+    Returns the rows and the key values to pass as `after_values` for the
+    next page, or None when this is the last page.
+    '''
+    statement = statement.add_columns(*(key.expression for key in keys))
+    if after_values is not None:
+        statement = statement.where(after(keys, after_values))
+    statement = statement.order_by(*order_by(keys))
+    if limit is not None:
+        # One extra row says whether there is a next page
+        statement = statement.limit(limit + 1)
+
+    # `exec` would return only the entity; the key columns are needed too
+    rows = session.execute(statement).all()
+    has_more = limit is not None and len(rows) > limit
+    rows = rows[:limit] if has_more else rows
+
+    next_values = [_to_json(value) for value in rows[-1][1:]] if has_more else None
+    return [row[0] for row in rows], next_values
+
+
+def _beyond(key: SortKey, value: Any) -> ColumnElement:
+    column = key.expression
+    if value is None:
+        # NULLs come first ascending and last descending
+        return false() if key.descending else column.is_not(None)
+    if key.descending:
+        return or_(column < value, column.is_(None))
+    return column > value
+
+
+def _equal(key: SortKey, value: Any) -> ColumnElement:
+    return key.expression.is_(None) if value is None else key.expression == value
+
+
+def _python_type(key: SortKey) -> type:
+    column_type = key.expression.type
+    # Type decorators such as SQLModel's AutoString defer to their impl
+    column_type = getattr(column_type, "impl_instance", column_type)
+    try:
+        return column_type.python_type
+    except NotImplementedError:
+        return object
+
+
+def _coerce(key: SortKey, value: Any) -> Any:
+    # Datetimes travel through cursors as ISO strings
+    python_type = _python_type(key)
+    if isinstance(value, str) and python_type in (datetime, date):
+        return python_type.fromisoformat(value)
+    return value
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
@@ -0,0 +1,224 @@
+"""Baseline schema
+
+The tables as they existed before the database was managed by Alembic.
+Databases created by the old `create_all()` startup are stamped at this
+revision instead of running it.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "portfoliomodel",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("creation_time", sa.DateTime(), nullable=False),
+        sa.Column("last_updated_at", sa.DateTime(), nullable=False),
+        sa.Column("project_ids_include", sa.JSON(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "resumemodel",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(), nullable=True),
+        sa.Column("name", sa.String(), nullable=True),
+        sa.Column("location", sa.String(), nullable=True),
+        sa.Column("email", sa.String(), nullable=True),
+        sa.Column("github", sa.String(), nullable=True),
+        sa.Column("linkedin", sa.String(), nullable=True),
+        sa.Column("skills", sa.JSON(), nullable=False),
+        sa.Column("education", sa.JSON(), nullable=False),
+        sa.Column("awards", sa.JSON(), nullable=False),
+        sa.Column("experience", sa.JSON(), nullable=False),
+        sa.Column("skills_expert", sa.JSON(), nullable=False),
+        sa.Column("skills_intermediate", sa.JSON(), nullable=False),
+        sa.Column("skills_exposure", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("last_updated", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "userconfigmodel",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("consent", sa.Boolean(), nullable=False),
+        sa.Column("ml_consent", sa.Boolean(), nullable=False),
+        sa.Column("name", sa.String(), nullable=True),
+        sa.Column("user_email", sa.String(), nullable=True),
+        sa.Column("github", sa.String(), nullable=True),
+        sa.Column("access_token", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "portfolioprojectcardmodel",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("portfolio_id", sa.Integer(), nullable=False),
+        sa.Column("project_name", sa.String(), nullable=False),
+        sa.Column("image_data", sa.LargeBinary(), nullable=True),
+        sa.Column("summary", sa.String(), nullable=False),
+        sa.Column("themes", sa.JSON(), nullable=True),
+        sa.Column("tones", sa.String(), nullable=False),
+        sa.Column("tags", sa.JSON(), nullable=True),
+        sa.Column("skills", sa.JSON(), nullable=True),
+        sa.Column("frameworks", sa.JSON(), nullable=True),
+        sa.Column("languages", sa.JSON(), nullable=True),
+        sa.Column("start_date", sa.Date(), nullable=True),
+        sa.Column("end_date", sa.Date(), nullable=True),
+        sa.Column("is_group_project", sa.Boolean(), nullable=False),
+        sa.Column("collaboration_role", sa.String(), nullable=False),
+        sa.Column("work_pattern", sa.String(), nullable=False),
+        sa.Column("commit_type_distribution", sa.JSON(), nullable=True),
+        sa.Column("activity_metrics", sa.JSON(), nullable=True),
+        sa.Column("is_showcase", sa.Boolean(), nullable=False),
+        sa.Column("title_override", sa.String(), nullable=True),
+        sa.Column("summary_override", sa.String(), nullable=True),
+        sa.Column("tags_override", sa.JSON(), nullable=True),
+        sa.Column("last_user_edit_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["portfolio_id"], ["portfoliomodel.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "portfoliosectionmodel",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("portfolio_id", sa.Integer(), nullable=True),
+        sa.Column("section_id", sa.String(), nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("order", sa.Integer(), nullable=False),
+        sa.Column("block_order", sa.JSON(), nullable=True),
+        sa.ForeignKeyConstraint(["portfolio_id"], ["portfoliomodel.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "projectreportmodel",
+        sa.Column("project_name", sa.String(), nullable=False),
+        sa.Column("user_config_used", sa.Integer(), nullable=True),
+        sa.Column("image_data", sa.LargeBinary(), nullable=True),
+        sa.Column("statistic", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("last_updated", sa.DateTime(), nullable=False),
+        sa.Column("analyzed_count", sa.Integer(), nullable=False),
+        sa.Column("parent", sa.String(), nullable=True),
+        sa.Column("representation_rank", sa.Integer(), nullable=True),
+        sa.Column("chrono_start_override", sa.DateTime(), nullable=True),
+        sa.Column("chrono_end_override", sa.DateTime(), nullable=True),
+        sa.Column("showcase_selected", sa.Boolean(), nullable=False),
+        sa.Column("compare_attributes", sa.JSON(), nullable=True),
+        sa.Column("highlight_skills", sa.JSON(), nullable=True),
+        sa.Column("representation_last_user_edit_at", sa.DateTime(), nullable=True),
+        sa.Column("showcase_title", sa.String(), nullable=True),
+        sa.Column("showcase_start_date", sa.DateTime(), nullable=True),
+        sa.Column("showcase_end_date", sa.DateTime(), nullable=True),
+        sa.Column("showcase_frameworks", sa.JSON(), nullable=True),
+        sa.Column("showcase_bullet_points", sa.JSON(), nullable=True),
+        sa.Column("showcase_last_user_edit_at", sa.DateTime(), nullable=True),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(["user_config_used"], ["userconfigmodel.id"]),
+        sa.PrimaryKeyConstraint("project_name"),
+    )
+    op.create_table(
+        "resumeconfigmodel",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_config_id", sa.Integer(), nullable=True),
+        sa.Column("education", sa.JSON(), nullable=False),
+        sa.Column("awards", sa.JSON(), nullable=False),
+        sa.Column("skills", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("last_updated", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_config_id"], ["userconfigmodel.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_config_id"),
+    )
+    op.create_table(
+        "blockmodel",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("section_id", sa.Integer(), nullable=True),
+        sa.Column("tag", sa.String(), nullable=False),
+        sa.Column("content_type", sa.String(), nullable=False),
+        sa.Column("last_generated_at", sa.DateTime(), nullable=True),
+        sa.Column("last_user_edit_at", sa.DateTime(), nullable=True),
+        sa.Column("current_content", sa.JSON(), nullable=True),
+        sa.ForeignKeyConstraint(["section_id"], ["portfoliosectionmodel.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "dismissedinsightmodel",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("project_name", sa.String(), nullable=False),
+        sa.Column("message", sa.String(), nullable=False),
+        sa.Column("dismissed_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["project_name"], ["projectreportmodel.project_name"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_dismissedinsightmodel_project_name",
+        "dismissedinsightmodel",
+        ["project_name"],
+    )
+    op.create_table(
+        "filereportmodel",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("project_name", sa.String(), nullable=False),
+        sa.Column("file_path", sa.String(), nullable=False),
+        sa.Column("is_info_file", sa.Boolean(), nullable=False),
+        sa.Column("file_hash", sa.LargeBinary(), nullable=True),
+        sa.Column("statistic", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["project_name"], ["projectreportmodel.project_name"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "projectinsightsmodel",
+        sa.Column("project_name", sa.String(), nullable=False),
+        sa.Column("insights", sa.JSON(), nullable=False),
+        sa.Column("generated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["project_name"], ["projectreportmodel.project_name"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("project_name"),
+    )
+    op.create_table(
+        "resumeitemmodel",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("resume_id", sa.Integer(), nullable=True),
+        sa.Column("project_name", sa.String(), nullable=True),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("frameworks", sa.JSON(), nullable=False),
+        sa.Column("bullet_points", sa.JSON(), nullable=False),
+        sa.Column("start_date", sa.Date(), nullable=True),
+        sa.Column("end_date", sa.Date(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("last_updated", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["resume_id"], ["resumemodel.id"]),
+        sa.ForeignKeyConstraint(["project_name"], ["projectreportmodel.project_name"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    for table in (
+        "resumeitemmodel",
+        "projectinsightsmodel",
+        "filereportmodel",
+        "dismissedinsightmodel",
+        "blockmodel",
+        "resumeconfigmodel",
+        "projectreportmodel",
+        "portfoliosectionmodel",
+        "portfolioprojectcardmodel",
+        "userconfigmodel",
+        "resumemodel",
+        "portfoliomodel",
+    ):
+        op.drop_table(table)
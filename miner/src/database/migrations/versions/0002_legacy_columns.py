@@ -0,0 +1,41 @@
+"""Add columns that older databases may be missing
+
+Replaces the `ALTER TABLE` patches that used to live in `_init_db`:
+`resumemodel.title` and `projectreportmodel.is_deleted` were added after
+some databases had already been created. Both steps are skipped when the
+column is already there.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def _has_column(table: str, column: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return column in {col["name"] for col in inspector.get_columns(table)}
+
+
+def upgrade() -> None:
+    if not _has_column("resumemodel", "title"):
+        op.add_column("resumemodel", sa.Column("title", sa.String(), nullable=True))
+
+    if not _has_column("projectreportmodel", "is_deleted"):
+        op.add_column(
+            "projectreportmodel",
+            sa.Column("is_deleted", sa.Boolean(), nullable=False, server_default=sa.false()),
+        )
+
+
+def downgrade() -> None:
+    # The baseline already declares both columns, so there is nothing to undo.
+    pass
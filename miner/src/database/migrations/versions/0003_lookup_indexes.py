@@ -0,0 +1,46 @@
+"""Index the hot lookup columns
+
+- filereportmodel.file_hash / file_path: looked up once per file on every
+  incremental upload (`get_file_report_model_by_hash`, `filepath_exists_in_db`).
+- filereportmodel.project_name: loading a project's file reports.
+- projectreportmodel.is_deleted: every project listing filters on it.
+- dismissedinsightmodel (project_name, message): duplicate check on dismiss.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ("ix_filereportmodel_file_hash", "filereportmodel", ["file_hash"]),
+    ("ix_filereportmodel_file_path", "filereportmodel", ["file_path"]),
+    ("ix_filereportmodel_project_name", "filereportmodel", ["project_name"]),
+    ("ix_projectreportmodel_is_deleted", "projectreportmodel", ["is_deleted"]),
+    ("ix_dismissedinsightmodel_project_name_message", "dismissedinsightmodel",
+     ["project_name", "message"]),
+]
+
+
+def upgrade() -> None:
+    # Databases that were created with `create_all()` after the models gained
+    # these indexes already have them.
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in INDEXES:
+        existing = {index["name"] for index in inspector.get_indexes(table)}
+        if name not in existing:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
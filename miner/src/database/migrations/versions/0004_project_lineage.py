@@ -0,0 +1,87 @@
+"""Project lineage table
+
+Replaces the `project_name LIKE 'base_%'` scan used to find the latest
+version of a project. Existing rows are backfilled: a row's base name is
+the root of its `parent` chain, and the row with the highest
+`analyzed_count` (then newest `created_at`) in each chain is the head.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def _backfill() -> None:
+    rows = op.get_bind().execute(sa.text(
+        "SELECT project_name, parent, analyzed_count, created_at FROM projectreportmodel"
+    )).all()
+    parents = {name: parent for name, parent, _, _ in rows}
+
+    chains: dict[str, list[tuple[int, str, str]]] = {}
+    for name, _, analyzed_count, created_at in rows:
+        base, seen = name, {name}
+        # A parent that was deleted still names the chain
+        while parents.get(base) and parents[base] not in seen:
+            base = parents[base]
+            seen.add(base)
+        chains.setdefault(base, []).append(
+            (analyzed_count or 1, str(created_at or ""), name))
+
+    lineage = []
+    for base, members in chains.items():
+        head = max(members)
+        for member in members:
+            version, _, name = member
+            lineage.append({"project_name": name, "base_name": base,
+                            "version": version, "is_head": member == head})
+
+    if lineage:
+        op.bulk_insert(sa.table(
+            "projectlineagemodel",
+            sa.column("project_name", sa.String()),
+            sa.column("base_name", sa.String()),
+            sa.column("version", sa.Integer()),
+            sa.column("is_head", sa.Boolean()),
+        ), lineage)
+
+
+def upgrade() -> None:
+    # Databases created with `create_all()` may already have the table.
+    if sa.inspect(op.get_bind()).has_table("projectlineagemodel"):
+        count = op.get_bind().execute(
+            sa.text("SELECT COUNT(*) FROM projectlineagemodel")).scalar()
+        if not count:
+            _backfill()
+        return
+
+    op.create_table(
+        "projectlineagemodel",
+        sa.Column("project_name", sa.String(), nullable=False),
+        sa.Column("base_name", sa.String(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("is_head", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["project_name"], ["projectreportmodel.project_name"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("project_name"),
+    )
+    op.create_index(
+        "ix_projectlineagemodel_base_name_is_head",
+        "projectlineagemodel",
+        ["base_name", "is_head"],
+    )
+    _backfill()
+
+
+def downgrade() -> None:
+    op.drop_index("ix_projectlineagemodel_base_name_is_head",
+                  table_name="projectlineagemodel")
+    op.drop_table("projectlineagemodel")
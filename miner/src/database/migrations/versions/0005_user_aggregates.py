@@ -0,0 +1,63 @@
+"""User aggregate tables
+
+Adds `projectcontributionmodel` (what each project adds to the user-level
+statistics) and `useraggregatemodel` (their running totals). Existing
+projects are not backfilled here since that needs their file reports
+deserialized; the CRUD layer fills in missing rows the first time they
+are read.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def _json_columns() -> list[sa.Column]:
+    return [
+        sa.Column("skill_weights", sa.JSON(), nullable=False),
+        sa.Column("language_bytes", sa.JSON(), nullable=False),
+        sa.Column("start_date", sa.DateTime(), nullable=True),
+        sa.Column("end_date", sa.DateTime(), nullable=True),
+        sa.Column("commit_timeline", sa.JSON(), nullable=False),
+        sa.Column("total_commit_timeline", sa.JSON(), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    # Databases created with `create_all()` may already have the tables.
+    if not inspector.has_table("projectcontributionmodel"):
+        op.create_table(
+            "projectcontributionmodel",
+            sa.Column("project_name", sa.String(), nullable=False),
+            sa.Column("weight", sa.Float(), nullable=False),
+            *_json_columns(),
+            sa.ForeignKeyConstraint(
+                ["project_name"], ["projectreportmodel.project_name"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("project_name"),
+        )
+
+    if not inspector.has_table("useraggregatemodel"):
+        op.create_table(
+            "useraggregatemodel",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("project_count", sa.Integer(), nullable=False),
+            *_json_columns(),
+            sa.Column("last_updated", sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("useraggregatemodel")
+    op.drop_table("projectcontributionmodel")
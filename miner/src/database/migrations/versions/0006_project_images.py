@@ -0,0 +1,122 @@
+"""Project image table
+
+Moves project images out of `projectreportmodel.image_data` into
+`projectimagemodel`, keyed by the SHA-256 hash of their bytes, and
+replaces the column with `projectreportmodel.image_hash`. Existing images
+are copied over without thumbnails; the image endpoint serves the full
+image for those.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19
+"""
+
+import hashlib
+from datetime import datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+_IMAGE_SIGNATURES = [
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF8", "image/gif"),
+    (b"RIFF", "image/webp"),
+]
+
+
+def _has_column(table: str, column: str) -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return column in {col["name"] for col in inspector.get_columns(table)}
+
+
+def _guess_content_type(data: bytes) -> str:
+    # The upload's content type was never stored, so sniff the common formats
+    for signature, content_type in _IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return content_type
+    return "application/octet-stream"
+
+
+def _backfill() -> None:
+    connection = op.get_bind()
+    rows = connection.execute(sa.text(
+        "SELECT project_name, image_data FROM projectreportmodel"
+        " WHERE image_data IS NOT NULL"
+    )).all()
+
+    images = {}
+    now = datetime.now(timezone.utc)
+    for project_name, data in rows:
+        image_hash = hashlib.sha256(data).hexdigest()
+        images.setdefault(image_hash, data)
+        connection.execute(
+            sa.text("UPDATE projectreportmodel SET image_hash = :hash"
+                    " WHERE project_name = :name"),
+            {"hash": image_hash, "name": project_name},
+        )
+
+    if images:
+        op.bulk_insert(sa.table(
+            "projectimagemodel",
+            sa.column("hash", sa.String()),
+            sa.column("content_type", sa.String()),
+            sa.column("data", sa.LargeBinary()),
+            sa.column("created_at", sa.DateTime()),
+        ), [
+            {"hash": image_hash, "content_type": _guess_content_type(data),
+             "data": data, "created_at": now}
+            for image_hash, data in images.items()
+        ])
+
+
+def upgrade() -> None:
+    # Databases created with `create_all()` may already have the new schema.
+    if not sa.inspect(op.get_bind()).has_table("projectimagemodel"):
+        op.create_table(
+            "projectimagemodel",
+            sa.Column("hash", sa.String(), nullable=False),
+            sa.Column("content_type", sa.String(), nullable=False),
+            sa.Column("data", sa.LargeBinary(), nullable=False),
+            sa.Column("thumbnail", sa.LargeBinary(), nullable=True),
+            sa.Column("thumbnail_content_type", sa.String(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.PrimaryKeyConstraint("hash"),
+        )
+
+    if not _has_column("projectreportmodel", "image_hash"):
+        with op.batch_alter_table("projectreportmodel") as batch_op:
+            batch_op.add_column(sa.Column("image_hash", sa.String(), nullable=True))
+            batch_op.create_foreign_key(
+                "fk_projectreportmodel_image_hash", "projectimagemodel",
+                ["image_hash"], ["hash"])
+            batch_op.create_index(
+                "ix_projectreportmodel_image_hash", ["image_hash"])
+
+    if _has_column("projectreportmodel", "image_data"):
+        _backfill()
+        with op.batch_alter_table("projectreportmodel") as batch_op:
+            batch_op.drop_column("image_data")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("projectreportmodel") as batch_op:
+        batch_op.add_column(sa.Column("image_data", sa.LargeBinary(), nullable=True))
+
+    op.execute(
+        "UPDATE projectreportmodel SET image_data = (SELECT data FROM projectimagemodel"
+        " WHERE projectimagemodel.hash = projectreportmodel.image_hash)"
+    )
+
+    with op.batch_alter_table("projectreportmodel") as batch_op:
+        batch_op.drop_index("ix_projectreportmodel_image_hash")
+        batch_op.drop_constraint("fk_projectreportmodel_image_hash", type_="foreignkey")
+        batch_op.drop_column("image_hash")
+
+    op.drop_table("projectimagemodel")
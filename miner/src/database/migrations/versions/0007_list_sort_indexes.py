@@ -0,0 +1,46 @@
+"""Index the columns list endpoints sort and page by
+
+- projectreportmodel.representation_rank / created_at / last_updated:
+  the sorts offered by `GET /projects/`.
+- resumemodel.last_updated / created_at: the sorts offered by `GET /resume`.
+- portfoliomodel.last_updated_at: the sort offered by `GET /portfolio`.
+- portfolioprojectcardmodel.portfolio_id: loading a portfolio's cards.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ("ix_projectreportmodel_representation_rank", "projectreportmodel", ["representation_rank"]),
+    ("ix_projectreportmodel_created_at", "projectreportmodel", ["created_at"]),
+    ("ix_projectreportmodel_last_updated", "projectreportmodel", ["last_updated"]),
+    ("ix_resumemodel_last_updated", "resumemodel", ["last_updated"]),
+    ("ix_resumemodel_created_at", "resumemodel", ["created_at"]),
+    ("ix_portfoliomodel_last_updated_at", "portfoliomodel", ["last_updated_at"]),
+    ("ix_portfolioprojectcardmodel_portfolio_id", "portfolioprojectcardmodel", ["portfolio_id"]),
+]
+
+
+def upgrade() -> None:
+    # Databases created with `create_all()` may already have these indexes.
+    inspector = sa.inspect(op.get_bind())
+    for name, table, columns in INDEXES:
+        existing = {index["name"] for index in inspector.get_indexes(table)}
+        if name not in existing:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
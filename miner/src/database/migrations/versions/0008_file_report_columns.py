@@ -0,0 +1,67 @@
+"""File report columns for the per-project file listing
+
+Copies the file statistics `GET /projects/{name}/files` filters and sorts
+by out of `filereportmodel.statistic` into their own columns, and indexes
+the sortable ones together with `project_name`.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+# column -> (type, JSON path of its value in `statistic`)
+COLUMNS = {
+    "coding_language": (sa.String(), "$.CODING_LANGUAGE.value"),
+    "file_type": (sa.String(), "$.TYPE_OF_FILE.value"),
+    "size_bytes": (sa.Integer(), "$.FILE_SIZE_BYTES"),
+    "line_count": (sa.Integer(), "$.LINES_IN_FILE"),
+    "percentage_lines_committed": (sa.Float(), "$.PERCENTAGE_LINES_COMMITTED"),
+}
+
+INDEXES = [
+    ("ix_filereportmodel_project_name_file_path", ["project_name", "file_path"]),
+    ("ix_filereportmodel_project_name_size_bytes", ["project_name", "size_bytes"]),
+    ("ix_filereportmodel_project_name_line_count", ["project_name", "line_count"]),
+    ("ix_filereportmodel_project_name_percentage_lines_committed",
+     ["project_name", "percentage_lines_committed"]),
+]
+
+
+def upgrade() -> None:
+    # Databases created with `create_all()` may already have the new schema.
+    inspector = sa.inspect(op.get_bind())
+    existing_columns = {col["name"] for col in inspector.get_columns("filereportmodel")}
+    missing = [name for name in COLUMNS if name not in existing_columns]
+
+    if missing:
+        with op.batch_alter_table("filereportmodel") as batch_op:
+            for name in missing:
+                batch_op.add_column(sa.Column(name, COLUMNS[name][0], nullable=True))
+
+        # Enum statistics are stored as {"__type__": "enum", ..., "value": ...}
+        assignments = ", ".join(
+            f"{name} = json_extract(statistic, '{COLUMNS[name][1]}')" for name in missing)
+        op.execute(f"UPDATE filereportmodel SET {assignments}")
+
+    existing_indexes = {index["name"] for index in inspector.get_indexes("filereportmodel")}
+    for name, columns in INDEXES:
+        if name not in existing_indexes:
+            op.create_index(name, "filereportmodel", columns)
+
+
+def downgrade() -> None:
+    for name, _ in reversed(INDEXES):
+        op.drop_index(name, table_name="filereportmodel")
+    with op.batch_alter_table("filereportmodel") as batch_op:
+        for name in reversed(COLUMNS):
+            batch_op.drop_column(name)
@@ -0,0 +1,58 @@
+"""Insight messages with their source
+
+Adds `insightmessagemodel`, one row per generated insight recording the
+calculator it came from and whether it is ML-derived, and drops the
+`insights` list from `projectinsightsmodel`. Rows cached under the old
+schema do not say which messages are ML-derived, so they are removed and
+regenerated the first time the project's insights are read.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    # Databases created with `create_all()` may already have the new schema.
+    if not inspector.has_table("insightmessagemodel"):
+        op.create_table(
+            "insightmessagemodel",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("project_name", sa.String(), nullable=False),
+            sa.Column("position", sa.Integer(), nullable=False),
+            sa.Column("message", sa.String(), nullable=False),
+            sa.Column("source", sa.String(), nullable=False),
+            sa.Column("uses_ml", sa.Boolean(), nullable=False),
+            sa.ForeignKeyConstraint(
+                ["project_name"], ["projectinsightsmodel.project_name"], ondelete="CASCADE"),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index(
+            "ix_insightmessagemodel_project_name_position",
+            "insightmessagemodel", ["project_name", "position"])
+
+    columns = {col["name"] for col in inspector.get_columns("projectinsightsmodel")}
+    if "insights" in columns:
+        op.execute("DELETE FROM projectinsightsmodel")
+        with op.batch_alter_table("projectinsightsmodel") as batch_op:
+            batch_op.drop_column("insights")
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM projectinsightsmodel")
+    with op.batch_alter_table("projectinsightsmodel") as batch_op:
+        batch_op.add_column(sa.Column("insights", sa.JSON(), nullable=False))
+    op.drop_index("ix_insightmessagemodel_project_name_position",
+                  table_name="insightmessagemodel")
+    op.drop_table("insightmessagemodel")
@@ -0,0 +1,39 @@
+"""Index the default project list order
+
+`GET /projects/` lists ranked projects first, by rank, then unranked ones,
+each by creation time and name. The index covers that order as one
+expression index, `(representation_rank IS NULL, representation_rank,
+created_at, project_name)`, so pages are range scans over it.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+INDEX = "ix_projectreportmodel_rank_order"
+
+
+def upgrade() -> None:
+    # Databases created with `create_all()` may already have this index.
+    # SQLAlchemy cannot reflect expression indexes on SQLite, so let the
+    # database check for it.
+    op.create_index(INDEX, "projectreportmodel", [
+        sa.text("CAST(representation_rank IS NULL AS INTEGER)"),
+        "representation_rank",
+        "created_at",
+        "project_name",
+    ], if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index(INDEX, table_name="projectreportmodel")
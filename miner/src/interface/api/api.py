@@ -11,6 +11,7 @@ http:http://127.0.0.1:<port>/docs
 import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 from src.utils.errors import (
@@ -23,7 +24,7 @@ from src.utils.errors import (
     BadOAuthStateError,
     ExpiredOAuthState
 )
-from src.app import init_system, _init_db
+from src.app import start_background_warmup, get_warmup_status, _init_db
 from src.interface.api.routers.projects import router as projects_router
 from src.interface.api.routers.resume import router as resume_router
 from src.interface.api.routers.portfolio import router as portfolio_router
@@ -34,13 +35,18 @@ from src.interface.api.routers.job_readiness import router as job_readiness_rout
 from src.interface.api.routers.insights import router as insights_router
 from src.interface.api.routers.interview import router as interview_router
 from src.interface.api.routers.github import router as github_router
+from src.interface.api.response_cache import response_cache
+from src.services.resume.export_resume_service import artifact_cache
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Commands to run on startup
     _init_db()  # Create database tables first
-    init_system()
+
+    # Model warmup loads transformers/torch, which takes a while. Run it in
+    # the background so requests are served right away; /ready reports on it.
+    start_background_warmup()
 
     yield
 
@@ -64,6 +70,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Statistic-heavy JSON lists compress well; small bodies are not worth it
+app.add_middleware(GZipMiddleware, minimum_size=1000)
 
 
 @app.get("/ping")
@@ -71,6 +79,26 @@ def ping_pong():
     return "pong"
 
 
+@app.get("/ready")
+def readiness():
+    """
+    Report whether the background ML warmup has finished. Returns 503
+    until it has, so callers can poll this before running ML-heavy work.
+    """
+    status = get_warmup_status()
+    status_code = 200 if status["state"] == "complete" else 503
+    return JSONResponse(status_code=status_code, content=status)
+
+
+@app.get("/cache/stats")
+def cache_stats():
+    """
+    Report hits, misses and 304s of the GET response cache, per endpoint,
+    and how often resume exports reused a render.
+    """
+    return {**response_cache.stats(), "resume_exports": artifact_cache.stats()}
+
+
 # Register routers
 app.include_router(projects_router)
 app.include_router(resume_router)
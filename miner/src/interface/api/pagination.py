@@ -0,0 +1,130 @@
+"""
+Query-parameter helpers shared by the list endpoints: opaque page
+cursors, `fields=` projections and paging of lists sorted in Python.
+
+A cursor is the sort it was made for plus the sort-key values of the last
+row served, so it can only continue the listing it came from.
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, Callable, Collection, Optional, Sequence, Union
+
+from fastapi import HTTPException, Query
+from pydantic import BaseModel
+
+LIMIT_QUERY = Query(
+    default=None, ge=1, le=500,
+    description="Page size. Every row is returned when omitted.")
+CURSOR_QUERY = Query(
+    default=None, description="The `next_cursor` of the previous page.")
+FIELDS_QUERY = Query(
+    default=None,
+    description="Comma-separated fields to return for each row. All fields when omitted.")
+
+
+def encode_cursor(sort: str, values: Optional[Sequence[Any]]) -> Optional[str]:
+    """The cursor for the page after `values`, or None when there is none."""
+    if values is None:
+        return None
+    payload = json.dumps({"sort": sort, "after": list(values)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(
+    cursor: Optional[str],
+    sort: str,
+    key_types: Sequence[tuple[type, ...]],
+) -> Optional[list]:
+    """
+    The sort-key values stored in `cursor`, one per entry of `key_types`
+    (the types each value may have) with datetimes parsed back. Raises a
+    400 if the cursor is malformed, was made for a different sort or does
+    not hold values of those types.
+    """
+    if cursor is None:
+        return None
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        after = payload["after"]
+        cursor_sort = payload["sort"]
+    except (binascii.Error, ValueError, TypeError, KeyError, UnicodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+    if cursor_sort != sort or not isinstance(after, list):
+        raise HTTPException(
+            status_code=400, detail=f"The cursor does not belong to sort '{sort}'.")
+    try:
+        if len(after) != len(key_types):
+            raise ValueError(f"expected {len(key_types)} values")
+        return [_cursor_value(value, types) for value, types in zip(after, key_types)]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+
+def _cursor_value(value: Any, types: tuple[type, ...]) -> Any:
+    for python_type in types:
+        if value is None:
+            if python_type is type(None):
+                return None
+        elif python_type in (datetime, date):
+            if isinstance(value, str):
+                # Datetimes travel through cursors as ISO strings
+                return python_type.fromisoformat(value)
+        elif python_type is float:
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return value
+        elif python_type is int:
+            if isinstance(value, int) and not isinstance(value, bool):
+                return value
+        elif python_type is object:
+            if isinstance(value, (str, int, float, bool)):
+                return value
+        elif isinstance(value, python_type):
+            return value
+    raise ValueError(f"{value!r} is not a valid cursor value")
+
+
+def parse_fields(
+    fields: Optional[str],
+    model: Union[type[BaseModel], Collection[str]],
+) -> Optional[set[str]]:
+    """
+    The fields named in a `fields=` parameter, checked against the fields
+    (including computed ones) of `model`, or against a collection of names
+    for endpoints that return plain dicts. None means every field.
+    """
+    if fields is None:
+        return None
+    wanted = {field.strip() for field in fields.split(",") if field.strip()}
+    if isinstance(model, type):
+        allowed = set(model.model_fields) | set(model.model_computed_fields)
+    else:
+        allowed = set(model)
+    unknown = sorted(wanted - allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown field(s): {', '.join(unknown)}. Allowed: {', '.join(sorted(allowed))}.")
+    return wanted
+
+
+def page_of(
+    items: list,
+    key: Callable[[Any], Sequence[Any]],
+    limit: Optional[int],
+    after: Optional[Sequence[Any]],
+) -> tuple[list, Optional[list]]:
+    """
+    Page a list already sorted by `key` the way the database pages a query:
+    the items whose key comes after `after`, at most `limit` of them, and
+    the key to continue from (None on the last page).
+    """
+    if after is not None:
+        after = list(after)
+        items = [item for item in items if list(key(item)) > after]
+    if limit is None or len(items) <= limit:
+        return items, None
+    items = items[:limit]
+    return items, list(key(items[-1]))
@@ -0,0 +1,128 @@
+"""
+Read-through cache for JSON GET responses.
+
+Each response is stored with the versions (see
+`src.database.core.entity_versions`) of the rows it was built from, and
+is served from memory until one of those versions moves. Responses carry
+a strong `ETag` of their body, so a client that already has the current
+body gets an empty 304 instead.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional, Sequence
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from src.database.core.entity_versions import Dependency, versions_of
+
+
+@dataclass(frozen=True)
+class _CachedResponse:
+    versions: tuple[int, ...]
+    body: bytes
+    etag: str
+
+
+@dataclass
+class _Counters:
+    hits: int = 0
+    misses: int = 0
+    not_modified: int = 0
+
+
+class ResponseCache:
+    """
+    Bounded, thread-safe map from `(namespace, key)` to the last response
+    built for it. Stale entries are replaced on their next request and the
+    least recently used ones are dropped past `max_entries`.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, Hashable], _CachedResponse] = OrderedDict()
+        self._counters: dict[str, _Counters] = {}
+        self._lock = threading.Lock()
+
+    def respond(
+        self,
+        request: Request,
+        namespace: str,
+        key: Hashable,
+        depends_on: Sequence[Dependency],
+        build: Callable[[], Any],
+    ) -> Response:
+        """
+        Return the response for `(namespace, key)`, calling `build` for its
+        content only if the cached one is missing or stale. Exceptions from
+        `build` propagate and nothing is cached.
+        """
+        # Read before building, so a write that lands mid-build leaves the
+        # entry stale rather than caching old data under the new versions
+        versions = versions_of(depends_on)
+        cache_key = (namespace, key)
+
+        with self._lock:
+            counters = self._counters.setdefault(namespace, _Counters())
+            cached = self._entries.get(cache_key)
+            if cached is not None and cached.versions == versions:
+                self._entries.move_to_end(cache_key)
+                counters.hits += 1
+            else:
+                cached = None
+                counters.misses += 1
+
+        if cached is None:
+            body = JSONResponse(content=jsonable_encoder(build())).body
+            cached = _CachedResponse(
+                versions=versions,
+                body=body,
+                etag=f'"{hashlib.sha1(body).hexdigest()}"',
+            )
+            with self._lock:
+                self._entries[cache_key] = cached
+                self._entries.move_to_end(cache_key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), cached.etag):
+            with self._lock:
+                counters.not_modified += 1
+            return Response(status_code=304, headers=headers)
+        return Response(content=cached.body, media_type="application/json", headers=headers)
+
+    def stats(self) -> dict[str, Any]:
+        """Hit counts and rates per namespace, plus the number of stored entries."""
+        with self._lock:
+            namespaces = {}
+            for namespace, counters in sorted(self._counters.items()):
+                requests = counters.hits + counters.misses
+                namespaces[namespace] = {
+                    "hits": counters.hits,
+                    "misses": counters.misses,
+                    "not_modified": counters.not_modified,
+                    "hit_rate": counters.hits / requests if requests else 0.0,
+                }
+            return {"entries": len(self._entries), "namespaces": namespaces}
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._counters.clear()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an `If-None-Match` header value matches `etag`."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+response_cache = ResponseCache()
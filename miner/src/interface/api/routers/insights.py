@@ -4,8 +4,9 @@ GET /projects/{project_name}/insights
 Returns a list of insight prompts derived from an existing ProjectReport.
 Insights help users reflect on their contributions when writing a resume.
 
-Insights are cached in the database after the first generation so that
-expensive or ML-based generators are only invoked once per project.
+Insights are generated in the background when a project is mined and stored
+per message along with whether each one is ML-derived, so this endpoint only
+reads them, leaving out the ML-derived ones when ML is not allowed.
 """
 
 from urllib.parse import unquote
@@ -14,23 +15,12 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from sqlmodel import Session
 
-from src.core.insight.insight_generator import (
-    ActivityInsightCalculator,
-    InsightCalculator,
-    InsightGenerator,
-    OwnershipInsightCalculator,
-    SkillsInsightCalculator,
-)
 from src.core.ML.models.readme_analysis.permissions import ml_extraction_allowed
-from src.database.api.CRUD.insights import (
-    dismiss_project_insight,
-    get_dismissed_insight_messages,
-    get_project_insights,
-    save_project_insights,
-)
+from src.database.api.CRUD.insights import dismiss_project_insight
 from src.database.api.CRUD.projects import get_project_report_by_name
 from src.infrastructure.log.logging import get_logger
 from src.interface.api.routers.util import get_session
+from src.services.project.insights_service import load_project_insights
 from src.utils.errors import ProjectNotFoundError
 
 router = APIRouter(
@@ -41,13 +31,6 @@ router = APIRouter(
 logger = get_logger(__name__)
 
 
-NON_ML_INSIGHT_CALCULATORS: list[type[InsightCalculator]] = [
-    ActivityInsightCalculator,
-    OwnershipInsightCalculator,
-    SkillsInsightCalculator,
-]
-
-
 class InsightResponse(BaseModel):
     message: str
 
@@ -69,8 +52,9 @@ def get_project_insights_endpoint(
     """
     Return a list of resume-writing insight prompts for the given project.
 
-    On the first call, insights are generated from the project's mined statistics
-    and cached in the database. Subsequent calls return the cached copy.
+    Insights are read from the database, without dismissed ones and, if ML
+    is not allowed, without ML-derived ones. Projects whose insights have
+    not been stored yet have them generated on this call.
 
     Path parameters:
     - `project_name`: The URL-encoded name of the project.
@@ -84,29 +68,11 @@ def get_project_insights_endpoint(
     """
     decoded_name = unquote(project_name)
 
-    ml_allowed = ml_extraction_allowed(session=session)
-
-    # Cached insight rows do not track whether messages were ML-derived.
-    # When ML is currently disallowed, bypass cache and regenerate only the
-    # non-ML subset so previously cached ML-derived prompts are not returned.
-    dismissed = get_dismissed_insight_messages(session, decoded_name)
-
-    cached = get_project_insights(session, decoded_name)
-    if cached is not None and ml_allowed:
-        active = [m for m in cached.insights if m not in dismissed]
-        return ProjectInsightsResponse(
-            project_name=decoded_name,
-            insights=[InsightResponse(message=m) for m in active],
-        )
-
-    report = get_project_report_by_name(session, decoded_name)
-    if report is None:
-        raise ProjectNotFoundError(f"Project '{decoded_name}' not found.")
-
     try:
-        requested_classes = None if ml_allowed else NON_ML_INSIGHT_CALCULATORS
-        insights = InsightGenerator.generate(
-            report, requested_classes=requested_classes)
+        messages = load_project_insights(
+            session, decoded_name, include_ml=ml_extraction_allowed(session=session))
+    except ProjectNotFoundError:
+        raise
     except Exception:
         logger.exception(
             "Error generating insights for project '%s'", decoded_name)
@@ -115,19 +81,9 @@ def get_project_insights_endpoint(
             detail="Failed to generate insights.",
         )
 
-    messages = [i.message for i in insights]
-
-    # Save only when ML-derived insights are currently allowed. The cache does
-    # not record per-message source metadata, so persisting filtered non-ML
-    # results here would overwrite a fuller cache generated under consent.
-    if ml_allowed:
-        save_project_insights(session, decoded_name, messages)
-        session.commit()
-
-    active_messages = [m for m in messages if m not in dismissed]
     return ProjectInsightsResponse(
         project_name=decoded_name,
-        insights=[InsightResponse(message=m) for m in active_messages],
+        insights=[InsightResponse(message=m) for m in messages],
     )
 
 
@@ -154,7 +110,8 @@ def dismiss_project_insight_endpoint(
     """
     decoded_name = unquote(project_name)
 
-    report = get_project_report_by_name(session, decoded_name)
+    report = get_project_report_by_name(
+        session, decoded_name, include_file_reports=False)
     if report is None:
         raise ProjectNotFoundError(f"Project '{decoded_name}' not found.")
 
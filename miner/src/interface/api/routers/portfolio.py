@@ -1,5 +1,6 @@
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Literal
 from fastapi import APIRouter, Depends, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi import HTTPException
 from sqlmodel import Session
 from pydantic import BaseModel
@@ -9,10 +10,20 @@ from src.services.portfolio.edit_portfolio_service import (
     edit_portfolio_metadata,
 )
 from src.services.portfolio.project_card_service import edit_project_card, set_showcase
-from src.services.portfolio.export_service import export_portfolio_static
+from src.services.portfolio.export_service import get_portfolio_export
 from src.services.portfolio.github_pages_service import deploy_to_github_pages
 from src.database import load_portfolio, update_portfolio_block, get_most_recent_user_config
-from src.database.api.CRUD.portfolio import get_project_cards_for_portfolio, list_portfolios, delete_portfolio
+from src.database.api.CRUD.portfolio import (
+    PORTFOLIO_SORTS,
+    get_project_cards_for_portfolio,
+    list_portfolios_page,
+    delete_portfolio,
+)
+from src.database.api.models import PortfolioProjectCardModel
+from src.database.core.pagination import key_types
+from src.interface.api.pagination import (CURSOR_QUERY, FIELDS_QUERY,
+                                         LIMIT_QUERY, decode_cursor,
+                                         encode_cursor, page_of, parse_fields)
 from src.interface.api.routers.util import get_session
 from src.utils.errors import KeyNotFoundError, UserConfigNotFoundError
 
@@ -22,15 +33,47 @@ router = APIRouter(
 )
 
 
+PortfolioSort = Literal[tuple(PORTFOLIO_SORTS)]  # type: ignore[valid-type]
+
+_PORTFOLIO_LIST_FIELDS = ("id", "title", "creation_time", "last_updated_at", "project_names")
+
+# Cards are filtered in Python, so they are paged in Python in the order
+# `get_project_cards_for_portfolio` returns them
+_CARD_SORT = "showcase"
+_CARD_KEY_TYPES = [(bool,), (str,)]
+
+
+def _card_sort_key(card) -> list:
+    return [not card.is_showcase, card.project_name]
+
+
 @router.get("")
-def get_all_portfolios(session: Session = Depends(get_session)):
+def get_all_portfolios(
+    sort: PortfolioSort = "id",
+    limit: Optional[int] = LIMIT_QUERY,
+    cursor: Optional[str] = CURSOR_QUERY,
+    fields: Optional[str] = FIELDS_QUERY,
+    session: Session = Depends(get_session),
+):
     """
     GET /portfolio
 
-    Returns a lightweight list of all portfolios.
-    Each entry contains: id, title, creation_time, last_updated_at.
+    Returns a lightweight list of portfolios.
+    Each entry contains: id, title, creation_time, last_updated_at, project_names.
+
+    Query parameters:
+    - `sort`: `id` (default), `-id`, `last_updated_at` or `-last_updated_at`.
+    - `limit`: Page size; every portfolio is returned when omitted.
+    - `cursor`: The `next_cursor` of the previous page.
+    - `fields`: Comma-separated entry fields to return.
     """
-    return {"portfolios": list_portfolios(session)}
+    selected = parse_fields(fields, _PORTFOLIO_LIST_FIELDS)
+    after = decode_cursor(cursor, sort, key_types(PORTFOLIO_SORTS[sort]))
+
+    portfolios, next_after = list_portfolios_page(session, sort, limit, after)
+    if selected is not None:
+        portfolios = [{k: v for k, v in p.items() if k in selected} for p in portfolios]
+    return {"portfolios": portfolios, "next_cursor": encode_cursor(sort, next_after)}
 
 
 @router.delete("/{portfolio_id}")
@@ -185,12 +228,15 @@ def get_cards(
     tones: Optional[str] = None,
     tags: Optional[str] = None,
     skills: Optional[str] = None,
+    limit: Optional[int] = LIMIT_QUERY,
+    cursor: Optional[str] = CURSOR_QUERY,
+    fields: Optional[str] = FIELDS_QUERY,
     session: Session = Depends(get_session),
 ):
     """
     GET /portfolio/{id}/cards
 
-    Returns all project cards for the portfolio (Part C gallery).
+    Returns the project cards for the portfolio (Part C gallery).
     Showcase cards (is_showcase=True) are listed first.
 
     Supports optional comma-separated query params:
@@ -198,7 +244,13 @@ def get_cards(
       ?tones=professional
       ?tags=python,api
       ?skills=React
+      ?fields=project_name,title_override   (image bytes are only read if image_data is listed)
+
+    Pages with `limit` and the returned `next_cursor`; every card is
+    returned when `limit` is omitted.
     """
+    selected = parse_fields(fields, PortfolioProjectCardModel)
+    after = decode_cursor(cursor, _CARD_SORT, _CARD_KEY_TYPES)
     theme_list = [t.strip() for t in themes.split(",")] if themes else None
     tone_list = [t.strip() for t in tones.split(",")] if tones else None
     tag_list = [t.strip() for t in tags.split(",")] if tags else None
@@ -210,8 +262,17 @@ def get_cards(
         tones=tone_list,
         tags=tag_list,
         skills=skill_list,
+        include_images=selected is None or "image_data" in selected,
     )
-    return {"portfolio_id": portfolio_id, "cards": cards, "count": len(cards)}
+    cards, next_after = page_of(cards, _card_sort_key, limit, after)
+    if selected is not None:
+        cards = [card.model_dump(include=selected) for card in cards]
+    return {
+        "portfolio_id": portfolio_id,
+        "cards": cards,
+        "count": len(cards),
+        "next_cursor": encode_cursor(_CARD_SORT, next_after),
+    }
 
 
 class EditCardRequest(BaseModel):
@@ -290,6 +351,9 @@ async def export_portfolio(
     deployed as a GitHub Pages site. If there is no GitHub auth, the site
     is downloaded as a `.zip` file.
 
+    The archive is built in a worker thread so other requests are served
+    meanwhile, and is reused while the portfolio is unchanged.
+
     Body Parameters:
     - `portfolio_id`: The selected portfolio's ID
 
@@ -304,7 +368,7 @@ async def export_portfolio(
     - 404 `USER_CONFIG_NOT_FOUND`: No user configuration has been created yet.
     """
     try:
-        zip_bytes = export_portfolio_static(portfolio_id, session)
+        zip_bytes = await run_in_threadpool(get_portfolio_export, portfolio_id, session)
     except KeyNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -315,7 +379,7 @@ async def export_portfolio(
     access_token = user_config.access_token if user_config else None
 
     if access_token:
-        portfolio = load_portfolio(session, portfolio_id)
+        portfolio = await run_in_threadpool(load_portfolio, session, portfolio_id)
         portfolio_name = portfolio.title if portfolio else f"Portfolio {portfolio_id}"
         pages_url = await deploy_to_github_pages(access_token, zip_bytes, portfolio_name)
         return {"pages_url": pages_url}
@@ -1,19 +1,34 @@
-import base64
 import os
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
-from urllib.parse import unquote
+from typing import Any, Dict, List, Literal, Optional
+from urllib.parse import quote, unquote
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
-from pydantic import field_serializer
+from fastapi import APIRouter, Depends, File, Header, HTTPException, Query, Request, Response, UploadFile
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import computed_field
 from sqlmodel import Field, SQLModel
-from src.database.api.CRUD.projects import (get_all_project_report_models,
+from src.core.statistic.statistic_models import CodingLanguage, FileDomain
+from src.database.api.CRUD.files import (FILE_SORTS,
+                                         get_file_report_models_page)
+from src.database.api.CRUD.images import (get_project_image,
+                                          remove_project_image,
+                                          save_project_image)
+from src.database.api.CRUD.projects import (PROJECT_SORTS,
+                                            get_all_project_report_models,
                                             get_project_report_by_name,
                                             get_project_report_model_by_name,
+                                            get_project_report_models_page,
                                             soft_delete_project_report_by_name)
 from src.database.api.CRUD.user_config import get_most_recent_user_config
 from src.database.api.models import ProjectReportModel
+from src.database.core.entity_versions import PROJECT, USER_CONFIG
+from src.database.core.pagination import key_types
 from src.infrastructure.log.logging import get_logger
+from src.interface.api.pagination import (CURSOR_QUERY, FIELDS_QUERY,
+                                         LIMIT_QUERY, decode_cursor,
+                                         encode_cursor, parse_fields)
+from src.interface.api.response_cache import etag_matches, response_cache
 from src.interface.api.routers.util import get_session
 from src.services.mining_service import start_miner_service
 from src.utils.errors import DatabaseOperationError, ProjectNotFoundError
@@ -31,16 +46,20 @@ SUPPORTED_FORMATS = [".tar.gz", ".gz", ".7z", ".zip"]
 class ProjectReportResponse(SQLModel):
     project_name: str
     user_config_used: Optional[int]
-    image_data: Optional[bytes]
+    image_hash: Optional[str] = None
     created_at: datetime
     statistic: dict
     last_updated: datetime
 
-    @field_serializer("image_data")
-    def encode_image_data(self, value: Optional[bytes]) -> Optional[str]:
-        if value is None:
-            return None
-        return base64.b64encode(value).decode("utf-8")
+    @computed_field
+    @property
+    def image_url(self) -> Optional[str]:
+        return _image_url(self.project_name, self.image_hash)
+
+    @computed_field
+    @property
+    def thumbnail_url(self) -> Optional[str]:
+        return _image_url(self.project_name, self.image_hash, size="thumbnail")
 
 
 class UploadProjectResponse(SQLModel):
@@ -50,6 +69,32 @@ class UploadProjectResponse(SQLModel):
 class ProjectListResponse(SQLModel):
     projects: List[ProjectReportResponse]
     count: int
+    next_cursor: Optional[str] = None
+
+
+ProjectSort = Literal[tuple(PROJECT_SORTS)]  # type: ignore[valid-type]
+
+
+class FileReportResponse(SQLModel):
+    id: int
+    file_path: str
+    is_info_file: bool
+    coding_language: Optional[str] = None
+    file_type: Optional[str] = None
+    size_bytes: Optional[int] = None
+    line_count: Optional[int] = None
+    percentage_lines_committed: Optional[float] = None
+    statistic: dict
+
+
+class ProjectFilesResponse(SQLModel):
+    project_name: str
+    files: List[FileReportResponse]
+    count: int
+    next_cursor: Optional[str] = None
+
+
+FileSort = Literal[tuple(FILE_SORTS)]  # type: ignore[valid-type]
 
 
 class ProjectShowcaseResponse(SQLModel):
@@ -106,6 +151,30 @@ class CompareProjectsResponse(SQLModel):
 # URLs, file paths, asset references, and other non-technology noise.
 
 
+def _image_url(project_name: str, image_hash: Optional[str], size: str = "full") -> Optional[str]:
+    """
+    URL of a project's image. The hash is part of the URL so a new upload
+    gets a new URL and the old one can be cached forever.
+    """
+    if image_hash is None:
+        return None
+    url = f"/projects/{quote(project_name, safe='')}/image?v={image_hash}"
+    if size != "full":
+        url += f"&size={size}"
+    return url
+
+
+def _project_list_item(model: ProjectReportModel, selected: Optional[set[str]]) -> dict:
+    if selected is None:
+        return ProjectReportResponse.model_validate(model).model_dump(mode="json")
+    # Only the selected columns are read, so deferred ones stay unloaded;
+    # the image URLs are computed from the name and hash
+    needed = selected | {"project_name", "image_hash"}
+    data = {name: getattr(model, name)
+            for name in ProjectReportResponse.model_fields if name in needed}
+    return ProjectReportResponse.model_construct(**data).model_dump(mode="json", include=selected)
+
+
 def _clean_framework(value: str) -> Optional[str]:
     if not value:
         return None
@@ -298,33 +367,47 @@ def upload_project(
     "/",
     response_model=ProjectListResponse,
 )
-def list_projects(session=Depends(get_session)):
+def list_projects(
+    sort: ProjectSort = "rank",
+    limit: Optional[int] = LIMIT_QUERY,
+    cursor: Optional[str] = CURSOR_QUERY,
+    fields: Optional[str] = FIELDS_QUERY,
+    session=Depends(get_session),
+):
     """
-    List all project reports ordered by representation_rank, then creation date.
+    List project reports, by default ordered by representation_rank, then creation date.
+
+    Query parameters:
+    - `sort`: `rank` (default), `created_at`, `last_updated` or `project_name`;
+      prefix with `-` for descending order (except `rank`).
+    - `limit`: Page size; every project is returned when omitted.
+    - `cursor`: The `next_cursor` of the previous page.
+    - `fields`: Comma-separated `ProjectReportResponse` fields to return, e.g.
+      `project_name,thumbnail_url`. Statistics are only read when `statistic` is asked for.
 
     Returns:
-    - 200: A `ProjectListResponse` with an ordered list of all project reports and a count.
+    - 200: A `ProjectListResponse` with the page of project reports, its count and the
+      `next_cursor` (null on the last page).
 
     Raises:
+    - 400: The cursor or a field name is invalid.
     - 500 `DATABASE_OPERATION_FAILED`: An unexpected error occurred while fetching the project list.
     """
-    try:
+    selected = parse_fields(fields, ProjectReportResponse)
+    after = decode_cursor(cursor, sort, key_types(PROJECT_SORTS[sort]))
 
-        all_projects = get_all_project_report_models(session)
-
-        # rank first (None ranks go after)
-        all_projects.sort(
-            key=lambda p: (
-                p.representation_rank is None,
-                p.representation_rank if p.representation_rank is not None else 10**9,
-                p.created_at,
-            )
+    try:
+        models, next_after = get_project_report_models_page(
+            session, sort, limit, after,
+            include_statistics=selected is None or "statistic" in selected,
         )
+        projects = [_project_list_item(model, selected) for model in models]
 
-        return ProjectListResponse(
-            projects=all_projects,
-            count=len(all_projects)
-        )
+        return JSONResponse(content=jsonable_encoder({
+            "projects": projects,
+            "count": len(projects),
+            "next_cursor": encode_cursor(sort, next_after),
+        }))
 
     except Exception as e:
         logger.error(f"Error fetching project list: {str(e)}")
@@ -367,10 +450,13 @@ def _resolve_compare_attribute(attr: str, model, report) -> Any:
 
 
 @router.get("/compare", response_model=CompareProjectsResponse)
-def compare_projects(projects: Optional[str] = None, session=Depends(get_session)):
+def compare_projects(request: Request, projects: Optional[str] = None, session=Depends(get_session)):
     """
     Compare selected projects across their saved comparison attributes.
 
+    Served from the response cache until any project or the user config
+    changes; see `GET /projects/{project_name}` for the `ETag` behaviour.
+
     Query parameters:
     - `projects`: Optional comma-separated project names. When omitted, all projects
       that have any compare_attributes set are included.
@@ -382,59 +468,65 @@ def compare_projects(projects: Optional[str] = None, session=Depends(get_session
     Raises:
     - 404 `PROJECT_NOT_FOUND`: One or more named projects were not found in the database.
     """
-    project_reports = get_all_project_report_models(session)
-
-    # Filter target set
-    if projects:
-        wanted = [unquote(x.strip()) for x in projects.split(",") if x.strip()]
-        wanted_set = set(wanted)
-        models = [m for m in project_reports if m.project_name in wanted_set]
-
-        if len(models) != len(wanted_set):
-            missing = sorted(
-                list(wanted_set - {m.project_name for m in models}))
-            raise ProjectNotFoundError(
-                f"Missing project(s): {', '.join(missing)}")
-    else:
-        models = [m for m in project_reports if (m.compare_attributes or [])]
+    def build() -> CompareProjectsResponse:
+        project_reports = get_all_project_report_models(session)
+
+        # Filter target set
+        if projects:
+            wanted = [unquote(x.strip()) for x in projects.split(",") if x.strip()]
+            wanted_set = set(wanted)
+            models = [m for m in project_reports if m.project_name in wanted_set]
+
+            if len(models) != len(wanted_set):
+                missing = sorted(
+                    list(wanted_set - {m.project_name for m in models}))
+                raise ProjectNotFoundError(
+                    f"Missing project(s): {', '.join(missing)}")
+        else:
+            models = [m for m in project_reports if (m.compare_attributes or [])]
 
-    # Determine union of attributes (stable order)
-    attr_set = set()
-    for m in models:
-        for a in (m.compare_attributes or []):
-            attr_set.add(a)
+        # Determine union of attributes (stable order)
+        attr_set = set()
+        for m in models:
+            for a in (m.compare_attributes or []):
+                attr_set.add(a)
 
-    attributes = sorted(attr_set)
+        attributes = sorted(attr_set)
 
-    # Sort projects
-    models.sort(
-        key=lambda p: (
-            p.representation_rank is None,
-            p.representation_rank if p.representation_rank is not None else 10**9,
-            p.created_at,
+        # Sort projects
+        models.sort(
+            key=lambda p: (
+                p.representation_rank is None,
+                p.representation_rank if p.representation_rank is not None else 10**9,
+                p.created_at,
+            )
         )
-    )
 
-    out_projects: List[CompareProjectItem] = []
-    for m in models:
-        report = get_project_report_by_name(session, m.project_name)
+        out_projects: List[CompareProjectItem] = []
+        for m in models:
+            report = get_project_report_by_name(session, m.project_name)
 
-        resolved = {a: _resolve_compare_attribute(
-            a, m, report) for a in attributes}
+            resolved = {a: _resolve_compare_attribute(
+                a, m, report) for a in attributes}
 
-        out_projects.append(
-            CompareProjectItem(
-                project_name=m.project_name,
-                representation_rank=m.representation_rank,
-                attributes=resolved,
+            out_projects.append(
+                CompareProjectItem(
+                    project_name=m.project_name,
+                    representation_rank=m.representation_rank,
+                    attributes=resolved,
+                )
             )
+
+        return CompareProjectsResponse(
+            attributes=attributes,
+            projects=out_projects,
+            count=len(out_projects),
         )
 
-    return CompareProjectsResponse(
-        attributes=attributes,
-        projects=out_projects,
-        count=len(out_projects),
-    )
+    # Keyed by the set of names, so the same selection in any order shares an entry
+    key = tuple(sorted({unquote(x.strip()) for x in projects.split(",") if x.strip()})) if projects else None
+    return response_cache.respond(
+        request, "projects.compare", key, [PROJECT, USER_CONFIG], build)
 
 
 @router.get("/showcase/selected")
@@ -460,7 +552,8 @@ def get_selected_showcase_projects(session=Depends(get_session)):
 
     out = []
     for m in models:
-        report = get_project_report_by_name(session, m.project_name)
+        report = get_project_report_by_name(
+            session, m.project_name, include_file_reports=False)
         if not report:
             continue
         out.append(_build_project_showcase_response(m, report))
@@ -469,10 +562,13 @@ def get_selected_showcase_projects(session=Depends(get_session)):
 
 
 @router.get("/{project_name}", response_model=ProjectReportResponse)
-def get_project(project_name: str, session=Depends(get_session)):
+def get_project(project_name: str, request: Request, session=Depends(get_session)):
     """
     Retrieve a single project report record by project name.
 
+    Responses are cached until the project changes and carry an `ETag`; a
+    request whose `If-None-Match` matches it gets an empty 304.
+
     Path parameters:
     - `project_name`: The unique name of the project.
 
@@ -483,26 +579,111 @@ def get_project(project_name: str, session=Depends(get_session)):
     - 404 `PROJECT_NOT_FOUND`: No project report exists with the given name.
     - 500 `DATABASE_OPERATION_FAILED`: An unexpected error occurred while fetching the report.
     """
-    result = None
+    def build() -> ProjectReportResponse:
+        result = None
+
+        try:
+            result = get_project_report_model_by_name(session, project_name)
+        except Exception as e:
+            raise DatabaseOperationError(
+                f"Failed to retrieve project report: {e}") from e
+
+        if not result:
+            raise ProjectNotFoundError(f"No project report named {project_name}")
+
+        return ProjectReportResponse.model_validate(result)
+
+    return response_cache.respond(
+        request, "projects.detail", project_name, [(PROJECT, project_name)], build)
+
+
+@router.get("/{project_name}/files", response_model=ProjectFilesResponse)
+def list_project_files(
+    project_name: str,
+    language: Optional[CodingLanguage] = None,
+    file_type: Optional[FileDomain] = None,
+    is_info_file: Optional[bool] = None,
+    min_contribution: Optional[float] = Query(default=None, ge=0, le=100),
+    path_prefix: Optional[str] = None,
+    sort: FileSort = "file_path",
+    limit: int = Query(default=100, ge=1, le=500),
+    cursor: Optional[str] = CURSOR_QUERY,
+    fields: Optional[str] = FIELDS_QUERY,
+    session=Depends(get_session),
+):
+    """
+    List a project's file reports a page at a time, without loading the rest
+    of the project.
+
+    Path parameters:
+    - `project_name`: The unique name of the project.
+
+    Query parameters:
+    - `language`: Only files in this `CODING_LANGUAGE`, e.g. `Python`.
+    - `file_type`: Only files of this `TYPE_OF_FILE`: `code`, `test`, `design` or `documentation`.
+    - `is_info_file`: Only info files (`true`) or only other files (`false`).
+    - `min_contribution`: Lowest `PERCENTAGE_LINES_COMMITTED` to include.
+    - `path_prefix`: Only files whose path starts with this.
+    - `sort`: `file_path` (default), `size`, `lines` or `contribution`; prefix
+      with `-` for descending order (except `file_path`). Files missing the
+      statistic come first ascending and last descending.
+    - `limit`: Page size, 100 by default.
+    - `cursor`: The `next_cursor` of the previous page.
+    - `fields`: Comma-separated `FileReportResponse` fields to return. The
+      statistic JSON is only read when `statistic` is asked for.
+
+    Returns:
+    - 200: A `ProjectFilesResponse` with the page of files, its count and the
+      `next_cursor` (null on the last page).
+
+    Raises:
+    - 400: The cursor or a field name is invalid.
+    - 404 `PROJECT_NOT_FOUND`: No project report exists with the given name.
+    - 500 `DATABASE_OPERATION_FAILED`: An unexpected error occurred while fetching the files.
+    """
+    selected = parse_fields(fields, FileReportResponse)
+    after = decode_cursor(cursor, sort, key_types(FILE_SORTS[sort]))
+
+    if not get_project_report_model_by_name(session, project_name):
+        raise ProjectNotFoundError(f"No project report named {project_name}")
 
     try:
-        result = get_project_report_model_by_name(session, project_name)
+        models, next_after = get_file_report_models_page(
+            session, project_name, sort, limit, after,
+            coding_language=language.value if language else None,
+            file_type=file_type.value if file_type else None,
+            is_info_file=is_info_file,
+            min_percentage_lines_committed=min_contribution,
+            path_prefix=path_prefix,
+            include_statistics=selected is None or "statistic" in selected,
+        )
     except Exception as e:
         raise DatabaseOperationError(
-            f"Failed to retrieve project report: {e}") from e
+            f"Failed to retrieve file reports: {e}") from e
 
-    if not result:
-        raise ProjectNotFoundError(f"No project report named {project_name}")
+    if selected is None:
+        files = [FileReportResponse.model_validate(m).model_dump(mode="json") for m in models]
+    else:
+        files = [{name: getattr(m, name) for name in FileReportResponse.model_fields
+                  if name in selected} for m in models]
 
-    return result
+    return JSONResponse(content=jsonable_encoder({
+        "project_name": project_name,
+        "files": files,
+        "count": len(files),
+        "next_cursor": encode_cursor(sort, next_after),
+    }))
 
 
 @router.get("/{project_name}/showcase", response_model=ProjectShowcaseResponse)
-def get_project_showcase(project_name: str, session=Depends(get_session)):
+def get_project_showcase(project_name: str, request: Request, session=Depends(get_session)):
     """
     Return the merged showcase view for a project, combining AI-generated defaults
     with any saved user overrides.
 
+    Served from the response cache until the project or the user config
+    changes; see `GET /projects/{project_name}` for the `ETag` behaviour.
+
     Path parameters:
     - `project_name`: The unique name of the project.
 
@@ -513,78 +694,83 @@ def get_project_showcase(project_name: str, session=Depends(get_session)):
     - 404 `PROJECT_NOT_FOUND`: No project report exists with the given name.
     - 500 `DATABASE_OPERATION_FAILED`: An unexpected error occurred while fetching the report.
     """
-    try:
-        report = get_project_report_by_name(session, project_name)
-    except Exception as e:
-        raise DatabaseOperationError(
-            f"Failed to retrieve project report: {e}") from e
-
-    if not report:
-        raise ProjectNotFoundError(f"No project report named {project_name}")
-
-    resume_item = report.generate_resume_item()
-    project_model = get_project_report_model_by_name(session, project_name)
-
-    # Helper to normalize date → datetime
-    def _to_datetime(value):
-        if value is None:
-            return None
-        if isinstance(value, datetime):
-            return value
+    def build() -> ProjectShowcaseResponse:
         try:
-            return datetime.combine(value, datetime.min.time())
+            report = get_project_report_by_name(
+                session, project_name, include_file_reports=False)
         except Exception as e:
-            logger.warning(
-                "Failed to convert value '%s' to datetime in project endpoint: %s",
-                value,
-                str(e),
-            )
-            return None
+            raise DatabaseOperationError(
+                f"Failed to retrieve project report: {e}") from e
 
-    # Default generated fields
-    default_title = resume_item.title
-    default_start = _to_datetime(resume_item.start_date)
-    default_end = _to_datetime(resume_item.end_date)
-    default_frameworks = _frameworks_to_strings(resume_item.frameworks)
-    default_bullets = list(resume_item.bullet_points or [])
-
-    # Apply overrides
-    title_out = (
-        project_model.showcase_title
-        if (project_model and project_model.showcase_title)
-        else default_title
-    )
-
-    start_out = project_model.showcase_start_date if (
-        project_model and project_model.showcase_start_date) else default_start
-    end_out = project_model.showcase_end_date if (
-        project_model and project_model.showcase_end_date) else default_end
+        if not report:
+            raise ProjectNotFoundError(f"No project report named {project_name}")
+
+        resume_item = report.generate_resume_item()
+        project_model = get_project_report_model_by_name(session, project_name)
+
+        # Helper to normalize date → datetime
+        def _to_datetime(value):
+            if value is None:
+                return None
+            if isinstance(value, datetime):
+                return value
+            try:
+                return datetime.combine(value, datetime.min.time())
+            except Exception as e:
+                logger.warning(
+                    "Failed to convert value '%s' to datetime in project endpoint: %s",
+                    value,
+                    str(e),
+                )
+                return None
+
+        # Default generated fields
+        default_title = resume_item.title
+        default_start = _to_datetime(resume_item.start_date)
+        default_end = _to_datetime(resume_item.end_date)
+        default_frameworks = _frameworks_to_strings(resume_item.frameworks)
+        default_bullets = list(resume_item.bullet_points or [])
+
+        # Apply overrides
+        title_out = (
+            project_model.showcase_title
+            if (project_model and project_model.showcase_title)
+            else default_title
+        )
 
-    # Chronology overrides take highest priority
-    if project_model and project_model.chrono_start_override is not None:
-        start_out = project_model.chrono_start_override
-    if project_model and project_model.chrono_end_override is not None:
-        end_out = project_model.chrono_end_override
+        start_out = project_model.showcase_start_date if (
+            project_model and project_model.showcase_start_date) else default_start
+        end_out = project_model.showcase_end_date if (
+            project_model and project_model.showcase_end_date) else default_end
+
+        # Chronology overrides take highest priority
+        if project_model and project_model.chrono_start_override is not None:
+            start_out = project_model.chrono_start_override
+        if project_model and project_model.chrono_end_override is not None:
+            end_out = project_model.chrono_end_override
+
+        frameworks_out = (
+            list(project_model.showcase_frameworks)
+            if (project_model and project_model.showcase_frameworks)
+            else default_frameworks
+        )
+        bullets_out = (
+            list(project_model.showcase_bullet_points)
+            if (project_model and project_model.showcase_bullet_points)
+            else default_bullets
+        )
 
-    frameworks_out = (
-        list(project_model.showcase_frameworks)
-        if (project_model and project_model.showcase_frameworks)
-        else default_frameworks
-    )
-    bullets_out = (
-        list(project_model.showcase_bullet_points)
-        if (project_model and project_model.showcase_bullet_points)
-        else default_bullets
-    )
+        return ProjectShowcaseResponse(
+            project_name=report.project_name,
+            title=title_out,
+            start_date=start_out,
+            end_date=end_out,
+            frameworks=frameworks_out,
+            bullet_points=bullets_out,
+        )
 
-    return ProjectShowcaseResponse(
-        project_name=report.project_name,
-        title=title_out,
-        start_date=start_out,
-        end_date=end_out,
-        frameworks=frameworks_out,
-        bullet_points=bullets_out,
-    )
+    return response_cache.respond(
+        request, "projects.showcase", project_name, [(PROJECT, project_name), USER_CONFIG], build)
 
 
 @router.get("/{project_name}/showcase/customization")
@@ -723,13 +909,16 @@ def clear_project_showcase_customization(project_name: str, session=Depends(get_
 
 
 @router.get("/{project_name}/resume-item", response_model=ProjectResumeItemResponse)
-def get_project_resume_item(project_name: str, session=Depends(get_session)):
+def get_project_resume_item(project_name: str, request: Request, session=Depends(get_session)):
     """
     Format a project as a structured résumé entry.
 
     Generates a title, date range, frameworks, and descriptive bullet points
     from the project's mined statistics.
 
+    Served from the response cache until the project or the user config
+    changes; see `GET /projects/{project_name}` for the `ETag` behaviour.
+
     Path parameters:
     - `project_name`: The unique name of the project.
 
@@ -740,39 +929,44 @@ def get_project_resume_item(project_name: str, session=Depends(get_session)):
     - 404 `PROJECT_NOT_FOUND`: No project report exists with the given name.
     - 500 `DATABASE_OPERATION_FAILED`: An unexpected error occurred while fetching the report.
     """
-    try:
-        report = get_project_report_by_name(session, project_name)
-    except Exception as e:
-        raise DatabaseOperationError(
-            f"Failed to retrieve project report: {e}") from e
-
-    if not report:
-        raise ProjectNotFoundError(f"No project report named {project_name}")
-
-    resume_item = report.generate_resume_item()
-
-    def _to_datetime(value):
-        if value is None:
-            return None
-        if isinstance(value, datetime):
-            return value
+    def build() -> ProjectResumeItemResponse:
         try:
-            return datetime.combine(value, datetime.min.time())
+            report = get_project_report_by_name(
+                session, project_name, include_file_reports=False)
         except Exception as e:
-            logger.warning(
-                "Failed to convert value '%s' to datetime in project endpoint: %s",
-                value,
-                str(e),
-            )
-            return None
+            raise DatabaseOperationError(
+                f"Failed to retrieve project report: {e}") from e
 
-    return ProjectResumeItemResponse(
-        title=resume_item.title,
-        start_date=_to_datetime(resume_item.start_date),
-        end_date=_to_datetime(resume_item.end_date),
-        frameworks=_frameworks_to_strings(resume_item.frameworks),
-        bullet_points=list(resume_item.bullet_points or []),
-    )
+        if not report:
+            raise ProjectNotFoundError(f"No project report named {project_name}")
+
+        resume_item = report.generate_resume_item()
+
+        def _to_datetime(value):
+            if value is None:
+                return None
+            if isinstance(value, datetime):
+                return value
+            try:
+                return datetime.combine(value, datetime.min.time())
+            except Exception as e:
+                logger.warning(
+                    "Failed to convert value '%s' to datetime in project endpoint: %s",
+                    value,
+                    str(e),
+                )
+                return None
+
+        return ProjectResumeItemResponse(
+            title=resume_item.title,
+            start_date=_to_datetime(resume_item.start_date),
+            end_date=_to_datetime(resume_item.end_date),
+            frameworks=_frameworks_to_strings(resume_item.frameworks),
+            bullet_points=list(resume_item.bullet_points or []),
+        )
+
+    return response_cache.respond(
+        request, "projects.resume_item", project_name, [(PROJECT, project_name), USER_CONFIG], build)
 
 
 @router.post("/{project_name}/image")
@@ -814,10 +1008,10 @@ def upload_project_image(
         )
 
     try:
-        # Read file bytes and update the model
+        # Stored by content hash, with a thumbnail generated on first upload
         image_bytes = file.file.read()
 
-        project_model.image_data = image_bytes
+        save_project_image(session, project_model, image_bytes, content_type)
         project_model.last_updated = datetime.now(timezone.utc)
 
         session.add(project_model)
@@ -833,6 +1027,67 @@ def upload_project_image(
             f"Failed to upload image: {str(e)}") from e
 
 
+
+@router.get(
+    "/{project_name}/image",
+    responses={
+        200: {"description": "The image bytes"},
+        304: {"description": "The client's cached copy is still current"},
+        404: {"description": "PROJECT_NOT_FOUND — no project with that name exists, or it has no image"},
+    },
+)
+def get_project_image_file(
+    project_name: str,
+    size: Literal["full", "thumbnail"] = "full",
+    v: Optional[str] = None,
+    if_none_match: Optional[str] = Header(default=None),
+    session=Depends(get_session),
+):
+    """
+    Serve the image of the specified project.
+
+    The response carries an `ETag` built from the image's content hash, so
+    a request with a matching `If-None-Match` header gets an empty 304.
+    Requests whose `v` matches the current hash (the URLs in project
+    responses) may be cached without revalidation.
+
+    Path parameters:
+    - `project_name`: The unique name of the project.
+
+    Query parameters:
+    - `size`: `full` (default) or `thumbnail`. Images without a thumbnail
+      are served at full size.
+    - `v`: The image hash, used only for caching.
+
+    Returns:
+    - 200: The image bytes.
+    - 304: No content; the cached image is current.
+
+    Raises:
+    - 404 `PROJECT_NOT_FOUND`: No project report exists with the given name, or it has no image.
+    """
+    project_model = get_project_report_model_by_name(session, project_name)
+    if not project_model:
+        raise ProjectNotFoundError(f"No project report named {project_name}")
+
+    image = get_project_image(session, project_model.image_hash) if project_model.image_hash else None
+    if image is None:
+        raise ProjectNotFoundError(f"Project '{project_name}' has no image")
+
+    if size == "thumbnail" and image.thumbnail is not None:
+        data, media_type, etag = image.thumbnail, image.thumbnail_content_type, f'"{image.hash}-thumbnail"'
+    else:
+        data, media_type, etag = image.data, image.content_type, f'"{image.hash}"'
+
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=31536000, immutable" if v == image.hash else "no-cache",
+    }
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=data, media_type=media_type, headers=headers)
+
+
 @router.delete(
     "/{project_name}",
     status_code=204,
@@ -905,7 +1160,7 @@ def delete_project_image(
         raise ProjectNotFoundError(f"No project report named {project_name}")
 
     try:
-        project_model.image_data = None
+        remove_project_image(session, project_model)
         project_model.last_updated = datetime.now(timezone.utc)
 
         session.add(project_model)
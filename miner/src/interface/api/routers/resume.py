@@ -1,23 +1,37 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import Response
 from sqlmodel import SQLModel
-from typing import List, Optional
+from typing import List, Literal, Optional
 import datetime
 
+from src.database.core.entity_versions import PROJECT, RESUME, USER_CONFIG
+from src.database.core.pagination import key_types
+from src.interface.api.pagination import (CURSOR_QUERY, FIELDS_QUERY,
+                                         LIMIT_QUERY, decode_cursor,
+                                         encode_cursor, parse_fields)
+from src.interface.api.response_cache import response_cache
 from src.interface.api.routers.util import get_session
 from src.interface.api.routers.user_config import get_user_config_safe
 import src.database as _db
 from src.database import (
-    get_project_report_by_name,
+    get_project_contributions,
+    get_project_reports_by_names,
 )
 from src.database.api.CRUD.resume import (
+    RESUME_SORTS,
     save_resume,
     load_resume,
     get_resume_model_by_id,
-    list_resumes,
+    list_resumes_page,
     delete_resume,
 )
 from src.core.report.user.user_report import UserReport
+from src.services.resume.export_resume_service import (
+    RenderedArtifact,
+    export_docx,
+    export_latex,
+    export_pdf,
+)
 from src.core.statistic.user_stat_collection import UserStatCollection
 from src.utils.errors import ResumeNotFoundError, ProjectNotFoundError, DatabaseOperationError
 from datetime import date
@@ -169,6 +183,10 @@ class ResumeListResponse(SQLModel):
     """Response model for all produced resumes"""
     resumes: List[ResumeListItemResponse]
     count: int
+    next_cursor: Optional[str] = None
+
+
+ResumeSort = Literal[tuple(RESUME_SORTS)]  # type: ignore[valid-type]
 
 # Helper function.
 def _build_resume_response(resume_model) -> ResumeResponse:
@@ -276,6 +294,19 @@ def _build_resume_list_item(resume_model) -> ResumeListItemResponse:
         project_names=project_names,
     )
 
+
+def _load_project_reports(session, project_names: list[str]) -> list:
+    """
+    Load the named projects without their file reports, in one query.
+    Raises `ProjectNotFoundError` if any of them does not exist.
+    """
+    try:
+        return get_project_reports_by_names(
+            session, project_names, include_file_reports=False)
+    except KeyError as e:
+        raise ProjectNotFoundError(f"No project found with name '{e.args[0]}'")
+
+
 class EditSkillsRequest(SQLModel):
     """Request model for editing categorized skills"""
     expert: List[str]
@@ -312,27 +343,57 @@ class EditExperienceRequest(SQLModel):
 
 # ---------- Resume API Endpoints ----------
 
-@router.get("", response_model=ResumeListResponse)
-def get_all_resumes(session=Depends(get_session)):
+@router.get("", response_model=ResumeListResponse, response_model_exclude_unset=True)
+def get_all_resumes(
+    sort: ResumeSort = "-last_updated",
+    limit: Optional[int] = LIMIT_QUERY,
+    cursor: Optional[str] = CURSOR_QUERY,
+    fields: Optional[str] = FIELDS_QUERY,
+    session=Depends(get_session),
+):
     """
     GET /resume
 
-    Returns a lightweight list of all produced resumes.
+    Returns a lightweight list of produced resumes, most recently updated first.
     Each entry contains: id, email, github, created_at, last_updated, item_count.
+
+    Query parameters:
+    - `sort`: `-last_updated` (default), `last_updated`, `-created_at` or `created_at`.
+    - `limit`: Page size; every resume is returned when omitted.
+    - `cursor`: The `next_cursor` of the previous page.
+    - `fields`: Comma-separated `ResumeListItemResponse` fields to return.
+
+    Raises:
+    - 400: The cursor or a field name is invalid.
     """
-    resume_models = list_resumes(session)
+    selected = parse_fields(fields, ResumeListItemResponse)
+    after = decode_cursor(cursor, sort, key_types(RESUME_SORTS[sort]))
+
+    resume_models, next_after = list_resumes_page(session, sort, limit, after)
     resumes = [_build_resume_list_item(resume_model) for resume_model in resume_models]
+    if selected is not None:
+        # Unset fields are left out of the response
+        resumes = [
+            ResumeListItemResponse.model_construct(
+                **{name: getattr(resume, name) for name in selected})
+            for resume in resumes
+        ]
 
     return ResumeListResponse(
         resumes=resumes,
         count=len(resumes),
+        next_cursor=encode_cursor(sort, next_after),
     )
 
 @router.get("/{resume_id}", response_model=ResumeResponse)
-def get_resume(resume_id: int, session=Depends(get_session)):
+def get_resume(resume_id: int, request: Request, session=Depends(get_session)):
     """
     Retrieve a saved resume by its database ID.
 
+    Responses are cached until the resume, its projects or the user config
+    change and carry an `ETag`; a request whose `If-None-Match` matches it
+    gets an empty 304.
+
     Path parameters:
     - `resume_id`: Integer primary key of the resume record.
 
@@ -342,45 +403,52 @@ def get_resume(resume_id: int, session=Depends(get_session)):
     Raises:
     - 404 `RESUME_NOT_FOUND`: No resume exists with the given ID.
     """
+    def build() -> ResumeResponse:
+        result = get_resume_model_by_id(session, resume_id)
 
-    result = get_resume_model_by_id(session, resume_id)
-
-    if not result:
-        raise ResumeNotFoundError(f"No resume found with id {resume_id}")
+        if not result:
+            raise ResumeNotFoundError(f"No resume found with id {resume_id}")
 
-    # If no stored skills, try to calculate from UserReport
-    has_stored_skills = (
-        bool(result.skills_expert) or
-        bool(result.skills_intermediate) or
-        bool(result.skills_exposure)
-    )
-    if not has_stored_skills:
-        user_config = _db.get_most_recent_user_config(session)
-        if user_config and user_config.project_reports:
-            try:
-                project_reports = [
-                    get_project_report_by_name(session, p.project_name)
-                    for p in user_config.project_reports
-                ]
-                project_reports = [p for p in project_reports if p is not None]
-                if project_reports:
-                    report = UserReport(project_reports)
-                    weighted_skills = report.statistics.get_value(UserStatCollection.USER_SKILLS.value) or []
-                    expert, intermediate, exposure = [], [], []
-                    for ws in weighted_skills:
-                        if ws.weight >= 0.7:
-                            expert.append(ws.skill_name)
-                        elif ws.weight >= 0.4:
-                            intermediate.append(ws.skill_name)
-                        else:
-                            exposure.append(ws.skill_name)
-                    result.skills_expert = expert
-                    result.skills_intermediate = intermediate
-                    result.skills_exposure = exposure
-            except Exception:
-                pass
-
-    return _build_resume_response(result)
+        # If no stored skills, try to calculate from UserReport
+        has_stored_skills = (
+            bool(result.skills_expert) or
+            bool(result.skills_intermediate) or
+            bool(result.skills_exposure)
+        )
+        if not has_stored_skills:
+            user_config = _db.get_most_recent_user_config(session)
+            if user_config and user_config.project_reports:
+                try:
+                    project_names = [
+                        p.project_name for p in user_config.project_reports]
+                    project_reports = get_project_reports_by_names(
+                        session, project_names, include_file_reports=False)
+                    if project_reports:
+                        report = UserReport(
+                            project_reports,
+                            contributions=get_project_contributions(
+                                session, project_names),
+                        )
+                        weighted_skills = report.statistics.get_value(UserStatCollection.USER_SKILLS.value) or []
+                        expert, intermediate, exposure = [], [], []
+                        for ws in weighted_skills:
+                            if ws.weight >= 0.7:
+                                expert.append(ws.skill_name)
+                            elif ws.weight >= 0.4:
+                                intermediate.append(ws.skill_name)
+                            else:
+                                exposure.append(ws.skill_name)
+                        result.skills_expert = expert
+                        result.skills_intermediate = intermediate
+                        result.skills_exposure = exposure
+                except Exception:
+                    pass
+
+        return _build_resume_response(result)
+
+    # Resumes without stored skills fall back to the user's projects
+    return response_cache.respond(
+        request, "resume", resume_id, [(RESUME, resume_id), PROJECT, USER_CONFIG], build)
 
 @router.post("/{resume_id}/edit/skills", response_model=ResumeResponse)
 def edit_resume_skills(
@@ -559,17 +627,14 @@ def generate_resume(request: GenerateResumeRequest, session=Depends(get_session)
     user_config = get_user_config_safe(session, request.user_config_id)
 
     # Get projects as domain objects
-    project_reports = []
-    for project_name in request.project_names:
-        project = get_project_report_by_name(session, project_name)
-        if not project:
-            raise ProjectNotFoundError(f"No project found with name '{project_name}'")
-        project_reports.append(project)
+    # The stored contributions stand in for the file reports
+    project_reports = _load_project_reports(session, request.project_names)
 
     try:
         # Generate resume
         user_report = UserReport(
-            project_reports=project_reports, report_name="Generated Resume")
+            project_reports=project_reports, report_name="Generated Resume",
+            contributions=get_project_contributions(session, request.project_names))
 
         # Extract defaults from user config
         user_email = user_config.user_email if user_config else None
@@ -857,16 +922,12 @@ def refresh_resume(
             status_code=400, detail="Cannot refresh: No projects are associated with this resume."
         )
 
-    project_reports = []
-    for project_name in project_names:
-        project = get_project_report_by_name(session, project_name)
-        if not project:
-            raise ProjectNotFoundError(f"No project found with name '{project_name}'")
-        project_reports.append(project)
+    project_reports = _load_project_reports(session, project_names)
 
     try:
         user_report = UserReport(
-            project_reports=project_reports, report_name="Generated Resume"
+            project_reports=project_reports, report_name="Generated Resume",
+            contributions=get_project_contributions(session, project_names)
         )
 
         new_resume_domain = user_report.generate_resume(
@@ -1030,24 +1091,38 @@ def edit_resume_item_frameworks(
         raise DatabaseOperationError(f"Failed to edit frameworks: {str(e)}") from e
 
 
+def _export_filename(resume, resume_id: int, extension: str) -> str:
+    filename = f"{resume.title or f'resume_{resume_id}'}.{extension}"
+    filename = "".join(c for c in filename if c.isalnum() or c in ("-", "_", ".")).strip()
+    return filename or f"resume_{resume_id}.{extension}"
+
+
+def _export_response(artifact: RenderedArtifact, media_type: str, filename: str) -> Response:
+    return Response(
+        content=artifact.content,
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Render-Time-Ms": f"{artifact.render_seconds * 1000:.1f}",
+            "X-Render-Cache": "hit" if artifact.cache_hit else "miss",
+        },
+    )
+
+
 @router.get("/{resume_id}/export/latex")
 def export_resume_latex(resume_id: int, session=Depends(get_session)):
-    """Export a resume as a raw LaTeX (.tex) file."""
-    from src.core.resume.render import ResumeLatexRenderer
+    """
+    Export a resume as a raw LaTeX (.tex) file.
 
+    Exports are cached until the resume changes. `X-Render-Cache` says
+    whether this one was, and `X-Render-Time-Ms` how long rendering took.
+    """
     resume = load_resume(session, resume_id)
     if resume is None:
         raise HTTPException(status_code=404, detail=f"No resume found with id {resume_id}")
 
-    tex = ResumeLatexRenderer().render(resume)
-    filename = f"{resume.title or f'resume_{resume_id}'}.tex"
-    filename = "".join(c for c in filename if c.isalnum() or c in ("-", "_", ".")).strip() or f"resume_{resume_id}.tex"
-
-    return Response(
-        content=tex.encode("utf-8"),
-        media_type="application/x-tex",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+    return _export_response(
+        export_latex(resume), "application/x-tex", _export_filename(resume, resume_id, "tex"))
 
 
 @router.get("/{resume_id}/export/pdf")
@@ -1055,6 +1130,10 @@ def export_resume_pdf(resume_id: int, session=Depends(get_session)):
     """
     Export a resume as a PDF file.
 
+    PDFs are cached by their LaTeX source, so pdflatex only runs again once
+    the resume changes. `X-Render-Cache` says whether this export was
+    cached, and `X-Render-Time-Ms` how long compiling took.
+
     Path parameters:
     - `resume_id`: Integer primary key of the resume record.
 
@@ -1065,8 +1144,6 @@ def export_resume_pdf(resume_id: int, session=Depends(get_session)):
     - 404: No resume exists with the given ID.
     - 500: PDF rendering failed (e.g. pdflatex not installed).
     """
-    from src.core.resume.render import PDFRenderer
-
     resume = load_resume(session, resume_id)
     if resume is None:
         raise HTTPException(
@@ -1075,52 +1152,43 @@ def export_resume_pdf(resume_id: int, session=Depends(get_session)):
         )
 
     try:
-        pdf_bytes = PDFRenderer().render(resume)
+        artifact = export_pdf(resume)
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"PDF rendering error: {str(e)}"
         )
 
-    if not pdf_bytes:
+    if not artifact.content:
         raise HTTPException(
             status_code=500,
             detail="PDF rendering produced empty output. Ensure pdflatex is installed and the LaTeX source is valid."
         )
 
-    filename = f"{resume.title or f'resume_{resume_id}'}.pdf"
-    filename = "".join(c for c in filename if c.isalnum() or c in ("-", "_", ".")).strip()
-    if not filename:
-        filename = f"resume_{resume_id}.pdf"
-
-    return Response(
-        content=pdf_bytes,
-        media_type="application/pdf",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
-    )
+    return _export_response(artifact, "application/pdf", _export_filename(resume, resume_id, "pdf"))
 
 
 @router.get("/{resume_id}/export/docx")
 def export_resume_docx(resume_id: int, session=Depends(get_session)):
-    """Export a resume as a Word (.docx) file."""
-    from src.core.resume.render import DocxResumeRenderer
+    """
+    Export a resume as a Word (.docx) file.
 
+    Exports are cached until the resume changes. `X-Render-Cache` says
+    whether this one was, and `X-Render-Time-Ms` how long rendering took.
+    """
     resume = load_resume(session, resume_id)
     if resume is None:
         raise HTTPException(status_code=404, detail=f"No resume found with id {resume_id}")
 
     try:
-        docx_bytes = DocxResumeRenderer().render(resume)
+        artifact = export_docx(resume)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Word export error: {str(e)}")
 
-    filename = f"{resume.title or f'resume_{resume_id}'}.docx"
-    filename = "".join(c for c in filename if c.isalnum() or c in ("-", "_", ".")).strip() or f"resume_{resume_id}.docx"
-
-    return Response(
-        content=docx_bytes,
-        media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    return _export_response(
+        artifact,
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        _export_filename(resume, resume_id, "docx"),
     )
 
 
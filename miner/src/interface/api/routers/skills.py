@@ -1,6 +1,8 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlmodel import SQLModel
 
+from src.database.core.entity_versions import PROJECT
+from src.interface.api.response_cache import response_cache
 from src.interface.api.routers.util import get_session
 from src.services.skills_service import get_skills
 
@@ -15,24 +17,29 @@ class WeightedUserSkills(SQLModel):
     weight: float
 
 @router.get("", response_model=dict[str, list[WeightedUserSkills]])
-def get_skills_endpoint(session=Depends(get_session)):
+def get_skills_endpoint(request: Request, session=Depends(get_session)):
     """
     Aggregate and return all skills detected across every project report.
 
     Skills are weighted by their relative contribution across projects, then
-    returned as a flat list sorted by the service layer.
+    returned as a flat list sorted by the service layer. The response is
+    cached until any project changes and carries an `ETag`; a request whose
+    `If-None-Match` matches it gets an empty 304.
 
     Returns:
     - 200: `{"skills": [{"name": "...", "weight": 0.0}]}` — a list of
       `WeightedUserSkills` sorted by the service layer.
     """
-    raw_skills = get_skills(session)
+    def build() -> dict[str, list[WeightedUserSkills]]:
+        raw_skills = get_skills(session)
 
-    # Map the dataclass (skill_name) to the response model (name)
-    formatted_skills = [WeightedUserSkills(name=s.skill_name, weight=s.weight) for s in raw_skills]
+        # Map the dataclass (skill_name) to the response model (name)
+        formatted_skills = [WeightedUserSkills(name=s.skill_name, weight=s.weight) for s in raw_skills]
 
-    # Return the mapped data
-    return {"skills": formatted_skills}
+        # Return the mapped data
+        return {"skills": formatted_skills}
+
+    return response_cache.respond(request, "skills", None, [PROJECT], build)
 
 @router.get("/highlighted", response_model=dict[str, list[WeightedUserSkills]])
 def get_highlighted_skills(session=Depends(get_session)):
@@ -1273,9 +1273,10 @@ class ArtifactMiner(cmd.Cmd):
 
     def do_warmup(self, arg):
         """Warm up the local summary model to avoid delays during output."""
-        from src.app import init_system
+        from src.app import start_background_warmup, wait_for_warmup
 
         print("\nWarming up summary model...")
-        _, status_message = init_system()
-        print(status_message)
+        start_background_warmup()
+        status = wait_for_warmup()
+        print(status["message"])
         print("\n" + self.options)
@@ -0,0 +1,241 @@
+"""
+Inverted index over the evidence each project offers for a job: its
+summary, statistics, file signals, frameworks, skills, themes and tags.
+
+Matching a job dimension against projects looks its terms up in the index
+and ranks the projects that contain them with BM25, instead of rebuilding
+and scanning every project's evidence text for every dimension. The
+database holds a single user's projects, so one index per process is the
+user's index. Each project's entry is built once from its stored
+statistics and rebuilt after the project is saved, which the entity
+versions (see `src.database.core.entity_versions`) reveal.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Collection, Iterable
+
+from sqlmodel import Session
+
+from src.database.api.CRUD.projects import get_project_report_models_by_names
+from src.database.api.models import ProjectReportModel
+from src.database.core.entity_versions import PROJECT, versions_of
+from src.services.job_readiness_service import (
+    project_file_signal_summary,
+    project_skills_from_stats,
+    project_stat_summary_lines,
+    project_summary,
+    project_tags_from_stats,
+)
+
+# BM25 term-frequency saturation and document-length normalization
+_K1 = 1.2
+_B = 0.75
+
+_TERM_PATTERN = re.compile(r"[a-z0-9+#]+")
+
+
+def clean_list(values: list[str]) -> list[str]:
+    """Strip `values` and drop empty ones and case-insensitive repeats."""
+    seen: set[str] = set()
+    out: list[str] = []
+    for value in values:
+        cleaned = str(value or "").strip()
+        if not cleaned:
+            continue
+        key = cleaned.lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        out.append(cleaned)
+    return out
+
+
+def _project_tech_stack(project: ProjectReportModel) -> list[str]:
+    values: list[str] = []
+    values.extend(clean_list(list(project.showcase_frameworks or [])))
+    values.extend(clean_list(project_skills_from_stats(project)))
+    values.extend(clean_list(project_tags_from_stats(project)))
+    return clean_list(values)
+
+
+def _project_evidence_blob(project: ProjectReportModel) -> str:
+    parts: list[str] = []
+    parts.append(project_summary(project))
+    parts.extend(project_stat_summary_lines(project.statistic))
+    parts.extend(project_file_signal_summary(project))
+    parts.extend(_project_tech_stack(project))
+    return "\n".join(clean_list(parts)).lower()
+
+
+def tokenize_terms(text: str) -> list[str]:
+    """
+    Split text into lowercase index terms. Paths and dotted names are split
+    into their parts and a plural "s" is dropped, so "api/routes.py"
+    matches "route" and "API".
+    """
+    terms = []
+    for term in _TERM_PATTERN.findall(text.lower()):
+        if len(term) > 3 and term.endswith("s") and not term.endswith("ss"):
+            term = term[:-1]
+        terms.append(term)
+    return terms
+
+
+@dataclass(frozen=True)
+class ProjectEvidence:
+    """What interview matching reads from a project, extracted once."""
+    project_name: str
+    showcase_title: str | None
+    showcase_bullet_points: tuple[str, ...]
+    summary: str
+    stat_lines: tuple[str, ...]
+    tech_stack: tuple[str, ...]
+    # Lowercased evidence text, for phrase checks
+    blob: str
+    term_counts: Counter = field(compare=False, repr=False)
+    # Number of terms in `blob`
+    length: int
+    # The terms of `blob` in order, space separated and padded, for phrases
+    term_text: str = field(compare=False, repr=False)
+
+    def mentions(self, phrase: str) -> bool:
+        """
+        Whether the evidence contains the terms of `phrase` one after the
+        other, so "unit test" is not matched by a project that only mentions
+        "unit" and "test" apart.
+        """
+        terms = tokenize_terms(phrase)
+        if not terms or any(term not in self.term_counts for term in terms):
+            return False
+        return len(terms) == 1 or f" {' '.join(terms)} " in self.term_text
+
+    @classmethod
+    def from_project(cls, project: ProjectReportModel) -> ProjectEvidence:
+        blob = _project_evidence_blob(project)
+        terms = tokenize_terms(blob)
+        term_counts = Counter(terms)
+        return cls(
+            project_name=project.project_name,
+            showcase_title=project.showcase_title,
+            showcase_bullet_points=tuple(project.showcase_bullet_points or []),
+            summary=project_summary(project),
+            stat_lines=tuple(project_stat_summary_lines(project.statistic)),
+            tech_stack=tuple(_project_tech_stack(project)),
+            blob=blob,
+            term_counts=term_counts,
+            length=len(terms),
+            term_text=f" {' '.join(terms)} ",
+        )
+
+
+class EvidenceIndex:
+    """
+    Thread-safe map from each term to the projects whose evidence contains
+    it and how often, plus the evidence itself.
+    """
+
+    def __init__(self):
+        self._documents: dict[str, ProjectEvidence] = {}
+        self._versions: dict[str, tuple[int, ...]] = {}
+        self._postings: dict[str, dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def refresh(self, session: Session, project_names: Iterable[str]) -> list[ProjectEvidence]:
+        """
+        Return the evidence of each named project, in order, first
+        (re)indexing the ones that are new or saved since they were indexed.
+        Unchanged projects are not read from the database. Raises `KeyError`
+        naming any project that does not exist.
+        """
+        names = list(dict.fromkeys(project_names))
+        # Read before loading, so a save that lands mid-load leaves the
+        # entry stale rather than indexing old data under the new version
+        versions = {name: versions_of([(PROJECT, name)]) for name in names}
+
+        with self._lock:
+            stale = [
+                name for name in names
+                if self._versions.get(name) != versions[name]
+            ]
+
+        if stale:
+            with self._lock:
+                # Deleted projects must not linger if the load below fails
+                for name in stale:
+                    self._remove(name)
+            loaded = [
+                ProjectEvidence.from_project(project)
+                for project in get_project_report_models_by_names(session, stale)
+            ]
+            with self._lock:
+                for evidence in loaded:
+                    self._add(evidence, versions[evidence.project_name])
+
+        with self._lock:
+            return [self._documents[name] for name in names if name in self._documents]
+
+    def search(self, terms: Iterable[str], among: Collection[str]) -> dict[str, float]:
+        """
+        BM25 score of each project in `among` whose evidence contains any
+        of `terms`. Term rarity and average length are taken over `among`,
+        so scores do not depend on which other projects are indexed.
+        """
+        query = set(terms)
+        candidates = set(among)
+        scores: dict[str, float] = {}
+
+        with self._lock:
+            documents = [self._documents[name] for name in candidates if name in self._documents]
+            if not query or not documents:
+                return scores
+            average_length = sum(doc.length for doc in documents) / len(documents) or 1.0
+
+            for term in query:
+                postings = {
+                    name: count
+                    for name, count in self._postings.get(term, {}).items()
+                    if name in candidates
+                }
+                if not postings:
+                    continue
+                idf = math.log(1 + (len(documents) - len(postings) + 0.5) / (len(postings) + 0.5))
+                for name, count in postings.items():
+                    length_ratio = self._documents[name].length / average_length
+                    saturation = count + _K1 * (1 - _B + _B * length_ratio)
+                    scores[name] = scores.get(name, 0.0) + idf * count * (_K1 + 1) / saturation
+        return scores
+
+    def clear(self) -> None:
+        """Drop every indexed project."""
+        with self._lock:
+            self._documents.clear()
+            self._versions.clear()
+            self._postings.clear()
+
+    def _add(self, evidence: ProjectEvidence, version: tuple[int, ...]) -> None:
+        self._documents[evidence.project_name] = evidence
+        self._versions[evidence.project_name] = version
+        for term, count in evidence.term_counts.items():
+            self._postings.setdefault(term, {})[evidence.project_name] = count
+
+    def _remove(self, project_name: str) -> None:
+        evidence = self._documents.pop(project_name, None)
+        self._versions.pop(project_name, None)
+        if evidence is None:
+            return
+        for term in evidence.term_counts:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(project_name, None)
+            if not postings:
+                del self._postings[term]
+
+
+evidence_index = EvidenceIndex()
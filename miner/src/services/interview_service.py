@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import copy
+import hashlib
 import json
 import os
 import re
+import threading
+from collections import OrderedDict
 from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
@@ -27,16 +31,17 @@ from src.core.ML.models.interview_constants import (
     INTERVIEW_START_SYSTEM_PROMPT,
     INTERVIEW_START_USER_PROMPT_TEMPLATE,
 )
-from src.database.api.CRUD.projects import get_all_project_ids, get_project_report_models_by_names
-from src.database.api.models import ProjectReportModel
+from src.database.api.CRUD.projects import get_all_project_ids
+from src.database.core.entity_versions import PROJECT, RESUME, Dependency, versions_of
 from src.infrastructure.log.logging import get_logger
+from src.services.evidence_index_service import (
+    ProjectEvidence,
+    clean_list,
+    evidence_index,
+    tokenize_terms,
+)
 from src.services.job_readiness_service import (
     JobReadinessUserProfileInput,
-    _project_file_signal_summary,
-    _project_skills_from_stats,
-    _project_stat_summary_lines,
-    _project_summary,
-    _project_tags_from_stats,
     build_user_profile,
     run_job_readiness_analysis,
 )
@@ -48,6 +53,13 @@ MAX_QUESTIONS_PER_DIMENSION = 2
 
 logger = get_logger(__name__)
 
+# Interview contexts by request hash, with the versions of the projects and
+# resume they were built from. Every answer in an interview resends the
+# same request, so all but the first reuse the context built for it.
+_CONTEXT_CACHE_SIZE = 16
+_context_cache: "OrderedDict[str, tuple[tuple[int, ...], dict[str, Any]]]" = OrderedDict()
+_context_cache_lock = threading.Lock()
+
 
 class InterviewStartResult(BaseModel):
     model_config = ConfigDict(extra="forbid")
@@ -174,21 +186,6 @@ def _infer_role_lens(job_description: str) -> str:
     return best_lens if best_score > 0 else "general_professional"
 
 
-def _clean_list(values: list[str]) -> list[str]:
-    seen: set[str] = set()
-    out: list[str] = []
-    for value in values:
-        cleaned = str(value or "").strip()
-        if not cleaned:
-            continue
-        key = cleaned.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        out.append(cleaned)
-    return out
-
-
 def _dimension_counts(values: list[str] | None) -> dict[str, int]:
     counts: dict[str, int] = {}
     for value in values or []:
@@ -199,23 +196,6 @@ def _dimension_counts(values: list[str] | None) -> dict[str, int]:
     return counts
 
 
-def _project_tech_stack(project: ProjectReportModel) -> list[str]:
-    values: list[str] = []
-    values.extend(_clean_list(list(project.showcase_frameworks or [])))
-    values.extend(_clean_list(_project_skills_from_stats(project)))
-    values.extend(_clean_list(_project_tags_from_stats(project)))
-    return _clean_list(values)
-
-
-def _project_evidence_blob(project: ProjectReportModel) -> str:
-    parts: list[str] = []
-    parts.append(_project_summary(project))
-    parts.extend(_project_stat_summary_lines(project.statistic))
-    parts.extend(_project_file_signal_summary(project))
-    parts.extend(_project_tech_stack(project))
-    return "\n".join(_clean_list(parts)).lower()
-
-
 def _extract_job_dimensions(job_description: str) -> list[dict[str, Any]]:
     lowered = job_description.lower()
     scored: list[dict[str, Any]] = []
@@ -269,7 +249,7 @@ def _parse_dimension_payload(payload: dict[str, Any] | None) -> list[dict[str, A
         dimension_id = _normalize_dimension_id(str(item.get("dimension_id", "")))
         label = str(item.get("label", "")).strip() or dimension_id.replace("_", " ")
         reason = str(item.get("reason", "")).strip() or f"Assess fit for {label}."
-        signals = _clean_list([str(signal) for signal in item.get("signals", [])])[:6]
+        signals = clean_list([str(signal) for signal in item.get("signals", [])])[:6]
         preferred = str(item.get("preferred_question_category", "project_based")).strip()
         if preferred not in {"project_based", "role_specific", "skill_gap"}:
             preferred = "project_based"
@@ -400,50 +380,69 @@ def _readiness_signals(
     }
 
 
+def _dimension_relevance(item: dict[str, Any], project_names: list[str]) -> dict[str, float]:
+    """
+    BM25 score of each project's evidence for the dimension's job keywords,
+    scaled so the best matching project scores 1. Only used to order
+    projects that match the same number of keywords.
+    """
+    terms = tokenize_terms(" ".join(str(keyword) for keyword in item.get("matches", [])))
+    scores = evidence_index.search(terms, among=project_names)
+    best = max(scores.values(), default=0.0)
+    return {name: score / best for name, score in scores.items()} if best else {}
+
+
 def _project_fit_entry(
-    project: ProjectReportModel,
+    evidence: ProjectEvidence,
     dimensions: list[dict[str, Any]],
+    dimension_relevance: dict[str, dict[str, float]],
     *,
     role_lens: str,
     job_description: str,
 ) -> dict[str, Any]:
-    evidence_blob = _project_evidence_blob(project)
     matched_dimensions: list[str] = []
+    dimension_scores: dict[str, dict[str, float]] = {}
     score = 0
     for item in dimensions:
         dimension = str(item["dimension"])
         dimension_matches = [
             keyword
             for keyword in item["matches"]
-            if keyword in evidence_blob
-        ]
-        label_tokens = _tokenize_lower(f"{item.get('label', '')} {item.get('reason', '')}")
-        overlap = [
-            token for token in label_tokens
-            if len(token) > 3 and token in evidence_blob
+            if evidence.mentions(str(keyword))
         ]
+        label_terms = tokenize_terms(f"{item.get('label', '')} {item.get('reason', '')}")
+        overlap = {
+            term for term in label_terms
+            if len(term) > 3 and term in evidence.term_counts
+        }
         if dimension_matches:
             matched_dimensions.append(dimension)
             score += len(dimension_matches) * 3
+            dimension_scores[dimension] = {
+                "keywords": len(dimension_matches),
+                "relevance": round(
+                    dimension_relevance[dimension].get(evidence.project_name, 0.0), 3),
+            }
         elif overlap:
             matched_dimensions.append(dimension)
             score += min(len(overlap), 2)
+            dimension_scores[dimension] = {"keywords": 0, "relevance": 0.0}
 
-    tech_stack = _project_tech_stack(project)
+    tech_stack = list(evidence.tech_stack)
     score += min(len(tech_stack), 6)
 
-    if project.showcase_title:
+    if evidence.showcase_title:
         score += 1
-    if project.showcase_bullet_points:
-        score += min(len(project.showcase_bullet_points), 3)
+    if evidence.showcase_bullet_points:
+        score += min(len(evidence.showcase_bullet_points), 3)
 
     role_hits = [
         signal for signal in _ROLE_PROJECT_SIGNALS.get(role_lens, ())
-        if signal in evidence_blob and signal in job_description.lower()
+        if signal in evidence.blob and signal in job_description.lower()
     ]
     score += len(role_hits) * 4
 
-    title_blob = f"{project.project_name} {project.showcase_title or ''}".lower()
+    title_blob = f"{evidence.project_name} {evidence.showcase_title or ''}".lower()
     if role_lens in {"product_strategy", "consulting_business", "data_analysis"}:
         if any(token in title_blob for token in ("portal", "dashboard", "analytics", "habit", "mobile")):
             score += 5
@@ -452,16 +451,19 @@ def _project_fit_entry(
             score += 5
 
     return {
-        "project_name": project.project_name,
-        "summary": _project_summary(project),
+        "project_name": evidence.project_name,
+        "summary": evidence.summary,
         "tech_stack": tech_stack[:10],
-        "evidence_points": _clean_list(
-            [str(_project_summary(project))]
-            + _project_stat_summary_lines(project.statistic)[:4]
-            + list(project.showcase_bullet_points or [])[:4]
+        "evidence_points": clean_list(
+            [evidence.summary]
+            + list(evidence.stat_lines[:4])
+            + list(evidence.showcase_bullet_points[:4])
         )[:8],
-        "matched_dimensions": _clean_list(matched_dimensions),
-        "role_hits": _clean_list(role_hits)[:8],
+        "matched_dimensions": clean_list(matched_dimensions),
+        # Job keywords matched per dimension, and BM25 relevance to order
+        # projects that match as many
+        "dimension_scores": dimension_scores,
+        "role_hits": clean_list(role_hits)[:8],
         "fit_score": score,
     }
 
@@ -508,22 +510,32 @@ def _derive_allowed_tools(
 def _derive_job_fit_context(
     *,
     job_description: str,
-    projects: list[ProjectReportModel],
+    projects: list[ProjectEvidence],
     dimensions: list[dict[str, Any]],
     readiness_signals: dict[str, Any],
     role_lens: str,
 ) -> dict[str, Any]:
     prioritized_dimensions = dimensions
+    project_names = [evidence.project_name for evidence in projects]
+    dimension_relevance = {
+        str(item["dimension"]): _dimension_relevance(item, project_names)
+        for item in prioritized_dimensions
+    }
     project_entries = [
         _project_fit_entry(
-            project,
+            evidence,
             prioritized_dimensions,
+            dimension_relevance,
             role_lens=role_lens,
             job_description=job_description,
         )
-        for project in projects
+        for evidence in projects
     ]
-    project_entries.sort(key=lambda item: (-int(item["fit_score"]), item["project_name"]))
+    project_entries.sort(key=lambda item: (
+        -int(item["fit_score"]),
+        -sum(scores["relevance"] for scores in item["dimension_scores"].values()),
+        item["project_name"],
+    ))
 
     weak_dimensions: list[str] = []
     for weakness in readiness_signals.get("weaknesses", []):
@@ -538,7 +550,7 @@ def _derive_job_fit_context(
         "prioritized_dimensions": prioritized_dimensions,
         "relevant_projects": project_entries[:5],
         "primary_project": project_entries[0]["project_name"] if project_entries else None,
-        "weak_dimensions": _clean_list(weak_dimensions),
+        "weak_dimensions": clean_list(weak_dimensions),
         "role_lens": role_lens,
         "allowed_tools": _derive_allowed_tools(
             job_description=job_description,
@@ -549,6 +561,36 @@ def _derive_job_fit_context(
     }
 
 
+def _context_cache_key(
+    *,
+    job_description: str,
+    resume_id: int | None,
+    project_names: list[str],
+    user_profile_input: JobReadinessUserProfileInput | None,
+) -> str:
+    request = {
+        "job_description": job_description,
+        "resume_id": resume_id,
+        "project_names": project_names,
+        "user_profile": user_profile_input.model_dump(mode="json") if user_profile_input else None,
+        # Dimensions come from the model only when it is available
+        "azure_deployment": _deployment_name() if azure_openai_enabled() else None,
+    }
+    serialized = json.dumps(request, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def _context_dependencies(resume_id: int | None, project_names: list[str]) -> list[Dependency]:
+    # Without named projects the context covers every project, or the
+    # resume's, so any project change can affect it
+    dependencies: list[Dependency] = (
+        [(PROJECT, name) for name in project_names] if project_names else [PROJECT]
+    )
+    if resume_id is not None:
+        dependencies.append((RESUME, resume_id))
+    return dependencies
+
+
 def build_interview_context(
     *,
     session: Session,
@@ -556,6 +598,58 @@ def build_interview_context(
     resume_id: int | None = None,
     project_names: list[str] | None = None,
     user_profile_input: JobReadinessUserProfileInput | None = None,
+) -> dict[str, Any]:
+    """
+    The candidate profile, job readiness signals and job-fit context for an
+    interview, reused while the request and the projects and resume it reads
+    are unchanged. Callers get their own copy.
+    """
+    project_names = list(project_names or [])
+    key = _context_cache_key(
+        job_description=job_description,
+        resume_id=resume_id,
+        project_names=project_names,
+        user_profile_input=user_profile_input,
+    )
+    # Read before building, so a write that lands mid-build leaves the
+    # entry stale rather than caching old data under the new versions
+    versions = versions_of(_context_dependencies(resume_id, project_names))
+
+    with _context_cache_lock:
+        cached = _context_cache.get(key)
+        if cached is not None and cached[0] == versions:
+            _context_cache.move_to_end(key)
+            return copy.deepcopy(cached[1])
+
+    context = _compute_interview_context(
+        session=session,
+        job_description=job_description,
+        resume_id=resume_id,
+        project_names=project_names,
+        user_profile_input=user_profile_input,
+    )
+
+    with _context_cache_lock:
+        _context_cache[key] = (versions, context)
+        _context_cache.move_to_end(key)
+        while len(_context_cache) > _CONTEXT_CACHE_SIZE:
+            _context_cache.popitem(last=False)
+    return copy.deepcopy(context)
+
+
+def clear_interview_context_cache() -> None:
+    """Drop every cached interview context."""
+    with _context_cache_lock:
+        _context_cache.clear()
+
+
+def _compute_interview_context(
+    *,
+    session: Session,
+    job_description: str,
+    resume_id: int | None,
+    project_names: list[str],
+    user_profile_input: JobReadinessUserProfileInput | None,
 ) -> dict[str, Any]:
     selected_project_names = list(project_names or [])
     if resume_id is None and not selected_project_names:
@@ -567,7 +661,7 @@ def build_interview_context(
         project_names=selected_project_names,
         user_profile_input=user_profile_input,
     )
-    projects = get_project_report_models_by_names(session, selected_project_names) if selected_project_names else []
+    projects = evidence_index.refresh(session, selected_project_names) if selected_project_names else []
     readiness_signals = _readiness_signals(
         job_description=job_description,
         user_profile=user_profile,
@@ -664,6 +758,11 @@ def _select_next_dimension(
     )
 
 
+def _dimension_rank(entry: dict[str, Any], fit_dimension: str) -> tuple[float, float]:
+    scores = entry.get("dimension_scores", {}).get(fit_dimension) or {}
+    return float(scores.get("keywords", 0)), float(scores.get("relevance", 0.0))
+
+
 def _select_project_for_dimension(
     interview_context: dict[str, Any],
     fit_dimension: str,
@@ -683,6 +782,9 @@ def _select_project_for_dimension(
         entry for entry in relevant_projects
         if fit_dimension in entry.get("matched_dimensions", [])
     ]
+    # Most matched keywords for this dimension first, then the most relevant
+    # evidence; ties keep the overall fit order
+    candidates.sort(key=lambda entry: _dimension_rank(entry, fit_dimension), reverse=True)
     if not candidates:
         candidates = relevant_projects[:3]
 
@@ -810,7 +912,7 @@ def _render_prompt_context(
         "tech_stack": list(project_entry.get("tech_stack", []))[:8] if project_entry else [],
         "evidence_points": list(project_entry.get("evidence_points", []))[:6] if project_entry else [],
     }
-    allowed_example_points = _clean_list(
+    allowed_example_points = clean_list(
         list(active_project_evidence.get("evidence_points", []))
         + [str(selected_dimension.get("label", ""))]
         + [str(match) for match in selected_dimension.get("matches", [])]
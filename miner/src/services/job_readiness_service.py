@@ -160,7 +160,7 @@ def _resume_to_text(resume: ResumeModel) -> str:
     return "\n".join(lines)
 
 
-def _project_summary(project: ProjectReportModel) -> str:
+def project_summary(project: ProjectReportModel) -> str:
     summary_lines = [f"Project: {project.project_name}"]
     if project.showcase_title:
         summary_lines.append(f"Showcase title: {project.showcase_title}")
@@ -168,10 +168,10 @@ def _project_summary(project: ProjectReportModel) -> str:
         summary_lines.append(f"Frameworks: {', '.join(_clean_value(framework) for framework in project.showcase_frameworks)}")
     if project.showcase_bullet_points:
         summary_lines.extend(f"- {bullet}" for bullet in project.showcase_bullet_points)
-    stat_summary = _project_stat_summary_lines(project.statistic)
+    stat_summary = project_stat_summary_lines(project.statistic)
     if stat_summary:
         summary_lines.extend(stat_summary)
-    file_summary = _project_file_signal_summary(project)
+    file_summary = project_file_signal_summary(project)
     if file_summary:
         summary_lines.extend(file_summary)
     return "\n".join(summary_lines)
@@ -222,7 +222,7 @@ def _top_mapping_keys(values: Any, limit: int = 5) -> list[str]:
     return [_clean_value(key) for key, _ in ordered[:limit]]
 
 
-def _project_stat_summary_lines(statistic: dict[str, Any]) -> list[str]:
+def project_stat_summary_lines(statistic: dict[str, Any]) -> list[str]:
     lines: list[str] = []
 
     frameworks = _weighted_skill_names(statistic.get("PROJECT_FRAMEWORKS"))
@@ -280,7 +280,7 @@ def _project_stat_summary_lines(statistic: dict[str, Any]) -> list[str]:
     return lines
 
 
-def _project_file_signal_summary(project: ProjectReportModel) -> list[str]:
+def project_file_signal_summary(project: ProjectReportModel) -> list[str]:
     file_paths = [file_report.file_path for file_report in project.file_reports]
     if not file_paths:
         return []
@@ -311,7 +311,7 @@ def _project_file_signal_summary(project: ProjectReportModel) -> list[str]:
     return evidence_lines
 
 
-def _project_tags_from_stats(project: ProjectReportModel) -> list[str]:
+def project_tags_from_stats(project: ProjectReportModel) -> list[str]:
     statistic = project.statistic
     tags: list[str] = []
 
@@ -336,7 +336,7 @@ def _project_tags_from_stats(project: ProjectReportModel) -> list[str]:
     return tags
 
 
-def _project_skills_from_stats(project: ProjectReportModel) -> list[str]:
+def project_skills_from_stats(project: ProjectReportModel) -> list[str]:
     statistic = project.statistic
     skills: list[str] = []
     skills.extend(_weighted_skill_names(statistic.get("PROJECT_FRAMEWORKS")))
@@ -443,11 +443,11 @@ def build_user_profile(
             tags.append(_clean_value(item.title))
 
     for project in projects:
-        project_summaries.append(_project_summary(project))
+        project_summaries.append(project_summary(project))
         tags.extend(_clean_value(framework) for framework in project.showcase_frameworks)
-        tags.extend(_project_tags_from_stats(project))
+        tags.extend(project_tags_from_stats(project))
         extracted_skills.extend(_clean_value(framework) for framework in project.showcase_frameworks)
-        extracted_skills.extend(_project_skills_from_stats(project))
+        extracted_skills.extend(project_skills_from_stats(project))
         history_summaries.append(_project_history_summary(project))
         file_evidence.append(_project_file_evidence(project))
 
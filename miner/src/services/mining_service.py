@@ -18,6 +18,7 @@ from src.database.core.base import get_engine
 from src.database.api.CRUD.projects import get_latest_related_project_report, save_project_report
 from src.infrastructure.log.logging import get_logger
 from src.database.api.models import UserConfigModel as UserConfig
+from src.services.project.insights_service import schedule_project_insights
 from src.utils.errors import (
     NoDiscoveredProjects,
     MissingStartMinerConsent,
@@ -137,10 +138,13 @@ def _analyze_project_files(
 ) -> tuple[ProjectReport, bool]:
     """
     Takes a defined `ProjectLayout` and returns a
-    full `ProjectReport`. Note, if a `ProjectReport`
+    `ProjectReport`. Note, if a `ProjectReport`
     has no `FileReports`, that PR is still returned,
     just as an empty `ProjectReport`.
 
+    The LLM backed contribution pattern statistics are not computed here;
+    `start_miner_service` runs them for every project at once afterwards.
+
     :param project_layout: The layout of the project to be analyzed.
     :type project_files: ProjectLayout
     :param user_config: The configuations of the user
@@ -148,6 +152,10 @@ def _analyze_project_files(
     :return: A tuple of (ProjectReport, needs_recomputation_flag)
     :rtype: tuple[ProjectReport, bool]
     """
+    from src.core.report.project.project_statistics import (
+        PROJECT_CALCULATOR_CLASSES,
+        ProjectContributionPatterns,
+    )
 
     file_reports, needs_recomputation = extract_file_reports(
         project_file=project_layout,
@@ -162,58 +170,60 @@ def _analyze_project_files(
         raise NoRevelantFiles(
             "f{project_layout.name} had no revelent files to analyze")
 
+    project_report = ProjectReport(
+        project_name=project_layout.name,
+        project_path=str(project_layout.root_path),
+        project_repo=project_layout.repo,
+        file_reports=file_reports,
+        user_email=user_config.user_email,
+        user_github=user_config.github,
+        calculator_classes=[
+            cls for cls in PROJECT_CALCULATOR_CLASSES
+            if cls is not ProjectContributionPatterns
+        ],
+    )
+
+    return project_report, needs_recomputation
+
+
+def _add_previous_analysis(project_report: ProjectReport) -> None:
+    """
+    Link a freshly analyzed report to the latest related report in the
+    database and record how its numeric statistics changed since then.
+    """
+
     engine = get_engine()
 
     with Session(engine) as session:
         previous_report = get_latest_related_project_report(
             session,
-            project_layout.name,
+            project_report.project_name,
+            include_file_reports=False,
         )
 
-    if needs_recomputation:
-        project_report = ProjectReport(
-            project_name=project_layout.name,
-            project_path=str(project_layout.root_path),
-            project_repo=project_layout.repo,
-            file_reports=file_reports,
-            user_email=user_config.user_email,
-            user_github=user_config.github
+    if previous_report is None:
+        return
+
+    project_report.project_statistics.add(
+        Statistic(
+            ProjectStatCollection.PREVIOUS_ANALYSIS_PROJECT.value,
+            previous_report.project_name,
         )
+    )
 
-        if previous_report is not None:
-            project_report.project_statistics.add(
-                Statistic(
-                    ProjectStatCollection.PREVIOUS_ANALYSIS_PROJECT.value,
-                    previous_report.project_name,
-                )
-            )
+    deltas = _compute_project_statistics_deltas(
+        project_report,
+        previous_report,
+    )
 
-            deltas = _compute_project_statistics_deltas(
-                project_report,
-                previous_report,
+    if deltas:
+        project_report.project_statistics.add(
+            Statistic(
+                ProjectStatCollection.PROJECT_STATISTICS_DELTA.value,
+                deltas,
             )
-
-            if deltas:
-                project_report.project_statistics.add(
-                    Statistic(
-                        ProjectStatCollection.PROJECT_STATISTICS_DELTA.value,
-                        deltas,
-                    )
-                )
-
-        return project_report, needs_recomputation
-    else:
-        project_report = ProjectReport(
-            project_name=project_layout.name,
-            project_path=str(project_layout.root_path),
-            project_repo=project_layout.repo,
-            file_reports=file_reports,
-            user_email=user_config.user_email,
-            user_github=user_config.github
         )
 
-        return project_report, needs_recomputation
-
 
 def _save_project_report_to_db(
     project_reports: list[tuple[ProjectReport, bool]],
@@ -221,7 +231,8 @@ def _save_project_report_to_db(
 ) -> None:
     """
     Saves many ProjectReports and their corresponding FileReports
-    to the database.
+    to the database, then generates each project's insights in the
+    background.
 
     :param project_report: ProjectReport(s) to be saved
     :type project_report: list[ProjectReport]
@@ -234,9 +245,11 @@ def _save_project_report_to_db(
 
     with Session(engine) as session:
         for pr, needs_recomputation in project_reports:
-            save_project_report(session, pr, user_config_id,
-                                needs_recomputation)
+            saved = save_project_report(session, pr, user_config_id,
+                                        needs_recomputation)
+            saved_name = saved.project_name
             session.commit()
+            schedule_project_insights(engine, saved_name, pr)
 
 
 def start_miner_service(
@@ -319,6 +332,21 @@ def start_miner_service(
                 error_message=str(e)
             ))
 
+    # The contribution pattern analysis is one LLM call per project, so run
+    # those calls together instead of one after another.
+    from src.core.report.project.project_statistics import ProjectContributionPatterns
+    ProjectContributionPatterns.calculate_many(
+        [report for report, _ in project_reports])
+
+    for report, needs_recomputation in project_reports:
+        if not needs_recomputation:
+            continue
+        try:
+            _add_previous_analysis(report)
+        except Exception as e:
+            logger.error(
+                f"Could not compare {report.project_name} with its previous analysis: {e}")
+
     _save_project_report_to_db(project_reports, None)
 
     success = len(project_errors) == 0
@@ -11,23 +11,42 @@ web portfolio:
 
 The static bundle requires no server — it is the "public mode" deliverable.
 Images are base64-encoded inline so the ZIP is fully self-contained.
+
+Archives are cached per portfolio under a fingerprint of everything they
+are built from (see `export_fingerprint`), so exporting an unchanged
+portfolio again returns the previous archive without rebuilding it.
 """
 
 import base64
+import hashlib
 import io
 import json
+import threading
 import urllib.request
 import zipfile
+from collections import OrderedDict
 from datetime import date, datetime
 from typing import Any, Optional
 
 from sqlmodel import Session
 
-from src.database.api.CRUD.portfolio import load_portfolio, get_project_cards_for_portfolio
+from src.database.api.CRUD.portfolio import (
+    get_portfolio_fingerprint,
+    get_project_cards_for_portfolio,
+    load_portfolio,
+)
 from src.database import get_project_report_models_by_names, get_most_recent_user_config
-from src.database.api.CRUD.projects import get_project_report_model_by_name
+from src.database.api.CRUD.projects import (
+    get_project_last_updated,
+    get_project_report_model_by_name,
+)
 from src.utils.errors import KeyNotFoundError
 
+# Archives can be several MB with inline images, so only a few are kept
+_EXPORT_CACHE_SIZE = 8
+_export_cache: "OrderedDict[int, tuple[str, bytes]]" = OrderedDict()
+_export_cache_lock = threading.Lock()
+
 
 _CODING_LANGUAGE_DISPLAY = {
     "PYTHON": "Python", "JAVASCRIPT": "JavaScript", "TYPESCRIPT": "TypeScript",
@@ -1751,6 +1770,65 @@ def _render_section_html(section) -> str:
     return "\n".join(parts)
 
 
+def export_fingerprint(portfolio_id: int, session: Session) -> Optional[str]:
+    """
+    A hash of everything `export_portfolio_static` reads: the portfolio's
+    sections, blocks, cards and metadata, the last update of each card's
+    project report and the GitHub username used for repository links.
+    Returns None if the portfolio does not exist.
+    """
+    portfolio_fingerprint = get_portfolio_fingerprint(session, portfolio_id)
+    if portfolio_fingerprint is None:
+        return None
+
+    card_names = [c.project_name for c in get_project_cards_for_portfolio(
+        session, portfolio_id, include_images=False)]
+    report_versions = get_project_last_updated(session, card_names)
+    user_config = get_most_recent_user_config(session)
+    github_username = (user_config.github or "").strip() if user_config else ""
+
+    inputs = {
+        "portfolio": portfolio_fingerprint,
+        "reports": sorted((name, str(updated)) for name, updated in report_versions.items()),
+        "github": github_username,
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
+
+
+def get_portfolio_export(portfolio_id: int, session: Session) -> bytes:
+    """
+    The static web portfolio ZIP for `portfolio_id`, built by
+    `export_portfolio_static` unless the portfolio is unchanged since the
+    cached archive was built.
+
+    Raises `KeyNotFoundError` if the portfolio does not exist.
+    """
+    fingerprint = export_fingerprint(portfolio_id, session)
+    if fingerprint is None:
+        raise KeyNotFoundError(f"No portfolio with ID {portfolio_id}")
+
+    with _export_cache_lock:
+        cached = _export_cache.get(portfolio_id)
+        if cached is not None and cached[0] == fingerprint:
+            _export_cache.move_to_end(portfolio_id)
+            return cached[1]
+
+    archive = export_portfolio_static(portfolio_id, session)
+
+    with _export_cache_lock:
+        _export_cache[portfolio_id] = (fingerprint, archive)
+        _export_cache.move_to_end(portfolio_id)
+        while len(_export_cache) > _EXPORT_CACHE_SIZE:
+            _export_cache.popitem(last=False)
+    return archive
+
+
+def clear_export_cache() -> None:
+    """Drop every cached archive."""
+    with _export_cache_lock:
+        _export_cache.clear()
+
+
 def export_portfolio_static(portfolio_id: int, session: Session) -> bytes:
     """
     Build and return a ZIP archive containing a static web portfolio for the
@@ -1834,7 +1912,8 @@ def export_portfolio_static(portfolio_id: int, session: Session) -> bytes:
     skill_activity: dict = {}  # {skill: {date: count}}
 
     try:
-        report_models = get_project_report_models_by_names(session, project_names)
+        report_models = get_project_report_models_by_names(
+            session, project_names, include_file_reports=False)
         report_by_name = {rm.project_name: rm for rm in (report_models or []) if rm is not None}
         for i, pname in enumerate(project_names):
             rm = report_by_name.get(pname)
@@ -1892,10 +1971,6 @@ def export_portfolio_static(portfolio_id: int, session: Session) -> bytes:
             "skill_timeline": skill_activity,
         },
     }
-    portfolio_data_js = "var PORTFOLIO_DATA = " + json.dumps(
-        portfolio_data, default=_json_default, indent=2
-    ) + ";\n"
-
     # --- Build index.html ---
     index_html = _HTML_TEMPLATE.format(
         title=_esc(portfolio.title),
@@ -1908,7 +1983,13 @@ def export_portfolio_static(portfolio_id: int, session: Session) -> bytes:
     buf = io.BytesIO()
     with zipfile.ZipFile(buf, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
         zf.writestr("index.html", index_html)
-        zf.writestr("portfolio_data.js", portfolio_data_js)
+        # The data (inline images included) is encoded straight into the
+        # archive rather than built up as one string first
+        with zf.open("portfolio_data.js", mode="w") as raw, \
+                io.TextIOWrapper(raw, encoding="utf-8") as data_js:
+            data_js.write("var PORTFOLIO_DATA = ")
+            json.dump(portfolio_data, data_js, default=_json_default, indent=2)
+            data_js.write(";\n")
         zf.writestr("style.css", _CSS)
         zf.writestr("filter.js", _FILTER_JS)
         zf.writestr("figures.js", _FIGURES_JS)
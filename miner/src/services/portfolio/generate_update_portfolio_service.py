@@ -13,9 +13,11 @@ from src.core.statistic import ProjectStatCollection
 from src.utils.errors import KeyNotFoundError
 from src.core.portfolio.portfolio import merge_portfolios
 from src.database.api.CRUD.portfolio import update_portfolio_from_domain
+from src.database.core.model_deserializer import deserialize_project_report
 from src.database import (
-    get_project_report_by_name,
+    get_project_contributions,
     get_project_report_models_by_names,
+    get_project_reports_by_names,
     get_engine,
     save_portfolio,
     load_portfolio,
@@ -38,9 +40,10 @@ def _build_project_cards(
     portfolio_id is set to -1 as a placeholder; it is assigned during save_portfolio
     after the PortfolioModel has been flushed and its PK is known.
     """
-    from src.core.portfolio.project_summary import build_project_summary, configure_summary_run
+    from src.core.portfolio.project_summary import build_project_summaries, configure_summary_run
 
     configure_summary_run(len(project_reports))
+    summaries = build_project_summaries(project_reports)
 
     # Determine default showcase set: top N by representation_rank
     ranked = sorted(
@@ -55,7 +58,7 @@ def _build_project_cards(
 
     cards = []
 
-    for model, report in zip(project_models, project_reports):
+    for model, report, summary in zip(project_models, project_reports, summaries):
         if report is None:
             continue
 
@@ -78,7 +81,7 @@ def _build_project_cards(
             ProjectStatCollection.COMMIT_TYPE_DISTRIBUTION.value) or {}
         activity = report.get_value(ProjectStatCollection.ACTIVITY_METRICS.value) or {}
 
-        summary = build_project_summary(report) or ""
+        summary = summary or ""
 
         # Normalise skill/framework objects to plain strings
         skill_names = [getattr(s, "skill_name", str(s)) for s in skills_raw]
@@ -89,7 +92,7 @@ def _build_project_cards(
         cards.append(ProjectCard(
             portfolio_id=-1,  # placeholder; assigned after flush in save_portfolio
             project_name=model.project_name,
-            image_data=base64.b64encode(model.image_data).decode("utf-8") if model.image_data else None,
+            image_data=base64.b64encode(model.image.data).decode("utf-8") if model.image else None,
             summary=summary,
             themes=[str(t) for t in themes],
             tones=tones,
@@ -122,17 +125,19 @@ def _create_portfolio(project_names: list[str], portfolio_title: Optional[str])
     :type portfolio_title: Optional[str]
     """
 
-    prs = []
-
     with Session(get_engine()) as session:
-        for pid in project_names:
-            pr = get_project_report_by_name(session, pid)
-            if pr is None:
-                raise KeyNotFoundError(f"No project report with key {pid}")
-            prs.append(pr)
+        try:
+            prs = get_project_reports_by_names(
+                session, project_names, include_file_reports=False)
+        except KeyError as e:
+            raise KeyNotFoundError(f"No project report with key {e.args[0]}")
+        # Stored contributions stand in for the file reports
+        contributions = get_project_contributions(session, project_names)
+        session.commit()
 
     portfolio = UserReport(project_reports=prs,
-                           report_name="").generate_portfolio()
+                           report_name="",
+                           contributions=contributions).generate_portfolio()
 
     if portfolio_title:
         portfolio.title = portfolio_title
@@ -164,9 +169,11 @@ def generate_and_save_portfolio(project_names: list[str], portfolio_title: Optio
     portfolio = _create_portfolio(project_names, portfolio_title)
 
     with Session(get_engine()) as session:
-        project_models = get_project_report_models_by_names(session, project_names)
+        project_models = get_project_report_models_by_names(
+            session, project_names, include_file_reports=False, include_images=True)
         project_reports = [
-            get_project_report_by_name(session, name) for name in project_names
+            deserialize_project_report(model, include_file_reports=False)
+            for model in project_models
         ]
 
         portfolio.project_cards = _build_project_cards(project_models, project_reports)
@@ -221,9 +228,11 @@ def update_portfolio(portfolio_id: int) -> PortfolioModel:
 
         # Rebuild Part C cards from fresh statistics
         # (update_portfolio_from_domain preserves is_showcase and user overrides)
-        project_models = get_project_report_models_by_names(session, project_names)
+        project_models = get_project_report_models_by_names(
+            session, project_names, include_file_reports=False, include_images=True)
         project_reports = [
-            get_project_report_by_name(session, name) for name in project_names
+            deserialize_project_report(model, include_file_reports=False)
+            for model in project_models
         ]
         merged_portfolio.project_cards = _build_project_cards(
             project_models, project_reports)
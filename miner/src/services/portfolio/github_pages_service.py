@@ -5,20 +5,29 @@ Deploys a static portfolio site (generated by `export_service.py`) to a
 repo on the user's account named `portfolio`. A few possibilities are handled here.
     1. The user doesn't have a repo called `portfolio` - Make a new repo and upload the portfolio
     2. The user has a `portfolio`, but it is archived or private - Throw error message
-    3. The user has a `portfolio`, and it is public - Wipe it and upload the portfolio
+    3. The user has a `portfolio`, and it is public - Replace its files with the portfolio
+
+Deploys are incremental: files whose content is already in the repo keep
+their blob, so only changed files are uploaded, and a deploy that changes
+nothing makes no commit.
 
 Pages URL:  https://{username}.github.io/portfolio
 """
 
+import asyncio
 import base64
+import hashlib
 import io
 import zipfile
+from typing import Optional
 
 import httpx
 from fastapi import HTTPException
 
 _GITHUB_API = "https://api.github.com"
 _REPO_NAME = "portfolio"
+# Blob uploads in flight at once; GitHub penalises bursts of writes
+_MAX_CONCURRENT_UPLOADS = 4
 _HEADERS = {
     "Accept": "application/vnd.github+json",
     "X-GitHub-Api-Version": "2026-03-10",
@@ -86,6 +95,64 @@ async def _validate_repo(client: httpx.AsyncClient, token: str, username: str) -
     return create_resp.json().get("default_branch", "main")
 
 
+def git_blob_sha(content: bytes) -> str:
+    """The SHA git gives a blob holding `content`."""
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+
+async def _get_current_blobs(
+    client: httpx.AsyncClient,
+    token: str,
+    username: str,
+    commit_sha: str,
+) -> dict[str, str]:
+    """
+    The files (path -> blob SHA) in the tree of `commit_sha`. Empty if the
+    tree cannot be listed in full, so every file is uploaded.
+    """
+    commit_resp = await client.get(
+        f"{_GITHUB_API}/repos/{username}/{_REPO_NAME}/git/commits/{commit_sha}",
+        headers=_auth_headers(token),
+    )
+    if commit_resp.status_code != 200:
+        return {}
+    tree_sha = commit_resp.json()["tree"]["sha"]
+
+    tree_resp = await client.get(
+        f"{_GITHUB_API}/repos/{username}/{_REPO_NAME}/git/trees/{tree_sha}",
+        headers=_auth_headers(token),
+        params={"recursive": "1"},
+    )
+    if tree_resp.status_code != 200 or tree_resp.json().get("truncated"):
+        return {}
+    return {
+        entry["path"]: entry["sha"]
+        for entry in tree_resp.json().get("tree", [])
+        if entry.get("type") == "blob"
+    }
+
+
+async def _upload_blob(
+    client: httpx.AsyncClient,
+    token: str,
+    username: str,
+    path: str,
+    content: bytes,
+    limit: asyncio.Semaphore,
+) -> str:
+    async with limit:
+        blob_resp = await client.post(
+            f"{_GITHUB_API}/repos/{username}/{_REPO_NAME}/git/blobs",
+            headers=_auth_headers(token),
+            json={"content": base64.b64encode(content).decode(
+                "utf-8"), "encoding": "base64"},
+        )
+    if blob_resp.status_code not in (200, 201):
+        raise HTTPException(
+            status_code=502, detail=f"Failed to create blob for {path}")
+    return blob_resp.json()["sha"]
+
+
 async def _replace_all_files(
     client: httpx.AsyncClient,
     token: str,
@@ -93,10 +160,15 @@ async def _replace_all_files(
     branch: str,
     files: dict[str, bytes],
     commit_message: str,
-) -> None:
+) -> bool:
     """
-    Wipes the portfolio repo, then commits and pushes `files`, which are
-    the files that make up the generated static portfolio website.
+    Commits and pushes `files`, which are the files that make up the
+    generated static portfolio website, as the repo's entire content
+    (files not in `files` are removed).
+
+    Only files whose content is not already in the repo are uploaded, a few
+    at a time. Returns False, without committing, if the repo already holds
+    exactly `files`.
     """
     # Get the current HEAD commit
     ref_resp = await client.get(
@@ -108,26 +180,29 @@ async def _replace_all_files(
             status_code=502, detail="Failed to get branch reference")
     parent_sha = ref_resp.json()["object"]["sha"]
 
-    # Create a blob for every file
-    tree_entries = []
-    for path, content in files.items():
-        blob_resp = await client.post(
-            f"{_GITHUB_API}/repos/{username}/{_REPO_NAME}/git/blobs",
-            headers=_auth_headers(token),
-            json={"content": base64.b64encode(content).decode(
-                "utf-8"), "encoding": "base64"},
-        )
-        if blob_resp.status_code not in (200, 201):
-            raise HTTPException(
-                status_code=502, detail=f"Failed to create blob for {path}")
-        tree_entries.append({
-            "path": path,
-            "mode": "100644",
-            "type": "blob",
-            "sha": blob_resp.json()["sha"],
-        })
-
-    # Create a new tree with the new blobs (wipes repo's current files)
+    current = await _get_current_blobs(client, token, username, parent_sha)
+    local = {path: git_blob_sha(content) for path, content in files.items()}
+    if local == current:
+        return False
+
+    # Blobs are addressed by content, so one already in the repo under any
+    # path can be reused as is
+    existing_shas = set(current.values())
+    to_upload = [path for path, sha in local.items() if sha not in existing_shas]
+    limit = asyncio.Semaphore(_MAX_CONCURRENT_UPLOADS)
+    uploaded = await asyncio.gather(*(
+        _upload_blob(client, token, username, path, files[path], limit)
+        for path in to_upload
+    ))
+    local.update(zip(to_upload, uploaded))
+
+    tree_entries = [
+        {"path": path, "mode": "100644", "type": "blob", "sha": sha}
+        for path, sha in local.items()
+    ]
+
+    # Create a new tree from just these entries (no base tree, so files
+    # that are no longer part of the site are dropped)
     tree_resp = await client.post(
         f"{_GITHUB_API}/repos/{username}/{_REPO_NAME}/git/trees",
         headers=_auth_headers(token),
@@ -159,6 +234,7 @@ async def _replace_all_files(
     if update_resp.status_code not in (200, 201):
         raise HTTPException(
             status_code=502, detail="Failed to update branch reference")
+    return True
 
 
 async def _enable_pages(client: httpx.AsyncClient, token: str, username: str, branch: str) -> str:
@@ -185,9 +261,15 @@ async def _enable_pages(client: httpx.AsyncClient, token: str, username: str, br
     return f"https://{username}.github.io/{_REPO_NAME}"
 
 
-async def deploy_to_github_pages(access_token: str, zip_bytes: bytes, portfolio_name: str = "Portfolio") -> str:
+async def deploy_to_github_pages(
+    access_token: str,
+    zip_bytes: bytes,
+    portfolio_name: str = "Portfolio",
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> str:
     """
     Deploy the static portfolio site contained in `zip_bytes` to GitHub Pages.
+    `transport` replaces the network, for tests.
 
     Returns:
         The portfolio URL (e.g. https://PaulAtreides.github.io/portfolio).
@@ -200,7 +282,8 @@ async def deploy_to_github_pages(access_token: str, zip_bytes: bytes, portfolio_
         for name in zf.namelist():
             files[name] = zf.read(name)
 
-    async with httpx.AsyncClient(timeout=30) as client:
+    limits = httpx.Limits(max_connections=_MAX_CONCURRENT_UPLOADS)
+    async with httpx.AsyncClient(timeout=30, limits=limits, transport=transport) as client:
         username = await _get_username(client, access_token)
         branch = await _validate_repo(client, access_token, username)
 
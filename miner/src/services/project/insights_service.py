@@ -0,0 +1,126 @@
+"""
+Service that generates and stores a project's insights.
+
+Insights are generated once, in the background, right after the miner saves
+a project, using every calculator. Each stored message records whether it
+is ML-derived, so reading them for a user with or without ML consent is a
+filtered query rather than a regeneration.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlmodel import Session
+
+from src.core.insight import InsightGenerator, ProjectInsight
+from src.core.report import ProjectReport
+from src.database.api.CRUD.insights import (
+    get_project_insight_messages,
+    save_project_insights,
+)
+from src.database.api.CRUD.projects import get_project_report_by_name
+from src.infrastructure.log.logging import get_logger
+from src.utils.errors import ProjectNotFoundError
+
+logger = get_logger(__name__)
+
+# A single worker runs jobs in the order they were scheduled, so when a
+# project is mined twice in a row its newer insights are written last
+_insight_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="project-insights")
+
+# Latest scheduled job of each project, until it finishes
+_pending_jobs: dict[str, Future] = {}
+_pending_lock = threading.Lock()
+
+
+def generate_project_insights(
+    session: Session,
+    project_name: str,
+    report: ProjectReport,
+) -> list[ProjectInsight]:
+    """
+    Generate insights for `report` with every calculator and save them under
+    `project_name`. DOES NOT COMMIT THE SESSION!
+    """
+    insights = InsightGenerator.generate(report)
+    save_project_insights(session, project_name, insights)
+    return insights
+
+
+def _generate_and_commit(engine: Engine, project_name: str, report: ProjectReport) -> None:
+    try:
+        with Session(engine) as session:
+            generate_project_insights(session, project_name, report)
+            session.commit()
+    except Exception:
+        # The endpoint generates them on first read if this failed
+        logger.exception("Error generating insights for project '%s'", project_name)
+
+
+def schedule_project_insights(
+    engine: Engine,
+    project_name: str,
+    report: ProjectReport,
+) -> Future:
+    """
+    Generate and save the insights of a just-saved project on a background
+    thread. The returned future completes once they are committed.
+    """
+    future = _insight_pool.submit(_generate_and_commit, engine, project_name, report)
+    with _pending_lock:
+        _pending_jobs[project_name] = future
+    future.add_done_callback(lambda done: _forget_job(project_name, done))
+    return future
+
+
+def _forget_job(project_name: str, future: Future) -> None:
+    with _pending_lock:
+        if _pending_jobs.get(project_name) is future:
+            del _pending_jobs[project_name]
+
+
+def _wait_for_pending_job(project_name: str) -> None:
+    with _pending_lock:
+        future = _pending_jobs.get(project_name)
+    if future is not None:
+        future.result()
+
+
+def load_project_insights(
+    session: Session,
+    project_name: str,
+    include_ml: bool,
+) -> list[str]:
+    """
+    Return a project's insight messages, without dismissed ones and, unless
+    `include_ml`, without ML-derived ones.
+
+    If the project's background job is still running this waits for it.
+    Projects mined before insights were stored, or whose job failed, have
+    theirs generated and committed here.
+
+    :raises ProjectNotFoundError: If no project has this name.
+    """
+    _wait_for_pending_job(project_name)
+    messages = get_project_insight_messages(session, project_name, include_ml)
+    if messages is not None:
+        return messages
+
+    report = get_project_report_by_name(
+        session, project_name, include_file_reports=False)
+    if report is None:
+        raise ProjectNotFoundError(f"Project '{project_name}' not found.")
+
+    try:
+        generate_project_insights(session, project_name, report)
+        session.commit()
+    except (IntegrityError, OperationalError):
+        # A job scheduled after the wait above saved them first
+        session.rollback()
+        messages = get_project_insight_messages(session, project_name, include_ml)
+        if messages is None:
+            raise
+        return messages
+    return get_project_insight_messages(session, project_name, include_ml) or []
@@ -0,0 +1,168 @@
+"""
+Service to export a resume as LaTeX, PDF or DOCX.
+
+Rendered files are cached by a hash of what they are rendered from: the
+LaTeX source for PDFs (so a pdflatex run only happens when the source
+changes) and the resume's contents for LaTeX and DOCX. Renders run on a
+small dedicated thread pool, and requests for a file that is already being
+rendered wait for that render instead of starting another.
+"""
+
+import dataclasses
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date
+from typing import Any, Callable, Optional
+
+from src.core.resume.render import DocxResumeRenderer, PDFRenderer, ResumeLatexRenderer
+from src.core.resume.resume import Resume
+from src.infrastructure.log.logging import get_logger
+
+logger = get_logger(__name__)
+
+# pdflatex is CPU-heavy, so only a couple of renders run at once
+_RENDER_WORKERS = 2
+_render_pool = ThreadPoolExecutor(
+    max_workers=_RENDER_WORKERS, thread_name_prefix="resume-render")
+
+
+@dataclasses.dataclass(frozen=True)
+class RenderedArtifact:
+    content: bytes
+    # Whether this request reused a finished or in-progress render
+    cache_hit: bool
+    # How long the render that produced `content` took
+    render_seconds: float
+
+
+@dataclasses.dataclass(frozen=True)
+class _Entry:
+    content: bytes
+    render_seconds: float
+
+
+class ArtifactCache:
+    """
+    Least-recently-used map from an input hash to the file rendered from
+    it, holding at most `max_bytes` of content. Empty renders (such as a
+    PDF without TeX installed) and failed ones are not cached.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._size = 0
+        self._in_flight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "coalesced": 0, "evictions": 0}
+
+    def get_or_render(self, key: str, render: Callable[[], bytes]) -> RenderedArtifact:
+        """
+        Return the file cached under `key`, or render it on the render pool.
+        Exceptions from `render` propagate to every request waiting on it.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._counters["hits"] += 1
+                return RenderedArtifact(entry.content, True, entry.render_seconds)
+
+            future = self._in_flight.get(key)
+            started_here = future is None
+            if started_here:
+                future = _render_pool.submit(self._render, key, render)
+                self._in_flight[key] = future
+                self._counters["misses"] += 1
+            else:
+                self._counters["coalesced"] += 1
+
+        entry = future.result()
+        return RenderedArtifact(entry.content, not started_here, entry.render_seconds)
+
+    def _render(self, key: str, render: Callable[[], bytes]) -> _Entry:
+        start = time.perf_counter()
+        try:
+            content = render()
+        except BaseException:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            raise
+
+        entry = _Entry(content, time.perf_counter() - start)
+        logger.info("Rendered %s (%d bytes) in %.3fs", key.split(":", 1)[0],
+                    len(content), entry.render_seconds)
+
+        with self._lock:
+            self._in_flight.pop(key, None)
+            if content and len(content) <= self.max_bytes:
+                self._entries[key] = entry
+                self._size += len(content)
+                while self._size > self.max_bytes:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._size -= len(evicted.content)
+                    self._counters["evictions"] += 1
+        return entry
+
+    def stats(self) -> dict[str, Any]:
+        """Hit counts, plus the number and total size of stored files."""
+        with self._lock:
+            return {**self._counters, "entries": len(self._entries), "bytes": self._size}
+
+    def clear(self) -> None:
+        """Drop every stored file and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._counters = dict.fromkeys(self._counters, 0)
+
+
+artifact_cache = ArtifactCache()
+
+
+def _encode(value: Any) -> Any:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def _resume_hash(resume: Resume) -> str:
+    """A hash of every attribute the renderers read from `resume`."""
+    serialized = json.dumps(vars(resume), default=_encode, sort_keys=True)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def export_latex(resume: Resume) -> RenderedArtifact:
+    """The resume as LaTeX source, UTF-8 encoded."""
+    return artifact_cache.get_or_render(
+        f"tex:{_resume_hash(resume)}",
+        lambda: resume.export(ResumeLatexRenderer()).encode("utf-8"),
+    )
+
+
+def export_pdf(resume: Resume, renderer: Optional[PDFRenderer] = None) -> RenderedArtifact:
+    """
+    The resume compiled to PDF by `renderer` (a `PDFRenderer` by default).
+    Empty if TeX is not installed.
+    """
+    renderer = renderer or PDFRenderer()
+    tex = export_latex(resume).content.decode("utf-8")
+    return artifact_cache.get_or_render(
+        f"pdf:{hashlib.sha256(tex.encode('utf-8')).hexdigest()}",
+        lambda: renderer.compile(tex),
+    )
+
+
+def export_docx(resume: Resume, renderer: Optional[DocxResumeRenderer] = None) -> RenderedArtifact:
+    """The resume as a Word document rendered by `renderer`."""
+    renderer = renderer or DocxResumeRenderer()
+    return artifact_cache.get_or_render(
+        f"docx:{_resume_hash(resume)}",
+        lambda: renderer.render(resume),
+    )
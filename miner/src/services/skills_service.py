@@ -4,33 +4,16 @@ Service for retriving skills
 
 from sqlmodel import Session
 
-from src.database.api.CRUD.projects import get_all_project_ids, get_project_report_by_name
-from src.database.core.base import get_engine
-from src.core.report import UserReport
-from src.core.statistic import WeightedSkills, UserStatCollection
-from src.core.report.user.user_statistics import UserWeightedSkills
+from src.database.api.CRUD.user_aggregates import get_user_aggregates
+from src.core.statistic import WeightedSkills
 
 
 def get_skills(session: Session) -> list[WeightedSkills]:
     """
-    Retrive a user skills. The way we do this is that we get the ids of
-    all the projects, and then make a UserReport for that project. Then,
-    we can use the user statistic of the skills to return
+    Retrive a user skills. These are the stored user-level skill weights,
+    summed over every project that is not soft-deleted and kept up to date
+    as projects are saved and deleted, so no project is loaded here.
     """
-    project_report_ids = get_all_project_ids(session)
-
-    domain_project_reports = [
-        report for pid in project_report_ids
-        if (report := get_project_report_by_name(session, pid)) is not None
-    ]
-
-    if not domain_project_reports:
-        return []
-
-    user_report = UserReport(
-        project_reports=domain_project_reports,
-        calculator_classes=[UserWeightedSkills],
-    )
-
-    skills = user_report.get_value(UserStatCollection.USER_SKILLS.value)
-    return skills if skills else []
+    aggregates = get_user_aggregates(session)
+    return [WeightedSkills(skill_name=name, weight=weight)
+            for name, weight in aggregates.skill_weights.items()]
@@ -0,0 +1,55 @@
+"""
+This file holds functions that help
+with image processing.
+"""
+
+import io
+from typing import Optional
+
+from src.infrastructure.log.logging import get_logger
+
+logger = get_logger(__name__)
+
+THUMBNAIL_SIZE = (320, 320)
+
+
+def make_thumbnail(
+    data: bytes,
+    size: tuple[int, int] = THUMBNAIL_SIZE,
+) -> Optional[tuple[bytes, str]]:
+    """
+    Shrink an image to fit within `size`, keeping its aspect ratio.
+
+    data : bytes
+        The encoded image.
+
+    size : tuple[int, int]
+        The largest width and height of the thumbnail.
+
+    Optional[tuple[bytes, str]]
+        The encoded thumbnail and its content type, or None when Pillow
+        is not installed or the image cannot be read.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        logger.info("Pillow is not installed; skipping thumbnail generation")
+        return None
+
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            image.thumbnail(size)
+            # JPEG has no alpha channel, so keep transparent images as PNG
+            if image.mode in ("RGBA", "LA", "P"):
+                image_format, content_type = "PNG", "image/png"
+            else:
+                image = image.convert("RGB")
+                image_format, content_type = "JPEG", "image/jpeg"
+
+            out = io.BytesIO()
+            image.save(out, format=image_format)
+    except Exception as e:
+        logger.warning("Could not generate a thumbnail: %s", e)
+        return None
+
+    return out.getvalue(), content_type
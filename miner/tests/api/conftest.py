@@ -2,6 +2,7 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
+from src.interface.api.response_cache import response_cache
 from src.interface.api.routers.util import get_session
 
 
@@ -20,5 +21,8 @@ def mock_engine(client, blank_db):
             yield session
 
     client.app.dependency_overrides[get_session] = fake_get_session
+    # Each test has its own database, so responses cached by another test
+    # must not be served
+    response_cache.clear()
     yield
     client.app.dependency_overrides.clear()
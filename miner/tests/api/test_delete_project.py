@@ -26,7 +26,6 @@ def _insert_project(engine, name: str, is_deleted: bool = False) -> None:
         session.add(ProjectReportModel(
             project_name=name,
             user_config_used=None,
-            image_data=None,
             statistic={"dummy": True},
             created_at=datetime.datetime.now(),
             last_updated=datetime.datetime.now(),
@@ -10,8 +10,10 @@ from urllib.parse import quote
 import pytest
 from sqlmodel import Session
 
+from src.core.insight import ProjectInsight
 from src.database.api.models import (
     DismissedInsightModel,
+    InsightMessageModel,
     ProjectInsightsModel,
     ProjectReportModel,
     UserConfigModel,
@@ -26,7 +28,6 @@ def _insert_project(engine, name: str) -> None:
         session.add(ProjectReportModel(
             project_name=name,
             user_config_used=None,
-            image_data=None,
             statistic={},
             created_at=datetime.datetime.now(),
             last_updated=datetime.datetime.now(),
@@ -48,7 +49,10 @@ def _insert_cached_insights(engine, project_name: str, messages: list[str]) -> N
     with Session(engine) as session:
         session.add(ProjectInsightsModel(
             project_name=project_name,
-            insights=messages,
+            messages=[
+                InsightMessageModel(position=i, message=m, source="Test")
+                for i, m in enumerate(messages)
+            ],
         ))
         session.commit()
 
@@ -179,16 +183,13 @@ def test_get_filters_dismissed_insight_from_generated_insights(client, blank_db)
     _insert_project(blank_db, "GenProj")
     _insert_dismissed(blank_db, "GenProj", "Dismissed prompt")
 
-    with patch("src.interface.api.routers.insights.get_project_insights") as mock_cached, \
-         patch("src.interface.api.routers.insights.get_project_report_by_name") as mock_get, \
-         patch("src.interface.api.routers.insights.InsightGenerator.generate") as mock_gen, \
-         patch("src.interface.api.routers.insights.save_project_insights"):
+    with patch("src.services.project.insights_service.get_project_report_by_name") as mock_get, \
+         patch("src.services.project.insights_service.InsightGenerator.generate") as mock_gen:
 
-        mock_cached.return_value = None
         mock_get.return_value = MagicMock()
         mock_gen.return_value = [
-            MagicMock(message="Keep this prompt"),
-            MagicMock(message="Dismissed prompt"),
+            ProjectInsight(message="Keep this prompt"),
+            ProjectInsight(message="Dismissed prompt"),
         ]
 
         response = client.get(f"/projects/{quote('GenProj')}/insights")
@@ -204,16 +205,13 @@ def test_get_returns_empty_list_when_all_generated_insights_dismissed(client, bl
     _insert_dismissed(blank_db, "AllDismissedGen", "Prompt A")
     _insert_dismissed(blank_db, "AllDismissedGen", "Prompt B")
 
-    with patch("src.interface.api.routers.insights.get_project_insights") as mock_cached, \
-         patch("src.interface.api.routers.insights.get_project_report_by_name") as mock_get, \
-         patch("src.interface.api.routers.insights.InsightGenerator.generate") as mock_gen, \
-         patch("src.interface.api.routers.insights.save_project_insights"):
+    with patch("src.services.project.insights_service.get_project_report_by_name") as mock_get, \
+         patch("src.services.project.insights_service.InsightGenerator.generate") as mock_gen:
 
-        mock_cached.return_value = None
         mock_get.return_value = MagicMock()
         mock_gen.return_value = [
-            MagicMock(message="Prompt A"),
-            MagicMock(message="Prompt B"),
+            ProjectInsight(message="Prompt A"),
+            ProjectInsight(message="Prompt B"),
         ]
 
         response = client.get(f"/projects/{quote('AllDismissedGen')}/insights")
@@ -3,15 +3,21 @@ Tests for GET /projects/{project_name}/insights
 """
 
 import datetime
-import pytest
 from unittest.mock import MagicMock, patch
 from urllib.parse import quote
 
-from sqlmodel import Session
+from sqlmodel import Session, select
 
-from src.database.api.models import ProjectReportModel, ProjectInsightsModel, UserConfigModel
-from src.interface.api.routers.insights import NON_ML_INSIGHT_CALCULATORS
-from src.interface.api.routers.util import get_session
+from src.core.insight import ProjectInsight
+from src.database.api.models import (
+    InsightMessageModel,
+    ProjectInsightsModel,
+    ProjectReportModel,
+    UserConfigModel,
+)
+
+_GENERATE = "src.services.project.insights_service.InsightGenerator.generate"
+_GET_REPORT = "src.services.project.insights_service.get_project_report_by_name"
 
 
 def _insert_ml_consent(engine, enabled: bool):
@@ -29,7 +35,6 @@ def _insert_project(engine, name: str):
         session.add(ProjectReportModel(
             project_name=name,
             user_config_used=None,
-            image_data=None,
             statistic={},
             created_at=datetime.datetime.now(),
             last_updated=datetime.datetime.now(),
@@ -37,126 +42,113 @@ def _insert_project(engine, name: str):
         session.commit()
 
 
-def _insert_cached_insights(engine, project_name: str, messages: list[str]):
+def _insert_stored_insights(engine, project_name: str, messages: list[tuple[str, bool]]):
+    """`messages` are (message, uses_ml) pairs."""
     with Session(engine) as session:
         session.add(ProjectInsightsModel(
             project_name=project_name,
-            insights=messages,
+            messages=[
+                InsightMessageModel(position=i, message=m, source="Test", uses_ml=uses_ml)
+                for i, (m, uses_ml) in enumerate(messages)
+            ],
         ))
         session.commit()
 
 
+def _messages(response) -> list[str]:
+    return [i["message"] for i in response.json()["insights"]]
+
+
 # ---------------------------------------------------------------------------
-# Cache miss: insights generated and saved on first call
+# Stored insights: read without generating
 # ---------------------------------------------------------------------------
 
-def test_get_project_insights_generates_and_returns_insights_on_cache_miss(client, blank_db):
-    _insert_project(blank_db, "NewProject")
+def test_get_project_insights_returns_stored_insights_in_order(client, blank_db):
+    _insert_project(blank_db, "StoredProject")
     _insert_ml_consent(blank_db, True)
+    _insert_stored_insights(blank_db, "StoredProject", [
+        ("Stored insight one.", False), ("Stored insight two.", True)])
 
-    with patch("src.interface.api.routers.insights.get_project_insights") as mock_cached, \
-         patch("src.interface.api.routers.insights.get_project_report_by_name") as mock_get, \
-         patch("src.interface.api.routers.insights.InsightGenerator.generate") as mock_gen, \
-         patch("src.interface.api.routers.insights.save_project_insights") as mock_save:
+    with patch(_GENERATE) as mock_gen, patch(_GET_REPORT) as mock_get:
+        response = client.get(f"/projects/{quote('StoredProject')}/insights")
 
-        mock_cached.return_value = None
-        mock_get.return_value = MagicMock()
-        mock_gen.return_value = [
-            MagicMock(message="You wrote 80% of this project."),
-            MagicMock(message="You used Python and FastAPI."),
-        ]
-
-        response = client.get(f"/projects/{quote('NewProject')}/insights")
+        mock_gen.assert_not_called()
+        mock_get.assert_not_called()
 
     assert response.status_code == 200
-    data = response.json()
-    assert data["project_name"] == "NewProject"
-    assert len(data["insights"]) == 2
-    assert data["insights"][0]["message"] == "You wrote 80% of this project."
-    mock_save.assert_called_once()
+    assert response.json()["project_name"] == "StoredProject"
+    assert _messages(response) == ["Stored insight one.", "Stored insight two."]
 
 
-def test_get_project_insights_saves_insights_to_db_on_cache_miss(client, blank_db):
-    _insert_project(blank_db, "SaveProject")
-    _insert_ml_consent(blank_db, True)
-
-    with patch("src.interface.api.routers.insights.get_project_insights") as mock_cached, \
-         patch("src.interface.api.routers.insights.get_project_report_by_name") as mock_get, \
-         patch("src.interface.api.routers.insights.InsightGenerator.generate") as mock_gen, \
-         patch("src.interface.api.routers.insights.save_project_insights") as mock_save:
+def test_get_project_insights_leaves_out_ml_insights_without_consent(client, blank_db):
+    _insert_project(blank_db, "ConsentProject")
+    _insert_ml_consent(blank_db, False)
+    _insert_stored_insights(blank_db, "ConsentProject", [
+        ("From statistics.", False), ("From ML.", True), ("Also statistics.", False)])
 
-        mock_cached.return_value = None
-        mock_get.return_value = MagicMock()
-        mock_gen.return_value = [MagicMock(message="Some insight.")]
+    with patch(_GENERATE) as mock_gen:
+        response = client.get(f"/projects/{quote('ConsentProject')}/insights")
 
-        client.get(f"/projects/{quote('SaveProject')}/insights")
+        mock_gen.assert_not_called()
 
-        mock_save.assert_called_once()
+    assert _messages(response) == ["From statistics.", "Also statistics."]
 
 
-def test_get_project_insights_passes_correct_messages_to_save(client, blank_db):
-    _insert_project(blank_db, "CheckSave")
+def test_get_project_insights_url_decodes_project_name(client, blank_db):
+    _insert_project(blank_db, "My Cool Project")
     _insert_ml_consent(blank_db, True)
+    _insert_stored_insights(blank_db, "My Cool Project", [("Great work!", False)])
 
-    captured = {}
-
-    def fake_save(session, name, messages):
-        captured["name"] = name
-        captured["messages"] = messages
-
-    with patch("src.interface.api.routers.insights.get_project_insights") as mock_cached, \
-         patch("src.interface.api.routers.insights.get_project_report_by_name") as mock_get, \
-         patch("src.interface.api.routers.insights.InsightGenerator.generate") as mock_gen, \
-         patch("src.interface.api.routers.insights.save_project_insights", side_effect=fake_save):
-
-        mock_cached.return_value = None
-        mock_get.return_value = MagicMock()
-        mock_gen.return_value = [
-            MagicMock(message="Insight A"),
-            MagicMock(message="Insight B"),
-        ]
-
-        client.get(f"/projects/{quote('CheckSave')}/insights")
+    response = client.get(f"/projects/{quote('My Cool Project')}/insights")
 
-    assert captured["name"] == "CheckSave"
-    assert captured["messages"] == ["Insight A", "Insight B"]
+    assert response.status_code == 200
+    assert response.json()["project_name"] == "My Cool Project"
+    assert _messages(response) == ["Great work!"]
 
 
 # ---------------------------------------------------------------------------
-# Cache hit: cached insights returned without calling the generator
+# Not stored yet: generated once, with every calculator, and saved
 # ---------------------------------------------------------------------------
 
-def test_get_project_insights_returns_cached_insights(client, blank_db):
-    _insert_project(blank_db, "CachedProject")
-    _insert_ml_consent(blank_db, True)
-    _insert_cached_insights(blank_db, "CachedProject", ["Cached insight one.", "Cached insight two."])
+def test_get_project_insights_generates_and_saves_missing_insights(client, blank_db):
+    _insert_project(blank_db, "NewProject")
+    _insert_ml_consent(blank_db, False)
 
-    with patch("src.interface.api.routers.insights.InsightGenerator.generate") as mock_gen:
-        response = client.get(f"/projects/{quote('CachedProject')}/insights")
-        mock_gen.assert_not_called()
+    with patch(_GET_REPORT) as mock_get, patch(_GENERATE) as mock_gen:
+        mock_get.return_value = MagicMock()
+        mock_gen.return_value = [
+            ProjectInsight(message="You wrote 80% of this project.", source="A"),
+            ProjectInsight(message="Your role was lead.", source="B", uses_ml=True),
+        ]
 
-    assert response.status_code == 200
-    data = response.json()
-    assert data["project_name"] == "CachedProject"
-    assert len(data["insights"]) == 2
-    assert data["insights"][0]["message"] == "Cached insight one."
-    assert data["insights"][1]["message"] == "Cached insight two."
+        first = client.get(f"/projects/{quote('NewProject')}/insights")
+        _insert_ml_consent(blank_db, True)
+        second = client.get(f"/projects/{quote('NewProject')}/insights")
+
+    mock_gen.assert_called_once()
+    assert mock_gen.call_args.kwargs.get("requested_classes") is None
+    assert _messages(first) == ["You wrote 80% of this project."]
+    assert _messages(second) == ["You wrote 80% of this project.", "Your role was lead."]
+    with Session(blank_db) as session:
+        rows = session.exec(select(InsightMessageModel).where(
+            InsightMessageModel.project_name == "NewProject")).all()
+    assert [(r.source, r.uses_ml) for r in rows] == [("A", False), ("B", True)]
 
 
-def test_get_project_insights_does_not_call_generator_on_cache_hit(client, blank_db):
-    _insert_project(blank_db, "HitProject")
+def test_get_project_insights_stores_empty_results(client, blank_db):
+    _insert_project(blank_db, "QuietProject")
     _insert_ml_consent(blank_db, True)
-    _insert_cached_insights(blank_db, "HitProject", ["Only from cache."])
-
-    with patch("src.interface.api.routers.insights.InsightGenerator.generate") as mock_gen, \
-         patch("src.interface.api.routers.insights.get_project_report_by_name") as mock_get:
 
-        response = client.get(f"/projects/{quote('HitProject')}/insights")
+    with patch(_GET_REPORT) as mock_get, patch(_GENERATE) as mock_gen:
+        mock_get.return_value = MagicMock()
+        mock_gen.return_value = []
 
-        mock_gen.assert_not_called()
-        mock_get.assert_not_called()
+        response = client.get(f"/projects/{quote('QuietProject')}/insights")
+        client.get(f"/projects/{quote('QuietProject')}/insights")
 
     assert response.status_code == 200
+    assert response.json()["insights"] == []
+    mock_gen.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
@@ -166,13 +158,7 @@ def test_get_project_insights_does_not_call_generator_on_cache_hit(client, blank
 def test_get_project_insights_returns_404_when_project_not_found(client, blank_db):
     _insert_ml_consent(blank_db, True)
 
-    with patch("src.interface.api.routers.insights.get_project_insights") as mock_cached, \
-         patch("src.interface.api.routers.insights.get_project_report_by_name") as mock_get:
-
-        mock_cached.return_value = None
-        mock_get.return_value = None
-
-        response = client.get("/projects/DoesNotExist/insights")
+    response = client.get("/projects/DoesNotExist/insights")
 
     assert response.status_code == 404
     assert "DoesNotExist" in response.json()["message"]
@@ -182,11 +168,7 @@ def test_get_project_insights_returns_500_on_generator_error(client, blank_db):
     _insert_project(blank_db, "BrokenProject")
     _insert_ml_consent(blank_db, True)
 
-    with patch("src.interface.api.routers.insights.get_project_insights") as mock_cached, \
-         patch("src.interface.api.routers.insights.get_project_report_by_name") as mock_get, \
-         patch("src.interface.api.routers.insights.InsightGenerator.generate") as mock_gen:
-
-        mock_cached.return_value = None
+    with patch(_GET_REPORT) as mock_get, patch(_GENERATE) as mock_gen:
         mock_get.return_value = MagicMock()
         mock_gen.side_effect = RuntimeError("something went wrong")
 
@@ -194,49 +176,3 @@ def test_get_project_insights_returns_500_on_generator_error(client, blank_db):
 
     assert response.status_code == 500
     assert "insights" in response.json()["detail"].lower()
-
-
-def test_get_project_insights_returns_empty_list_when_no_insights_generated(client, blank_db):
-    _insert_project(blank_db, "QuietProject")
-    _insert_ml_consent(blank_db, True)
-
-    with patch("src.interface.api.routers.insights.get_project_insights") as mock_cached, \
-         patch("src.interface.api.routers.insights.get_project_report_by_name") as mock_get, \
-         patch("src.interface.api.routers.insights.InsightGenerator.generate") as mock_gen, \
-         patch("src.interface.api.routers.insights.save_project_insights"):
-
-        mock_cached.return_value = None
-        mock_get.return_value = MagicMock()
-        mock_gen.return_value = []
-
-        response = client.get(f"/projects/{quote('QuietProject')}/insights")
-
-    assert response.status_code == 200
-    assert response.json()["insights"] == []
-
-
-def test_get_project_insights_url_decodes_project_name(client, blank_db):
-    _insert_project(blank_db, "My Cool Project")
-    _insert_ml_consent(blank_db, True)
-    _insert_cached_insights(blank_db, "My Cool Project", ["Great work!"])
-
-    response = client.get(f"/projects/{quote('My Cool Project')}/insights")
-
-    assert response.status_code == 200
-    assert response.json()["project_name"] == "My Cool Project"
-
-
-def test_get_project_insights_returns_non_ml_only_when_ml_consent_not_granted(client, blank_db):
-    _insert_project(blank_db, "ConsentProject")
-
-    with patch("src.interface.api.routers.insights.InsightGenerator.generate") as mock_gen, \
-         patch("src.interface.api.routers.insights.save_project_insights") as mock_save:
-        mock_gen.return_value = []
-        response = client.get(f"/projects/{quote('ConsentProject')}/insights")
-
-    assert response.status_code == 200
-    assert response.json()["insights"] == []
-    mock_gen.assert_called_once()
-    _, kwargs = mock_gen.call_args
-    assert kwargs["requested_classes"] == NON_ML_INSIGHT_CALCULATORS
-    mock_save.assert_not_called()
@@ -0,0 +1,210 @@
+"""
+Tests for cursor pagination, `fields=` projection, sorting and compression
+on the list endpoints: /projects, /resume, /portfolio and
+/portfolio/{id}/cards.
+"""
+
+import base64
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlmodel import Session
+
+from src.database.api.models import (
+    PortfolioModel,
+    PortfolioProjectCardModel,
+    ProjectReportModel,
+    ResumeModel,
+)
+
+_START = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _insert_projects(engine, count: int, *, statistic=None) -> None:
+    with Session(engine) as session:
+        for i in range(count):
+            session.add(ProjectReportModel(
+                project_name=f"Project {i:02d}",
+                statistic=statistic or {"dummy": i},
+                created_at=_START + timedelta(hours=i),
+                last_updated=_START + timedelta(hours=i),
+            ))
+        session.commit()
+
+
+def _pages(client, url: str, params: dict, items_key: str) -> list[list[dict]]:
+    pages = []
+    cursor = None
+    while True:
+        query = dict(params, **({"cursor": cursor} if cursor else {}))
+        body = client.get(url, params=query).json()
+        pages.append(body[items_key])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_projects_without_limit_returns_everything(client, blank_db):
+    _insert_projects(blank_db, 3)
+
+    body = client.get("/projects/").json()
+
+    assert body["count"] == 3
+    assert body["next_cursor"] is None
+    assert [p["project_name"] for p in body["projects"]] == [
+        "Project 00", "Project 01", "Project 02"]
+
+
+def test_project_pages_cover_every_row_once(client, blank_db):
+    _insert_projects(blank_db, 7)
+
+    pages = _pages(client, "/projects/", {"limit": 3}, "projects")
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    names = [p["project_name"] for page in pages for p in page]
+    assert names == [f"Project {i:02d}" for i in range(7)]
+
+
+def test_project_pages_follow_the_requested_sort(client, blank_db):
+    _insert_projects(blank_db, 5)
+
+    pages = _pages(client, "/projects/", {"limit": 2, "sort": "-created_at"}, "projects")
+
+    names = [p["project_name"] for page in pages for p in page]
+    assert names == [f"Project {i:02d}" for i in reversed(range(5))]
+
+
+def test_rank_sort_puts_ranked_projects_first(client, blank_db):
+    _insert_projects(blank_db, 3)
+    with Session(blank_db) as session:
+        session.get(ProjectReportModel, "Project 02").representation_rank = 1
+        session.get(ProjectReportModel, "Project 00").representation_rank = 2
+        session.commit()
+
+    pages = _pages(client, "/projects/", {"limit": 1}, "projects")
+
+    names = [p["project_name"] for page in pages for p in page]
+    assert names == ["Project 02", "Project 00", "Project 01"]
+
+
+def test_fields_projection_leaves_out_statistics(client, blank_db):
+    _insert_projects(blank_db, 2)
+
+    body = client.get("/projects/", params={"fields": "project_name,thumbnail_url"}).json()
+
+    assert body["projects"] == [
+        {"project_name": "Project 00", "thumbnail_url": None},
+        {"project_name": "Project 01", "thumbnail_url": None},
+    ]
+
+
+def test_unknown_field_is_rejected(client, blank_db):
+    response = client.get("/projects/", params={"fields": "project_name,nope"})
+
+    assert response.status_code == 400
+    assert "nope" in response.json()["detail"]
+
+
+def test_bad_or_mismatched_cursor_is_rejected(client, blank_db):
+    _insert_projects(blank_db, 3)
+    cursor = client.get("/projects/", params={"limit": 1}).json()["next_cursor"]
+
+    assert client.get("/projects/", params={"cursor": "not-a-cursor"}).status_code == 400
+    assert client.get(
+        "/projects/", params={"cursor": cursor, "sort": "project_name"}).status_code == 400
+
+
+def _cursor(sort: str, after) -> str:
+    payload = json.dumps({"sort": sort, "after": after})
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+@pytest.mark.parametrize("url, sort, after", [
+    ("/projects/", "rank", [0, 1, "2026-01-01T12:00:00"]),
+    ("/projects/", "rank", [0, 1, "yesterday", "Project 00"]),
+    ("/projects/", "rank", [0, {"rank": 1}, "2026-01-01T12:00:00", "Project 00"]),
+    ("/projects/", "created_at", ["2026-01-01T12:00:00", 5]),
+    ("/resume", "-last_updated", ["not a date", 1]),
+    ("/resume", "-last_updated", ["2026-01-01T12:00:00", "1"]),
+    ("/portfolio", "id", [True]),
+])
+def test_tampered_cursor_is_rejected(client, blank_db, url, sort, after):
+    _insert_projects(blank_db, 2)
+
+    response = client.get(url, params={"sort": sort, "cursor": _cursor(sort, after)})
+
+    assert response.status_code == 400
+
+
+def test_large_lists_are_gzipped(client, blank_db):
+    _insert_projects(blank_db, 10, statistic={"blob": "x" * 500})
+
+    response = client.get("/projects/", headers={"Accept-Encoding": "gzip"})
+    small = client.get("/projects/", params={"fields": "project_name", "limit": 1},
+                       headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()["count"] == 10
+    assert "content-encoding" not in small.headers
+
+
+def test_resume_pages_newest_first_with_projection(client, blank_db):
+    with Session(blank_db) as session:
+        for i in range(5):
+            session.add(ResumeModel(
+                title=f"Resume {i}",
+                skills=[],
+                created_at=_START + timedelta(hours=i),
+                last_updated=_START + timedelta(hours=i),
+            ))
+        session.commit()
+
+    pages = _pages(client, "/resume", {"limit": 2, "fields": "id,title"}, "resumes")
+
+    resumes = [r for page in pages for r in page]
+    assert [r["title"] for r in resumes] == [f"Resume {i}" for i in reversed(range(5))]
+    assert all(set(r) == {"id", "title"} for r in resumes)
+
+
+def test_portfolio_pages_and_projection(client, blank_db):
+    with Session(blank_db) as session:
+        for i in range(3):
+            session.add(PortfolioModel(
+                title=f"Portfolio {i}",
+                creation_time=_START,
+                last_updated_at=_START + timedelta(hours=i),
+                project_ids_include=[],
+            ))
+        session.commit()
+
+    pages = _pages(client, "/portfolio", {"limit": 2, "sort": "-last_updated_at",
+                                          "fields": "title"}, "portfolios")
+
+    assert pages == [[{"title": "Portfolio 2"}, {"title": "Portfolio 1"}],
+                     [{"title": "Portfolio 0"}]]
+    assert client.get("/portfolio", params={"fields": "sections"}).status_code == 400
+
+
+def test_card_pages_keep_showcase_cards_first(client, blank_db):
+    with Session(blank_db) as session:
+        portfolio = PortfolioModel(
+            title="P", creation_time=_START, last_updated_at=_START, project_ids_include=[])
+        session.add(portfolio)
+        session.flush()
+        for name, showcase in [("b", False), ("a", False), ("c", True), ("d", False)]:
+            session.add(PortfolioProjectCardModel(
+                portfolio_id=portfolio.id, project_name=name, is_showcase=showcase,
+                image_data=b"\x89PNG"))
+        session.commit()
+        portfolio_id = portfolio.id
+
+    pages = _pages(client, f"/portfolio/{portfolio_id}/cards",
+                   {"limit": 3, "fields": "project_name,is_showcase"}, "cards")
+
+    assert pages == [
+        [{"project_name": "c", "is_showcase": True},
+         {"project_name": "a", "is_showcase": False},
+         {"project_name": "b", "is_showcase": False}],
+        [{"project_name": "d", "is_showcase": False}],
+    ]
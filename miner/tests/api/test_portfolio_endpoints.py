@@ -15,6 +15,7 @@ from unittest.mock import MagicMock, patch
 
 from sqlmodel import Session
 
+from src.services.portfolio.export_service import clear_export_cache, export_portfolio_static
 from src.database.api.models import (
     PortfolioModel,
     PortfolioSectionModel,
@@ -666,6 +667,32 @@ class TestExportPortfolio:
         r = client.get("/portfolio/9999/export")
         assert r.status_code == 404
 
+    def test_repeated_export_reuses_the_archive(self, client, blank_db):
+        clear_export_cache()
+        pid = _make_portfolio(blank_db)
+        _make_card(blank_db, pid, "alpha")
+
+        with patch("src.services.portfolio.export_service.export_portfolio_static",
+                   wraps=export_portfolio_static) as build:
+            first = client.get(f"/portfolio/{pid}/export")
+            second = client.get(f"/portfolio/{pid}/export")
+
+        assert build.call_count == 1
+        assert first.content == second.content
+
+    def test_export_is_rebuilt_after_a_card_edit(self, client, blank_db):
+        clear_export_cache()
+        pid = _make_portfolio(blank_db)
+        _make_card(blank_db, pid, "alpha")
+        before = client.get(f"/portfolio/{pid}/export")
+
+        client.patch(f"/portfolio/{pid}/cards/alpha", json={"title_override": "Renamed"})
+        after = client.get(f"/portfolio/{pid}/export")
+
+        js_src = zipfile.ZipFile(io.BytesIO(after.content)).read("portfolio_data.js").decode()
+        assert before.content != after.content
+        assert '"title_override": "Renamed"' in js_src
+
 
 # ---------------------------------------------------------------------------
 # POST /portfolio/{id}/sections/{section_id}/block/{block_tag}/edit
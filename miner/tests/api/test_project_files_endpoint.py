@@ -0,0 +1,161 @@
+"""
+Tests for `GET /projects/{name}/files`: paging, filters, sorts and the
+columns copied out of the file statistics.
+"""
+
+import datetime
+
+from sqlmodel import Session
+
+from src.core.report import FileReport
+from src.core.statistic import FileStatCollection, Statistic, StatisticIndex
+from src.core.statistic.statistic_models import CodingLanguage, FileDomain
+from src.database.api.models import ProjectReportModel
+from src.database.core.model_serializer import serialize_file_report
+
+# path, language, type, size, lines, percentage committed (None = missing)
+_FILES = [
+    ("src/app.py", CodingLanguage.PYTHON, FileDomain.CODE, 300, 30, 80.0),
+    ("src/util.py", CodingLanguage.PYTHON, FileDomain.CODE, 100, 10, 20.0),
+    ("src/web/index.js", CodingLanguage.JAVASCRIPT, FileDomain.CODE, 500, 50, None),
+    ("tests/test_app.py", CodingLanguage.PYTHON, FileDomain.TEST, 200, 20, 100.0),
+    ("README.md", None, FileDomain.DOCUMENTATION, 50, 5, 0.0),
+]
+
+
+def _file_report(path, language, domain, size, lines, committed) -> FileReport:
+    stats = StatisticIndex()
+    stats.add(Statistic(FileStatCollection.FILE_SIZE_BYTES.value, size))
+    stats.add(Statistic(FileStatCollection.LINES_IN_FILE.value, lines))
+    stats.add(Statistic(FileStatCollection.TYPE_OF_FILE.value, domain))
+    if language is not None:
+        stats.add(Statistic(FileStatCollection.CODING_LANGUAGE.value, language))
+    if committed is not None:
+        stats.add(Statistic(FileStatCollection.PERCENTAGE_LINES_COMMITTED.value, committed))
+    return FileReport(
+        statistics=stats,
+        filepath=path,
+        is_info_file=path == "README.md",
+        file_hash=path.encode(),
+        project_name="Demo",
+    )
+
+
+def _insert_project(engine) -> None:
+    with Session(engine) as session:
+        session.add(ProjectReportModel(
+            project_name="Demo",
+            statistic={},
+            created_at=datetime.datetime.now(),
+            last_updated=datetime.datetime.now(),
+        ))
+        for file in _FILES:
+            session.add(serialize_file_report(_file_report(*file)))
+        session.commit()
+
+
+def _paths(response) -> list[str]:
+    return [f["file_path"] for f in response.json()["files"]]
+
+
+def test_files_are_listed_by_path_with_extracted_columns(client, blank_db):
+    _insert_project(blank_db)
+
+    response = client.get("/projects/Demo/files")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["count"] == 5
+    assert body["next_cursor"] is None
+    assert _paths(response) == sorted(path for path, *_ in _FILES)
+    app = body["files"][1]
+    assert app["file_path"] == "src/app.py"
+    assert (app["coding_language"], app["file_type"], app["size_bytes"],
+            app["line_count"], app["percentage_lines_committed"]) == ("Python", "code", 300, 30, 80.0)
+    assert app["statistic"]["FILE_SIZE_BYTES"] == 300
+
+
+def test_pages_cover_every_file_once(client, blank_db):
+    _insert_project(blank_db)
+
+    paths, cursor = [], None
+    while True:
+        params = {"limit": 2, "sort": "-contribution"}
+        if cursor:
+            params["cursor"] = cursor
+        body = client.get("/projects/Demo/files", params=params).json()
+        paths += [f["file_path"] for f in body["files"]]
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+
+    # The file without a contribution statistic comes last
+    assert paths == ["tests/test_app.py", "src/app.py", "src/util.py",
+                     "README.md", "src/web/index.js"]
+
+
+def test_ascending_sort_puts_missing_values_first(client, blank_db):
+    _insert_project(blank_db)
+
+    pages = [client.get("/projects/Demo/files", params={"sort": "contribution", "limit": 1})]
+    while pages[-1].json()["next_cursor"]:
+        pages.append(client.get("/projects/Demo/files", params={
+            "sort": "contribution", "limit": 1, "cursor": pages[-1].json()["next_cursor"]}))
+
+    assert [path for page in pages for path in _paths(page)] == [
+        "src/web/index.js", "README.md", "src/util.py", "src/app.py", "tests/test_app.py"]
+
+
+def test_size_sort(client, blank_db):
+    _insert_project(blank_db)
+
+    response = client.get("/projects/Demo/files", params={"sort": "-size"})
+
+    assert _paths(response) == ["src/web/index.js", "src/app.py", "tests/test_app.py",
+                                "src/util.py", "README.md"]
+
+
+def test_filters_combine(client, blank_db):
+    _insert_project(blank_db)
+
+    python = client.get("/projects/Demo/files", params={"language": "Python"})
+    tests = client.get("/projects/Demo/files", params={"file_type": "test"})
+    info = client.get("/projects/Demo/files", params={"is_info_file": "true"})
+    src_owned = client.get("/projects/Demo/files", params={
+        "path_prefix": "src/", "min_contribution": 50})
+
+    assert _paths(python) == ["src/app.py", "src/util.py", "tests/test_app.py"]
+    assert _paths(tests) == ["tests/test_app.py"]
+    assert _paths(info) == ["README.md"]
+    assert _paths(src_owned) == ["src/app.py"]
+
+
+def test_path_prefix_is_case_sensitive(client, blank_db):
+    _insert_project(blank_db)
+
+    response = client.get("/projects/Demo/files", params={"path_prefix": "SRC/"})
+
+    assert response.json()["files"] == []
+
+
+def test_fields_projection(client, blank_db):
+    _insert_project(blank_db)
+
+    response = client.get("/projects/Demo/files", params={
+        "fields": "file_path,size_bytes", "limit": 1})
+
+    assert response.json()["files"] == [{"file_path": "README.md", "size_bytes": 50}]
+
+
+def test_invalid_parameters_are_rejected(client, blank_db):
+    _insert_project(blank_db)
+
+    assert client.get("/projects/Demo/files", params={"language": "Klingon"}).status_code == 422
+    assert client.get("/projects/Demo/files", params={"fields": "bogus"}).status_code == 400
+    assert client.get("/projects/Demo/files", params={"cursor": "x"}).status_code == 400
+
+
+def test_unknown_project_is_404(client, blank_db):
+    response = client.get("/projects/Nope/files")
+
+    assert response.status_code == 404
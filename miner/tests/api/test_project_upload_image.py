@@ -2,12 +2,15 @@
 Integration tests for the project image upload and retrieval endpoints.
 """
 
+import hashlib
+
 import pytest
-from sqlmodel import Session
+from sqlmodel import Session, select
 from datetime import datetime
 from unittest.mock import patch
 
-from src.database.api.models import ProjectReportModel
+from src.database.api.CRUD.images import save_project_image
+from src.database.api.models import ProjectImageModel, ProjectReportModel
 
 # --- Fixtures ---
 
@@ -24,7 +27,7 @@ def seeded_project(blank_db):
             statistic={"lines_of_code": 100},
             created_at=datetime.now(),
             last_updated=datetime.now(),
-            # image_data defaults to None
+            # image_hash defaults to None
         )
         session.add(project)
         session.commit()
@@ -42,9 +45,9 @@ def seeded_project_with_image(blank_db, seeded_project):
     with Session(blank_db) as session:
         # Fetch the project we just seeded
         project = session.get(ProjectReportModel, seeded_project.project_name)
-        project.image_data = b"existing dummy image bytes"
-        session.add(project)
+        save_project_image(session, project, b"existing dummy image bytes", "image/png")
         session.commit()
+        session.refresh(project)
         return project
 
 
@@ -69,7 +72,11 @@ def test_upload_project_image_success(client, blank_db, seeded_project):
     with Session(blank_db) as session:
         updated_project = session.get(
             ProjectReportModel, seeded_project.project_name)
-        assert updated_project.image_data == b"new fake image bytes"
+        image_hash = hashlib.sha256(b"new fake image bytes").hexdigest()
+        assert updated_project.image_hash == image_hash
+        image = session.get(ProjectImageModel, image_hash)
+        assert image.data == b"new fake image bytes"
+        assert image.content_type == "image/png"
         # Ensure last_updated was modified
         assert updated_project.last_updated > seeded_project.last_updated
 
@@ -132,3 +139,78 @@ def test_upload_project_image_sneaky_extension(client, seeded_project):
 
     assert response.status_code == 400
     assert "Invalid file type" in response.json()["detail"]
+
+
+def test_replacing_an_image_removes_the_unused_one(client, blank_db, seeded_project_with_image):
+    old_hash = seeded_project_with_image.image_hash
+
+    response = client.post(
+        "/projects/TestProject/image",
+        files={"file": ("new.png", b"replacement bytes", "image/png")})
+
+    assert response.status_code == 200
+    with Session(blank_db) as session:
+        assert session.get(ProjectImageModel, old_hash) is None
+        assert len(session.exec(select(ProjectImageModel)).all()) == 1
+
+
+def test_shared_images_are_stored_once(client, blank_db, seeded_project_with_image):
+    with Session(blank_db) as session:
+        session.add(ProjectReportModel(
+            project_name="OtherProject", statistic={},
+            created_at=datetime.now(), last_updated=datetime.now()))
+        session.commit()
+
+    client.post("/projects/OtherProject/image",
+                files={"file": ("same.png", b"existing dummy image bytes", "image/png")})
+    client.delete("/projects/TestProject/image")
+
+    with Session(blank_db) as session:
+        # Still used by OtherProject, so removing it from TestProject keeps it
+        images = session.exec(select(ProjectImageModel)).all()
+        assert [image.hash for image in images] == [seeded_project_with_image.image_hash]
+        assert session.get(ProjectReportModel, "TestProject").image_hash is None
+
+
+# --- Tests for GET /projects/{project_name}/image ---
+
+def test_project_responses_carry_image_urls(client, seeded_project_with_image):
+    image_hash = seeded_project_with_image.image_hash
+
+    body = client.get("/projects/TestProject").json()
+
+    assert "image_data" not in body
+    assert body["image_hash"] == image_hash
+    assert body["image_url"] == f"/projects/TestProject/image?v={image_hash}"
+    assert body["thumbnail_url"] == f"/projects/TestProject/image?v={image_hash}&size=thumbnail"
+
+
+def test_get_project_image_uses_etags(client, seeded_project_with_image):
+    image_hash = seeded_project_with_image.image_hash
+
+    response = client.get(f"/projects/TestProject/image?v={image_hash}")
+
+    assert response.status_code == 200
+    assert response.content == b"existing dummy image bytes"
+    assert response.headers["content-type"] == "image/png"
+    assert response.headers["etag"] == f'"{image_hash}"'
+    assert "immutable" in response.headers["cache-control"]
+
+    cached = client.get("/projects/TestProject/image",
+                        headers={"If-None-Match": response.headers["etag"]})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["cache-control"] == "no-cache"
+
+
+def test_get_project_thumbnail_falls_back_to_full_image(client, seeded_project_with_image):
+    # The dummy bytes are not a readable image, so no thumbnail was made
+    response = client.get("/projects/TestProject/image?size=thumbnail")
+
+    assert response.status_code == 200
+    assert response.content == b"existing dummy image bytes"
+
+
+def test_get_project_image_missing(client, seeded_project):
+    assert client.get("/projects/TestProject/image").status_code == 404
+    assert client.get("/projects/NonExistentProject/image").status_code == 404
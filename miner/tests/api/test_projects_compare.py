@@ -14,7 +14,6 @@ def _insert_project(engine, name: str, created_at: datetime.datetime, rank=None,
         m = ProjectReportModel(
             project_name=name,
             user_config_used=None,
-            image_data=None,
             statistic={"dummy": True},
             created_at=created_at,
             last_updated=created_at,
@@ -45,7 +44,7 @@ def test_compare_projects_unions_attributes_and_sorts(client, blank_db, monkeypa
     _insert_project(blank_db, "A", now + datetime.timedelta(seconds=1), rank=1, compare=["frameworks", "weight"])
     _insert_project(blank_db, "B", now + datetime.timedelta(seconds=2), rank=0, compare=["start_date", "end_date"])
 
-    def fake_get_project_report_by_name(_session, project_name: str):
+    def fake_get_project_report_by_name(_session, project_name: str, include_file_reports=True):
         if project_name == "A":
             item = SimpleNamespace(
                 start_date=datetime.date(2026, 1, 1),
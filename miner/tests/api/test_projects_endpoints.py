@@ -98,7 +98,6 @@ def _insert_project(engine, name: str):
         session.add(ProjectReportModel(
             project_name=name,
             user_config_used=None,
-            image_data=None,
             statistic={"dummy": True},
             created_at=datetime.datetime.now(),
             last_updated=datetime.datetime.now(),
@@ -40,7 +40,7 @@ def test_showcase_success_200(monkeypatch):
         ),
     )
 
-    def fake_get_project_report_by_name(session, project_name: str):
+    def fake_get_project_report_by_name(session, project_name: str, include_file_reports=True):
         assert project_name == "DemoProject"
         return stub_report
 
@@ -57,7 +57,7 @@ def test_showcase_success_200(monkeypatch):
     assert body["end_date"].startswith("2026-02-20T12:30:00")
 
 def test_showcase_404(monkeypatch):
-    def fake_get_project_report_by_name(session, project_name: str):
+    def fake_get_project_report_by_name(session, project_name: str, include_file_reports=True):
         return None
 
     monkeypatch.setattr(projects_mod, "get_project_report_by_name", fake_get_project_report_by_name)
@@ -67,7 +67,7 @@ def test_showcase_404(monkeypatch):
     assert "No project report named" in res.json()["message"]
 
 def test_showcase_500(monkeypatch):
-    def fake_get_project_report_by_name(session, project_name: str):
+    def fake_get_project_report_by_name(session, project_name: str, include_file_reports=True):
         raise RuntimeError("Database connection failed")
 
     monkeypatch.setattr(projects_mod, "get_project_report_by_name", fake_get_project_report_by_name)
@@ -87,7 +87,7 @@ def test_showcase_frameworks_weighted_skill_normalized(monkeypatch):
         ),
     )
 
-    def fake_get_project_report_by_name(session, project_name: str):
+    def fake_get_project_report_by_name(session, project_name: str, include_file_reports=True):
         assert project_name == "DemoProject"
         return stub_report
 
@@ -110,7 +110,7 @@ def test_resume_item_success_200(monkeypatch):
         ),
     )
 
-    def fake_get_project_report_by_name(session, project_name: str):
+    def fake_get_project_report_by_name(session, project_name: str, include_file_reports=True):
         assert project_name == "DemoProject"
         return stub_report
 
@@ -127,7 +127,7 @@ def test_resume_item_success_200(monkeypatch):
     assert body["end_date"].startswith("2026-02-20T12:30:00")
 
 def test_resume_item_404(monkeypatch):
-    def fake_get_project_report_by_name(session, project_name: str):
+    def fake_get_project_report_by_name(session, project_name: str, include_file_reports=True):
         return None
 
     monkeypatch.setattr(projects_mod, "get_project_report_by_name", fake_get_project_report_by_name)
@@ -137,7 +137,7 @@ def test_resume_item_404(monkeypatch):
     assert "No project report named" in res.json()["message"]
 
 def test_resume_item_500(monkeypatch):
-    def fake_get_project_report_by_name(session, project_name: str):
+    def fake_get_project_report_by_name(session, project_name: str, include_file_reports=True):
         raise RuntimeError("Database connection failed")
 
     monkeypatch.setattr(projects_mod, "get_project_report_by_name", fake_get_project_report_by_name)
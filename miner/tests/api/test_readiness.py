@@ -0,0 +1,82 @@
+"""
+Tests the background ML warmup and the /ready endpoint.
+"""
+
+import threading
+
+import pytest
+
+import src.app as app_module
+
+
+@pytest.fixture
+def fresh_warmup(monkeypatch):
+    """
+    Reset the module level warmup state so each test starts from
+    `not_started`, and block the fake warmup until the test releases it.
+    """
+    release = threading.Event()
+
+    def fake_init_system():
+        release.wait(timeout=5)
+        return True, "ML warmup complete: fake ready."
+
+    monkeypatch.setattr(app_module, "init_system", fake_init_system)
+    monkeypatch.setattr(app_module, "_WARMUP_THREAD", None)
+    monkeypatch.setattr(app_module, "_WARMUP_STATUS", {
+        "state": "not_started",
+        "ml_ready": False,
+        "message": "ML warmup has not started.",
+    })
+
+    yield release
+
+    release.set()
+    app_module.wait_for_warmup(timeout=5)
+
+
+def test_ready_is_503_before_warmup(client, fresh_warmup):
+    response = client.get("/ready")
+
+    assert response.status_code == 503
+    assert response.json()["state"] == "not_started"
+
+
+def test_ready_reports_running_then_complete(client, fresh_warmup):
+    app_module.start_background_warmup()
+
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.json()["state"] == "running"
+
+    fresh_warmup.set()
+    status = app_module.wait_for_warmup(timeout=5)
+    assert status["state"] == "complete"
+
+    response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.json() == {
+        "state": "complete",
+        "ml_ready": True,
+        "message": "ML warmup complete: fake ready.",
+    }
+
+
+def test_start_background_warmup_is_idempotent(fresh_warmup):
+    first = app_module.start_background_warmup()
+    second = app_module.start_background_warmup()
+
+    assert first is second
+
+
+def test_warmup_crash_is_reported(monkeypatch, fresh_warmup):
+    def exploding_init_system():
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(app_module, "init_system", exploding_init_system)
+
+    app_module.start_background_warmup()
+    status = app_module.wait_for_warmup(timeout=5)
+
+    assert status["state"] == "complete"
+    assert status["ml_ready"] is False
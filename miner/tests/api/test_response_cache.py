@@ -0,0 +1,95 @@
+"""
+Tests for the cached GET responses in `src/interface/api/response_cache.py`:
+ETags, 304s, invalidation by writes and the hit-rate stats.
+"""
+
+import datetime
+
+from sqlmodel import Session
+
+from src.database.api.models import ProjectReportModel
+
+
+def _insert_project(engine, project_name: str) -> None:
+    with Session(engine) as session:
+        session.add(ProjectReportModel(
+            project_name=project_name,
+            statistic={"dummy": True},
+            created_at=datetime.datetime.now(),
+            last_updated=datetime.datetime.now(),
+        ))
+        session.commit()
+
+
+def _stats(client, namespace: str) -> dict:
+    return client.get("/cache/stats").json()["namespaces"][namespace]
+
+
+def test_repeated_gets_are_served_from_the_cache(client, blank_db):
+    _insert_project(blank_db, "Demo")
+
+    first = client.get("/projects/Demo")
+    second = client.get("/projects/Demo")
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    assert first.headers["etag"] == second.headers["etag"]
+    assert _stats(client, "projects.detail") == {
+        "hits": 1, "misses": 1, "not_modified": 0, "hit_rate": 0.5}
+
+
+def test_matching_etag_gets_a_304(client, blank_db):
+    _insert_project(blank_db, "Demo")
+    etag = client.get("/projects/Demo").headers["etag"]
+
+    response = client.get("/projects/Demo", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert _stats(client, "projects.detail")["not_modified"] == 1
+
+
+def test_writes_invalidate_the_cached_response(client, blank_db):
+    _insert_project(blank_db, "Demo")
+    before = client.get("/projects/Demo")
+
+    client.put("/projects/Demo/showcase/customization", json={"title": "New"})
+    after = client.get("/projects/Demo", headers={"If-None-Match": before.headers["etag"]})
+
+    assert after.status_code == 200
+    assert after.headers["etag"] != before.headers["etag"]
+    assert after.json()["last_updated"] != before.json()["last_updated"]
+
+
+def test_writes_to_other_projects_keep_the_entry(client, blank_db):
+    _insert_project(blank_db, "Demo")
+    _insert_project(blank_db, "Other")
+    client.get("/projects/Demo")
+
+    client.put("/projects/Other/showcase/customization", json={"title": "New"})
+    client.get("/projects/Demo")
+
+    assert _stats(client, "projects.detail")["hits"] == 1
+
+
+def test_errors_are_not_cached(client, blank_db):
+    assert client.get("/projects/Later").status_code == 404
+
+    _insert_project(blank_db, "Later")
+
+    assert client.get("/projects/Later").status_code == 200
+
+
+def test_skills_are_rebuilt_after_a_project_is_deleted(client, blank_db):
+    _insert_project(blank_db, "Demo")
+    # The first read stores the user totals, which moves the version once
+    client.get("/skills")
+    etag = client.get("/skills").headers["etag"]
+    assert client.get("/skills", headers={"If-None-Match": etag}).status_code == 304
+
+    client.delete("/projects/Demo")
+    client.get("/skills")
+
+    assert _stats(client, "skills") == {
+        "hits": 1, "misses": 3, "not_modified": 1, "hit_rate": 0.25}
@@ -7,6 +7,32 @@ from datetime import datetime, date
 from unittest.mock import patch, MagicMock
 
 
+def _each_project(project):
+    """
+    Stand-in for the bulk project loader: `project` for every requested
+    name, or a `KeyError` like a missing project when it is None.
+    """
+    def load(_session, project_names, **_kwargs):
+        if project is None:
+            raise KeyError(project_names[0])
+        return [project for _ in project_names]
+    return load
+
+
+@pytest.fixture(autouse=True)
+def stored_contributions():
+    """
+    Project loading is mocked in these tests, so the stored contributions
+    the resume router reads alongside the projects are stubbed as well.
+    """
+    from src.core.report.user.user_aggregates import ProjectContribution
+
+    with patch('src.interface.api.routers.resume.get_project_contributions') as mock_contributions:
+        mock_contributions.side_effect = lambda _session, names: [
+            ProjectContribution() for _ in names]
+        yield mock_contributions
+
+
 @pytest.fixture
 def sample_resume_model():
     """Create a sample ResumeModel for testing"""
@@ -148,12 +174,12 @@ def test_generate_resume_basic(client, sample_resume_domain, sample_resume_model
     mock_project = MagicMock()
     mock_project.project_name = "Test Project"
 
-    with patch('src.interface.api.routers.resume.get_project_report_by_name') as mock_get_project, \
+    with patch('src.interface.api.routers.resume.get_project_reports_by_names') as mock_get_project, \
             patch('src.interface.api.routers.resume.get_user_config_safe') as mock_config, \
             patch('src.interface.api.routers.resume.UserReport') as mock_user_report, \
             patch('src.interface.api.routers.resume.save_resume') as mock_save:
 
-        mock_get_project.return_value = mock_project
+        mock_get_project.side_effect = _each_project(mock_project)
         mock_config.return_value = None
 
         mock_report_instance = MagicMock()
@@ -181,8 +207,8 @@ def test_generate_resume_empty_projects(client):
 
 def test_generate_resume_nonexistent_project(client):
     """Test that nonexistent project returns 404"""
-    with patch('src.interface.api.routers.resume.get_project_report_by_name') as mock_get:
-        mock_get.return_value = None
+    with patch('src.interface.api.routers.resume.get_project_reports_by_names') as mock_get:
+        mock_get.side_effect = _each_project(None)
 
         response = client.post("/resume/generate", json={
             "project_names": ["NonexistentProject"]
@@ -214,12 +240,12 @@ def test_generate_resume_with_user_config(client, sample_resume_domain, sample_r
 
     mock_config.resume_config = mock_resume_config
 
-    with patch('src.interface.api.routers.resume.get_project_report_by_name') as mock_get_project, \
+    with patch('src.interface.api.routers.resume.get_project_reports_by_names') as mock_get_project, \
             patch('src.interface.api.routers.resume.UserReport') as mock_user_report, \
             patch('src.interface.api.routers.resume.save_resume') as mock_save, \
             patch('src.interface.api.routers.resume.get_user_config_safe') as mock_get_config:
 
-        mock_get_project.return_value = mock_project
+        mock_get_project.side_effect = _each_project(mock_project)
         mock_get_config.return_value = mock_config
 
         mock_report_instance = MagicMock()
@@ -247,8 +273,8 @@ def test_generate_resume_invalid_user_config(client):
 
     mock_project = MagicMock()
 
-    with patch('src.interface.api.routers.resume.get_project_report_by_name') as mock_get_project:
-        mock_get_project.return_value = mock_project
+    with patch('src.interface.api.routers.resume.get_project_reports_by_names') as mock_get_project:
+        mock_get_project.side_effect = _each_project(mock_project)
 
         mock_session = MagicMock()
         mock_session.get.return_value = None
@@ -273,12 +299,12 @@ def test_generate_resume_multiple_projects(client, sample_resume_domain, sample_
     """Test generating resume from multiple projects"""
     mock_project = MagicMock()
 
-    with patch('src.interface.api.routers.resume.get_project_report_by_name') as mock_get_project, \
+    with patch('src.interface.api.routers.resume.get_project_reports_by_names') as mock_get_project, \
             patch('src.interface.api.routers.resume.get_user_config_safe') as mock_config, \
             patch('src.interface.api.routers.resume.UserReport') as mock_user_report, \
             patch('src.interface.api.routers.resume.save_resume') as mock_save:
 
-        mock_get_project.return_value = mock_project
+        mock_get_project.side_effect = _each_project(mock_project)
         mock_config.return_value = None
 
         mock_report_instance = MagicMock()
@@ -292,7 +318,7 @@ def test_generate_resume_multiple_projects(client, sample_resume_domain, sample_
         })
 
         assert response.status_code == 200
-        assert mock_get_project.call_count == 3
+        mock_get_project.assert_called_once()
 
 
 def test_generate_resume_missing_field(client):
@@ -386,12 +412,12 @@ def test_generate_resume_save_failure(client, sample_resume_domain):
     """Test handling of save failure during generation"""
     mock_project = MagicMock()
 
-    with patch('src.interface.api.routers.resume.get_project_report_by_name') as mock_get_project, \
+    with patch('src.interface.api.routers.resume.get_project_reports_by_names') as mock_get_project, \
             patch('src.interface.api.routers.resume.get_user_config_safe') as mock_config, \
             patch('src.interface.api.routers.resume.UserReport') as mock_user_report, \
             patch('src.interface.api.routers.resume.save_resume') as mock_save:
 
-        mock_get_project.return_value = mock_project
+        mock_get_project.side_effect = _each_project(mock_project)
         mock_config.return_value = None
 
         mock_report_instance = MagicMock()
@@ -699,12 +725,12 @@ def test_generate_resume_with_user_config_no_resume_config(client, sample_resume
     )
     mock_config.resume_config = None
 
-    with patch('src.interface.api.routers.resume.get_project_report_by_name') as mock_get_project, \
+    with patch('src.interface.api.routers.resume.get_project_reports_by_names') as mock_get_project, \
             patch('src.interface.api.routers.resume.UserReport') as mock_user_report, \
             patch('src.interface.api.routers.resume.save_resume') as mock_save, \
             patch('src.interface.api.routers.resume.get_user_config_safe') as mock_get_config:
 
-        mock_get_project.return_value = mock_project
+        mock_get_project.side_effect = _each_project(mock_project)
         mock_get_config.return_value = mock_config
 
         mock_report_instance = MagicMock()
@@ -747,12 +773,12 @@ def test_generate_resume_with_empty_education_awards(client, sample_resume_domai
     )
     mock_config.resume_config = mock_resume_config
 
-    with patch('src.interface.api.routers.resume.get_project_report_by_name') as mock_get_project, \
+    with patch('src.interface.api.routers.resume.get_project_reports_by_names') as mock_get_project, \
             patch('src.interface.api.routers.resume.UserReport') as mock_user_report, \
             patch('src.interface.api.routers.resume.save_resume') as mock_save, \
             patch('src.interface.api.routers.resume.get_user_config_safe') as mock_get_config:
 
-        mock_get_project.return_value = mock_project
+        mock_get_project.side_effect = _each_project(mock_project)
         mock_get_config.return_value = mock_config
 
         mock_report_instance = MagicMock()
@@ -817,11 +843,11 @@ def test_refresh_resume_success(client, blank_db):
         project_name="OldProject",
     ))
 
-    with patch('src.interface.api.routers.resume.get_project_report_by_name') as mock_get_project, \
+    with patch('src.interface.api.routers.resume.get_project_reports_by_names') as mock_get_project, \
             patch('src.interface.api.routers.resume.UserReport') as mock_user_report, \
             patch('src.interface.api.routers.resume._db') as mock_db:
 
-        mock_get_project.return_value = MagicMock()
+        mock_get_project.side_effect = _each_project(MagicMock())
         mock_report_instance = MagicMock()
         mock_report_instance.generate_resume.return_value = refreshed_domain
         mock_user_report.return_value = mock_report_instance
@@ -864,11 +890,11 @@ def test_refresh_resume_no_unique_constraint_error(client, blank_db):
     mock_user_config = UserConfigModel(id=99, consent=True)
     mock_user_config.resume_config = None
 
-    with patch('src.interface.api.routers.resume.get_project_report_by_name') as mock_get_project, \
+    with patch('src.interface.api.routers.resume.get_project_reports_by_names') as mock_get_project, \
             patch('src.interface.api.routers.resume.UserReport') as mock_user_report, \
             patch('src.interface.api.routers.resume._db') as mock_db:
 
-        mock_get_project.return_value = MagicMock()
+        mock_get_project.side_effect = _each_project(MagicMock())
         mock_report_instance = MagicMock()
         mock_report_instance.generate_resume.return_value = refreshed_domain
         mock_user_report.return_value = mock_report_instance
@@ -917,8 +943,8 @@ def test_refresh_resume_project_not_found(client, blank_db):
     """Test refreshing when source project no longer exists"""
     resume_id = _seed_resume(blank_db)
 
-    with patch('src.interface.api.routers.resume.get_project_report_by_name') as mock_get_project:
-        mock_get_project.return_value = None
+    with patch('src.interface.api.routers.resume.get_project_reports_by_names') as mock_get_project:
+        mock_get_project.side_effect = _each_project(None)
 
         response = client.post(f"/resume/{resume_id}/refresh")
 
@@ -938,11 +964,11 @@ def test_refresh_resume_preserves_id(client, blank_db):
         start_date=None, end_date=None, project_name="OldProject",
     ))
 
-    with patch('src.interface.api.routers.resume.get_project_report_by_name') as mock_get_project, \
+    with patch('src.interface.api.routers.resume.get_project_reports_by_names') as mock_get_project, \
             patch('src.interface.api.routers.resume.UserReport') as mock_user_report, \
             patch('src.interface.api.routers.resume._db') as mock_db:
 
-        mock_get_project.return_value = MagicMock()
+        mock_get_project.side_effect = _each_project(MagicMock())
         mock_report_instance = MagicMock()
         mock_report_instance.generate_resume.return_value = refreshed_domain
         mock_user_report.return_value = mock_report_instance
@@ -1020,11 +1046,11 @@ def test_generate_resume_null_dates_succeeds(client, blank_db):
     mock_project = MagicMock()
     mock_project.project_name = "EarthLingo"
 
-    with patch('src.interface.api.routers.resume.get_project_report_by_name') as mock_get_project, \
+    with patch('src.interface.api.routers.resume.get_project_reports_by_names') as mock_get_project, \
             patch('src.interface.api.routers.resume.get_user_config_safe') as mock_config, \
             patch('src.interface.api.routers.resume.UserReport') as mock_user_report:
 
-        mock_get_project.return_value = mock_project
+        mock_get_project.side_effect = _each_project(mock_project)
         mock_config.return_value = None
 
         mock_report_instance = MagicMock()
@@ -6,6 +6,32 @@ from unittest.mock import patch, MagicMock
 import pytest
 
 
+def _each_project(project):
+    """
+    Stand-in for the bulk project loader: `project` for every requested
+    name, or a `KeyError` like a missing project when it is None.
+    """
+    def load(_session, project_names, **_kwargs):
+        if project is None:
+            raise KeyError(project_names[0])
+        return [project for _ in project_names]
+    return load
+
+
+@pytest.fixture(autouse=True)
+def stored_contributions():
+    """
+    Project loading is mocked in these tests, so the stored contributions
+    the resume router reads alongside the projects are stubbed as well.
+    """
+    from src.core.report.user.user_aggregates import ProjectContribution
+
+    with patch('src.interface.api.routers.resume.get_project_contributions') as mock_contributions:
+        mock_contributions.side_effect = lambda _session, names: [
+            ProjectContribution() for _ in names]
+        yield mock_contributions
+
+
 @pytest.fixture
 def sample_resume_model():
     """Create a sample ResumeModel for testing"""
@@ -99,12 +125,12 @@ def test_get_resume_with_skills_by_expertise(client, sample_resume_model):
 
     with patch('src.interface.api.routers.resume.get_resume_model_by_id') as mock_get, \
             patch('src.database.get_most_recent_user_config') as mock_get_config, \
-            patch('src.interface.api.routers.resume.get_project_report_by_name') as mock_load_project, \
+            patch('src.interface.api.routers.resume.get_project_reports_by_names') as mock_load_project, \
             patch('src.interface.api.routers.resume.UserReport') as mock_user_report:
 
         mock_get.return_value = sample_resume_model
         mock_get_config.return_value = mock_user_config
-        mock_load_project.return_value = MagicMock()
+        mock_load_project.side_effect = _each_project(MagicMock())
 
         mock_report_instance = MagicMock()
         mock_stats = MagicMock()
@@ -181,12 +207,12 @@ def test_get_resume_with_only_expert_skills(client, sample_resume_model):
 
     with patch('src.interface.api.routers.resume.get_resume_model_by_id') as mock_get, \
             patch('src.database.get_most_recent_user_config') as mock_get_config, \
-            patch('src.interface.api.routers.resume.get_project_report_by_name') as mock_load_project, \
+            patch('src.interface.api.routers.resume.get_project_reports_by_names') as mock_load_project, \
             patch('src.interface.api.routers.resume.UserReport') as mock_user_report:
 
         mock_get.return_value = sample_resume_model
         mock_get_config.return_value = mock_user_config
-        mock_load_project.return_value = MagicMock()
+        mock_load_project.side_effect = _each_project(MagicMock())
 
         mock_report_instance = MagicMock()
         mock_stats = MagicMock()
@@ -230,12 +256,12 @@ def test_get_resume_with_threshold_boundary_skills(client, sample_resume_model):
 
     with patch('src.interface.api.routers.resume.get_resume_model_by_id') as mock_get, \
             patch('src.database.get_most_recent_user_config') as mock_get_config, \
-            patch('src.interface.api.routers.resume.get_project_report_by_name') as mock_load_project, \
+            patch('src.interface.api.routers.resume.get_project_reports_by_names') as mock_load_project, \
             patch('src.interface.api.routers.resume.UserReport') as mock_user_report:
 
         mock_get.return_value = sample_resume_model
         mock_get_config.return_value = mock_user_config
-        mock_load_project.return_value = MagicMock()
+        mock_load_project.side_effect = _each_project(MagicMock())
 
         mock_report_instance = MagicMock()
         mock_stats = MagicMock()
@@ -392,12 +418,12 @@ def test_generate_resume_snapshots_skills(client, sample_resume_domain, sample_r
     sample_resume_model.skills_intermediate = ["React"]
     sample_resume_model.skills_exposure = ["Rust"]
 
-    with patch('src.interface.api.routers.resume.get_project_report_by_name') as mock_get_project, \
+    with patch('src.interface.api.routers.resume.get_project_reports_by_names') as mock_get_project, \
             patch('src.interface.api.routers.resume.get_user_config_safe') as mock_get_config, \
             patch('src.interface.api.routers.resume.UserReport') as mock_user_report, \
             patch('src.interface.api.routers.resume.save_resume') as mock_save, \
             patch('src.database.get_most_recent_user_config') as mock_get_recent_config:
 
-        mock_get_project.return_value = mock_project
+        mock_get_project.side_effect = _each_project(mock_project)
         mock_get_config.return_value = mock_user_config
         mock_get_recent_config.return_value = mock_user_config
\ No newline at end of file
@@ -13,7 +13,6 @@ def _insert_project(engine, project_name: str = "Demo Project") -> None:
         model = ProjectReportModel(
             project_name=project_name,
             user_config_used=None,
-            image_data=None,
             statistic={"dummy": True},
             created_at=datetime.datetime.now(),
             last_updated=datetime.datetime.now(),
@@ -101,7 +100,7 @@ def test_showcase_merges_overrides_over_defaults(client, blank_db, monkeypatch):
     assert r.json().get("ok") is True
 
     # Mock domain object retrieval so we don't depend on heavy ProjectReport internals
-    def fake_get_project_report_by_name(_session, project_name: str):
+    def fake_get_project_report_by_name(_session, project_name: str, include_file_reports=True):
         assert project_name == "Demo Project"
         fake_resume_item = SimpleNamespace(
             title="Generated Title",
@@ -150,7 +149,7 @@ def test_showcase_returns_500_when_crud_raises(client, monkeypatch):
 def test_showcase_defaults_when_no_overrides(client, blank_db, monkeypatch):
     _insert_project(blank_db, "Demo Project")
 
-    def fake_get_project_report_by_name(_session, project_name: str):
+    def fake_get_project_report_by_name(_session, project_name: str, include_file_reports=True):
         assert project_name == "Demo Project"
         fake_resume_item = SimpleNamespace(
             title="Generated Title",
@@ -190,7 +189,7 @@ def test_showcase_respects_chronology_override(client, blank_db, monkeypatch):
         session.add(m)
         session.commit()
 
-    def fake_get_project_report_by_name(_session, project_name):
+    def fake_get_project_report_by_name(_session, project_name, include_file_reports=True):
         fake_resume_item = SimpleNamespace(
             title="Generated",
             start_date=datetime.date(2025, 1, 1),
@@ -13,7 +13,6 @@ def _insert_project(engine, name: str, created_at: datetime.datetime, selected:
         m = ProjectReportModel(
             project_name=name,
             user_config_used=None,
-            image_data=None,
             statistic={"dummy": True},
             created_at=created_at,
             last_updated=created_at,
@@ -45,7 +44,7 @@ def test_get_selected_showcase_projects_filters_and_sorts(client, blank_db, monk
     _insert_project(blank_db, "B", now + datetime.timedelta(seconds=2), selected=True, rank=0)
     _insert_project(blank_db, "C", now + datetime.timedelta(seconds=3), selected=False, rank=2)
 
-    def fake_get_project_report_by_name(_session, project_name: str):
+    def fake_get_project_report_by_name(_session, project_name: str, include_file_reports=True):
         fake_resume_item = SimpleNamespace(
             title=f"Generated {project_name}",
             start_date=datetime.date(2026, 1, 1),
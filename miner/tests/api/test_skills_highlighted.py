@@ -18,7 +18,6 @@ def _insert_project(engine, project_name: str, highlight_skills: list[str] | Non
         model = ProjectReportModel(
             project_name=project_name,
             user_config_used=None,
-            image_data=None,
             statistic={"dummy": True},
             created_at=now,
             last_updated=now,
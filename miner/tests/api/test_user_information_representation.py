@@ -14,7 +14,6 @@ def _insert_project(engine, project_name: str, created_at: datetime.datetime) ->
         model = ProjectReportModel(
             project_name=project_name,
             user_config_used=None,
-            image_data=None,
             statistic={"dummy": True},
             created_at=created_at,
             last_updated=created_at,
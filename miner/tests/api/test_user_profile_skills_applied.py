@@ -15,6 +15,32 @@ import pytest
 # Fixtures
 # ---------------------------------------------------------------------------
 
+def _each_project(project):
+    """
+    Stand-in for the bulk project loader: `project` for every requested
+    name, or a `KeyError` like a missing project when it is None.
+    """
+    def load(_session, project_names, **_kwargs):
+        if project is None:
+            raise KeyError(project_names[0])
+        return [project for _ in project_names]
+    return load
+
+
+@pytest.fixture(autouse=True)
+def stored_contributions():
+    """
+    Project loading is mocked in these tests, so the stored contributions
+    the resume router reads alongside the projects are stubbed as well.
+    """
+    from src.core.report.user.user_aggregates import ProjectContribution
+
+    with patch("src.interface.api.routers.resume.get_project_contributions") as mock_contributions:
+        mock_contributions.side_effect = lambda _session, names: [
+            ProjectContribution() for _ in names]
+        yield mock_contributions
+
+
 @pytest.fixture
 def bare_resume_model():
     """A ResumeModel with no detected skills."""
@@ -175,12 +201,12 @@ class TestGenerateResumeAppliesProfileSkills:
         should all appear in the generated resume's skill buckets."""
         mock_domain = MagicMock()
 
-        with patch("src.interface.api.routers.resume.get_project_report_by_name") as mock_proj, \
+        with patch("src.interface.api.routers.resume.get_project_reports_by_names") as mock_proj, \
              patch("src.interface.api.routers.resume.get_user_config_safe") as mock_cfg, \
              patch("src.interface.api.routers.resume.UserReport") as mock_report_cls, \
              patch("src.interface.api.routers.resume.save_resume") as mock_save:
 
-            mock_proj.return_value = MagicMock()
+            mock_proj.side_effect = _each_project(MagicMock())
             mock_cfg.return_value = user_config_with_skills
             mock_report_cls.return_value.generate_resume.return_value = mock_domain
             mock_save.return_value = bare_resume_model
@@ -202,12 +228,12 @@ class TestGenerateResumeAppliesProfileSkills:
         """Detected skills (React, Bash) not in profile should survive alongside profile skills."""
         mock_domain = MagicMock()
 
-        with patch("src.interface.api.routers.resume.get_project_report_by_name") as mock_proj, \
+        with patch("src.interface.api.routers.resume.get_project_reports_by_names") as mock_proj, \
              patch("src.interface.api.routers.resume.get_user_config_safe") as mock_cfg, \
              patch("src.interface.api.routers.resume.UserReport") as mock_report_cls, \
              patch("src.interface.api.routers.resume.save_resume") as mock_save:
 
-            mock_proj.return_value = MagicMock()
+            mock_proj.side_effect = _each_project(MagicMock())
             mock_cfg.return_value = user_config_with_skills
             mock_report_cls.return_value.generate_resume.return_value = mock_domain
             mock_save.return_value = resume_model_with_detected
@@ -231,12 +257,12 @@ class TestGenerateResumeAppliesProfileSkills:
         """When the user has no profile skills, detected skills are untouched."""
         mock_domain = MagicMock()
 
-        with patch("src.interface.api.routers.resume.get_project_report_by_name") as mock_proj, \
+        with patch("src.interface.api.routers.resume.get_project_reports_by_names") as mock_proj, \
              patch("src.interface.api.routers.resume.get_user_config_safe") as mock_cfg, \
              patch("src.interface.api.routers.resume.UserReport") as mock_report_cls, \
              patch("src.interface.api.routers.resume.save_resume") as mock_save:
 
-            mock_proj.return_value = MagicMock()
+            mock_proj.side_effect = _each_project(MagicMock())
             mock_cfg.return_value = user_config_no_skills
             mock_report_cls.return_value.generate_resume.return_value = mock_domain
             mock_save.return_value = resume_model_with_detected
@@ -256,12 +282,12 @@ class TestGenerateResumeAppliesProfileSkills:
         """Python is detected as Expert; profile says Expert too — only one Python in Expert."""
         mock_domain = MagicMock()
 
-        with patch("src.interface.api.routers.resume.get_project_report_by_name") as mock_proj, \
+        with patch("src.interface.api.routers.resume.get_project_reports_by_names") as mock_proj, \
              patch("src.interface.api.routers.resume.get_user_config_safe") as mock_cfg, \
              patch("src.interface.api.routers.resume.UserReport") as mock_report_cls, \
              patch("src.interface.api.routers.resume.save_resume") as mock_save:
 
-            mock_proj.return_value = MagicMock()
+            mock_proj.side_effect = _each_project(MagicMock())
             mock_cfg.return_value = user_config_with_skills
             mock_report_cls.return_value.generate_resume.return_value = mock_domain
             mock_save.return_value = resume_model_with_detected
@@ -337,11 +363,11 @@ class TestRefreshResumeAppliesProfileSkills:
         # Domain has no detected skills; profile skills should be the only ones present
         domain = self._make_domain()
 
-        with patch("src.interface.api.routers.resume.get_project_report_by_name") as mock_proj, \
+        with patch("src.interface.api.routers.resume.get_project_reports_by_names") as mock_proj, \
              patch("src.interface.api.routers.resume.UserReport") as mock_report_cls, \
              patch("src.interface.api.routers.resume._db") as mock_db:
 
-            mock_proj.return_value = MagicMock()
+            mock_proj.side_effect = _each_project(MagicMock())
             mock_report_cls.return_value.generate_resume.return_value = domain
             mock_db.get_most_recent_user_config.return_value = user_config_with_skills
 
@@ -367,11 +393,11 @@ class TestRefreshResumeAppliesProfileSkills:
             skills_exposure=["Bash"],
         )
 
-        with patch("src.interface.api.routers.resume.get_project_report_by_name") as mock_proj, \
+        with patch("src.interface.api.routers.resume.get_project_reports_by_names") as mock_proj, \
              patch("src.interface.api.routers.resume.UserReport") as mock_report_cls, \
              patch("src.interface.api.routers.resume._db") as mock_db:
 
-            mock_proj.return_value = MagicMock()
+            mock_proj.side_effect = _each_project(MagicMock())
             mock_report_cls.return_value.generate_resume.return_value = domain
             mock_db.get_most_recent_user_config.return_value = user_config_no_skills
 
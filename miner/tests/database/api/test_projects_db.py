@@ -3,11 +3,27 @@ Tests CRUD for the ProjectReport object
 """
 
 import datetime
-from sqlmodel import Session
-from src.database.api.CRUD.projects import get_project_report_by_name, save_project_report
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session, select
+from src.database.api.CRUD.projects import (
+    _add_to_lineage,
+    _get_latest_related_project_model,
+    delete_project_report_by_name,
+    get_latest_related_project_report,
+    get_project_report_by_name,
+    get_project_report_models_by_names,
+    get_project_reports_by_names,
+    save_project_report,
+)
+from src.database.api.CRUD.images import save_project_image
+from src.database.api.models import InsightMessageModel, ProjectLineageModel, ProjectReportModel
 from src.database.api.CRUD.insights import get_project_insights, save_project_insights
+from src.core.insight import ProjectInsight
 from src.core.report import FileReport, ProjectReport
-from src.core.statistic import FileStatCollection, StatisticIndex, Statistic
+from src.core.statistic import FileStatCollection, ProjectStatCollection, StatisticIndex, Statistic
 from src.core.statistic.statistic_models import FileDomain
 
 
@@ -128,7 +144,7 @@ def test_reupload_unchanged_files_still_updates_in_place(temp_db):
 def test_save_project_report_clears_cached_insights_on_update(temp_db):
     """Re-analyzing a project must delete its cached insights."""
     with Session(temp_db) as session:
-        save_project_insights(session, "Project1", ["Old insight."])
+        save_project_insights(session, "Project1", [ProjectInsight("Old insight.")])
         session.commit()
 
         assert get_project_insights(session, "Project1") is not None
@@ -141,12 +157,13 @@ def test_save_project_report_clears_cached_insights_on_update(temp_db):
         session.commit()
 
         assert get_project_insights(session, "Project1") is None
+        assert session.exec(select(InsightMessageModel)).all() == []
 
 
 def test_save_project_report_does_not_clear_insights_for_other_projects(temp_db):
     """Updating one project must not touch another project's cached insights."""
     with Session(temp_db) as session:
-        save_project_insights(session, "Project2", ["Project2 insight."])
+        save_project_insights(session, "Project2", [ProjectInsight("Project2 insight.")])
         session.commit()
 
         new_report = ProjectReport(
@@ -172,3 +189,150 @@ def test_save_project_report_new_project_initializes_analysis_fields(temp_db):
         assert saved_model.project_name == "BrandNewProject"
         assert saved_model.analyzed_count == 1
         assert saved_model.parent is None
+
+
+def _save_new(session: Session, project_name: str):
+    report = ProjectReport(
+        file_reports=[_build_file_report(project_name, "main.py")],
+        project_name=project_name
+    )
+    return save_project_report(session, report, 0)
+
+
+def test_related_lookup_does_not_match_shared_prefix(temp_db):
+    """The base "api" must not pick up an unrelated project called "api_gateway"."""
+    with Session(temp_db) as session:
+        _save_new(session, "api")
+        _save_new(session, "api_gateway")
+        session.commit()
+
+        assert _get_latest_related_project_model(session, "api").project_name == "api"
+        assert _get_latest_related_project_model(
+            session, "api_gateway").project_name == "api_gateway"
+        assert get_latest_related_project_report(session, "ap") is None
+
+
+def test_related_lookup_returns_chain_head(temp_db):
+    with Session(temp_db) as session:
+        version_2 = ProjectReportModel(
+            project_name="Project1_2", statistic={}, analyzed_count=2, parent="Project1")
+        session.add(version_2)
+        _add_to_lineage(session, "Project1", version_2)
+        session.commit()
+
+        assert _get_latest_related_project_model(
+            session, "Project1").project_name == "Project1_2"
+        heads = session.exec(
+            select(ProjectLineageModel).where(ProjectLineageModel.is_head == True)  # noqa: E712
+        ).all()
+        assert sorted(h.project_name for h in heads) == ["Project1_2", "Project2"]
+
+
+def test_deleting_head_promotes_previous_version(temp_db):
+    with Session(temp_db) as session:
+        version_2 = ProjectReportModel(
+            project_name="Project1_2", statistic={}, analyzed_count=2, parent="Project1")
+        session.add(version_2)
+        _add_to_lineage(session, "Project1", version_2)
+        session.commit()
+
+        assert delete_project_report_by_name(session, "Project1_2")
+        session.commit()
+
+        assert _get_latest_related_project_model(
+            session, "Project1").project_name == "Project1"
+
+
+def test_get_project_without_file_reports(temp_db):
+    with Session(temp_db) as session:
+        full = get_project_report_by_name(session, "Project1")
+        light = get_project_report_by_name(
+            session, "Project1", include_file_reports=False)
+
+        assert light.file_reports == []
+        assert light.project_statistics.to_dict() == full.project_statistics.to_dict()
+
+
+@contextmanager
+def _count_queries(engine):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def _save_projects(engine, count: int) -> list[str]:
+    names = [f"Bulk{i}" for i in range(count)]
+    with Session(engine) as session:
+        for name in names:
+            files = [
+                FileReport(
+                    StatisticIndex([
+                        Statistic(FileStatCollection.LINES_IN_FILE.value, 10),
+                        Statistic(FileStatCollection.TYPE_OF_FILE.value, FileDomain.CODE),
+                    ]),
+                    f"file{j}.py",
+                    is_info_file=False,
+                    file_hash=b"",
+                    project_name=name,
+                )
+                for j in range(3)
+            ]
+            save_project_report(
+                session, ProjectReport(file_reports=files, project_name=name), 0)
+        session.commit()
+    return names
+
+
+@pytest.mark.parametrize("include_file_reports, expected_queries", [(True, 2), (False, 1)])
+def test_bulk_load_uses_constant_number_of_queries(temp_db, include_file_reports, expected_queries):
+    names = _save_projects(temp_db, 8)
+
+    for count in (2, 8):
+        with Session(temp_db) as session, _count_queries(temp_db) as statements:
+            reports = get_project_reports_by_names(
+                session, names[:count], include_file_reports=include_file_reports)
+            for report in reports:
+                report.get_value(ProjectStatCollection.PROJECT_START_DATE.value)
+
+        assert len(statements) == expected_queries
+        assert [r.project_name for r in reports] == names[:count]
+        assert all(len(r.file_reports) == (3 if include_file_reports else 0)
+                   for r in reports)
+
+
+def test_bulk_load_can_include_images_in_one_query(temp_db):
+    names = _save_projects(temp_db, 4)
+    with Session(temp_db) as session:
+        for i, name in enumerate(names):
+            save_project_image(
+                session, session.get(ProjectReportModel, name), f"image {i}".encode(), "image/png")
+        session.commit()
+
+    with Session(temp_db) as session, _count_queries(temp_db) as statements:
+        models = get_project_report_models_by_names(
+            session, names, include_file_reports=False, include_images=True)
+        images = [model.image.data for model in models]
+
+    assert len(statements) == 2
+    assert images == [f"image {i}".encode() for i in range(4)]
+
+
+def test_bulk_load_selected_statistics_and_missing_projects(temp_db):
+    with Session(temp_db) as session:
+        start = ProjectStatCollection.PROJECT_START_DATE.value
+        [report] = get_project_reports_by_names(
+            session, ["Project1"], include_file_reports=False,
+            statistic_keys=[start.name])
+
+        assert report.get_value(start) is not None
+        assert list(report.project_statistics.to_dict()) == [start.name]
+
+        with pytest.raises(KeyError, match="NoSuchProject"):
+            get_project_reports_by_names(session, ["Project1", "NoSuchProject"])
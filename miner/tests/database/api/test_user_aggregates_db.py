@@ -0,0 +1,172 @@
+"""
+Tests for the stored user-level aggregates in
+`src/database/api/CRUD/user_aggregates.py`, and for keeping them up to
+date through the project CRUD functions.
+"""
+import datetime
+
+import pytest
+from pytest import approx
+from sqlmodel import Session, delete, select
+
+from src.core.report import FileReport, ProjectReport
+from src.core.statistic import (
+    FileStatCollection,
+    ProjectStatCollection,
+    Statistic,
+    StatisticIndex,
+    WeightedSkills,
+)
+from src.database.api.CRUD.projects import (
+    delete_project_report_by_name,
+    save_project_report,
+    soft_delete_project_report_by_name,
+)
+from src.database.api.CRUD.user_aggregates import (
+    get_project_contributions,
+    get_user_aggregates,
+    rebuild_user_aggregates,
+)
+from src.database.api.models import ProjectContributionModel, UserAggregateModel
+
+
+def _project(name: str, skills: dict[str, float], start: datetime.datetime,
+             end: datetime.datetime) -> ProjectReport:
+    """A project with a weight of 0.5 (250 lines, no date range weight)."""
+    fr = FileReport(
+        StatisticIndex([
+            Statistic(FileStatCollection.LINES_IN_FILE.value, 250),
+            Statistic(FileStatCollection.FILE_SIZE_BYTES.value, 1000),
+        ]),
+        "main.py",
+        is_info_file=False,
+        file_hash=b"abc",
+        project_name=name,
+    )
+    return ProjectReport(
+        file_reports=[fr],
+        project_name=name,
+        statistics=StatisticIndex([
+            Statistic(ProjectStatCollection.PROJECT_SKILLS_DEMONSTRATED.value,
+                      [WeightedSkills(skill_name=s, weight=w) for s, w in skills.items()]),
+            Statistic(ProjectStatCollection.PROJECT_START_DATE.value, start),
+            Statistic(ProjectStatCollection.PROJECT_END_DATE.value, end),
+        ]),
+    )
+
+
+def _save(engine, *projects: ProjectReport) -> None:
+    with Session(engine) as session:
+        for project in projects:
+            save_project_report(session, project, None)
+        session.commit()
+
+
+def _read(engine):
+    with Session(engine) as session:
+        return get_user_aggregates(session)
+
+
+def _rebuilt(engine):
+    with Session(engine) as session:
+        return rebuild_user_aggregates(session)
+
+
+A = _project("A", {"Python": 1.0}, datetime.datetime(2024, 1, 1), datetime.datetime(2024, 1, 1))
+B = _project("B", {"Python": 0.5, "Go": 1.0},
+             datetime.datetime(2023, 1, 1), datetime.datetime(2023, 1, 1))
+C = _project("C", {"Rust": 2.0}, datetime.datetime(2025, 1, 1), datetime.datetime(2025, 1, 1))
+
+
+@pytest.fixture
+def db(blank_db):
+    _save(blank_db, A, B)
+    # The first read builds the totals, later saves keep them up to date
+    _read(blank_db)
+    return blank_db
+
+
+def test_totals_are_built_on_first_read(db):
+    aggregates = _read(db)
+
+    assert aggregates.skill_weights == approx({"Python": 0.75, "Go": 0.5})
+    assert aggregates.start_date == datetime.datetime(2023, 1, 1)
+    assert aggregates.end_date == datetime.datetime(2024, 1, 1)
+    with Session(db) as session:
+        assert session.exec(select(UserAggregateModel)).one().project_count == 2
+
+
+def test_first_read_saves_the_totals_without_committing_the_callers_session(blank_db):
+    _save(blank_db, A)
+
+    with Session(blank_db) as session:
+        get_user_aggregates(session)
+        assert not session.new and not session.dirty
+        session.rollback()
+
+    with Session(blank_db) as session:
+        assert session.exec(select(UserAggregateModel)).one().project_count == 1
+
+
+def test_saving_a_project_adds_to_the_totals(db):
+    _save(db, C)
+
+    aggregates = _read(db)
+    assert aggregates.skill_weights == approx({"Python": 0.75, "Go": 0.5, "Rust": 1.0})
+    assert aggregates.end_date == datetime.datetime(2025, 1, 1)
+    assert aggregates == _rebuilt(db)
+
+
+def test_resaving_a_project_replaces_its_contribution(db):
+    _save(db, _project("A", {"Java": 1.0}, datetime.datetime(2024, 1, 1),
+                       datetime.datetime(2024, 1, 1)))
+
+    aggregates = _read(db)
+    assert aggregates.skill_weights == approx({"Python": 0.25, "Go": 0.5, "Java": 0.5})
+    assert aggregates == _rebuilt(db)
+
+
+def test_soft_delete_and_resurrection(db):
+    with Session(db) as session:
+        soft_delete_project_report_by_name(session, "B")
+        # A second soft-delete must not take B out twice
+        soft_delete_project_report_by_name(session, "B")
+        session.commit()
+
+    aggregates = _read(db)
+    assert aggregates.skill_weights == approx({"Python": 0.5})
+    assert aggregates.start_date == datetime.datetime(2024, 1, 1)
+    assert aggregates == _rebuilt(db)
+
+    _save(db, B)
+    assert _read(db).skill_weights == approx({"Python": 0.75, "Go": 0.5})
+
+
+def test_delete_removes_the_contribution(db):
+    with Session(db) as session:
+        delete_project_report_by_name(session, "A")
+        session.commit()
+
+    aggregates = _read(db)
+    assert aggregates.skill_weights == approx({"Python": 0.25, "Go": 0.5})
+    assert aggregates.end_date == datetime.datetime(2023, 1, 1)
+    with Session(db) as session:
+        assert session.get(ProjectContributionModel, "A") is None
+        assert session.exec(select(UserAggregateModel)).one().project_count == 1
+
+
+def test_missing_contributions_are_computed_from_the_project(db):
+    with Session(db) as session:
+        session.exec(delete(ProjectContributionModel))
+        session.commit()
+
+    with Session(db) as session:
+        contributions = get_project_contributions(session, ["B", "A"])
+        session.commit()
+
+    assert [c.skill_weights for c in contributions] == [
+        approx({"Python": 0.25, "Go": 0.5}), approx({"Python": 0.5})]
+    with Session(db) as session:
+        assert session.get(ProjectContributionModel, "A") is not None
+        with pytest.raises(KeyError, match="Missing"):
+            get_project_contributions(session, ["A", "Missing"])
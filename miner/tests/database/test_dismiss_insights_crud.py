@@ -24,7 +24,6 @@ def _insert_project(engine, name: str) -> None:
         session.add(ProjectReportModel(
             project_name=name,
             user_config_used=None,
-            image_data=None,
             statistic={},
             created_at=datetime.datetime.now(),
             last_updated=datetime.datetime.now(),
@@ -0,0 +1,42 @@
+"""
+Tests for the SQLite performance profile applied by `create_sqlite_engine`.
+"""
+
+from sqlalchemy import text
+
+from src.database.core.base import create_sqlite_engine
+
+
+def _pragma(engine, name: str):
+    with engine.connect() as connection:
+        return connection.execute(text(f"PRAGMA {name}")).scalar()
+
+
+def test_profile_is_applied_to_every_connection(tmp_path):
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'data.db'}")
+
+    assert _pragma(engine, "journal_mode") == "wal"
+    assert _pragma(engine, "synchronous") == 1  # NORMAL
+    assert _pragma(engine, "busy_timeout") == 5000
+    assert _pragma(engine, "temp_store") == 2  # MEMORY
+    assert _pragma(engine, "cache_size") == -64 * 1024
+
+    # A second, concurrently checked out connection gets the profile too
+    with engine.connect() as first, engine.connect() as second:
+        assert first.execute(text("PRAGMA synchronous")).scalar() == 1
+        assert second.execute(text("PRAGMA synchronous")).scalar() == 1
+
+
+def test_profile_can_be_overridden(tmp_path, monkeypatch):
+    monkeypatch.setenv("ARTIFACT_MINER_SQLITE_BUSY_TIMEOUT", "250")
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'data.db'}")
+
+    assert _pragma(engine, "busy_timeout") == 250
+
+
+def test_profile_can_be_disabled(tmp_path, monkeypatch):
+    monkeypatch.setenv("ARTIFACT_MINER_SQLITE_PROFILE", "0")
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'data.db'}")
+
+    assert _pragma(engine, "journal_mode") == "delete"
+    assert _pragma(engine, "synchronous") == 2  # FULL
@@ -0,0 +1,69 @@
+"""
+Tests for the version counters that session commits bump in
+`src/database/core/entity_versions.py`.
+"""
+
+import datetime
+
+from sqlmodel import Session, delete
+
+from src.database.api.models import FileReportModel, ProjectReportModel, UserConfigModel
+from src.database.core.entity_versions import PROJECT, USER_CONFIG, versions_of
+
+
+def _project(name: str) -> ProjectReportModel:
+    return ProjectReportModel(
+        project_name=name,
+        statistic={},
+        created_at=datetime.datetime.now(),
+        last_updated=datetime.datetime.now(),
+    )
+
+
+def test_commit_bumps_the_written_entity_and_its_kind(blank_db):
+    demo, other = (PROJECT, "Demo"), (PROJECT, "Other")
+    before = versions_of([demo, other, PROJECT, USER_CONFIG])
+
+    with Session(blank_db) as session:
+        session.add(_project("Demo"))
+        session.commit()
+
+    demo_v, other_v, kind_v, config_v = (
+        versions_of([demo]), versions_of([other]), versions_of([PROJECT]), versions_of([USER_CONFIG]))
+    assert demo_v != before[0:2]
+    assert other_v == before[2:4]
+    assert kind_v[0] > before[4]
+    assert config_v[0] == before[5]
+
+
+def test_rolled_back_writes_do_not_bump(blank_db):
+    before = versions_of([(PROJECT, "Demo"), PROJECT])
+
+    with Session(blank_db) as session:
+        session.add(_project("Demo"))
+        session.flush()
+        session.rollback()
+
+    assert versions_of([(PROJECT, "Demo"), PROJECT]) == before
+
+
+def test_bulk_statements_bump_every_entity_of_their_kind(blank_db):
+    before = versions_of([(PROJECT, "Anything")])
+
+    with Session(blank_db) as session:
+        session.exec(delete(FileReportModel))
+        session.commit()
+
+    assert versions_of([(PROJECT, "Anything")]) != before
+
+
+def test_kind_wide_rows_only_bump_the_kind(blank_db):
+    before = versions_of([USER_CONFIG, (PROJECT, "Demo")])
+
+    with Session(blank_db) as session:
+        session.add(UserConfigModel(consent=True, user_email="a@b.c"))
+        session.commit()
+
+    after = versions_of([USER_CONFIG, (PROJECT, "Demo")])
+    assert after[0] > before[0]
+    assert after[1:] == before[1:]
@@ -0,0 +1,180 @@
+"""
+Tests for the Alembic migrations applied by `upgrade_database`.
+"""
+
+from alembic.autogenerate import compare_metadata
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import inspect, text
+from sqlmodel import SQLModel, create_engine
+
+import src.database.api.models  # noqa: F401
+from src.database.core.migrations import current_revision, upgrade_database
+
+
+def _engine(tmp_path):
+    return create_engine(f"sqlite:///{tmp_path / 'data.db'}")
+
+
+def _index_names(engine, table: str) -> set[str]:
+    return {index["name"] for index in inspect(engine).get_indexes(table)}
+
+
+def test_fresh_database_matches_models(tmp_path):
+    engine = _engine(tmp_path)
+
+    upgrade_database(engine)
+
+    assert current_revision(engine) == "0010"
+    with engine.connect() as connection:
+        assert compare_metadata(MigrationContext.configure(connection), SQLModel.metadata) == []
+
+
+def test_lookup_columns_are_indexed(tmp_path):
+    engine = _engine(tmp_path)
+    upgrade_database(engine)
+
+    assert {
+        "ix_filereportmodel_file_hash",
+        "ix_filereportmodel_file_path",
+        "ix_filereportmodel_project_name",
+    } <= _index_names(engine, "filereportmodel")
+    assert "ix_projectreportmodel_is_deleted" in _index_names(engine, "projectreportmodel")
+    assert "ix_dismissedinsightmodel_project_name_message" in _index_names(
+        engine, "dismissedinsightmodel")
+
+
+def test_default_project_order_is_indexed(tmp_path):
+    engine = _engine(tmp_path)
+    upgrade_database(engine)
+
+    with engine.connect() as connection:
+        plan = connection.execute(text(
+            "EXPLAIN QUERY PLAN SELECT project_name FROM projectreportmodel "
+            "ORDER BY CAST(representation_rank IS NULL AS INTEGER), representation_rank, "
+            "created_at, project_name")).all()
+
+    assert "ix_projectreportmodel_rank_order" in plan[0][-1]
+
+
+def test_upgrade_is_idempotent(tmp_path):
+    engine = _engine(tmp_path)
+
+    upgrade_database(engine)
+    upgrade_database(engine)
+
+    assert current_revision(engine) == "0010"
+
+
+def test_unversioned_legacy_database_is_adopted(tmp_path):
+    engine = _engine(tmp_path)
+    SQLModel.metadata.create_all(engine)
+
+    # Recreate what an old database looks like: no index, missing columns.
+    with engine.begin() as connection:
+        connection.execute(text("DROP INDEX ix_filereportmodel_file_hash"))
+        connection.execute(text("DROP INDEX ix_projectreportmodel_is_deleted"))
+        connection.execute(text("ALTER TABLE projectreportmodel DROP COLUMN is_deleted"))
+        connection.execute(text("ALTER TABLE resumemodel DROP COLUMN title"))
+        connection.execute(text(
+            "INSERT INTO projectreportmodel (project_name, statistic, created_at, last_updated,"
+            " analyzed_count, showcase_selected) VALUES ('kept', '{}', '2025-01-01',"
+            " '2025-01-01', 1, 0)"
+        ))
+
+    assert current_revision(engine) is None
+
+    upgrade_database(engine)
+
+    assert current_revision(engine) == "0010"
+    assert "ix_filereportmodel_file_hash" in _index_names(engine, "filereportmodel")
+    columns = {col["name"] for col in inspect(engine).get_columns("resumemodel")}
+    assert "title" in columns
+    with engine.connect() as connection:
+        rows = connection.execute(
+            text("SELECT project_name, is_deleted FROM projectreportmodel")).all()
+    assert rows == [("kept", 0)]
+
+
+def test_lineage_is_backfilled_from_parent_chains(tmp_path):
+    engine = _engine(tmp_path)
+    upgrade_database(engine, "0003")
+
+    with engine.begin() as connection:
+        for name, parent, count, created in [
+            ("api", None, 1, "2025-01-01"),
+            ("api_2", "api", 2, "2025-02-01"),
+            ("api_gateway", None, 1, "2025-03-01"),
+        ]:
+            connection.execute(text(
+                "INSERT INTO projectreportmodel (project_name, parent, statistic, created_at,"
+                " last_updated, analyzed_count, showcase_selected, is_deleted)"
+                " VALUES (:name, :parent, '{}', :created, :created, :count, 0, 0)"
+            ), {"name": name, "parent": parent, "created": created, "count": count})
+
+    upgrade_database(engine)
+
+    with engine.connect() as connection:
+        rows = connection.execute(text(
+            "SELECT project_name, base_name, version, is_head FROM projectlineagemodel"
+            " ORDER BY project_name"
+        )).all()
+    assert rows == [
+        ("api", "api", 1, 0),
+        ("api_2", "api", 2, 1),
+        ("api_gateway", "api_gateway", 1, 1),
+    ]
+
+
+def test_file_report_columns_are_backfilled_from_statistics(tmp_path):
+    engine = _engine(tmp_path)
+    upgrade_database(engine, "0007")
+
+    with engine.begin() as connection:
+        connection.execute(text(
+            "INSERT INTO projectreportmodel (project_name, statistic, created_at, last_updated,"
+            " analyzed_count, showcase_selected, is_deleted) VALUES ('p', '{}', '2025-01-01',"
+            " '2025-01-01', 1, 0, 0)"
+        ))
+        connection.execute(text(
+            "INSERT INTO filereportmodel (project_name, file_path, is_info_file, statistic,"
+            " created_at) VALUES ('p', 'a.py', 0, :statistic, '2025-01-01')"
+        ), {"statistic": '{"CODING_LANGUAGE": {"__type__": "enum", "class": "CodingLanguage",'
+                         ' "value": "Python"}, "TYPE_OF_FILE": {"__type__": "enum", "class":'
+                         ' "FileDomain", "value": "code"}, "FILE_SIZE_BYTES": 120,'
+                         ' "LINES_IN_FILE": 12, "PERCENTAGE_LINES_COMMITTED": 50.0}'})
+
+    upgrade_database(engine)
+
+    with engine.connect() as connection:
+        row = connection.execute(text(
+            "SELECT coding_language, file_type, size_bytes, line_count,"
+            " percentage_lines_committed FROM filereportmodel"
+        )).one()
+    assert tuple(row) == ("Python", "code", 120, 12, 50.0)
+    assert "ix_filereportmodel_project_name_size_bytes" in _index_names(
+        engine, "filereportmodel")
+
+
+def test_insights_cached_without_sources_are_dropped(tmp_path):
+    engine = _engine(tmp_path)
+    upgrade_database(engine, "0008")
+
+    with engine.begin() as connection:
+        connection.execute(text(
+            "INSERT INTO projectreportmodel (project_name, statistic, created_at, last_updated,"
+            " analyzed_count, showcase_selected, is_deleted) VALUES ('p', '{}', '2025-01-01',"
+            " '2025-01-01', 1, 0, 0)"
+        ))
+        connection.execute(text(
+            "INSERT INTO projectinsightsmodel (project_name, insights, generated_at)"
+            " VALUES ('p', '[\"Old insight\"]', '2025-01-01')"
+        ))
+
+    upgrade_database(engine)
+
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT * FROM projectinsightsmodel")).all() == []
+    columns = {col["name"] for col in inspect(engine).get_columns("projectinsightsmodel")}
+    assert "insights" not in columns
+    assert "ix_insightmessagemodel_project_name_position" in _index_names(
+        engine, "insightmessagemodel")
@@ -562,6 +562,20 @@ def test_insight_generator_runs_all_calculators_by_default():
     assert all(isinstance(i, ProjectInsight) for i in insights)
 
 
+def test_insight_generator_records_source_and_ml_use():
+    report = _mock_report({
+        ProjectStatCollection.PROJECT_SKILLS_DEMONSTRATED.value: [
+            WeightedSkills(skill_name="Python", weight=1.0)
+        ],
+        ProjectStatCollection.WORK_PATTERN.value: "consistent",
+    })
+    insights = InsightGenerator.generate(report)
+    assert [(i.source, i.uses_ml) for i in insights] == [
+        ("SkillsInsightCalculator", False),
+        ("WorkPatternInsightCalculator", True),
+    ]
+
+
 def test_insight_generator_with_specific_calculators():
     report = _mock_report({
         ProjectStatCollection.WORK_PATTERN.value: "sprint-based",
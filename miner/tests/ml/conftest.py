@@ -1,6 +1,11 @@
 import pytest
 import os
+import json
+import threading
+import time
+from collections import deque
 from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 from src.core.ML.models.contribution_analysis.commit_classifier import CommitClassifier
 from src.core.ML.models.contribution_analysis.pattern_detector import (
@@ -9,6 +14,8 @@ from src.core.ML.models.contribution_analysis.pattern_detector import (
 from src.core.ML.models.contribution_analysis.role_analyzer import (
     RoleAnalyzer,
 )
+from src.core.ML.models import azure_openai_runtime
+from src.core.ML.models.llm_cache import reset_llm_cache
 
 # NOTE: Anything inside the tests/ml folder will not run with the pytest command
 # if you wish to run it, set env "RUN_ML_TESTS" variable to 1
@@ -54,3 +61,89 @@ def user_email():
 def contribution_patterns_calculator():
     from src.core.report.project.project_statistics import ProjectContributionPatterns
     return ProjectContributionPatterns()
+
+
+def _completion_body(content: str) -> dict:
+    return {"choices": [{"message": {"content": content}}]}
+
+
+class StubAzure:
+    """
+    Queue of scripted responses plus a record of what the server saw.
+    Each response is `(status, headers, body_dict)`. When the queue is
+    empty every request gets a successful completion.
+    """
+
+    def __init__(self):
+        self.responses: deque = deque()
+        self.client_ports: list[int] = []
+        self.delay = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+
+@pytest.fixture
+def stub_azure(monkeypatch, tmp_path):
+    """
+    Runs a local HTTP server that speaks the Azure chat completions API and
+    points the runtime at it. The response cache is disabled unless a test
+    turns it back on.
+    """
+    stub = StubAzure()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *_args):
+            pass
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            self.rfile.read(length)
+
+            with stub.lock:
+                stub.client_ports.append(self.client_address[1])
+                stub.in_flight += 1
+                stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                scripted = stub.responses.popleft() if stub.responses else None
+
+            if stub.delay:
+                time.sleep(stub.delay)
+
+            status, headers, body = scripted or (
+                200, {}, _completion_body('{"answer": "ok"}'))
+            raw = json.dumps(body).encode("utf-8")
+
+            with stub.lock:
+                stub.in_flight -= 1
+
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(raw)))
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(raw)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    monkeypatch.setenv("ARTIFACT_MINER_ML_PROVIDER", "azure_openai")
+    monkeypatch.setenv("AZURE_OPENAI_ENDPOINT", f"http://127.0.0.1:{server.server_port}")
+    monkeypatch.setenv("AZURE_OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("AZURE_OPENAI_API_VERSION", "2024-08-01-preview")
+    monkeypatch.setenv("AZURE_OPENAI_DEPLOYMENT", "stub")
+    monkeypatch.setenv("ARTIFACT_MINER_AZURE_REQUESTS_PER_SECOND", "1000")
+    monkeypatch.setenv("ARTIFACT_MINER_LLM_CACHE_PATH", str(tmp_path / "llm_cache.db"))
+    monkeypatch.setenv("ARTIFACT_MINER_LLM_CACHE_DISABLE", "1")
+    azure_openai_runtime.reset_azure_runtime()
+    reset_llm_cache()
+
+    yield stub
+
+    azure_openai_runtime.reset_azure_runtime()
+    reset_llm_cache()
+    server.shutdown()
+    server.server_close()
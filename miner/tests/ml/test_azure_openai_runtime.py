@@ -0,0 +1,184 @@
+"""
+Tests the pooled Azure OpenAI runtime against a local stub server that
+speaks the chat completions API.
+"""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from src.core.ML.models import azure_openai_runtime as runtime
+
+
+def _completion(content: str) -> dict:
+    return {"choices": [{"message": {"content": content}}]}
+
+
+RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {"answer": {"type": "string"}},
+    "required": ["answer"],
+}
+
+
+def _ask() -> dict | None:
+    return runtime.azure_chat_json(
+        system_prompt="system",
+        user_prompt="user",
+        response_schema=RESPONSE_SCHEMA,
+        schema_name="stub_answer",
+    )
+
+
+def test_chat_json_reuses_keep_alive_connection(stub_azure):
+    assert _ask() == {"answer": "ok"}
+    assert _ask() == {"answer": "ok"}
+
+    assert len(stub_azure.client_ports) == 2
+    assert len(set(stub_azure.client_ports)) == 1
+
+    metrics = runtime.get_azure_runtime_metrics()
+    assert metrics["requests"] == 2
+    assert metrics["successes"] == 2
+    assert metrics["latency_seconds"]["count"] == 2
+
+
+def test_retry_after_is_honoured_on_throttle(stub_azure):
+    stub_azure.responses.append(
+        (429, {"retry-after-ms": "50"}, {"error": {"code": "429"}}))
+
+    started = time.monotonic()
+    assert _ask() == {"answer": "ok"}
+    elapsed = time.monotonic() - started
+
+    metrics = runtime.get_azure_runtime_metrics()
+    assert metrics["throttled"] == 1
+    assert metrics["retries"] == 1
+    assert metrics["requests"] == 2
+    assert metrics["throttle_wait_seconds"] == pytest.approx(0.05)
+    # The default rate limited backoff is 1.5s, Retry-After asked for 50ms
+    assert elapsed < 1.0
+
+
+def test_client_error_is_not_retried(stub_azure):
+    stub_azure.responses.append((400, {}, {"error": {"code": "400"}}))
+
+    assert _ask() is None
+
+    metrics = runtime.get_azure_runtime_metrics()
+    assert metrics["requests"] == 1
+    assert metrics["retries"] == 0
+    assert metrics["failures"] == 1
+
+
+def test_malformed_output_is_retried(stub_azure):
+    stub_azure.responses.append((200, {}, _completion("not json at all")))
+
+    assert _ask() == {"answer": "ok"}
+    assert runtime.get_azure_runtime_metrics()["retries"] == 1
+
+
+def test_concurrency_is_capped(stub_azure, monkeypatch):
+    monkeypatch.setenv("ARTIFACT_MINER_AZURE_MAX_CONCURRENCY", "2")
+    runtime.reset_azure_runtime()
+    stub_azure.delay = 0.1
+
+    threads = [threading.Thread(target=_ask) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert len(stub_azure.client_ports) == 6
+    assert stub_azure.max_in_flight <= 2
+
+
+def test_llm_batch_keeps_order_and_runs_concurrently(stub_azure, monkeypatch):
+    monkeypatch.setenv("ARTIFACT_MINER_AZURE_MAX_CONCURRENCY", "3")
+    runtime.reset_azure_runtime()
+    stub_azure.delay = 0.1
+
+    results = runtime.run_llm_batch(lambda i: (i, _ask()), list(range(6)),
+                                    task_name="test")
+
+    assert [i for i, _ in results] == list(range(6))
+    assert all(answer is not None for _, answer in results)
+    assert 1 < stub_azure.max_in_flight <= 3
+
+
+def test_llm_batch_isolates_failures(stub_azure):
+    def _work(i: int) -> int:
+        if i == 2:
+            raise RuntimeError("boom")
+        return i * 10
+
+    assert runtime.run_llm_batch(_work, [0, 1, 2, 3], task_name="test") == [0, 10, None, 30]
+    assert runtime.run_llm_batch(_work, [], task_name="test") == []
+
+
+def test_async_chat_json(stub_azure):
+    async def _ask_many():
+        return await asyncio.gather(*[
+            runtime.azure_chat_json_async(
+                system_prompt="system",
+                user_prompt=f"user {i}",
+                response_schema=RESPONSE_SCHEMA,
+                schema_name="stub_answer",
+            )
+            for i in range(3)
+        ])
+
+    results = asyncio.run(_ask_many())
+
+    assert results == [{"answer": "ok"}] * 3
+    assert runtime.get_azure_runtime_metrics()["successes"] == 3
+
+
+def test_async_concurrency_is_capped(stub_azure, monkeypatch):
+    monkeypatch.setenv("ARTIFACT_MINER_AZURE_MAX_CONCURRENCY", "2")
+    runtime.reset_azure_runtime()
+    stub_azure.delay = 0.1
+
+    async def _ask_many():
+        return await asyncio.gather(*[
+            runtime.azure_chat_json_async(
+                system_prompt="system",
+                user_prompt=f"user {i}",
+                response_schema=RESPONSE_SCHEMA,
+                schema_name="stub_answer",
+            )
+            for i in range(6)
+        ])
+
+    assert asyncio.run(_ask_many()) == [{"answer": "ok"}] * 6
+    assert stub_azure.max_in_flight <= 2
+
+
+def test_reset_closes_idle_async_clients(stub_azure):
+    loop = asyncio.new_event_loop()
+    try:
+        async def _client():
+            return runtime._get_async_client()
+
+        client = loop.run_until_complete(_client())
+        runtime.reset_azure_runtime()
+
+        assert client.is_closed
+    finally:
+        loop.close()
+
+
+@pytest.mark.parametrize("headers, expected", [
+    ({"retry-after-ms": "250"}, 0.25),
+    ({"Retry-After": "2"}, 2.0),
+    ({"Retry-After": "600"}, runtime._MAX_RETRY_AFTER_SECONDS),
+    ({"Retry-After": "garbage"}, None),
+    ({}, None),
+])
+def test_retry_after_seconds(headers, expected):
+    response = httpx.Response(429, headers=headers)
+
+    assert runtime._retry_after_seconds(response) == expected
@@ -0,0 +1,175 @@
+"""
+Tests the disk-backed LLM response cache and single-flight coalescing.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from pydantic import BaseModel
+
+from src.core.ML.models import azure_openai_runtime as runtime
+from src.core.ML.models.azure_foundry_manager import AzureFoundryManager
+from src.core.ML.models.llm_cache import LLMResponseCache, SingleFlight, llm_cache_key
+
+RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {"answer": {"type": "string"}},
+    "required": ["answer"],
+}
+
+
+class AnswerModel(BaseModel):
+    answer: str
+
+
+@pytest.fixture
+def cached_stub(stub_azure, monkeypatch):
+    monkeypatch.setenv("ARTIFACT_MINER_LLM_CACHE_DISABLE", "0")
+    return stub_azure
+
+
+def _ask(user_prompt: str = "user", temperature: float = 0.0) -> dict | None:
+    return runtime.azure_chat_json(
+        system_prompt="system",
+        user_prompt=user_prompt,
+        response_schema=RESPONSE_SCHEMA,
+        schema_name="stub_answer",
+        temperature=temperature,
+    )
+
+
+def test_cache_round_trip(tmp_path):
+    cache = LLMResponseCache(tmp_path / "cache.db", ttl_seconds=60, max_bytes=1024)
+
+    assert cache.get("missing") is None
+
+    cache.put("key", '{"answer": "ok"}')
+    assert cache.get("key") == '{"answer": "ok"}'
+
+    # Entries survive a new cache object on the same file
+    reopened = LLMResponseCache(tmp_path / "cache.db", ttl_seconds=60, max_bytes=1024)
+    assert reopened.get("key") == '{"answer": "ok"}'
+
+
+def test_cache_entries_expire(tmp_path):
+    cache = LLMResponseCache(tmp_path / "cache.db", ttl_seconds=0.05, max_bytes=1024)
+    cache.put("key", "value")
+
+    time.sleep(0.1)
+
+    assert cache.get("key") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = LLMResponseCache(tmp_path / "cache.db", ttl_seconds=60, max_bytes=25)
+
+    cache.put("a", "x" * 10)
+    time.sleep(0.01)
+    cache.put("b", "y" * 10)
+    time.sleep(0.01)
+    cache.get("a")  # a is now more recent than b
+    time.sleep(0.01)
+    cache.put("c", "z" * 10)
+
+    assert cache.get("a") == "x" * 10
+    assert cache.get("b") is None
+    assert cache.get("c") == "z" * 10
+    assert cache.stats()["bytes"] <= 25
+
+
+def test_cache_key_covers_request_fields():
+    base = llm_cache_key("deploy", "system", "user", "schema", 0.0)
+
+    assert base == llm_cache_key("deploy", "system", "user", "schema", 0.0)
+    assert base != llm_cache_key("other", "system", "user", "schema", 0.0)
+    assert base != llm_cache_key("deploy", "system!", "user", "schema", 0.0)
+    assert base != llm_cache_key("deploy", "system", "user!", "schema", 0.0)
+    assert base != llm_cache_key("deploy", "system", "user", "schema2", 0.0)
+    assert base != llm_cache_key("deploy", "system", "user", "schema", 0.7)
+
+
+def test_identical_prompt_is_served_from_cache(cached_stub):
+    assert _ask() == {"answer": "ok"}
+    assert _ask() == {"answer": "ok"}
+
+    assert len(cached_stub.client_ports) == 1
+    metrics = runtime.get_azure_runtime_metrics()
+    assert metrics["cache_hits"] == 1
+    assert metrics["cache_misses"] == 1
+
+
+def test_different_prompt_or_temperature_misses(cached_stub):
+    _ask()
+    _ask(user_prompt="another user")
+    _ask(temperature=0.5)
+
+    assert len(cached_stub.client_ports) == 3
+
+
+def test_failed_requests_are_not_cached(cached_stub):
+    cached_stub.responses.append((400, {}, {"error": {"code": "400"}}))
+
+    assert _ask() is None
+    assert _ask() == {"answer": "ok"}
+    assert len(cached_stub.client_ports) == 2
+
+
+def test_concurrent_identical_requests_are_coalesced(cached_stub):
+    cached_stub.delay = 0.2
+    results = []
+
+    def _worker():
+        results.append(_ask())
+
+    threads = [threading.Thread(target=_worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert results == [{"answer": "ok"}] * 5
+    assert len(cached_stub.client_ports) == 1
+
+    metrics = runtime.get_azure_runtime_metrics()
+    assert metrics["coalesced"] + metrics["cache_hits"] == 4
+
+
+def test_async_followers_are_woken_by_a_leader_on_another_thread():
+    flights = SingleFlight()
+    flight, leader = flights.join("key")
+
+    async def _follow():
+        follower, is_leader = flights.join("key")
+        assert not is_leader
+        return await asyncio.gather(follower.wait_async(), follower.wait_async())
+
+    threading.Timer(0.05, flight.finish, args=("answer",)).start()
+
+    assert leader
+    assert asyncio.run(asyncio.wait_for(_follow(), timeout=5)) == ["answer", "answer"]
+
+
+def test_foundry_manager_uses_cache(cached_stub):
+    manager = AzureFoundryManager()
+
+    def _request():
+        return manager.process_request(
+            user_input="readme text",
+            system_prompt="extract",
+            response_model=AnswerModel,
+            schema_name="answer_model",
+        )
+
+    assert _request() == AnswerModel(answer="ok")
+    assert _request() == AnswerModel(answer="ok")
+    assert len(cached_stub.client_ports) == 1
+
+
+def test_cache_can_be_disabled(stub_azure):
+    _ask()
+    _ask()
+
+    assert len(stub_azure.client_ports) == 2
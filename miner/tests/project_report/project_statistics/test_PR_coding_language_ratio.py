@@ -45,3 +45,28 @@ def test_coding_ratio_in_normal_project(tmp_path, get_ready_specific_analyzer):
 
     assert len(coding_language_ratio) == len(expected_ratio)
     assert len(coding_language_ratio) == len(expected_ratio)
+
+
+def test_coding_ratio_lists_languages_by_path_outside_databases_first(tmp_path, get_ready_specific_analyzer):
+    """
+    Languages come out in the order of their first file when the files are
+    sorted by path, with files under a database path last
+    """
+
+    files = ["database/dump.rb", "src/z.py", "src/a.c"]
+
+    reports = []
+    for file in files:
+        path = tmp_path / file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+        reports.append(get_ready_specific_analyzer(str(tmp_path), file).analyze())
+
+    project_report = ProjectReport(
+        reports, calculator_classes=[CodingLanguageRatio])
+
+    coding_language_ratio = project_report.get_value(
+        ProjectStatCollection.CODING_LANGUAGE_RATIO.value)
+
+    assert list(coding_language_ratio) == [
+        CodingLanguage.C, CodingLanguage.PYTHON, CodingLanguage.RUBY]
@@ -0,0 +1,74 @@
+from datetime import datetime
+
+import numpy as np
+
+from src.core.report import FileReport, ProjectReport
+from src.core.report.project.file_columns import FileColumns, count_per_key, group_sum
+from src.core.statistic import (
+    CodingLanguage,
+    FileDomain,
+    FileStatCollection,
+    Statistic,
+    StatisticIndex,
+)
+
+
+def _file(path: str, *stats: Statistic, is_info_file=None) -> FileReport:
+    return FileReport(StatisticIndex(list(stats)), path, is_info_file=is_info_file)
+
+
+def test_columns_hold_values_and_mark_missing_ones():
+    files = [
+        _file(
+            "a.py",
+            Statistic(FileStatCollection.LINES_IN_FILE.value, 10),
+            Statistic(FileStatCollection.CODING_LANGUAGE.value, CodingLanguage.PYTHON),
+            Statistic(FileStatCollection.TYPE_OF_FILE.value, FileDomain.CODE),
+            Statistic(FileStatCollection.DATE_CREATED.value, datetime(2024, 1, 1)),
+            Statistic(FileStatCollection.IMPORTED_PACKAGES.value, ["numpy"]),
+        ),
+        _file("README.md", is_info_file=True),
+    ]
+
+    columns = FileColumns(files)
+
+    assert len(columns) == 2
+    assert columns.filepath.tolist() == ["a.py", "README.md"]
+    assert columns.is_info.tolist() == [False, True]
+    assert columns.lines[0] == 10 and np.isnan(columns.lines[1])
+    assert np.isnan(columns.size).all()
+    assert columns.languages[columns.language[0]] is CodingLanguage.PYTHON
+    assert columns.language[1] == -1
+    assert columns.domains[columns.domain[0]] is FileDomain.CODE
+    assert columns.created[0].item() == datetime(2024, 1, 1)
+    assert np.isnat(columns.created[1]) and np.isnat(columns.modified).all()
+    assert columns.packages[0] == ["numpy"] and columns.packages[1] is None
+
+
+def test_empty_columns():
+    columns = FileColumns([])
+
+    assert len(columns) == 0
+    assert group_sum(columns.domain, columns.domains, columns.lines) == {}
+    assert count_per_key(columns.filepath) == {}
+
+
+def test_group_sum_keeps_first_appearance_order_and_skips_missing():
+    labels = np.array(["b", "a"], dtype=object)
+    codes = np.array([0, -1, 1, 0])
+
+    assert list(group_sum(codes, labels, [1.0, 5.0, 2.0, 3.0]).items()) == [("b", 4.0), ("a", 2.0)]
+    assert group_sum(codes[2:], labels, 1.0) == {"a": 1.0, "b": 1.0}
+
+
+def test_project_report_rebuilds_columns_when_files_change():
+    project = ProjectReport([_file("a.py")], calculator_classes=[])
+    first = project.file_columns
+
+    assert project.file_columns is first
+
+    project.file_reports.append(_file("b.py"))
+    assert len(project.file_columns) == 2
+
+    project.file_reports = [_file("c.py")]
+    assert project.file_columns.filepath.tolist() == ["c.py"]
@@ -74,3 +74,38 @@ def test_userreport_can_create_resume(project_report_from_stats):
     assert resume_item.items[0].title == "TESTING ONLY SHOULD SEE THIS IN PYTEST"
     assert resume_item.items[0].start_date == datetime(2020, 1, 1)
     assert resume_item.items[0].end_date == datetime(2021, 1, 1)
+
+
+def test_resume_items_are_cached_per_statistics(project_report_from_stats, monkeypatch):
+    from src.core.report import ProjectReport
+    from src.core.report.user.user_statistics import UserWeightedSkills
+
+    ProjectReport.clear_resume_item_cache()
+    builds = []
+    monkeypatch.setattr(ProjectReport.bullet_builder, "context", lambda: ())
+    monkeypatch.setattr(ProjectReport.bullet_builder, "build",
+                        lambda report: builds.append(report.project_name) or ["Built it"])
+
+    stats = [Statistic(ProjectStatCollection.PROJECT_START_DATE.value, datetime(2020, 1, 1))]
+    first = project_report_from_stats(stats, project_name="cached")
+    again = project_report_from_stats(list(stats), project_name="cached")
+
+    # Skill-only reports never build resume items
+    user_report = UserReport([first, again], calculator_classes=[UserWeightedSkills])
+    assert builds == []
+
+    items = user_report.resume_items
+    assert builds == ["cached"]
+    assert user_report.resume_items is items
+    # Each caller gets its own copy to edit
+    assert items[0] is not items[1]
+    items[0].bullet_points.append("Edited")
+    assert again.generate_resume_item().bullet_points == ["Built it"]
+    assert builds == ["cached"]
+
+    changed = project_report_from_stats(
+        [Statistic(ProjectStatCollection.PROJECT_START_DATE.value, datetime(2021, 1, 1))],
+        project_name="cached")
+    changed.generate_resume_item()
+    assert builds == ["cached", "cached"]
+    ProjectReport.clear_resume_item_cache()
@@ -0,0 +1,109 @@
+"""
+Tests for the project evidence index in
+`src/services/evidence_index_service.py`.
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlmodel import Session
+
+import src.services.evidence_index_service as evidence_index_service
+from src.database.api.CRUD.projects import delete_project_report_by_name
+from src.database.api.models import FileReportModel, ProjectReportModel
+from src.services.evidence_index_service import EvidenceIndex, tokenize_terms
+
+
+def _insert_project(session: Session, name: str, frameworks: list[str], files: list[str]) -> None:
+    project = ProjectReportModel(
+        project_name=name,
+        statistic={},
+        created_at=datetime(2026, 1, 1),
+        last_updated=datetime(2026, 1, 1),
+        showcase_frameworks=frameworks,
+    )
+    project.file_reports = [
+        FileReportModel(project_name=name, file_path=path, is_info_file=False, statistic={})
+        for path in files
+    ]
+    session.add(project)
+
+
+@pytest.fixture
+def projects(blank_db):
+    with Session(blank_db) as session:
+        _insert_project(session, "ReportingDB", ["PostgreSQL"],
+                        ["db/schema.sql", "db/reports.sql", "db/queries.sql"])
+        _insert_project(session, "WebShop", ["React", "FastAPI"],
+                        ["api/routes.py", "web/App.tsx", "db/orders.sql"])
+        _insert_project(session, "Notes", ["Markdown"], ["notes/todo.md"])
+        session.commit()
+    return blank_db
+
+
+def test_terms_split_paths_and_drop_plurals():
+    assert tokenize_terms("API/routes.py, Tests") == ["api", "route", "py", "test"]
+    assert tokenize_terms("C++ and C# process") == ["c++", "and", "c#", "process"]
+
+
+def test_multi_word_phrases_must_appear_together(projects):
+    index = EvidenceIndex()
+    with Session(projects) as session:
+        reporting, = index.refresh(session, ["ReportingDB"])
+
+    assert reporting.mentions("PostgreSQL")
+    assert reporting.mentions("db schemas")
+    assert not reporting.mentions("schema db")
+    assert not reporting.mentions("unit test")
+
+
+def test_search_ranks_projects_by_their_evidence(projects):
+    index = EvidenceIndex()
+    names = ["ReportingDB", "WebShop", "Notes"]
+    with Session(projects) as session:
+        index.refresh(session, names)
+
+    scores = index.search(tokenize_terms("SQL database schema"), among=names)
+
+    assert set(scores) == {"ReportingDB", "WebShop"}
+    assert scores["ReportingDB"] > scores["WebShop"]
+    assert index.search(["sql"], among=["Notes"]) == {}
+
+
+def test_unchanged_projects_are_not_reloaded(projects, monkeypatch):
+    index = EvidenceIndex()
+    loads = []
+    load = evidence_index_service.get_project_report_models_by_names
+    monkeypatch.setattr(
+        evidence_index_service,
+        "get_project_report_models_by_names",
+        lambda session, names: loads.append(sorted(names)) or load(session, names),
+    )
+
+    with Session(projects) as session:
+        index.refresh(session, ["ReportingDB", "WebShop"])
+        evidence = index.refresh(session, ["WebShop", "ReportingDB"])
+
+        project = session.get(ProjectReportModel, "WebShop")
+        project.showcase_frameworks = ["React", "Django"]
+        session.add(project)
+        session.commit()
+        updated = index.refresh(session, ["ReportingDB", "WebShop"])
+
+    assert loads == [["ReportingDB", "WebShop"], ["WebShop"]]
+    assert [e.project_name for e in evidence] == ["WebShop", "ReportingDB"]
+    assert "django" in updated[1].blob
+    assert index.search(["fastapi"], among=["WebShop"]) == {}
+    assert "WebShop" in index.search(["django"], among=["WebShop"])
+
+
+def test_deleted_projects_leave_the_index(projects):
+    index = EvidenceIndex()
+    with Session(projects) as session:
+        index.refresh(session, ["Notes"])
+        delete_project_report_by_name(session, "Notes")
+        session.commit()
+
+        with pytest.raises(KeyError, match="Notes"):
+            index.refresh(session, ["Notes"])
+    assert index.search(["markdown"], among=["Notes"]) == {}
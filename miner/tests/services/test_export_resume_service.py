@@ -0,0 +1,129 @@
+"""
+Tests for the cached resume exports in
+`src/services/resume/export_resume_service.py`. PDFs are compiled by a
+stub renderer so the tests do not need TeX installed.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+
+from src.core.resume.render import PDFRenderer
+from src.core.resume.resume import Resume, ResumeItem
+from src.services.resume.export_resume_service import (
+    ArtifactCache,
+    artifact_cache,
+    export_docx,
+    export_latex,
+    export_pdf,
+)
+
+
+class StubPDFRenderer(PDFRenderer):
+    def __init__(self, release: threading.Event = None):
+        self.compiled: list[str] = []
+        self.release = release
+
+    def compile(self, tex: str) -> bytes:
+        if self.release is not None:
+            self.release.wait(timeout=5)
+        self.compiled.append(tex)
+        return b"%PDF-" + str(len(tex)).encode()
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    artifact_cache.clear()
+    yield
+    artifact_cache.clear()
+
+
+def _resume(email: str = "paul@example.com") -> Resume:
+    resume = Resume(email=email, github="paul", title="Resume")
+    resume.add_item(ResumeItem(
+        title="Project Miner",
+        frameworks=[],
+        bullet_points=["Built the API"],
+        start_date=date(2025, 1, 1),
+        end_date=date(2025, 6, 1),
+    ))
+    return resume
+
+
+def test_pdf_is_compiled_once_per_latex_source():
+    renderer = StubPDFRenderer()
+
+    first = export_pdf(_resume(), renderer)
+    second = export_pdf(_resume(), renderer)
+
+    assert len(renderer.compiled) == 1
+    assert first.content == second.content
+    assert (first.cache_hit, second.cache_hit) == (False, True)
+    assert second.render_seconds == first.render_seconds
+
+
+def test_changed_resume_is_rendered_again():
+    renderer = StubPDFRenderer()
+
+    export_pdf(_resume(), renderer)
+    export_pdf(_resume(email="other@example.com"), renderer)
+
+    assert len(renderer.compiled) == 2
+    assert export_latex(_resume()).content != export_latex(
+        _resume(email="other@example.com")).content
+
+
+def test_concurrent_identical_renders_are_coalesced():
+    release = threading.Event()
+    renderer = StubPDFRenderer(release)
+    resume = _resume()
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(export_pdf, resume, renderer) for _ in range(4)]
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(renderer.compiled) == 1
+    assert len({result.content for result in results}) == 1
+    assert [result.cache_hit for result in results].count(False) == 1
+
+
+def test_docx_is_cached():
+    first = export_docx(_resume())
+    second = export_docx(_resume())
+
+    assert first.content.startswith(b"PK")
+    assert second.cache_hit
+    assert artifact_cache.stats()["hits"] == 1
+
+
+def test_least_recently_used_files_are_evicted_past_the_size_limit():
+    cache = ArtifactCache(max_bytes=10)
+
+    cache.get_or_render("a", lambda: b"aaaa")
+    cache.get_or_render("b", lambda: b"bbbb")
+    cache.get_or_render("a", lambda: b"aaaa")  # a is now the most recent
+    cache.get_or_render("c", lambda: b"cccc")
+
+    assert cache.stats()["evictions"] == 1
+    assert cache.get_or_render("a", lambda: b"new!").cache_hit
+    assert not cache.get_or_render("b", lambda: b"bbbb").cache_hit
+
+
+def test_failed_and_empty_renders_are_not_cached():
+    cache = ArtifactCache()
+
+    def fail():
+        raise RuntimeError("pdflatex crashed")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_render("x", fail)
+    empty = cache.get_or_render("y", lambda: b"")
+    retried = cache.get_or_render("x", lambda: b"ok")
+
+    assert not retried.cache_hit
+    assert empty.content == b""
+    assert not cache.get_or_render("y", lambda: b"").cache_hit
+    assert cache.stats()["entries"] == 1
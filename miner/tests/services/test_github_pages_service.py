@@ -0,0 +1,176 @@
+"""
+Tests for the incremental GitHub Pages deploy in
+`src/services/portfolio/github_pages_service.py`, run against an
+in-memory stand-in for the GitHub API.
+"""
+
+import asyncio
+import base64
+import io
+import json
+import zipfile
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from src.services.portfolio.github_pages_service import (
+    _MAX_CONCURRENT_UPLOADS,
+    deploy_to_github_pages,
+    git_blob_sha,
+)
+
+_REPO = "/repos/paul/portfolio"
+
+
+class FakeGitHub:
+    """Just enough of the git data API to hold one repo with one branch."""
+
+    def __init__(self, repo_exists: bool = True, fail_blobs: bool = False):
+        self.repo_exists = repo_exists
+        self.fail_blobs = fail_blobs
+        self.blobs: dict[str, bytes] = {}
+        self.trees: dict[str, dict[str, str]] = {}
+        self.commits: dict[str, str] = {}
+        self.head = self._commit(self._tree({"README.md": self._blob(b"# portfolio\n")}))
+        self.uploaded: list[bytes] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def _blob(self, content: bytes) -> str:
+        sha = git_blob_sha(content)
+        self.blobs[sha] = content
+        return sha
+
+    def _tree(self, entries: dict[str, str]) -> str:
+        sha = f"tree{len(self.trees)}"
+        self.trees[sha] = entries
+        return sha
+
+    def _commit(self, tree_sha: str) -> str:
+        sha = f"commit{len(self.commits)}"
+        self.commits[sha] = tree_sha
+        return sha
+
+    def files(self) -> dict[str, bytes]:
+        tree = self.trees[self.commits[self.head]]
+        return {path: self.blobs[sha] for path, sha in tree.items()}
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        path, method = request.url.path, request.method
+        body = json.loads(request.content) if request.content else None
+
+        if path == "/user":
+            return httpx.Response(200, json={"login": "paul"})
+        if path == _REPO and method == "GET":
+            if not self.repo_exists:
+                return httpx.Response(404)
+            return httpx.Response(200, json={"default_branch": "main", "private": False})
+        if path == "/user/repos":
+            self.repo_exists = True
+            return httpx.Response(201, json={"default_branch": "main"})
+        if path == f"{_REPO}/git/ref/heads/main":
+            return httpx.Response(200, json={"object": {"sha": self.head}})
+        if path.startswith(f"{_REPO}/git/commits/"):
+            commit_sha = path.rsplit("/", 1)[1]
+            return httpx.Response(200, json={"tree": {"sha": self.commits[commit_sha]}})
+        if path.startswith(f"{_REPO}/git/trees/"):
+            tree = self.trees[path.rsplit("/", 1)[1]]
+            return httpx.Response(200, json={"truncated": False, "tree": [
+                {"path": p, "type": "blob", "sha": sha} for p, sha in tree.items()]})
+        if path == f"{_REPO}/git/blobs":
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            if self.fail_blobs:
+                return httpx.Response(500)
+            content = base64.b64decode(body["content"])
+            self.uploaded.append(content)
+            return httpx.Response(201, json={"sha": self._blob(content)})
+        if path == f"{_REPO}/git/trees":
+            tree_sha = self._tree({e["path"]: e["sha"] for e in body["tree"]})
+            return httpx.Response(201, json={"sha": tree_sha})
+        if path == f"{_REPO}/git/commits":
+            return httpx.Response(201, json={"sha": self._commit(body["tree"])})
+        if path == f"{_REPO}/git/refs/heads/main":
+            self.head = body["sha"]
+            return httpx.Response(200, json={})
+        if path == f"{_REPO}/pages":
+            if method == "POST":
+                return httpx.Response(409)
+            return httpx.Response(200, json={"html_url": "https://paul.github.io/portfolio/"})
+        return httpx.Response(404)
+
+
+def _zip(files: dict[str, bytes]) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, content in files.items():
+            zf.writestr(name, content)
+    return buf.getvalue()
+
+
+def _deploy(github: FakeGitHub, files: dict[str, bytes]) -> str:
+    return asyncio.run(deploy_to_github_pages(
+        "token", _zip(files), transport=httpx.MockTransport(github.handle)))
+
+
+def test_blob_sha_matches_git():
+    # `printf 'hello\n' | git hash-object --stdin`
+    assert git_blob_sha(b"hello\n") == "ce013625030ba8dba906f756967f9e9ca394464a"
+
+
+def test_first_deploy_uploads_every_file_and_replaces_the_tree():
+    github = FakeGitHub(repo_exists=False)
+    site = {"index.html": b"<html>", "style.css": b"body {}", "filter.js": b"//"}
+
+    url = _deploy(github, site)
+
+    assert url == "https://paul.github.io/portfolio/"
+    assert github.files() == site
+    assert sorted(github.uploaded) == sorted(site.values())
+
+
+def test_only_changed_files_are_uploaded():
+    github = FakeGitHub()
+    _deploy(github, {"index.html": b"<html>v1", "style.css": b"body {}"})
+    github.uploaded.clear()
+
+    _deploy(github, {"index.html": b"<html>v2", "style.css": b"body {}"})
+
+    assert github.uploaded == [b"<html>v2"]
+    assert github.files() == {"index.html": b"<html>v2", "style.css": b"body {}"}
+
+
+def test_unchanged_site_makes_no_commit():
+    github = FakeGitHub()
+    site = {"index.html": b"<html>", "style.css": b"body {}"}
+    _deploy(github, site)
+    head = github.head
+    github.uploaded.clear()
+
+    _deploy(github, site)
+
+    assert github.head == head
+    assert github.uploaded == []
+
+
+def test_uploads_run_concurrently_within_the_limit():
+    github = FakeGitHub()
+
+    _deploy(github, {f"page{i}.html": f"<p>{i}</p>".encode() for i in range(12)})
+
+    assert len(github.uploaded) == 12
+    assert 1 < github.max_in_flight <= _MAX_CONCURRENT_UPLOADS
+
+
+def test_failed_upload_raises_and_leaves_the_branch():
+    github = FakeGitHub(fail_blobs=True)
+    head = github.head
+
+    with pytest.raises(HTTPException) as exc_info:
+        _deploy(github, {"index.html": b"<html>"})
+
+    assert exc_info.value.status_code == 502
+    assert github.head == head
@@ -450,3 +450,78 @@ def test_interview_start_endpoint_requires_ml_consent(blank_db):
 
     assert response.status_code == 503
     assert "consent" in response.json()["message"].lower()
+
+
+def test_interview_context_is_reused_until_its_projects_change(blank_db, monkeypatch):
+    _insert_resume_with_project(blank_db)
+    interview_service.clear_interview_context_cache()
+    readiness_calls = []
+    monkeypatch.setattr(
+        interview_service,
+        "run_job_readiness_analysis",
+        lambda **_: readiness_calls.append(1) or _fake_readiness_result(),
+    )
+    monkeypatch.setattr(interview_service, "azure_openai_enabled", lambda: False)
+    job = "Backend engineer with FastAPI and SQL experience."
+
+    def build(job_description: str = job) -> dict:
+        return interview_service.build_interview_context(
+            session=session, job_description=job_description, project_names=["InventoryAPI"])
+
+    with Session(blank_db) as session:
+        first = build()
+        first["job_fit_context"]["relevant_projects"].clear()
+        second = build()
+        assert len(readiness_calls) == 1
+        assert second["job_fit_context"]["primary_project"] == "InventoryAPI"
+        assert len(second["job_fit_context"]["relevant_projects"]) == 1
+
+        build(job + " Docker too.")
+        assert len(readiness_calls) == 2
+
+        project = session.get(ProjectReportModel, "InventoryAPI")
+        project.showcase_title = "Inventory Service"
+        session.add(project)
+        session.commit()
+
+        build()
+    assert len(readiness_calls) == 3
+
+
+def test_projects_match_dimensions_by_whole_keyword_phrases(blank_db):
+    with Session(blank_db) as session:
+        for name, frameworks in (
+            ("TimeTracker", ["Code", "Error", "Service", "Time"]),
+            ("CheckoutAPI", ["Unit test", "Code review"]),
+            ("ReviewBot", ["Code review"]),
+        ):
+            session.add(ProjectReportModel(
+                project_name=name,
+                statistic={},
+                created_at=datetime(2026, 1, 1),
+                last_updated=datetime(2026, 1, 1),
+                showcase_frameworks=frameworks,
+            ))
+        session.commit()
+        interview_service.evidence_index.clear()
+        projects = interview_service.evidence_index.refresh(
+            session, ["TimeTracker", "CheckoutAPI", "ReviewBot"])
+
+    dimensions = [
+        {"dimension": "testing", "label": "testing strategy", "matches": ["unit test"]},
+        {"dimension": "collaboration", "label": "collaboration",
+         "matches": ["code review", "git"]},
+    ]
+    context = interview_service._derive_job_fit_context(
+        job_description="",
+        projects=projects,
+        dimensions=dimensions,
+        readiness_signals={},
+        role_lens="general",
+    )
+    entries = {entry["project_name"]: entry for entry in context["relevant_projects"]}
+
+    assert entries["TimeTracker"]["matched_dimensions"] == []
+    assert entries["CheckoutAPI"]["matched_dimensions"] == ["testing", "collaboration"]
+    assert entries["CheckoutAPI"]["dimension_scores"]["testing"]["keywords"] == 1
+    assert context["primary_project"] == "CheckoutAPI"
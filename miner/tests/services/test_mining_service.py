@@ -39,3 +39,37 @@ def test_compute_project_statistics_deltas_numeric_and_nested(project_report_fro
     assert deltas["USER_COMMIT_PERCENTAGE"] == 20.0
     assert round(deltas["CODING_LANGUAGE_RATIO.Python"], 2) == 0.20
     assert round(deltas["CODING_LANGUAGE_RATIO.JavaScript"], 2) == -0.20
+
+
+def test_contribution_patterns_run_per_project_in_order(project_report_from_stats, monkeypatch):
+    from src.core.ML.models.contribution_analysis.commit_classifier import ContributionPatternOutput
+    from src.core.report.project.project_statistics import ProjectContributionPatterns
+
+    reports = [
+        project_report_from_stats([], project_name=name)
+        for name in ("alpha", "beta", "gamma", "delta")
+    ]
+
+    def _facts(self, report):
+        return None if report.project_name == "delta" else {"project_name": report.project_name}
+
+    def _request(self, facts):
+        if facts["project_name"] == "beta":
+            raise RuntimeError("Azure unavailable")
+        return ContributionPatternOutput.model_validate({
+            "commit_type_distribution": {"feat": 60.0, "fix": 20.0, "docs": 10.0, "refactor": 5.0, "chore": 5.0},
+            "work_pattern": "consistent",
+            "collaboration_role": f"lead on {facts['project_name']}",
+            "activity_metrics": {"commits_per_day": 1.5, "avg_message_length": 42.0},
+            "role_description": "Built it.",
+        })
+
+    monkeypatch.setattr(ProjectContributionPatterns, "_build_facts", _facts)
+    monkeypatch.setattr(ProjectContributionPatterns, "_request", _request)
+
+    results = ProjectContributionPatterns.calculate_many(reports)
+
+    assert [len(stats) for stats in results] == [5, 0, 5, 0]
+    assert reports[0].get_value(ProjectStatCollection.COLLABORATION_ROLE.value) == "lead on alpha"
+    assert reports[2].get_value(ProjectStatCollection.COLLABORATION_ROLE.value) == "lead on gamma"
+    assert reports[1].get_value(ProjectStatCollection.COLLABORATION_ROLE.value) is None
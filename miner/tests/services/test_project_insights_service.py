@@ -0,0 +1,108 @@
+"""
+Tests for `src/services/project/insights_service.py`: insights generated in
+the background after a project is saved.
+"""
+
+import datetime
+import threading
+
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
+
+import src.services.project.insights_service as insights_service
+
+from src.core.report import ProjectReport
+from src.core.statistic import ProjectStatCollection, Statistic, StatisticIndex
+from src.core.statistic.statistic_models import WeightedSkills
+from src.database.api.CRUD.insights import get_project_insight_messages
+from src.database.api.models import ProjectReportModel
+from src.core.insight import InsightGenerator
+from src.services.project.insights_service import (
+    generate_project_insights,
+    load_project_insights,
+    schedule_project_insights,
+)
+
+
+def _report() -> ProjectReport:
+    return ProjectReport(
+        project_name="Demo",
+        statistics=StatisticIndex([
+            Statistic(ProjectStatCollection.PROJECT_SKILLS_DEMONSTRATED.value,
+                      [WeightedSkills(skill_name="Python", weight=1.0)]),
+            Statistic(ProjectStatCollection.WORK_PATTERN.value, "consistent"),
+        ]),
+    )
+
+
+def _insert_project(engine) -> None:
+    with Session(engine) as session:
+        session.add(ProjectReportModel(
+            project_name="Demo",
+            statistic={},
+            created_at=datetime.datetime.now(),
+            last_updated=datetime.datetime.now(),
+        ))
+        session.commit()
+
+
+def test_scheduled_insights_are_stored_with_their_source(blank_db):
+    _insert_project(blank_db)
+
+    schedule_project_insights(blank_db, "Demo", _report()).result(timeout=10)
+
+    with Session(blank_db) as session:
+        everything = get_project_insight_messages(session, "Demo", include_ml=True)
+        without_ml = get_project_insight_messages(session, "Demo", include_ml=False)
+    assert len(everything) == 2
+    assert without_ml == [everything[0]]
+    assert "Python" in without_ml[0]
+
+
+def test_failed_generation_is_logged_not_raised(blank_db):
+    _insert_project(blank_db)
+
+    future = schedule_project_insights(blank_db, "Demo", None)
+
+    assert future.result(timeout=10) is None
+    with Session(blank_db) as session:
+        assert get_project_insight_messages(session, "Demo", include_ml=True) is None
+
+
+def test_loading_waits_for_the_running_job_instead_of_generating_again(blank_db, monkeypatch):
+    _insert_project(blank_db)
+    release = threading.Event()
+    reports = []
+    generate = InsightGenerator.generate
+
+    def slow_generate(report, requested_classes=None):
+        reports.append(report)
+        release.wait(timeout=5)
+        return generate(report, requested_classes)
+
+    monkeypatch.setattr(InsightGenerator, "generate", slow_generate)
+    schedule_project_insights(blank_db, "Demo", _report())
+    threading.Timer(0.1, release.set).start()
+
+    with Session(blank_db) as session:
+        messages = load_project_insights(session, "Demo", include_ml=True)
+
+    assert len(reports) == 1
+    assert len(messages) == 2
+
+
+def test_loading_rereads_insights_saved_by_a_job_that_won_the_race(blank_db, monkeypatch):
+    _insert_project(blank_db)
+
+    def lose_race(session, project_name, report):
+        with Session(blank_db) as job_session:
+            generate_project_insights(job_session, project_name, _report())
+            job_session.commit()
+        raise IntegrityError("INSERT INTO projectinsightsmodel", {}, Exception("UNIQUE"))
+
+    monkeypatch.setattr(insights_service, "generate_project_insights", lose_race)
+
+    with Session(blank_db) as session:
+        messages = load_project_insights(session, "Demo", include_ml=False)
+
+    assert len(messages) == 1 and "Python" in messages[0]
@@ -0,0 +1,68 @@
+"""
+Benchmarks statistic serialization and deserialization through the
+per-template codecs against the generic recursive serializer.
+"""
+
+import datetime
+import time
+
+from src.core.statistic import (
+    CodingLanguage,
+    FileDomain,
+    FileStatCollection,
+    ProjectStatCollection,
+    Statistic,
+    WeightedSkills,
+    deserialize,
+    serialize,
+)
+from src.core.statistic.statistic_codecs import get_codec
+
+ROUNDS = 2000
+
+
+def _statistics() -> list[Statistic]:
+    skills = [WeightedSkills(f"skill_{i}", i / 10) for i in range(10)]
+    return [
+        Statistic(FileStatCollection.LINES_IN_FILE.value, 120),
+        Statistic(FileStatCollection.DATE_CREATED.value, datetime.datetime(2025, 1, 1)),
+        Statistic(FileStatCollection.DATE_MODIFIED.value, datetime.datetime(2025, 2, 1)),
+        Statistic(FileStatCollection.TYPE_OF_FILE.value, FileDomain.CODE),
+        Statistic(ProjectStatCollection.PROJECT_SKILLS_DEMONSTRATED.value, skills),
+        Statistic(ProjectStatCollection.CODING_LANGUAGE_RATIO.value,
+                  {language: 1 / len(CodingLanguage) for language in CodingLanguage}),
+        Statistic(ProjectStatCollection.ACTIVITY_TYPE_CONTRIBUTIONS.value,
+                  {domain: 0.25 for domain in FileDomain}),
+        Statistic(ProjectStatCollection.PROJECT_TAGS.value, ["api", "backend", "sql"]),
+    ]
+
+
+def _time(fn) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn()
+    return time.perf_counter() - start
+
+
+def test_codecs_are_faster_than_generic_serializer():
+    stats = _statistics()
+    codecs = [(get_codec(s.get_template()), s.value) for s in stats]
+    encoded = [serialize(s.value) for s in stats]
+
+    generic_encode = _time(lambda: [serialize(s.value) for s in stats])
+    codec_encode = _time(lambda: [codec.encode(value) for codec, value in codecs])
+    # The generic path cannot read C++/C# enum keys, so leave the ratio out of
+    # the decode comparison.
+    readable = [(codec, raw) for (codec, _), raw, s in zip(codecs, encoded, stats)
+                if s.get_template() != ProjectStatCollection.CODING_LANGUAGE_RATIO.value]
+    generic_decode = _time(lambda: [deserialize(raw) for _, raw in readable])
+    codec_decode = _time(lambda: [codec.decode(raw) for codec, raw in readable])
+
+    print(
+        f"\n{ROUNDS} rounds of {len(stats)} statistics:"
+        f"\n  encode: generic {generic_encode * 1000:.1f} ms, codecs {codec_encode * 1000:.1f} ms"
+        f"\n  decode: generic {generic_decode * 1000:.1f} ms, codecs {codec_decode * 1000:.1f} ms"
+    )
+
+    assert codec_encode < generic_encode
+    assert codec_decode < generic_decode
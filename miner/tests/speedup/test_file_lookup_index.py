@@ -0,0 +1,102 @@
+"""
+Benchmarks the per-file lookups run on every incremental upload
+(`get_file_report_model_by_hash`, `filepath_exists_in_db`) against a large
+filereportmodel table, with and without the lookup indexes.
+
+The default row count keeps the suite fast. To reproduce the 1M row
+numbers run:
+
+    ARTIFACT_MINER_BENCH_FILE_ROWS=1000000 pytest tests/speedup/test_file_lookup_index.py -s
+"""
+
+import hashlib
+import os
+import random
+import time
+
+from sqlalchemy import text
+from sqlmodel import Session, create_engine
+
+from src.database.api.CRUD.files import filepath_exists_in_db, get_file_report_model_by_hash
+from src.database.core.migrations import upgrade_database
+
+ROWS = int(os.environ.get("ARTIFACT_MINER_BENCH_FILE_ROWS", "50000"))
+PROJECTS = 100
+LOOKUPS = 200
+
+
+def _file_hash(i: int) -> bytes:
+    return hashlib.md5(str(i).encode()).digest()
+
+
+def _file_path(i: int) -> str:
+    return f"project_{i % PROJECTS}/src/module_{i}.py"
+
+
+def _populate(engine) -> None:
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO projectreportmodel (project_name, statistic, created_at,"
+                " last_updated, analyzed_count, showcase_selected, is_deleted)"
+                " VALUES (:name, '{}', '2025-01-01', '2025-01-01', 1, 0, 0)"
+            ),
+            [{"name": f"project_{p}"} for p in range(PROJECTS)],
+        )
+        batch = 50_000
+        for start in range(0, ROWS, batch):
+            connection.execute(
+                text(
+                    "INSERT INTO filereportmodel (project_name, file_path, is_info_file,"
+                    " file_hash, statistic, created_at)"
+                    " VALUES (:project, :path, 0, :hash, '{}', '2025-01-01')"
+                ),
+                [
+                    {"project": f"project_{i % PROJECTS}",
+                     "path": _file_path(i), "hash": _file_hash(i)}
+                    for i in range(start, min(start + batch, ROWS))
+                ],
+            )
+
+
+def _time_lookups(engine, ids: list[int]) -> tuple[float, float]:
+    with Session(engine) as session:
+        start = time.perf_counter()
+        for i in ids:
+            assert get_file_report_model_by_hash(session, _file_hash(i)) is not None
+        by_hash = (time.perf_counter() - start) / len(ids)
+
+        start = time.perf_counter()
+        for i in ids:
+            assert filepath_exists_in_db(session, _file_path(i))
+        by_path = (time.perf_counter() - start) / len(ids)
+    return by_hash, by_path
+
+
+def test_file_lookups_use_indexes(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'bench.db'}")
+    upgrade_database(engine)
+    _populate(engine)
+
+    with engine.connect() as connection:
+        plan = connection.execute(text(
+            "EXPLAIN QUERY PLAN SELECT * FROM filereportmodel WHERE file_hash = x'00'"
+        )).all()
+    assert "ix_filereportmodel_file_hash" in " ".join(str(row) for row in plan)
+
+    ids = random.Random(0).sample(range(ROWS), min(LOOKUPS, ROWS))
+    indexed_hash, indexed_path = _time_lookups(engine, ids)
+
+    with engine.begin() as connection:
+        connection.execute(text("DROP INDEX ix_filereportmodel_file_hash"))
+        connection.execute(text("DROP INDEX ix_filereportmodel_file_path"))
+    scan_hash, scan_path = _time_lookups(engine, ids[:20])
+
+    print(
+        f"\n{ROWS} file reports, mean per-file lookup:"
+        f"\n  by hash: {indexed_hash * 1000:.3f} ms indexed, {scan_hash * 1000:.3f} ms scan"
+        f"\n  by path: {indexed_path * 1000:.3f} ms indexed, {scan_path * 1000:.3f} ms scan"
+    )
+
+    assert indexed_hash < scan_hash
+    assert indexed_path < scan_path
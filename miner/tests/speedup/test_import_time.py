@@ -0,0 +1,72 @@
+"""
+Import-time benchmark for the API and CLI entry points. Heavy ML and
+document libraries must stay off the import path so cold start stays fast.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+MINER_ROOT = Path(__file__).resolve().parents[2]
+
+# Libraries that are only needed once a model is loaded or a file exported
+HEAVY_MODULES = [
+    "keybert",
+    "bertopic",
+    "transformers",
+    "torch",
+    "sentence_transformers",
+    "sklearn",
+    "pdflatex",
+    "docx",
+]
+
+# Cold start budget in seconds. CI machines vary so allow an override.
+IMPORT_BUDGET_SECONDS = float(
+    os.environ.get("ARTIFACT_MINER_IMPORT_BUDGET_SECONDS", "6.0"))
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{imports}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "elapsed": elapsed,
+    "loaded": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+
+def _probe_import(imports: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(imports=imports, heavy=HEAVY_MODULES)],
+        cwd=MINER_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("imports", [
+    "import src.interface.api.api",
+    "import src.app",
+    # The mining path loads the project calculators and ML model wrappers
+    "import src.services.mining_service; import src.core.report.project.project_statistics",
+    "import src.services.mining_service; import src.core.ML.models.contribution_analysis",
+])
+def test_heavy_modules_not_imported(imports):
+    probe = _probe_import(imports)
+
+    assert probe["loaded"] == []
+
+
+def test_api_cold_import_under_budget():
+    probe = _probe_import("import src.interface.api.api")
+
+    assert probe["elapsed"] < IMPORT_BUDGET_SECONDS
@@ -0,0 +1,108 @@
+"""
+Measures loading a large project from the database with eager statistic
+decoding (the old behaviour), lazy decoding, and with file reports
+skipped altogether. Each variant reads a couple of project-level values,
+like most endpoints do.
+"""
+
+import datetime
+import time
+import tracemalloc
+
+from sqlmodel import Session
+
+from src.core.report import FileReport, ProjectReport
+from src.core.statistic import (
+    FileDomain,
+    FileStatCollection,
+    ProjectStatCollection,
+    Statistic,
+    StatisticIndex,
+    deserialize,
+)
+from src.database.api.CRUD.projects import get_project_report_model_by_name
+from src.database.core import model_deserializer
+from src.database.core.model_deserializer import TEMPLATE_LOOKUP, deserialize_project_report
+from src.database.core.model_serializer import serialize_project_report
+
+FILES = 3000
+REPEATS = 3
+
+
+def _eager_statistics(statistic: dict) -> StatisticIndex:
+    return StatisticIndex([
+        Statistic(TEMPLATE_LOOKUP[key], deserialize(value))
+        for key, value in statistic.items() if key in TEMPLATE_LOOKUP
+    ])
+
+
+def _file_report(i: int) -> FileReport:
+    return FileReport(
+        StatisticIndex([
+            Statistic(FileStatCollection.LINES_IN_FILE.value, i),
+            Statistic(FileStatCollection.DATE_CREATED.value,
+                      datetime.datetime(2025, 1, 1) + datetime.timedelta(hours=i)),
+            Statistic(FileStatCollection.DATE_MODIFIED.value,
+                      datetime.datetime(2025, 2, 1) + datetime.timedelta(hours=i)),
+            Statistic(FileStatCollection.FILE_SIZE_BYTES.value, 40 * i),
+            Statistic(FileStatCollection.TYPE_OF_FILE.value, FileDomain.CODE),
+        ]),
+        f"src/module_{i}.py",
+        is_info_file=False,
+        file_hash=str(i).encode(),
+        project_name="big_project",
+    )
+
+
+def _load(model, load) -> None:
+    report = load(model)
+    report.get_value(ProjectStatCollection.PROJECT_START_DATE.value)
+    report.get_value(ProjectStatCollection.TOTAL_PROJECT_LINES.value)
+
+
+def _measure(engine, load) -> tuple[float, int]:
+    with Session(engine) as session:
+        model = get_project_report_model_by_name(session, "big_project")
+        _ = model.statistic, model.file_reports  # keep the SQL out of the timing
+
+        # Best of a few runs, timed without tracemalloc, so the variant that
+        # happens to run first is not penalised for cold caches
+        elapsed = float("inf")
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            _load(model, load)
+            elapsed = min(elapsed, time.perf_counter() - start)
+
+        tracemalloc.start()
+        _load(model, load)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def test_lazy_loading_large_project(blank_db, monkeypatch):
+    report = ProjectReport(
+        file_reports=[_file_report(i) for i in range(FILES)],
+        project_name="big_project",
+        statistics=StatisticIndex([
+            Statistic(ProjectStatCollection.PROJECT_START_DATE.value,
+                      datetime.datetime(2025, 1, 1)),
+            Statistic(ProjectStatCollection.TOTAL_PROJECT_LINES.value, 12345),
+        ]),
+    )
+    with Session(blank_db) as session:
+        session.add(serialize_project_report(report, None))
+        session.commit()
+
+    lazy = _measure(blank_db, deserialize_project_report)
+    skipped = _measure(blank_db, lambda m: deserialize_project_report(m, False))
+    monkeypatch.setattr(model_deserializer, "deserialize_statistics", _eager_statistics)
+    eager = _measure(blank_db, deserialize_project_report)
+
+    print(f"\nLoading a project with {FILES} file reports:")
+    for label, (elapsed, peak) in [("eager", eager), ("lazy", lazy),
+                                   ("no file reports", skipped)]:
+        print(f"  {label:>16}: {elapsed * 1000:7.1f} ms, peak {peak / 1024:8.0f} KiB")
+
+    assert lazy[0] < eager[0]
+    assert skipped[1] < lazy[1] < eager[1]
@@ -0,0 +1,154 @@
+"""
+Benchmarks the project calculators that aggregate file-level statistics
+(now reductions over `ProjectReport.file_columns`) against the per-file
+`get_value` loops they replaced, and checks both give the same results.
+
+The default file count keeps the suite fast. To reproduce the 100k file
+numbers run:
+
+    ARTIFACT_MINER_BENCH_PROJECT_FILES=100000 pytest tests/speedup/test_project_aggregation.py -s
+"""
+
+import os
+import random
+import time
+from datetime import datetime, timedelta
+
+from pytest import approx
+
+from src.core.report import FileReport, ProjectReport
+from src.core.report.project.project_statistics import (
+    CodingLanguageRatio,
+    ProjectActivityTypeContributions,
+    ProjectDates,
+    ProjectTotalContributionPercentage,
+)
+from src.core.statistic import (
+    CodingLanguage,
+    FileDomain,
+    FileStatCollection,
+    ProjectStatCollection,
+    Statistic,
+    StatisticIndex,
+)
+from src.utils.data_processing import normalize
+
+FILES = int(os.environ.get("ARTIFACT_MINER_BENCH_PROJECT_FILES", "20000"))
+
+# ProjectWeightedSkills also reduces over the columns, but its time goes to
+# SkillMapper's per-path matching, so it would drown out the comparison.
+CALCULATORS = [
+    ProjectDates,
+    CodingLanguageRatio,
+    ProjectActivityTypeContributions,
+    ProjectTotalContributionPercentage,
+]
+
+_LANGUAGES = [CodingLanguage.PYTHON, CodingLanguage.JAVASCRIPT,
+              CodingLanguage.TYPESCRIPT, CodingLanguage.CSS]
+_DOMAINS = [FileDomain.CODE, FileDomain.TEST, FileDomain.DOCUMENTATION]
+_PACKAGES = ["numpy", "pandas", "react", "fastapi", "sqlmodel", "requests"]
+
+
+def _file_reports(count: int) -> list[FileReport]:
+    rng = random.Random(7)
+    start = datetime(2022, 1, 1)
+    reports = []
+    for i in range(count):
+        created = start + timedelta(days=rng.randint(0, 500))
+        stats = StatisticIndex([
+            Statistic(FileStatCollection.LINES_IN_FILE.value, rng.randint(0, 400)),
+            Statistic(FileStatCollection.FILE_SIZE_BYTES.value, rng.randint(0, 9000)),
+            Statistic(FileStatCollection.DATE_CREATED.value, created),
+            Statistic(FileStatCollection.DATE_MODIFIED.value,
+                      created + timedelta(days=rng.randint(0, 200))),
+            Statistic(FileStatCollection.TYPE_OF_FILE.value, rng.choice(_DOMAINS)),
+            Statistic(FileStatCollection.CODING_LANGUAGE.value, rng.choice(_LANGUAGES)),
+            Statistic(FileStatCollection.PERCENTAGE_LINES_COMMITTED.value,
+                      float(rng.randint(0, 100))),
+            Statistic(FileStatCollection.IMPORTED_PACKAGES.value,
+                      rng.sample(_PACKAGES, rng.randint(0, 3))),
+        ])
+        folder = "database" if i % 50 == 0 else f"pkg_{i % 40}"
+        reports.append(FileReport(stats, f"{folder}/module_{i % 5000}.py",
+                                  is_info_file=False))
+    return reports
+
+
+def _loop_aggregates(file_reports: list[FileReport]) -> dict:
+    """The per-file loops the calculators used before, for comparison."""
+    start_date, end_date = None, None
+    ratio: dict = {}
+    activity: dict = {}
+    contribution_lines = 0.0
+    seen = set()
+
+    for fr in sorted(file_reports, key=lambda r: ("database" in r.filepath.lower(), r.filepath)):
+        created = fr.get_value(FileStatCollection.DATE_CREATED.value)
+        modified = fr.get_value(FileStatCollection.DATE_MODIFIED.value)
+        start_date = created if start_date is None or created < start_date else start_date
+        end_date = modified if end_date is None or modified > end_date else end_date
+
+        lines = fr.get_value(FileStatCollection.LINES_IN_FILE.value)
+        percent = fr.get_value(FileStatCollection.PERCENTAGE_LINES_COMMITTED.value)
+        contribution_lines += percent / 100 * lines
+
+        size = fr.get_value(FileStatCollection.FILE_SIZE_BYTES.value)
+        signature = (fr.filepath.rsplit("/", 1)[-1], size)
+        if signature not in seen:
+            seen.add(signature)
+            language = fr.get_value(FileStatCollection.CODING_LANGUAGE.value)
+            ratio[language] = ratio.get(language, 0) + max(size, 1) if size > 0 \
+                else ratio.get(language, 0) + 1
+
+        domain = fr.get_value(FileStatCollection.TYPE_OF_FILE.value)
+        if lines:
+            activity[domain] = activity.get(domain, 0) + lines
+
+    total = sum(ratio.values())
+    normalize(activity)
+    return {
+        "start": start_date,
+        "end": end_date,
+        "ratio": {k: round(v / total, 4) for k, v in ratio.items()},
+        "activity": activity,
+        "contribution_lines": contribution_lines,
+    }
+
+
+def test_columnar_aggregation_matches_and_beats_loops():
+    file_reports = _file_reports(FILES)
+
+    start = time.perf_counter()
+    expected = _loop_aggregates(file_reports)
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    project = ProjectReport(file_reports, calculator_classes=CALCULATORS)
+    columnar_seconds = time.perf_counter() - start
+
+    # Run again on the now-built columns to see the reductions on their own
+    start = time.perf_counter()
+    for calculator in CALCULATORS:
+        calculator().calculate(project)
+    reduce_seconds = time.perf_counter() - start
+
+    print(
+        f"\n{FILES} files, dates/ratio/activity/contribution:"
+        f"\n  per-file get_value loops:      {loop_seconds * 1000:.1f} ms"
+        f"\n  building columns + reductions: {columnar_seconds * 1000:.1f} ms"
+        f"\n  reductions only:               {reduce_seconds * 1000:.1f} ms"
+    )
+
+    assert project.get_value(ProjectStatCollection.PROJECT_START_DATE.value) == expected["start"]
+    assert project.get_value(ProjectStatCollection.PROJECT_END_DATE.value) == expected["end"]
+    assert project.get_value(
+        ProjectStatCollection.CODING_LANGUAGE_RATIO.value) == approx(expected["ratio"])
+    assert project.get_value(
+        ProjectStatCollection.ACTIVITY_TYPE_RATIO.value) == approx(expected["activity"])
+
+    calculator = ProjectTotalContributionPercentage()
+    assert calculator._total_contribution_percentage(project, 1.0) == approx(
+        round(expected["contribution_lines"] * 100, 2))
+
+    assert reduce_seconds < loop_seconds
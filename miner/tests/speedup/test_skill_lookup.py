@@ -0,0 +1,83 @@
+"""
+Benchmarks the SkillMapper lookup rate: the compiled package index and
+filepath matchers on unseen inputs, memoized repeats, and the original
+linear scan over every skill's indicators.
+"""
+
+import time
+from pathlib import Path
+
+from src.core.statistic.skills import SkillMapper
+
+PATHS = 20000
+PACKAGES = ["numpy", "pandas", "react", "fastapi", "left_pad", "os", "jwt", "boto3"]
+
+
+def _scan_filepath(filepath: str):
+    path = Path(filepath)
+    extension = path.suffix.lower()
+    for skill, indicators in SkillMapper.SKILL_INDICATORS.items():
+        if extension and extension in indicators.file_extensions:
+            return skill
+        if _matches_any_pattern(filepath, indicators.file_patterns):
+            return skill
+    return None
+
+
+def _matches_any_pattern(filepath: str, patterns) -> bool:
+    path = Path(filepath)
+    filename = path.name.lower()
+    filepath_lower = str(path).lower()
+    for pattern in patterns:
+        if '/' in pattern:
+            if pattern.lower().replace('*', '').strip('/') in filepath_lower:
+                return True
+        elif pattern.startswith('*'):
+            if filename.endswith(pattern[1:].lower()):
+                return True
+        elif pattern.endswith('*'):
+            if filename.startswith(pattern[:-1].lower()):
+                return True
+        elif filename == pattern.lower():
+            return True
+    return False
+
+
+def _rate(count: int, seconds: float) -> str:
+    return f"{count / seconds:,.0f}/s"
+
+
+def test_skill_lookup_rate():
+    paths = [f"pkg_{i % 50}/module_{i}.{('py', 'ts', 'sql', 'md')[i % 4]}" for i in range(PATHS)]
+    packages = [f"{PACKAGES[i % len(PACKAGES)]}.sub{i % 100}" for i in range(PATHS)]
+    SkillMapper.clear_caches()
+
+    start = time.perf_counter()
+    expected = [_scan_filepath(path) for path in paths]
+    scan_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compiled = [SkillMapper.map_filepath_to_skill(path) for path in paths]
+    compiled_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    memoized = [SkillMapper.map_filepath_to_skill(path) for path in paths]
+    memoized_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for package in packages:
+        SkillMapper.map_package_to_skill(package)
+    package_seconds = time.perf_counter() - start
+
+    print(
+        f"\n{PATHS} file paths:"
+        f"\n  linear scan:        {_rate(PATHS, scan_seconds)}"
+        f"\n  compiled, unseen:   {_rate(PATHS, compiled_seconds)}"
+        f"\n  memoized:           {_rate(PATHS, memoized_seconds)}"
+        f"\n{PATHS} package lookups: {_rate(PATHS, package_seconds)}"
+    )
+
+    assert compiled == expected == memoized
+    assert compiled_seconds < scan_seconds
+    assert memoized_seconds < compiled_seconds
+    SkillMapper.clear_caches()
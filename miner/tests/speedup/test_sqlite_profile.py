@@ -0,0 +1,99 @@
+"""
+Concurrent read/write benchmark for the SQLite profile in `get_engine`.
+
+A writer commits small transactions (like the per-project commits of an
+upload) while reader threads issue the kind of lookups the API serves.
+The same workload runs against the old defaults (rollback journal,
+`synchronous=FULL`) and against the WAL profile.
+"""
+
+import threading
+import time
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from src.database.core.base import create_sqlite_engine
+
+WRITES = 200
+READERS = 4
+DEFAULTS = {"busy_timeout": 100}  # the old setup, with a short wait to expose lock errors
+
+
+def _make_engine(path, pragmas):
+    engine = create_sqlite_engine(f"sqlite:///{path}", pragmas=pragmas)
+    with engine.begin() as connection:
+        connection.execute(text(
+            "CREATE TABLE IF NOT EXISTS item (id INTEGER PRIMARY KEY, body TEXT)"))
+    return engine
+
+
+def _run_workload(engine) -> dict[str, float]:
+    done = threading.Event()
+    lock_errors = 0
+    reads = 0
+    counter_lock = threading.Lock()
+
+    def _reader():
+        nonlocal lock_errors, reads
+        while not done.is_set():
+            try:
+                with engine.connect() as connection:
+                    connection.execute(text("SELECT COUNT(*) FROM item")).scalar()
+                with counter_lock:
+                    reads += 1
+            except OperationalError:
+                with counter_lock:
+                    lock_errors += 1
+
+    threads = [threading.Thread(target=_reader) for _ in range(READERS)]
+    for thread in threads:
+        thread.start()
+
+    start = time.perf_counter()
+    for i in range(WRITES):
+        while True:
+            try:
+                with engine.begin() as connection:
+                    connection.execute(
+                        text("INSERT INTO item (body) VALUES (:body)"), {"body": "x" * 512})
+                break
+            except OperationalError:
+                with counter_lock:
+                    lock_errors += 1
+    elapsed = time.perf_counter() - start
+
+    done.set()
+    for thread in threads:
+        thread.join()
+
+    return {"write_seconds": elapsed, "reads": reads, "lock_errors": lock_errors}
+
+
+def test_readers_are_not_blocked_by_a_writer(tmp_path):
+    engine = _make_engine(tmp_path / "wal.db", None)
+
+    with engine.connect() as writer:
+        writer.execute(text("BEGIN EXCLUSIVE"))
+        writer.execute(text("INSERT INTO item (body) VALUES ('pending')"))
+
+        # In rollback-journal mode this read would fail with "database is locked"
+        with engine.connect() as reader:
+            assert reader.execute(text("SELECT COUNT(*) FROM item")).scalar() == 0
+
+        writer.execute(text("COMMIT"))
+
+
+def test_concurrent_read_write_benchmark(tmp_path):
+    default = _run_workload(_make_engine(tmp_path / "default.db", DEFAULTS))
+    profiled = _run_workload(_make_engine(tmp_path / "profiled.db", None))
+
+    print(
+        f"\n{WRITES} commits with {READERS} concurrent readers:"
+        f"\n  defaults: {default['write_seconds']:.3f}s writing, "
+        f"{default['reads']} reads, {default['lock_errors']} lock errors"
+        f"\n  profile:  {profiled['write_seconds']:.3f}s writing, "
+        f"{profiled['reads']} reads, {profiled['lock_errors']} lock errors"
+    )
+
+    assert profiled["lock_errors"] == 0
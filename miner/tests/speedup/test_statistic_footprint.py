@@ -0,0 +1,69 @@
+"""
+Measures the memory and construction cost of `Statistic` objects: a plain
+(dict-backed, always validated) copy of the class against the slotted class,
+built either through the validating constructor or `Statistic.trusted`.
+"""
+
+import timeit
+import tracemalloc
+from typing import get_origin
+
+from src.core.statistic import FileStatCollection, Statistic
+from src.core.statistic.base_classes import StatisticTemplate
+
+COUNT = 50_000
+# Construction timing: best of REPEATS runs of CALLS constructor calls each
+CALLS = 20_000
+REPEATS = 7
+
+
+class _DictStatistic:
+    """The pre-slots layout of `Statistic`, kept here as the baseline."""
+
+    def __init__(self, stat_template: StatisticTemplate, value):
+        self.statistic_template = stat_template
+        top_level_type = get_origin(stat_template.expected_type) or stat_template.expected_type
+        if isinstance(top_level_type, type) and not isinstance(value, top_level_type):
+            raise TypeError(stat_template.name)
+        self.value = value
+
+
+def _build(factory) -> list:
+    template = FileStatCollection.LINES_IN_FILE.value
+    return [factory(template, i) for i in range(COUNT)]
+
+
+def _construction_time(factory) -> float:
+    # The best of several runs of the constructor alone, so list allocation and
+    # garbage collection do not drown out the difference being measured
+    template = FileStatCollection.LINES_IN_FILE.value
+    return min(timeit.repeat(lambda: factory(template, 1), number=CALLS, repeat=REPEATS))
+
+
+def _measure(factory) -> tuple[float, int]:
+    elapsed = _construction_time(factory)
+
+    tracemalloc.start()
+    objects = _build(factory)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(objects) == COUNT
+    return elapsed, size
+
+
+def test_slotted_statistics_are_smaller_and_trusted_ones_faster():
+    dict_time, dict_size = _measure(_DictStatistic)
+    slot_time, slot_size = _measure(Statistic)
+    trusted_time, trusted_size = _measure(Statistic.trusted)
+
+    print(
+        f"\n{COUNT} statistics ({CALLS} constructor calls timed):"
+        f"\n  dict + validated : {dict_time * 1000:.1f} ms, {dict_size / 1024:.0f} KiB"
+        f"\n  slots + validated: {slot_time * 1000:.1f} ms, {slot_size / 1024:.0f} KiB"
+        f"\n  slots + trusted  : {trusted_time * 1000:.1f} ms, {trusted_size / 1024:.0f} KiB"
+    )
+
+    assert slot_size < dict_size
+    # `trusted` skips validation, so it should win by well over the 10% margin that
+    # keeps the check stable against scheduler noise
+    assert trusted_time < slot_time * 0.9
@@ -0,0 +1,99 @@
+from pathlib import Path
+
+import pytest
+
+from src.core.statistic.skills import Skill, SkillIndicator, SkillMapper
+
+
+def _scan_package(package: str):
+    """The original linear scan over every skill's packages."""
+    normalized_package = package.split('.')[0].lower()
+    for skill, indicators in SkillMapper.SKILL_INDICATORS.items():
+        if normalized_package in indicators.packages:
+            return skill
+    return None
+
+
+def _scan_filepath(filepath: str):
+    """The original linear scan over every skill's extensions and patterns."""
+    path = Path(filepath)
+    extension = path.suffix.lower()
+    filename = path.name.lower()
+    filepath_lower = str(path).lower()
+
+    for skill, indicators in SkillMapper.SKILL_INDICATORS.items():
+        if extension and extension in indicators.file_extensions:
+            return skill
+        for pattern in indicators.file_patterns:
+            if '/' in pattern:
+                if pattern.lower().replace('*', '').strip('/') in filepath_lower:
+                    return skill
+            elif pattern.startswith('*'):
+                if filename.endswith(pattern[1:].lower()):
+                    return skill
+            elif pattern.endswith('*'):
+                if filename.startswith(pattern[:-1].lower()):
+                    return skill
+            elif filename == pattern.lower():
+                return skill
+    return None
+
+
+def _sample_packages() -> list[str]:
+    packages = {"numpy.linalg", "Pandas", "app", "left_pad", "tensorflow.js", ""}
+    for indicators in SkillMapper.SKILL_INDICATORS.values():
+        packages.update(indicators.packages)
+    return sorted(packages)
+
+
+def _sample_filepaths() -> list[str]:
+    paths = {"src/main.py", "README.md", "./a//b/c.txt", "notes"}
+    for indicators in SkillMapper.SKILL_INDICATORS.values():
+        for extension in indicators.file_extensions:
+            paths.add(f"src/file{extension}")
+        for pattern in indicators.file_patterns:
+            name = pattern.replace('*', 'x')
+            paths.add(name)
+            paths.add(f"nested/{name}")
+            paths.add(f"nested/{name.upper()}")
+    return sorted(paths)
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    SkillMapper.clear_caches()
+    yield
+    SkillMapper.clear_caches()
+
+
+def test_package_index_matches_linear_scan():
+    for package in _sample_packages():
+        assert SkillMapper.map_package_to_skill(package) == _scan_package(package), package
+
+
+def test_filepath_matcher_matches_linear_scan():
+    for filepath in _sample_filepaths():
+        assert SkillMapper.map_filepath_to_skill(filepath) == _scan_filepath(filepath), filepath
+
+
+def test_lookups_are_memoized():
+    assert SkillMapper.map_package_to_skill("numpy") is Skill.DATA_ANALYTICS
+    assert SkillMapper.map_filepath_to_skill("Dockerfile") is Skill.CONTAINERIZATION
+    assert SkillMapper.map_filepath_to_skill("notes") is None
+
+    assert SkillMapper._PACKAGE_SKILL_CACHE == {"numpy": Skill.DATA_ANALYTICS}
+    assert SkillMapper._FILEPATH_SKILL_CACHE == {
+        "Dockerfile": Skill.CONTAINERIZATION, "notes": None}
+
+
+def test_clear_caches_picks_up_new_indicators(monkeypatch):
+    assert SkillMapper.map_package_to_skill("left_pad") is None
+
+    indicators = dict(SkillMapper.SKILL_INDICATORS)
+    indicators[Skill.SECURITY] = SkillIndicator(
+        packages={"left_pad"}, file_patterns={"vault/*"}, file_extensions=set(), keywords=set())
+    monkeypatch.setattr(SkillMapper, "SKILL_INDICATORS", indicators)
+    SkillMapper.clear_caches()
+
+    assert SkillMapper.map_package_to_skill("left_pad") is Skill.SECURITY
+    assert SkillMapper.map_filepath_to_skill("infra/vault/keys.txt") is Skill.SECURITY
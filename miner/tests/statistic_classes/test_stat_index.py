@@ -138,3 +138,93 @@ def test_user_statistic_collection_dates(sample_date: date):
     template = UserStatCollection.USER_START_DATE.value
     stat = Statistic(template, sample_date)
     assert stat.value == sample_date
+
+
+def test_lazy_index_decodes_on_first_read(skill_weighted_list):
+    skills_template = ProjectStatCollection.PROJECT_SKILLS_DEMONSTRATED.value
+    lines_template = ProjectStatCollection.TOTAL_PROJECT_LINES.value
+    eager = StatisticIndex([
+        Statistic(skills_template, skill_weighted_list),
+        Statistic(lines_template, 120),
+    ])
+
+    lazy = LazyStatisticIndex({
+        skills_template: serialize(skill_weighted_list),
+        lines_template: 120,
+    })
+
+    assert len(lazy) == 2
+    assert skills_template in lazy
+    assert lazy._stats == {}
+
+    assert lazy.get_value(lines_template) == 120
+    assert list(lazy._raw) == [skills_template]
+
+    # Pending values are written back without a decode/encode round trip
+    assert lazy.to_json() == eager.to_json()
+    assert list(lazy._raw) == [skills_template]
+
+    assert lazy.get_value(skills_template) == skill_weighted_list
+    assert lazy.to_dict() == eager.to_dict()
+
+
+def test_lazy_index_add_and_remove_override_pending_values():
+    lines_template = ProjectStatCollection.TOTAL_PROJECT_LINES.value
+    authors_template = ProjectStatCollection.TOTAL_AUTHORS.value
+    lazy = LazyStatisticIndex({lines_template: 120, authors_template: 3})
+
+    lazy.add(Statistic(lines_template, 500))
+    lazy.remove(Statistic(authors_template, 3))
+
+    assert lazy.get_value(lines_template) == 500
+    assert authors_template not in lazy
+    assert [stat.value for stat in lazy] == [500]
+
+
+def test_lazy_index_trusts_stored_values():
+    """Stored values were validated when computed, so decoding skips the type check."""
+    lazy = LazyStatisticIndex(
+        {ProjectStatCollection.TOTAL_PROJECT_LINES.value: "not a number"})
+
+    assert lazy.get_value(ProjectStatCollection.TOTAL_PROJECT_LINES.value) == "not a number"
+
+
+def test_trusted_statistic_skips_validation(stat_template: StatisticTemplate):
+    with pytest.raises(TypeError):
+        Statistic(stat_template, "a")
+
+    stat = Statistic.trusted(stat_template, 8)
+    assert stat.value == 8
+    assert stat.get_template() is stat_template
+
+
+def test_statistic_classes_are_slotted(stat_template: StatisticTemplate):
+    assert not hasattr(Statistic(stat_template, 8), "__dict__")
+    assert not hasattr(StatisticIndex(), "__dict__")
+    assert not hasattr(LazyStatisticIndex({}), "__dict__")
+
+
+def test_equal_templates_share_a_hash():
+    first = StatisticTemplate("SAME", "one", int)
+    second = StatisticTemplate("SAME", "one", int)
+    assert first == second and hash(first) == hash(second)
+    assert {first: 1}[second] == 1
+
+
+def test_fingerprint_follows_the_values(skill_weighted_list):
+    skills_template = ProjectStatCollection.PROJECT_SKILLS_DEMONSTRATED.value
+    lines_template = ProjectStatCollection.TOTAL_PROJECT_LINES.value
+    eager = StatisticIndex([
+        Statistic(lines_template, 120),
+        Statistic(skills_template, skill_weighted_list),
+    ])
+    lazy = LazyStatisticIndex({
+        skills_template: serialize(skill_weighted_list),
+        lines_template: 120,
+    })
+
+    # Insertion order and lazy decoding do not matter, only the values
+    assert lazy.fingerprint() == eager.fingerprint()
+
+    eager.add(Statistic(lines_template, 121))
+    assert lazy.fingerprint() != eager.fingerprint()
@@ -0,0 +1,83 @@
+"""
+Tests that the per-template codecs read and write exactly the format of
+the generic statistic serializer.
+"""
+
+from datetime import date, datetime
+from typing import Any, get_args, get_origin
+
+import pytest
+
+from src.core.statistic import (
+    CodingLanguage,
+    FileDomain,
+    FileStatCollection,
+    ProjectStatCollection,
+    UserStatCollection,
+    WeightedSkills,
+    deserialize,
+    serialize,
+)
+from src.core.statistic.statistic_codecs import GENERIC_CODEC, compile_codec, get_codec
+
+TEMPLATES = [
+    member.value
+    for collection in (FileStatCollection, ProjectStatCollection, UserStatCollection)
+    for member in collection
+]
+
+
+def _sample(expected_type: Any) -> Any:
+    origin, args = get_origin(expected_type), get_args(expected_type)
+    if origin is list:
+        return [_sample(args[0]), _sample(args[0])]
+    if origin is dict:
+        key_type, value_type = args
+        keys = list(key_type)[:3] if key_type in (CodingLanguage, FileDomain) else ["a", "b"]
+        return {key: _sample(value_type) for key in keys}
+    return {
+        int: 7,
+        float: 0.25,
+        str: "text",
+        bool: True,
+        date: datetime(2025, 3, 1, 12, 30),
+        CodingLanguage: CodingLanguage.PYTHON,
+        FileDomain: FileDomain.TEST,
+        WeightedSkills: WeightedSkills("Python", 0.5),
+        dict: {"plain": 1, "nested": {"x": [1, 2]}},
+        list: ["one", 2],
+    }.get(expected_type, "fallback")
+
+
+@pytest.mark.parametrize("template", TEMPLATES, ids=lambda t: t.name)
+def test_codec_matches_generic_serializer(template):
+    value = _sample(template.expected_type)
+    codec = get_codec(template)
+
+    encoded = codec.encode(value)
+
+    assert encoded == serialize(value)
+    assert codec.decode(encoded) == deserialize(serialize(value)) == value
+
+
+def test_enum_keys_that_literal_eval_cannot_parse():
+    codec = compile_codec(dict[CodingLanguage, float])
+    value = {CodingLanguage.CPP: 0.5, CodingLanguage.CSHARP: 0.5}
+
+    assert codec.decode(codec.encode(value)) == value
+
+
+def test_codecs_fall_back_for_unexpected_shapes():
+    skills = compile_codec(list[WeightedSkills])
+    timeline = compile_codec(dict[str, int])
+
+    # A value that does not match the declared type still round trips
+    assert skills.decode(skills.encode(["Python"])) == ["Python"]
+    assert timeline.decode(serialize({FileDomain.CODE: 1})) == {FileDomain.CODE: 1}
+    assert compile_codec(date).decode(None) is None
+
+
+def test_untyped_templates_use_generic_codec():
+    assert compile_codec(dict) is GENERIC_CODEC
+    assert compile_codec(list) is GENERIC_CODEC
+    assert compile_codec(Any) is GENERIC_CODEC
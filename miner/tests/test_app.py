@@ -13,7 +13,7 @@ from src.core.project_discovery import project_discovery as pd
 
 
 @pytest.fixture(autouse=True, scope="function")
-def mock_engine(monkeypatch, blank_db):
+def mock_engine(monkeypatch, blank_db, insights_in_foreground):
     """
     Tells start_miner to use our fake_get_engine function
     rather than the real get_engine() function
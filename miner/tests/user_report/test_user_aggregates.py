@@ -0,0 +1,77 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+from pytest import approx
+
+from src.core.report import UserReport
+from src.core.report.user.user_aggregates import ProjectContribution, UserAggregates
+from src.core.statistic import (
+    CodingLanguage,
+    ProjectStatCollection,
+    Statistic,
+    UserStatCollection,
+    WeightedSkills,
+)
+
+
+def _contribution(skill_weight: float, start: datetime, end: datetime) -> ProjectContribution:
+    return ProjectContribution(
+        weight=1.0,
+        skill_weights={"Python": skill_weight},
+        language_bytes={CodingLanguage.PYTHON: 100.0},
+        start_date=start,
+        end_date=end,
+        commit_timeline={"2025-01-01": 2},
+        total_commit_timeline={"2025-01-01": 3},
+    )
+
+
+def test_contribution_scales_skills_by_project_weight(project_report_from_stats):
+    project = project_report_from_stats([
+        Statistic(ProjectStatCollection.PROJECT_SKILLS_DEMONSTRATED.value,
+                  [WeightedSkills(skill_name="Python", weight=0.5)]),
+        Statistic(ProjectStatCollection.PROJECT_START_DATE.value, datetime(2024, 1, 1)),
+    ])
+    project.get_project_weight = Mock(return_value=2.0)
+
+    contribution = ProjectContribution.from_project_report(project)
+
+    assert contribution.weight == 2.0
+    assert contribution.skill_weights == {"Python": 1.0}
+    assert contribution.start_date == datetime(2024, 1, 1)
+    assert contribution.end_date is None
+    # Without a total timeline the project has no git history to count
+    assert contribution.commit_timeline == {}
+
+
+def test_subtract_undoes_add_and_drops_emptied_keys():
+    first = _contribution(0.1, datetime(2024, 1, 1), datetime(2024, 6, 1))
+    second = _contribution(0.2, datetime(2023, 1, 1), datetime(2025, 1, 1))
+    second.skill_weights["React"] = 0.3
+
+    aggregates = UserAggregates.from_contributions([first, second])
+    assert aggregates.skill_weights == approx({"Python": 0.3, "React": 0.3})
+    assert aggregates.commit_timeline == {"2025-01-01": 4}
+    assert (aggregates.start_date, aggregates.end_date) == (
+        datetime(2023, 1, 1), datetime(2025, 1, 1))
+
+    aggregates.subtract(second)
+    assert aggregates.skill_weights == approx({"Python": 0.1})
+    assert aggregates.language_bytes == {CodingLanguage.PYTHON: 100.0}
+    assert aggregates.total_commit_timeline == {"2025-01-01": 3}
+
+
+def test_user_report_uses_given_contributions(project_report_from_stats):
+    first = project_report_from_stats([], project_name="first")
+    second = project_report_from_stats([], project_name="second")
+    contributions = [
+        ProjectContribution(weight=0.5, skill_weights={"Go": 1.0}),
+        ProjectContribution(weight=2.0, skill_weights={"Go": 0.5, "Rust": 2.0}),
+    ]
+
+    user = UserReport([first, second], contributions=contributions)
+
+    skills = user.get_value(UserStatCollection.USER_SKILLS.value)
+    assert {s.skill_name: s.weight for s in skills} == {"Go": 1.5, "Rust": 2.0}
+    # Ranked by the stored weights, heaviest first
+    assert [item.title for item in user.resume_items] == ["second", "first"]
@@ -0,0 +1,21 @@
+import io
+
+import pytest
+
+from src.utils.images import make_thumbnail
+
+
+def test_make_thumbnail_shrinks_and_keeps_aspect_ratio():
+    Image = pytest.importorskip("PIL.Image")
+    source = io.BytesIO()
+    Image.new("RGB", (1000, 500), "red").save(source, format="PNG")
+
+    data, content_type = make_thumbnail(source.getvalue(), size=(100, 100))
+
+    assert content_type == "image/jpeg"
+    with Image.open(io.BytesIO(data)) as thumbnail:
+        assert thumbnail.size == (100, 50)
+
+
+def test_make_thumbnail_rejects_unreadable_data():
+    assert make_thumbnail(b"not an image") is None
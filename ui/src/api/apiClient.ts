@@ -29,6 +29,11 @@ function buildUrl(path: string): string {
   return `${base}${path.startsWith("/") ? path : `/${path}`}`;
 }
 
+/** Absolute URL for an API-relative path such as a project's `image_url`. */
+export function getApiUrl(path: string): string {
+  return buildUrl(path);
+}
+
 /** Extract a human-readable message from an error response.
  *  FastAPI errors have the shape `{"detail": "..."}` — prefer that over raw body. */
 async function readApiError(res: Response): Promise<string> {
@@ -191,7 +196,9 @@ export type UpdateUserConfigPayload = {
 export type ProjectListItem = {
   project_name: string;
   user_config_used?: number | null;
-  image_data?: string | null;
+  image_hash?: string | null;
+  image_url?: string | null;
+  thumbnail_url?: string | null;
   created_at?: string;
   statistic?: Record<string, unknown>;
   last_updated?: string;
@@ -200,6 +207,7 @@ export type ProjectListItem = {
 export type ListProjectsResponse = {
   projects: ProjectListItem[];
   count: number;
+  next_cursor?: string | null;
 };
 
 export type ProjectInsightResponse = {
@@ -423,7 +431,12 @@ export const api = {
     }
   },
 
-  getProjects: () => getJson<ListProjectsResponse>("/projects"),
+  getProjects: (fields?: string[]) =>
+    getJson<ListProjectsResponse>(
+      fields?.length
+        ? `/projects?fields=${encodeURIComponent(fields.join(","))}`
+        : "/projects"
+    ),
 
   getSkills: () => getJson<any>("/skills"),
 
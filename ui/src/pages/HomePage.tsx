@@ -2,6 +2,7 @@ import { useEffect, useRef, useState } from "react";
 import { Link, useLocation } from "react-router-dom";
 import {
   api,
+  getApiUrl,
   getLatestResumeId,
   type ProjectListItem,
   type ResumeListItem,
@@ -20,14 +21,6 @@ type ListPortfoliosResponse = {
   portfolios: PortfolioListItem[];
 };
 
-function getImageSrc(base64: string): string {
-  if (base64.startsWith("/9j/")) return `data:image/jpeg;base64,${base64}`;
-  if (base64.startsWith("iVBOR")) return `data:image/png;base64,${base64}`;
-  if (base64.startsWith("R0lG")) return `data:image/gif;base64,${base64}`;
-  if (base64.startsWith("UklG")) return `data:image/webp;base64,${base64}`;
-  return `data:image/jpeg;base64,${base64}`;
-}
-
 export default function HomePage({ backendReady }: { backendReady: boolean }) {
   const location = useLocation();
   const { isProjectMining, startMining } = useProjectMining();
@@ -273,10 +266,10 @@ function handleUploadSuccess(file: File) {
                         <div style={{ fontWeight: 600, color: "#333", flex: 1, wordBreak: "break-word" }}>
                           {project.project_name}
                         </div>
-                        {project.image_data && (
+                        {project.thumbnail_url && (
                           <div style={{ width: 64, height: 44, flexShrink: 0, borderRadius: 6, overflow: "hidden", background: "#f0f0f0" }}>
                             <img
-                              src={getImageSrc(project.image_data)}
+                              src={getApiUrl(project.thumbnail_url)}
                               alt=""
                               style={{ width: "100%", height: "100%", objectFit: "cover", display: "block" }}
                             />
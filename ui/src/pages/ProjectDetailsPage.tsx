@@ -1,6 +1,6 @@
 import { type ReactNode, useEffect, useRef, useState } from "react";
 import { useLocation, useNavigate, useParams } from "react-router-dom";
-import { api } from "../api/apiClient";
+import { api, getApiUrl } from "../api/apiClient";
 import { LANG_COLOR_MAP, LANG_FALLBACK_COLORS, LanguageDonut } from "../components/LanguageDonut";
 
 type WeightedSkill = { name?: string; skill?: string; weight?: number } | string;
@@ -8,7 +8,7 @@ type WeightedSkill = { name?: string; skill?: string; weight?: number } | string
 type ProjectReport = {
   project_name: string;
   user_config_used?: number | null;
-  image_data?: string | null;
+  image_url?: string | null;
   created_at?: string;
   last_updated?: string;
   statistic?: Record<string, unknown>;
@@ -27,14 +27,6 @@ function formatDate(value?: string) {
     : d.toLocaleDateString(undefined, { year: "numeric", month: "short", day: "numeric" });
 }
 
-function getImageSrc(base64: string): string {
-  if (base64.startsWith("/9j/")) return `data:image/jpeg;base64,${base64}`;
-  if (base64.startsWith("iVBOR")) return `data:image/png;base64,${base64}`;
-  if (base64.startsWith("R0lG")) return `data:image/gif;base64,${base64}`;
-  if (base64.startsWith("UklG")) return `data:image/webp;base64,${base64}`;
-  return `data:image/jpeg;base64,${base64}`;
-}
-
 /** Unwrap stat value — handles both raw value and {value: ...} wrapper */
 function getStat(statistic: Record<string, unknown>, key: string): unknown {
   const raw = statistic[key];
@@ -624,7 +616,7 @@ export default function ProjectDetailsPage() {
                 }}
               />
 
-              {project.image_data ? (
+              {project.image_url ? (
                 <div
                   style={{
                     width: 260,
@@ -639,7 +631,7 @@ export default function ProjectDetailsPage() {
                   }}
                 >
                   <img
-                    src={getImageSrc(project.image_data)}
+                    src={getApiUrl(project.image_url)}
                     alt="Project thumbnail"
                     style={{ width: "100%", height: "100%", objectFit: "contain", display: "block" }}
                   />
@@ -671,7 +663,7 @@ export default function ProjectDetailsPage() {
                 </button>
               )}
 
-              {project.image_data && (
+              {project.image_url && (
                 <div style={{ display: "flex", gap: 6, marginTop: 8, justifyContent: "center" }}>
                   <button
                     type="button"
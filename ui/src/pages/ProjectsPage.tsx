@@ -1,22 +1,14 @@
 import { useEffect, useRef, useState } from "react";
 import { Link, useNavigate } from "react-router-dom";
-import { api } from "../api/apiClient";
+import { api, getApiUrl } from "../api/apiClient";
 import ProjectSkeleton from "@/components/ProjectSkeleton";
 import { useProjectMining } from "@/context/ProjectMiningContext";
 
 type ProjectListItem = {
   project_name: string;
-  image_data?: string | null;
+  thumbnail_url?: string | null;
 };
 
-function getImageSrc(base64: string): string {
-  if (base64.startsWith("/9j/")) return `data:image/jpeg;base64,${base64}`;
-  if (base64.startsWith("iVBOR")) return `data:image/png;base64,${base64}`;
-  if (base64.startsWith("R0lG")) return `data:image/gif;base64,${base64}`;
-  if (base64.startsWith("UklG")) return `data:image/webp;base64,${base64}`;
-  return `data:image/jpeg;base64,${base64}`;
-}
-
 type ListProjectsResponse = {
   projects: ProjectListItem[];
 };
@@ -34,7 +26,7 @@ export default function ProjectsPage() {
       setLoading(true);
       setError(null);
 
-      const res = (await api.getProjects()) as ListProjectsResponse;
+      const res = (await api.getProjects(["project_name", "thumbnail_url"])) as ListProjectsResponse;
       setProjects(Array.isArray(res?.projects) ? res.projects : []);
     } catch (e: any) {
       setError(e?.message ?? "Failed to load projects");
@@ -183,10 +175,10 @@ export default function ProjectsPage() {
                   {p.project_name}
                 </div>
 
-                {p.image_data ? (
+                {p.thumbnail_url ? (
                   <div style={{ width: 120, height: 80, flexShrink: 0, borderRadius: 8, overflow: "hidden", background: "#f0f0f0" }}>
                     <img
-                      src={getImageSrc(p.image_data)}
+                      src={getApiUrl(p.thumbnail_url)}
                       alt={`${p.project_name} thumbnail`}
                       style={{ width: "100%", height: "100%", objectFit: "cover", display: "block" }}
                     />